@@ -72,6 +72,7 @@ class DashboardLifecycleService:
                         config_data = dashboard_config.config or {}
                         dashboard_type = dashboard_config.dashboard_type
                         original_message_id = active_dashboard.message_id # Store original message_id
+                        render_hash = active_dashboard.render_hash # Fingerprint of the content shown in that message
 
                         if not channel_id_str:
                              logger.warning(f"[DashboardLifecycleService] Skipping activation for ActiveDashboard {active_dashboard.id}: Missing channel_id.")
@@ -92,7 +93,8 @@ class DashboardLifecycleService:
                             dashboard_type=dashboard_type,
                             config_data=config_data,
                             active_dashboard_id=active_dashboard.id,
-                            message_id=original_message_id # Pass original ID for initial edit attempt
+                            message_id=original_message_id, # Pass original ID for initial edit attempt
+                            render_hash=render_hash
                         )
 
                         if success:
@@ -190,6 +192,7 @@ class DashboardLifecycleService:
         active_dashboard_entity = None
         active_dashboard_id = None
         current_message_id = None
+        current_render_hash = None
         configuration_entity = None
         # We receive name/type as args now, use them directly later.
 
@@ -222,6 +225,7 @@ class DashboardLifecycleService:
                     logger.debug(f"[DashboardLifecycleService] Found existing ActiveDashboard ID: {active_dashboard_entity.id} for channel {channel.id}.")
                     active_dashboard_id = active_dashboard_entity.id
                     current_message_id = active_dashboard_entity.message_id 
+                    current_render_hash = active_dashboard_entity.render_hash
 
                     update_data = {}
                     if active_dashboard_entity.dashboard_configuration_id != configuration_entity.id:
@@ -282,7 +286,8 @@ class DashboardLifecycleService:
                 dashboard_type=dashboard_type, # Use PASSED type
                 config_data=config_data,       # Use PASSED data dict
                 active_dashboard_id=active_dashboard_id, 
-                message_id=current_message_id 
+                message_id=current_message_id,
+                render_hash=current_render_hash
             )
             
             if not registry_success:
@@ -356,7 +361,7 @@ class DashboardLifecycleService:
             
         dashboard_controller = self.registry.active_dashboards[channel_id]
         if dashboard_controller and hasattr(dashboard_controller, 'display_dashboard'):
-             await dashboard_controller.display_dashboard()
+             await dashboard_controller.display_dashboard(force=True)
              return True 
         else:
             logger.error(f"Could not refresh dashboard for channel {channel_id}: Controller invalid or missing display_dashboard method.")
@@ -371,6 +376,10 @@ class DashboardLifecycleService:
         """
         if not self.registry:
             return True
+
+        # Stop scheduled refreshes first: they must not outlive the REST scheduler,
+        # which the bot shuts down after the workflows
+        await self.registry.shutdown()
             
         # Deactivate all dashboards
         for channel_id in list(self.registry.active_dashboards.keys()):
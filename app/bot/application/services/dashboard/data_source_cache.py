@@ -0,0 +1,136 @@
+"""Process-wide TTL cache for dashboard data sources."""
+import asyncio
+import json
+import time
+from typing import Dict, Any, Optional, Callable, Awaitable, Tuple, Hashable
+
+from app.shared.interfaces.logging.api import get_bot_logger
+
+logger = get_bot_logger()
+
+CacheKey = Tuple[Hashable, ...]
+
+
+class DataSourceCache:
+    """
+    Shares data source results between dashboards.
+
+    Entries are keyed by (source type, method, params, guild_id) and expire after a
+    per-source TTL. Concurrent requests for the same key while a collection is running
+    wait for that one collection (single-flight) instead of starting their own.
+    Failed collections are never cached.
+    """
+
+    # Seconds a result stays valid, per data source type
+    DEFAULT_TTLS: Dict[str, float] = {
+        'system_collector': 15,
+        'service_collector': 30,
+        'db_repository': 10,
+    }
+    DEFAULT_TTL = 10
+    MAX_ENTRIES = 1024
+
+    def __init__(self,
+                 ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = DEFAULT_TTL,
+                 max_entries: int = MAX_ENTRIES,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: Dict[CacheKey, Tuple[float, Any]] = {}  # key -> (expires_at, value)
+        self._in_flight: Dict[CacheKey, asyncio.Task] = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "errors": 0}
+
+    @staticmethod
+    def make_key(source_type: str, method: Optional[str] = None,
+                 params: Optional[Dict[str, Any]] = None, guild_id: Optional[int] = None) -> CacheKey:
+        """Builds a hashable cache key. Params are serialized with sorted keys so dict order does not matter."""
+        params_key = json.dumps(params, sort_keys=True, default=str) if params else ""
+        return (source_type, method, params_key, guild_id)
+
+    def get_ttl(self, source_type: str, override: Optional[float] = None) -> float:
+        """Returns the TTL for a source type; an explicit override (e.g. from the source config) wins."""
+        if override is not None:
+            try:
+                return max(0.0, float(override))
+            except (TypeError, ValueError):
+                logger.warning(f"DataSourceCache: Invalid cache_ttl '{override}' for '{source_type}'. Using default.")
+        return self.ttls.get(source_type, self.default_ttl)
+
+    async def get_or_fetch(self, key: CacheKey, fetcher: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        """
+        Returns the cached value for key or runs fetcher once to produce it.
+        A ttl of 0 bypasses the cache but still coalesces concurrent callers.
+        """
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                self.stats["hits"] += 1
+                return value
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+        else:
+            self.stats["misses"] += 1
+            task = asyncio.create_task(self._run(key, fetcher, ttl))
+            self._in_flight[key] = task
+        # Shield so a cancelled waiter does not cancel the collection others are waiting on
+        return await asyncio.shield(task)
+
+    async def _run(self, key: CacheKey, fetcher: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        try:
+            value = await fetcher()
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+        if ttl > 0:
+            self._store(key, value, ttl)
+        return value
+
+    def _store(self, key: CacheKey, value: Any, ttl: float) -> None:
+        now = self._clock()
+        if len(self._entries) >= self.max_entries:
+            # Drop expired entries first, then the ones closest to expiry
+            for k in [k for k, (exp, _) in self._entries.items() if exp <= now]:
+                del self._entries[k]
+            while len(self._entries) >= self.max_entries:
+                del self._entries[min(self._entries, key=lambda k: self._entries[k][0])]
+        self._entries[key] = (now + ttl, value)
+
+    def invalidate(self, source_type: Optional[str] = None, guild_id: Optional[int] = None) -> int:
+        """Drops cached entries matching source_type and/or guild_id (all if neither is given)."""
+        to_drop = [
+            k for k in self._entries
+            if (source_type is None or k[0] == source_type) and (guild_id is None or k[3] == guild_id)
+        ]
+        for k in to_drop:
+            del self._entries[k]
+        return len(to_drop)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns hit/miss counters plus current size."""
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["coalesced"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "in_flight": len(self._in_flight),
+            "hit_rate": round((self.stats["hits"] + self.stats["coalesced"]) / lookups, 3) if lookups else 0.0,
+        }
+
+
+# Singleton instance
+_data_source_cache = DataSourceCache()
+
+def get_data_source_cache() -> DataSourceCache:
+    """Get the process-wide data source cache instance"""
+    return _data_source_cache
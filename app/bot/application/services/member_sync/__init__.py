@@ -0,0 +1,10 @@
+"""Incremental, event-driven member synchronisation."""
+from .member_sync_service import MemberSyncService, member_payload, compute_member_hash
+from .member_sync_listener import MemberSyncListener
+
+__all__ = [
+    'MemberSyncService',
+    'MemberSyncListener',
+    'member_payload',
+    'compute_member_hash',
+]
@@ -0,0 +1,61 @@
+from nextcord.ext import commands, tasks
+
+from app.shared.interfaces.logging.api import get_bot_logger
+from app.bot.infrastructure.config.constants import MEMBER_RECONCILE_INTERVAL
+
+logger = get_bot_logger()
+
+
+class MemberSyncListener(commands.Cog):
+    """Feeds member gateway events into the MemberSyncService and runs the periodic reconciliation."""
+
+    def __init__(self, bot, member_sync):
+        self.bot = bot
+        self.member_sync = member_sync
+        self._reconcile_loop.start()
+
+    def cog_unload(self):
+        self._reconcile_loop.cancel()
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        self.member_sync.enqueue_upsert(member.guild.id, member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before, after):
+        # Nickname and role changes do not touch the synced fields
+        if before.name != after.name or before.avatar != after.avatar:
+            self.member_sync.enqueue_upsert(after.guild.id, after)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member):
+        self.member_sync.enqueue_removal(member.guild.id, member.id)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before, after):
+        if before.name == after.name and before.avatar == after.avatar:
+            return
+        for guild in after.mutual_guilds:
+            self.member_sync.enqueue_upsert(guild.id, after)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self.member_sync.forget_guild(guild.id)
+
+    @tasks.loop(seconds=MEMBER_RECONCILE_INTERVAL)
+    async def _reconcile_loop(self):
+        """Full member sync for guilds whose member hash changed (catches events missed while disconnected)."""
+        if self._reconcile_loop.current_loop == 0:
+            return  # UserWorkflow.initialize reconciles on startup
+        try:
+            summary = await self.member_sync.reconcile_all(self.bot.guilds)
+            logger.info(
+                f"Member reconciliation: {summary['synced']} guild(s) synced, "
+                f"{summary['skipped']} unchanged, {summary['failed']} failed"
+            )
+        except Exception as e:
+            logger.error(f"Error during member reconciliation: {e}", exc_info=True)
+
+    @_reconcile_loop.before_loop
+    async def before_reconcile_loop(self):
+        await self.bot.wait_until_ready()
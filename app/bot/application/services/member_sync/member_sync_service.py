@@ -0,0 +1,275 @@
+"""
+Incremental member synchronisation.
+
+Member events (join, update, leave) are queued per guild and written in
+batches: at most MEMBER_SYNC_DEBOUNCE seconds after the first queued change,
+or immediately once MEMBER_SYNC_MAX_BATCH changes are waiting. Full member
+syncs only run for guilds whose member content hash differs from the stored
+hash. A successful full sync stores the hash; a successful flush refreshes it
+for guilds known to be in sync, a failed one clears it so the next
+reconciliation runs a full sync (which also drops links of departed members).
+"""
+import asyncio
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+
+from sqlalchemy import select, update
+
+from app.shared.interfaces.logging.api import get_bot_logger
+from app.shared.infrastructure.database.session import session_context
+from app.shared.infrastructure.models.discord import GuildEntity
+from app.shared.infrastructure.repositories.auth.user_repository_impl import UserRepositoryImpl
+from app.bot.infrastructure.config.constants import (
+    MEMBER_SYNC_CHUNK_SIZE, MEMBER_SYNC_DEBOUNCE, MEMBER_SYNC_MAX_BATCH
+)
+
+logger = get_bot_logger()
+
+DEFAULT_AVATAR_URL = "https://cdn.discordapp.com/embed/avatars/0.png"
+
+
+def member_payload(member) -> Optional[Dict[str, Any]]:
+    """Returns the app_users row data for a member or user, None for bots."""
+    if member.bot:
+        return None
+    return {
+        'discord_id': member.id,
+        'username': member.name,
+        'avatar': str(member.avatar.url) if member.avatar else DEFAULT_AVATAR_URL
+    }
+
+
+def compute_member_hash(payloads: Iterable[Dict[str, Any]]) -> str:
+    """SHA-256 over the synced member fields, independent of member order."""
+    rows = sorted(
+        (str(p['discord_id']), p.get('username') or '', p.get('avatar') or '')
+        for p in payloads
+    )
+    digest = hashlib.sha256()
+    for row in rows:
+        digest.update("\x1f".join(row).encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+class MemberSyncService:
+    """Batches member events into bulk writes and gates full syncs by member hash."""
+
+    def __init__(self, full_sync: Callable[[Any], Awaitable[Optional[Dict[str, int]]]],
+                 guild_lookup: Optional[Callable[[int], Any]] = None,
+                 debounce: float = MEMBER_SYNC_DEBOUNCE,
+                 max_batch: int = MEMBER_SYNC_MAX_BATCH,
+                 chunk_size: int = MEMBER_SYNC_CHUNK_SIZE):
+        self.full_sync = full_sync
+        self.guild_lookup = guild_lookup
+        self.debounce = debounce
+        self.max_batch = max(1, max_batch)
+        self.chunk_size = chunk_size
+
+        self._pending_upserts: Dict[str, Dict[str, Dict[str, Any]]] = {}  # guild_id -> discord_id -> payload
+        self._pending_removals: Dict[str, Set[str]] = {}                 # guild_id -> discord_ids
+        self._pending_count = 0
+        self._flush_timer: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._stored_hashes: Dict[str, Optional[str]] = {}
+        self.stats = {
+            'events': 0, 'flushes': 0, 'upserted': 0, 'removed': 0, 'errors': 0,
+            'reconciled': 0, 'reconcile_skipped': 0,
+        }
+
+    # --- Event queue ---
+
+    @property
+    def pending(self) -> int:
+        """Number of queued, not yet written member changes."""
+        return self._pending_count
+
+    def enqueue_upsert(self, guild_id, member) -> None:
+        """Queues a joined or changed member. Later changes of the same member replace earlier ones."""
+        payload = member_payload(member)
+        if payload is None:
+            return
+        guild_id, discord_id = str(guild_id), str(payload['discord_id'])
+        removals = self._pending_removals.get(guild_id)
+        if removals and discord_id in removals:
+            removals.discard(discord_id)
+            self._pending_count -= 1
+        upserts = self._pending_upserts.setdefault(guild_id, {})
+        if discord_id not in upserts:
+            self._pending_count += 1
+        upserts[discord_id] = payload
+        self._queued()
+
+    def enqueue_removal(self, guild_id, discord_id) -> None:
+        """Queues a member that left the guild."""
+        guild_id, discord_id = str(guild_id), str(discord_id)
+        upserts = self._pending_upserts.get(guild_id)
+        if upserts and upserts.pop(discord_id, None) is not None:
+            self._pending_count -= 1
+        removals = self._pending_removals.setdefault(guild_id, set())
+        if discord_id not in removals:
+            self._pending_count += 1
+            removals.add(discord_id)
+        self._queued()
+
+    def _queued(self) -> None:
+        self.stats['events'] += 1
+        loop = asyncio.get_running_loop()
+        if self._pending_count >= self.max_batch and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = loop.create_task(self.flush())
+        elif self._flush_timer is None or self._flush_timer.done():
+            self._flush_timer = loop.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.debounce)
+        await self.flush()
+
+    async def flush(self) -> Dict[str, int]:
+        """Writes all queued changes: one bulk upsert and one DELETE per guild."""
+        async with self._flush_lock:
+            upserts, self._pending_upserts = self._pending_upserts, {}
+            removals, self._pending_removals = self._pending_removals, {}
+            self._pending_count = 0
+            timer = self._flush_timer
+            if timer is not None and timer is not asyncio.current_task() and not timer.done():
+                timer.cancel()
+            self._flush_timer = None
+
+            result = {'upserted': 0, 'removed': 0, 'errors': 0}
+            guild_ids = set(upserts) | set(removals)
+            if not any(upserts.get(g) or removals.get(g) for g in guild_ids):
+                return result
+
+            for guild_id in guild_ids:
+                members = list(upserts.get(guild_id, {}).values())
+                left = removals.get(guild_id)
+                if not members and not left:
+                    continue
+                errors = 0
+                try:
+                    # One session per guild: a failed write must not abort the other guilds' transaction
+                    async with session_context() as session:
+                        user_repo = UserRepositoryImpl(session)
+                        if members:
+                            stats = await user_repo.bulk_upsert_guild_members(
+                                guild_id, members, chunk_size=self.chunk_size
+                            )
+                            result['upserted'] += len(members) - stats['errors']
+                            errors += stats['errors']
+                        if left:
+                            result['removed'] += await user_repo.remove_guild_members(guild_id, left)
+                except Exception as e:
+                    errors = len(members) + len(left or ())
+                    logger.error(f"[Guild:{guild_id}] Failed to write queued member changes: {e}", exc_info=True)
+                result['errors'] += errors
+                await self._after_flush(guild_id, ok=errors == 0)
+
+            self.stats['flushes'] += 1
+            for key, value in result.items():
+                self.stats[key] += value
+            logger.debug(
+                f"Member sync flush: {result['upserted']} upserted, {result['removed']} removed, "
+                f"{result['errors']} errors across {len(guild_ids)} guild(s)"
+            )
+            return result
+
+    async def _after_flush(self, guild_id: str, ok: bool) -> None:
+        """Keeps the stored member hash consistent with what a flush wrote."""
+        if not ok:
+            # Full sync on the next reconciliation; it upserts current members and drops departed ones
+            await self._store_hash(guild_id, None)
+            return
+        if not self._stored_hashes.get(guild_id) or self.guild_lookup is None:
+            # Not known to be in sync before this flush: leave the decision to reconciliation
+            return
+        guild = self.guild_lookup(int(guild_id))
+        if guild is None:
+            return
+        await self._store_hash(guild_id, compute_member_hash(
+            p for p in (member_payload(m) for m in guild.members) if p is not None
+        ))
+
+    async def close(self) -> None:
+        """Writes remaining queued changes."""
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        await self.flush()
+
+    # --- Hash-gated reconciliation ---
+
+    async def _load_stored_hash(self, guild_id: str) -> Optional[str]:
+        if guild_id in self._stored_hashes:
+            return self._stored_hashes[guild_id]
+        try:
+            async with session_context() as session:
+                result = await session.execute(
+                    select(GuildEntity.member_sync_hash).where(GuildEntity.guild_id == guild_id)
+                )
+                stored = result.scalar_one_or_none()
+        except Exception as e:
+            logger.warning(f"[Guild:{guild_id}] Could not load stored member hash: {e}")
+            return None
+        self._stored_hashes[guild_id] = stored
+        return stored
+
+    async def _store_hash(self, guild_id: str, member_hash: Optional[str]) -> None:
+        self._stored_hashes[guild_id] = member_hash
+        try:
+            async with session_context() as session:
+                await session.execute(
+                    update(GuildEntity).where(GuildEntity.guild_id == guild_id).values(member_sync_hash=member_hash)
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"[Guild:{guild_id}] Could not store member hash: {e}")
+
+    async def reconcile_guild(self, guild, force: bool = False) -> Optional[Dict[str, int]]:
+        """
+        Runs a full member sync if the guild's member hash changed since the last one.
+
+        Returns:
+            The full sync statistics, {'skipped': True} if nothing changed,
+            or None if the sync failed.
+        """
+        guild_id = str(guild.id)
+        payloads = [p for p in (member_payload(m) for m in guild.members) if p is not None]
+        member_hash = compute_member_hash(payloads)
+
+        if not force and await self._load_stored_hash(guild_id) == member_hash:
+            self.stats['reconcile_skipped'] += 1
+            logger.debug(f"[Guild:{guild_id}] Member hash unchanged, skipping full member sync")
+            return {'skipped': True}
+
+        stats = await self.full_sync(guild)
+        self.stats['reconciled'] += 1
+        if isinstance(stats, dict) and stats.get('errors') == 0:
+            await self._store_hash(guild_id, member_hash)
+        else:
+            # Keep retrying on the next reconciliation
+            self._stored_hashes.pop(guild_id, None)
+        return stats
+
+    async def reconcile_all(self, guilds: Iterable[Any], force: bool = False) -> Dict[str, int]:
+        """Reconciles several guilds one after another and returns how many were synced or skipped."""
+        summary = {'synced': 0, 'skipped': 0, 'failed': 0}
+        for guild in list(guilds):
+            try:
+                stats = await self.reconcile_guild(guild, force=force)
+            except Exception as e:
+                logger.error(f"[Guild:{guild.id}] Member reconciliation failed: {e}", exc_info=True)
+                stats = None
+            if stats is None:
+                summary['failed'] += 1
+            elif isinstance(stats, dict) and stats.get('skipped'):
+                summary['skipped'] += 1
+            else:
+                summary['synced'] += 1
+        return summary
+
+    def forget_guild(self, guild_id) -> None:
+        """Drops cached state of a guild the bot left."""
+        guild_id = str(guild_id)
+        self._stored_hashes.pop(guild_id, None)
+        self._pending_count -= len(self._pending_upserts.pop(guild_id, {}))
+        self._pending_count -= len(self._pending_removals.pop(guild_id, set()))
@@ -1,9 +1,11 @@
 import asyncio
+import datetime
 import nextcord
 from app.shared.interfaces.logging.api import get_bot_logger
+from app.bot.application.tasks.cleanup_engine import get_cleanup_engine
 logger = get_bot_logger()
-import datetime
-import pytz
+
+DM_CLEANUP_MAX_AGE = datetime.timedelta(hours=3)
 
 async def log_all_dm_channels(bot):
     """Protokolliert alle privaten DM-Kanäle des Bots."""
@@ -40,7 +42,8 @@ async def cleanup_dm_messages(bot):
         logger.info("Starte Bereinigung der DM-Nachrichten.")
         
         dm_channels = await log_all_dm_channels(bot)
-        current_time = datetime.datetime.now(pytz.utc)
+        engine = get_cleanup_engine()
+        deleted = 0
         
         for user_id, user_name, channel_id in dm_channels:
             try:
@@ -53,30 +56,17 @@ async def cleanup_dm_messages(bot):
                 continue
                 
             try:
-                async for message in channel.history(limit=None):
-                    if message.author.id != bot.user.id:
-                        continue  # Nur eigene Nachrichten löschen
-                    message_time = message.created_at.replace(tzinfo=pytz.utc)
-                    time_difference = current_time - message_time
-                    
-                    if time_difference.total_seconds() > 10800:  # 3 Stunden in Sekunden
-                        try:
-                            await message.delete()
-                            logger.debug(f"Gelöscht: {message.id} von {message.author} - Inhalt: {message.content}")
-                            await asyncio.sleep(0.75)  # Rate-Limit-Schutz
-                        except nextcord.NotFound:
-                            logger.warning(f"Nachricht {message.id} nicht gefunden, vermutlich bereits gelöscht.")
-                            continue
-                        except nextcord.Forbidden as e:
-                            logger.error(f"Löschen verboten: {e}")
-                            break
-                        except Exception as e:
-                            logger.error(f"Fehler beim Löschen der Nachricht {message.id}: {e}")
-                            await asyncio.sleep(2)
+                # Nur eigene Nachrichten löschen; ab dem zweiten Lauf nur der Verlauf seit der High-Water-Mark
+                result = await engine.cleanup_channel(
+                    channel,
+                    DM_CLEANUP_MAX_AGE,
+                    lambda message: message.author.id == bot.user.id,
+                )
+                deleted += result.deleted
             except Exception as e:
                 logger.error(f"Fehler beim Durchsuchen des Kanalverlaufs: {e}")
         
-        logger.info("Bereinigung der DMs abgeschlossen.")
+        logger.info(f"Bereinigung der DMs abgeschlossen, {deleted} Nachrichten gelöscht.")
     except Exception as e:
         logger.error(f"Fehler bei der Bereinigung der DMs: {e}")
 
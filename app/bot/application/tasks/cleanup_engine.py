@@ -0,0 +1,135 @@
+import datetime
+from functools import partial
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import nextcord
+
+from app.shared.interfaces.logging.api import get_bot_logger
+from app.bot.infrastructure.discord.rest_scheduler import get_rest_scheduler, rest_route, RequestPriority
+logger = get_bot_logger()
+
+# Discord lehnt Bulk-Deletes für Nachrichten älter als 14 Tage ab; kleiner Puffer für Uhrabweichungen
+BULK_DELETE_MAX_AGE = datetime.timedelta(days=14) - datetime.timedelta(minutes=5)
+BULK_DELETE_BATCH_SIZE = 100  # Discord-Maximum pro bulk-delete Request
+
+
+class CleanupResult(NamedTuple):
+    """Ergebnis eines Bereinigungslaufs für einen Kanal"""
+    scanned: int
+    bulk_deleted: int
+    single_deleted: int
+    failed: int
+
+    @property
+    def deleted(self) -> int:
+        return self.bulk_deleted + self.single_deleted
+
+
+class ChannelCleanupEngine:
+    """
+    Löscht Nachrichten, die älter als max_age sind und dem Prädikat entsprechen.
+
+    Der Verlauf wird vom ältesten Eintrag an gelesen (höchstens scan_limit
+    Nachrichten pro Lauf). Pro Kanal wird die höchste bereits durchsuchte
+    Nachrichten-ID gemerkt (High-Water-Mark); Folgeläufe lesen nur den Verlauf
+    danach, ein großer Rückstand wird so über mehrere Läufe abgearbeitet. Nachrichten
+    jünger als 14 Tage werden in Batches zu 100 per bulk-delete entfernt,
+    ältere (und alle in DMs, wo Bots kein bulk-delete dürfen) einzeln.
+    Alle Löschungen laufen mit CLEANUP-Priorität über den REST-Scheduler.
+    """
+
+    def __init__(self):
+        self._high_water_marks: Dict[int, int] = {}
+
+    def high_water_mark(self, channel_id: int) -> Optional[int]:
+        return self._high_water_marks.get(channel_id)
+
+    def reset(self, channel_id: Optional[int] = None) -> None:
+        """Vergisst die High-Water-Mark eines Kanals (oder aller), der nächste Lauf liest wieder den ganzen Verlauf."""
+        if channel_id is None:
+            self._high_water_marks.clear()
+        else:
+            self._high_water_marks.pop(channel_id, None)
+
+    async def cleanup_channel(self,
+                              channel: nextcord.abc.Messageable,
+                              max_age: datetime.timedelta,
+                              predicate: Callable[[nextcord.Message], bool],
+                              scan_limit: Optional[int] = None) -> CleanupResult:
+        now = nextcord.utils.utcnow()
+        # Oldest first, so a scan cut off by scan_limit continues at the mark next time
+        # instead of skipping everything older than the first window
+        history_kwargs = {"limit": scan_limit, "before": now - max_age, "oldest_first": True}
+        high_water_mark = self._high_water_marks.get(channel.id)
+        if high_water_mark:
+            history_kwargs["after"] = nextcord.Object(id=high_water_mark)
+
+        can_bulk_delete = isinstance(channel, nextcord.abc.GuildChannel) and hasattr(channel, "delete_messages")
+        bulk_cutoff = now - BULK_DELETE_MAX_AGE
+        bulk: List[nextcord.Message] = []
+        single: List[nextcord.Message] = []
+        newest_seen = high_water_mark or 0
+        scanned = 0
+
+        async for message in channel.history(**history_kwargs):
+            scanned += 1
+            newest_seen = max(newest_seen, message.id)
+            if not predicate(message):
+                continue
+            if can_bulk_delete and message.created_at > bulk_cutoff:
+                bulk.append(message)
+            else:
+                single.append(message)
+
+        bulk_deleted = 0
+        for start in range(0, len(bulk), BULK_DELETE_BATCH_SIZE):
+            batch = bulk[start:start + BULK_DELETE_BATCH_SIZE]
+            try:
+                await get_rest_scheduler().submit(
+                    partial(channel.delete_messages, batch),
+                    rest_route("POST", "/channels/{channel_id}/messages/bulk-delete", channel.id),
+                    RequestPriority.CLEANUP,
+                )
+                bulk_deleted += len(batch)
+            except nextcord.Forbidden as e:
+                logger.error(f"Bulk-Delete in Kanal {channel.id} verboten: {e}")
+                return CleanupResult(scanned, bulk_deleted, 0, len(bulk) - bulk_deleted + len(single))
+            except nextcord.HTTPException as e:
+                # z.B. eine Nachricht wurde inzwischen gelöscht: Batch einzeln nachholen
+                logger.warning(f"Bulk-Delete in Kanal {channel.id} fehlgeschlagen ({e}), lösche {len(batch)} Nachrichten einzeln.")
+                single.extend(batch)
+
+        single_deleted = 0
+        failed = 0
+        for message in single:
+            try:
+                await get_rest_scheduler().submit(
+                    message.delete,
+                    rest_route("DELETE", "/channels/{channel_id}/messages/{message_id}", channel.id),
+                    RequestPriority.CLEANUP,
+                )
+                single_deleted += 1
+            except nextcord.NotFound:
+                logger.debug("Nachricht %s nicht gefunden, vermutlich bereits gelöscht.", message.id)
+            except nextcord.Forbidden as e:
+                logger.error(f"Löschen in Kanal {channel.id} verboten: {e}")
+                return CleanupResult(scanned, bulk_deleted, single_deleted, failed + 1)
+            except Exception as e:
+                logger.error(f"Fehler beim Löschen der Nachricht {message.id}: {e}")
+                failed += 1
+
+        # Nur bei vollständig verarbeitetem Lauf weiterrücken, sonst wird der Bereich erneut gelesen
+        if newest_seen and not failed:
+            self._high_water_marks[channel.id] = newest_seen
+        return CleanupResult(scanned, bulk_deleted, single_deleted, failed)
+
+
+# Singleton instance
+_cleanup_engine = None
+
+def get_cleanup_engine() -> ChannelCleanupEngine:
+    """Returns the bot-wide channel cleanup engine."""
+    global _cleanup_engine
+    if _cleanup_engine is None:
+        _cleanup_engine = ChannelCleanupEngine()
+    return _cleanup_engine
@@ -1,9 +1,21 @@
 import asyncio
-import nextcord
+import datetime
+from functools import partial
 from app.shared.interfaces.logging.api import get_bot_logger
+from app.bot.application.tasks.cleanup_engine import get_cleanup_engine
 logger = get_bot_logger()
-import datetime
-import pytz
+
+CLEANUP_MAX_AGE = datetime.timedelta(hours=3)
+CLEANUP_SCAN_LIMIT = 200  # Nachrichten pro Lauf, älteste zuerst ab der High-Water-Mark
+
+
+def _is_cleanup_candidate(bot, message) -> bool:
+    """Nachrichten des Bots sowie Befehle ("!" / "/") und Antworten darauf"""
+    return (message.author.id == bot.user.id
+            or message.content.startswith('!')
+            or message.content.startswith('/')
+            or message.reference is not None)
+
 
 async def cleanup_homelab_channel(bot, channel_id):
     """Bereinigt den Homelab-Channel, indem Befehle und deren Antworten gelöscht werden, die älter als 3 Stunden sind."""
@@ -11,30 +23,16 @@ async def cleanup_homelab_channel(bot, channel_id):
         channel = bot.get_channel(channel_id)
         if channel:
             logger.info(f"Starte Bereinigung des Kanals {channel_id}.")
-            
-            # Holen von Nachrichten aus dem Channel (letzte 200 Nachrichten)
-            messages = await channel.history(limit=200).flatten()
-            current_time = datetime.datetime.now(pytz.utc)  # Aktuelle Zeit in UTC (offset-aware)
-
-            for message in messages:
-                # Berechne die Differenz in Stunden zwischen der Nachricht und der aktuellen Zeit
-                message_time = message.created_at.replace(tzinfo=pytz.utc)  # Sicherstellen, dass der Zeitstempel offset-aware ist
-                time_difference = current_time - message_time
-                hours_diff = time_difference.total_seconds() / 3600  # In Stunden umwandeln
-
-                if hours_diff > 3:  # Wenn die Nachricht älter als 3 Stunden ist
-                    bot_user_id = bot.user.id
-                    if message.author.id == bot_user_id:
-                        # Nur Nachrichten vom Bot löschen
-                        await message.delete()
-                        logger.debug(f"Gelöscht: {message.id} von {message.author} - Inhalt: {message.content}")
-
-                    # Lösche Nachrichten, die mit "!" und "/" beginnen (Befehle) oder Antworten darauf
-                    if message.content.startswith('!') or message.content.startswith('/') or message.reference:
-                        await message.delete()
-                        logger.debug(f"Gelöscht: {message.id} von {message.author} - Inhalt: {message.content}")
-
-            logger.info("Bereinigung abgeschlossen.")
+
+            result = await get_cleanup_engine().cleanup_channel(
+                channel,
+                CLEANUP_MAX_AGE,
+                partial(_is_cleanup_candidate, bot),
+                scan_limit=CLEANUP_SCAN_LIMIT,
+            )
+
+            logger.info(f"Bereinigung abgeschlossen: {result.scanned} Nachrichten geprüft, "
+                        f"{result.bulk_deleted} per Bulk-Delete und {result.single_deleted} einzeln gelöscht, {result.failed} Fehler.")
         else:
             logger.error(f"Channel mit ID {channel_id} konnte nicht gefunden werden.")
     except Exception as e:
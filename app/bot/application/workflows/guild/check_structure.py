@@ -1,9 +1,11 @@
 import logging
+from functools import partial
 from typing import Dict, List, Optional
 import nextcord
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.shared.interfaces.logging.api import get_bot_logger
 from app.shared.infrastructure.models.discord.entities import GuildConfigEntity
+from app.bot.infrastructure.discord.rest_scheduler import get_rest_scheduler, rest_route, RequestPriority
 from app.shared.domain.repositories.guild_templates import (
     GuildTemplateCategoryPermissionRepository,
     GuildTemplateChannelPermissionRepository
@@ -40,10 +42,15 @@ async def check_and_create_category(
     # --- Proceed with Creation Logic ---
     logger.info(f"[GuildWorkflow]     Category '{template_cat.category_name}' does not appear to exist by name server-wide. Proceeding with creation...")
     try:
-        new_discord_cat = await discord_guild.create_category(
-            name=template_cat.category_name,
-            overwrites=creation_overwrites,
-            reason=f"Applying template: {template_name}"
+        new_discord_cat = await get_rest_scheduler().submit(
+            partial(
+                discord_guild.create_category,
+                name=template_cat.category_name,
+                overwrites=creation_overwrites,
+                reason=f"Applying template: {template_name}"
+            ),
+            rest_route("POST", "/guilds/{guild_id}/channels", discord_guild.id),
+            RequestPriority.TEMPLATE,
         )
         logger.info(f"[GuildWorkflow]       Successfully created category '{new_discord_cat.name}' (ID: {new_discord_cat.id}) at position {new_discord_cat.position}")
         return new_discord_cat
@@ -131,7 +138,11 @@ async def check_and_create_channel(
 
     # Create the channel
     try:
-        new_discord_chan = await channel_creator(**creation_kwargs)
+        new_discord_chan = await get_rest_scheduler().submit(
+            partial(channel_creator, **creation_kwargs),
+            rest_route("POST", "/guilds/{guild_id}/channels", discord_guild.id),
+            RequestPriority.TEMPLATE,
+        )
         logger.info(f"[GuildWorkflow]       Successfully created {template_chan.channel_type} channel '{new_discord_chan.name}' (ID: {new_discord_chan.id})")
         return new_discord_chan # Return the created channel object
 
@@ -138,12 +138,12 @@ async def sync_guild(self, guild_id: str, sync_members_only: bool = True) -> boo
                 await guild_repo.update(db_guild) # Use update for existing entity
                 logger.info(f"[GuildWorkflow] [Guild:{guild_id}] Updated guild metadata.")
                 
-            # Sync members if user_workflow exists
+            # Sync members if user_workflow exists (skipped if the member hash is unchanged)
             user_workflow = self.bot.workflow_manager.get_workflow("user")
             if user_workflow:
-                logger.debug(f"[GuildWorkflow] [Guild:{guild_id}] Calling UserWorkflow.sync_guild_members...")
-                await user_workflow.sync_guild_members(discord_guild)
-                logger.debug(f"[GuildWorkflow] [Guild:{guild_id}] UserWorkflow.sync_guild_members finished.")
+                logger.debug(f"[GuildWorkflow] [Guild:{guild_id}] Calling UserWorkflow.reconcile_guild_members...")
+                await user_workflow.reconcile_guild_members(discord_guild)
+                logger.debug(f"[GuildWorkflow] [Guild:{guild_id}] UserWorkflow.reconcile_guild_members finished.")
             else:
                 logger.warning(f"[GuildWorkflow] [Guild:{guild_id}] User workflow not available for member sync")
             logger.info(f"[GuildWorkflow] [Guild:{guild_id}] Sync successful (members_only={sync_members_only}).")
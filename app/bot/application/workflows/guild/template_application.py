@@ -1,4 +1,5 @@
 import logging
+from functools import partial
 from typing import Dict, List, Optional
 import nextcord
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,6 +23,7 @@ from app.shared.infrastructure.repositories.guild_templates.guild_template_chann
 from app.shared.infrastructure.repositories.dashboards.dashboard_configuration_repository_impl import DashboardConfigurationRepositoryImpl
 from app.bot.application.services.discord.discord_query_service import DiscordQueryService
 from app.bot.application.services.dashboard.dashboard_lifecycle_service import DashboardLifecycleService # Import Lifecycle Service
+from app.bot.infrastructure.discord.rest_scheduler import get_rest_scheduler, rest_route, RequestPriority
 
 logger = get_bot_logger()
 
@@ -125,7 +127,11 @@ async def apply_template(self, guild_id: str, config: GuildConfigEntity, session
                 if updates_needed:
                     try:
                         logger.info(f"[GuildWorkflow] [Guild:{guild_id}]       Updating category '{existing_discord_cat_object.name}' ({existing_discord_cat_object.id}) with changes: {updates_needed}")
-                        await existing_discord_cat_object.edit(**updates_needed, reason="Applying template updates")
+                        await get_rest_scheduler().submit(
+                            partial(existing_discord_cat_object.edit, **updates_needed, reason="Applying template updates"),
+                            rest_route("PATCH", "/channels/{channel_id}", existing_discord_cat_object.id),
+                            RequestPriority.TEMPLATE,
+                        )
                         logger.debug(f"[GuildWorkflow] [Guild:{guild_id}]         Successfully updated category.")
                     except nextcord.Forbidden:
                         logger.error(f"[GuildWorkflow] [Guild:{guild_id}]         PERMISSION ERROR updating category '{existing_discord_cat_object.name}'.")
@@ -284,7 +290,11 @@ async def apply_template(self, guild_id: str, config: GuildConfigEntity, session
                 if updates_needed:
                     try:
                         logger.info(f"[GuildWorkflow] [Guild:{guild_id}]       Updating channel '{existing_discord_chan_object.name}' ({existing_discord_chan_object.id}) with changes: {list(updates_needed.keys())}") # Log keys only for brevity
-                        await existing_discord_chan_object.edit(**updates_needed, reason="Applying template updates")
+                        await get_rest_scheduler().submit(
+                            partial(existing_discord_chan_object.edit, **updates_needed, reason="Applying template updates"),
+                            rest_route("PATCH", "/channels/{channel_id}", existing_discord_chan_object.id),
+                            RequestPriority.TEMPLATE,
+                        )
                         logger.debug(f"[GuildWorkflow] [Guild:{guild_id}]         Successfully updated channel.")
                     except nextcord.Forbidden:
                         logger.error(f"[GuildWorkflow] [Guild:{guild_id}]         PERMISSION ERROR updating channel '{existing_discord_chan_object.name}'.")
@@ -408,7 +418,11 @@ async def apply_template(self, guild_id: str, config: GuildConfigEntity, session
                 if channel_to_delete and not isinstance(channel_to_delete, nextcord.CategoryChannel): # Make sure not to delete categories here
                     logger.warning(f"[GuildWorkflow] [Guild:{guild_id}]     Discord channel '{chan_name_for_log}' (ID: {discord_chan_id}, Type: {channel_to_delete.type}) is not in the template. Deleting...")
                     try:
-                        await channel_to_delete.delete(reason="Removing channel not defined in template")
+                        await get_rest_scheduler().submit(
+                            partial(channel_to_delete.delete, reason="Removing channel not defined in template"),
+                            rest_route("DELETE", "/channels/{channel_id}", discord_chan_id),
+                            RequestPriority.TEMPLATE,
+                        )
                         logger.info(f"[GuildWorkflow] [Guild:{guild_id}]       Successfully deleted channel '{chan_name_for_log}'.")
                     except nextcord.Forbidden:
                         logger.error(f"[GuildWorkflow] [Guild:{guild_id}]       PERMISSION ERROR: Cannot delete channel '{chan_name_for_log}'.")
@@ -447,7 +461,11 @@ async def apply_template(self, guild_id: str, config: GuildConfigEntity, session
                     if not category_to_delete.channels: 
                         logger.warning(f"[GuildWorkflow] [Guild:{guild_id}]     Discord category '{cat_name_for_log}' (ID: {discord_cat_id}) is not in the template and is empty. Deleting...")
                         try:
-                            await category_to_delete.delete(reason="Removing category not defined in template")
+                            await get_rest_scheduler().submit(
+                                partial(category_to_delete.delete, reason="Removing category not defined in template"),
+                                rest_route("DELETE", "/channels/{channel_id}", discord_cat_id),
+                                RequestPriority.TEMPLATE,
+                            )
                             logger.info(f"[GuildWorkflow] [Guild:{guild_id}]       Successfully deleted category '{cat_name_for_log}'.")
                         except nextcord.Forbidden:
                             logger.error(f"[GuildWorkflow] [Guild:{guild_id}]       PERMISSION ERROR: Cannot delete category '{cat_name_for_log}'.")
@@ -550,7 +568,11 @@ async def _apply_category_permissions(self, discord_category: nextcord.CategoryC
         if overwrites_to_apply: # Only edit if there are permissions to apply
                 # --- MODIFICATION: Standardize prefix ---
                 logger.info(f"{log_prefix}[GuildWorkflow] Setting {len(overwrites_to_apply)} permission overwrites for category '{discord_category.name}'")
-                await discord_category.edit(overwrites=overwrites_to_apply, reason="Applying template permissions")
+                await get_rest_scheduler().submit(
+                    partial(discord_category.edit, overwrites=overwrites_to_apply, reason="Applying template permissions"),
+                    rest_route("PATCH", "/channels/{channel_id}", discord_category.id),
+                    RequestPriority.TEMPLATE,
+                )
                 # --- MODIFICATION: Standardize prefix ---
                 logger.debug(f"{log_prefix}[GuildWorkflow]  Successfully applied permissions to category '{discord_category.name}'.")
         # else: # Already logged by helper
@@ -591,7 +613,11 @@ async def _apply_channel_permissions(
         if overwrites_to_apply:
                 # --- MODIFICATION: Standardize prefix ---
                 logger.info(f"{log_prefix}[GuildWorkflow] Setting {len(overwrites_to_apply)} permission overwrites for channel '{discord_channel.name}'")
-                await discord_channel.edit(overwrites=overwrites_to_apply, reason="Applying template permissions")
+                await get_rest_scheduler().submit(
+                    partial(discord_channel.edit, overwrites=overwrites_to_apply, reason="Applying template permissions"),
+                    rest_route("PATCH", "/channels/{channel_id}", discord_channel.id),
+                    RequestPriority.TEMPLATE,
+                )
                 # --- MODIFICATION: Standardize prefix ---
                 logger.debug(f"{log_prefix}[GuildWorkflow] Successfully applied permissions to channel '{discord_channel.name}'.")
         # else: # Logged by helper
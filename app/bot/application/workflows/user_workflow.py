@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Dict, Optional
 import logging
 from nextcord import Guild, Member
 from app.shared.infrastructure.models.discord.entities.guild_user_entity import DiscordGuildUserEntity
@@ -8,6 +8,8 @@ from app.shared.interfaces.logging.api import get_bot_logger
 from sqlalchemy import select
 from app.shared.infrastructure.database.session import session_context
 from app.shared.infrastructure.repositories.auth.user_repository_impl import UserRepositoryImpl
+from app.bot.infrastructure.config.constants import MEMBER_SYNC_CHUNK_SIZE
+from app.bot.application.services.member_sync import MemberSyncService, member_payload
 
 logger = get_bot_logger()
 
@@ -24,6 +26,12 @@ class UserWorkflow(BaseWorkflow):
         
         # This workflow doesn't require guild approval to sync members
         self.requires_guild_approval = False
+        
+        # Incremental sync of member events; full syncs only for changed guilds
+        self.member_sync = MemberSyncService(
+            full_sync=self.sync_guild_members,
+            guild_lookup=bot.get_guild if bot else None
+        )
     
     async def initialize(self) -> bool:
         """Initialize the user workflow globally"""
@@ -34,8 +42,12 @@ class UserWorkflow(BaseWorkflow):
             if hasattr(self, 'bot') and self.bot:
                 for guild in self.bot.guilds:
                     self.guild_status[str(guild.id)] = WorkflowStatus.PENDING
-                    # Sync users immediately for all guilds
-                    await self.sync_guild_members(guild)
+                # Full sync only for guilds whose members changed since the last sync
+                summary = await self.member_sync.reconcile_all(self.bot.guilds)
+                logger.debug(
+                    f"Member reconciliation on startup: {summary['synced']} synced, "
+                    f"{summary['skipped']} unchanged, {summary['failed']} failed"
+                )
             
             logger.debug("User workflow initialized successfully")
             return True
@@ -63,7 +75,7 @@ class UserWorkflow(BaseWorkflow):
                 return False
             
             # Sync guild members regardless of approval status
-            await self.sync_guild_members(guild)
+            await self.reconcile_guild_members(guild)
             
             # Mark as active
             self.guild_status[guild_id] = WorkflowStatus.ACTIVE
@@ -109,8 +121,17 @@ class UserWorkflow(BaseWorkflow):
         except Exception as e:
             logger.error(f"Error synchronizing guild {guild.name} to database: {e}")
 
-    async def sync_guild_members(self, guild: Guild) -> None:
-        """Sync all members from a guild to the database"""
+    async def sync_guild_members(self, guild: Guild) -> Optional[Dict[str, int]]:
+        """Sync all members from a guild to the database in bulk.
+
+        Members are upserted in chunks of MEMBER_SYNC_CHUNK_SIZE with
+        INSERT ... ON CONFLICT, so a sync costs a few statements per chunk
+        instead of several round-trips and a commit per member.
+
+        Returns:
+            Counts of inserted, updated and unchanged users (plus guild links
+            added and removed, skipped bots and errors), or None if the sync failed.
+        """
         try:
             # First sync the guild itself
             await self.sync_guild_to_database(guild)
@@ -118,54 +139,61 @@ class UserWorkflow(BaseWorkflow):
             members = guild.members
             logger.debug(f"[Guild:{guild.id}] Starting sync of {len(members)} members from guild {guild.name}")
             
-            synced_count = 0
+            members_data = []
             skipped_count = 0
-            error_count = 0
+            for member in members:
+                payload = member_payload(member)
+                if payload is None:
+                    skipped_count += 1
+                    continue
+                members_data.append(payload)
             
             async with session_context() as session:
                  # Instantiate repo inside session
                  user_repo = UserRepositoryImpl(session)
-                 for member in members:
-                     try:             
-                         user_data = {
-                             'discord_id': member.id,
-                             'username': member.name,
-                             'discriminator': member.discriminator,
-                             'guild_id': str(guild.id),  # Convert to string for consistency
-                             'is_bot': member.bot,
-                             'joined_at': member.joined_at,
-                             'nickname': member.nick,
-                             'avatar': str(member.avatar.url) if member.avatar else "https://cdn.discordapp.com/embed/avatars/0.png"
-                         }
-                         
-                         if member.bot:
-                             skipped_count += 1
-                             continue
-                         
-                         await user_repo.create_or_update(user_data)
-                         synced_count += 1
-                         
-                     except Exception as e:
-                         error_count += 1
-                         logger.error(f"[Guild:{guild.id}] Failed to sync member {member.name} (ID: {member.id}): {e}", exc_info=True)
-                         continue
+                 stats = await user_repo.bulk_upsert_guild_members(
+                     str(guild.id), members_data, chunk_size=MEMBER_SYNC_CHUNK_SIZE
+                 )
+                 # Drop links of members that left; only with a complete member list
+                 if guild.chunked:
+                     stats['guild_links_removed'] = await user_repo.remove_departed_guild_members(
+                         str(guild.id), [member.id for member in members]
+                     )
+                 else:
+                     stats['guild_links_removed'] = 0
+                     logger.warning(f"[Guild:{guild.id}] Member list incomplete, not removing departed members")
+            stats['skipped_bots'] = skipped_count
             
             # Log final statistics
-            logger.debug(f"[Guild:{guild.id}] Guild {guild.name} sync complete:")
-            logger.debug(f"[Guild:{guild.id}] - Total members processed: {len(members)}")
-            logger.debug(f"[Guild:{guild.id}] - Successfully synced: {synced_count}")
-            logger.debug(f"[Guild:{guild.id}] - Skipped (bots): {skipped_count}")
-            logger.debug(f"[Guild:{guild.id}] - Errors: {error_count}")
+            logger.info(
+                f"[Guild:{guild.id}] Member sync for {guild.name}: {len(members)} members, "
+                f"{stats['inserted']} inserted, {stats['updated']} updated, {stats['unchanged']} unchanged, "
+                f"{stats['guild_links_added']} guild links added, {stats['guild_links_removed']} removed, "
+                f"{skipped_count} bots skipped, {stats['errors']} errors"
+            )
+            return stats
             
         except Exception as e:
             logger.error(f"[Guild:{guild.id}] Failed to sync members for guild {guild.name}: {e}", exc_info=True)
+            return None
+
+    async def reconcile_guild_members(self, guild: Guild, force: bool = False) -> Optional[Dict[str, int]]:
+        """Runs sync_guild_members only if the guild's member hash differs from the stored one.
+
+        Returns:
+            The sync statistics, {'skipped': True} if the members are unchanged,
+            or None if the sync failed.
+        """
+        return await self.member_sync.reconcile_guild(guild, force=force)
 
     async def cleanup_guild(self, guild_id: str) -> None:
         """Cleanup resources for a specific guild"""
         logger.info(f"Cleaning up user workflow for guild {guild_id}")
+        self.member_sync.forget_guild(guild_id)
         await super().cleanup_guild(guild_id)
 
     async def cleanup(self) -> None:
         """Cleanup all resources"""
         logger.info("Cleaning up user workflow")
+        await self.member_sync.close()
         await super().cleanup() 
\ No newline at end of file
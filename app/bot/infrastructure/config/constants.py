@@ -14,6 +14,24 @@ UPDATE_INTERVAL_LONG = 1800      # 30 Minuten für ressourcenschonende Updates
 # Standardwert aus Umgebungsvariable oder Fallback
 DEFAULT_UPDATE_INTERVAL = int(os.getenv('STATUS_UPDATE_INTERVAL', UPDATE_INTERVAL_MEDIUM))
 
+# ===== DASHBOARD-REFRESH KONFIGURATION =====
+# Standard-Intervall pro Dashboard (überschreibbar via config['metadata']['refresh_interval'])
+DASHBOARD_REFRESH_INTERVAL = int(os.getenv('DASHBOARD_REFRESH_INTERVAL', 60))
+# Maximale Anzahl parallel aktualisierter Dashboards
+DASHBOARD_REFRESH_CONCURRENCY = int(os.getenv('DASHBOARD_REFRESH_CONCURRENCY', 10))
+# Zufälliger Versatz (Sekunden), damit nicht alle Dashboards im selben Tick fällig werden
+DASHBOARD_REFRESH_JITTER = float(os.getenv('DASHBOARD_REFRESH_JITTER', 5))
+# Wie oft der Scheduler nach fälligen Dashboards sucht
+DASHBOARD_REFRESH_TICK = 5  # Sekunden
+
+# ===== DISCORD-REST-SCHEDULER KONFIGURATION =====
+# Maximale Anzahl gleichzeitig laufender Discord-API-Aufrufe
+DISCORD_REST_CONCURRENCY = int(os.getenv('DISCORD_REST_CONCURRENCY', 8))
+# Globales Discord-Limit (Requests pro Sekunde über alle Routen)
+DISCORD_GLOBAL_RATE_LIMIT = float(os.getenv('DISCORD_GLOBAL_RATE_LIMIT', 50))
+# Wie oft ein Aufruf nach einem 429 erneut eingeplant wird
+DISCORD_REST_MAX_RETRIES = 3
+
 # Retry-Konfiguration für fehlgeschlagene Updates
 MAX_RETRY_ATTEMPTS = 3
 RETRY_DELAY = 10  # Sekunden
@@ -92,6 +110,16 @@ FIREWALL_FALLBACK_COMMANDS = [
     "firewall-cmd --state | grep -q 'running'"
 ]
 
+# ===== MITGLIEDER-SYNC =====
+# Anzahl Mitglieder pro INSERT ... ON CONFLICT Statement (und pro Commit)
+MEMBER_SYNC_CHUNK_SIZE = int(os.getenv('MEMBER_SYNC_CHUNK_SIZE', 1000))
+# Sekunden, die Member-Events gesammelt werden, bevor sie gebündelt geschrieben werden
+MEMBER_SYNC_DEBOUNCE = float(os.getenv('MEMBER_SYNC_DEBOUNCE', 5))
+# Ab so vielen wartenden Änderungen wird sofort geschrieben
+MEMBER_SYNC_MAX_BATCH = int(os.getenv('MEMBER_SYNC_MAX_BATCH', 500))
+# Intervall (Sekunden) des Abgleichs; synchronisiert nur Guilds mit geändertem Mitglieder-Hash
+MEMBER_RECONCILE_INTERVAL = int(os.getenv('MEMBER_RECONCILE_INTERVAL', 3600))
+
 # ===== LOGGING-KONFIGURATION =====
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
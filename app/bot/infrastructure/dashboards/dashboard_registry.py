@@ -10,6 +10,8 @@ from app.bot.interfaces.dashboards.components.base_component import BaseComponen
 # from app.bot.infrastructure.config.registries.component_registry import ComponentRegistry # Removed
 # from app.bot.infrastructure.factories.service_factory import ServiceFactory # Removed
 from nextcord.ext import tasks
+from app.bot.infrastructure.dashboards.refresh_scheduler import DashboardRefreshScheduler
+from app.bot.infrastructure.config.constants import DASHBOARD_REFRESH_TICK
 
 # Interface Imports
 from app.bot.application.interfaces.bot import Bot as BotInterface
@@ -25,7 +27,7 @@ class DashboardRegistry:
         bot_id = getattr(bot.user, 'id', 'N/A')
         has_factory = hasattr(bot, 'service_factory')
         factory_type = type(getattr(bot, 'service_factory', None)).__name__
-        logger.debug(f"[DEBUG registry.__init__] Received bot. Bot ID: {bot_id}, Has service_factory: {has_factory}, Factory Type: {factory_type}")
+        logger.debug("[DEBUG registry.__init__] Received bot. Bot ID: %s, Has service_factory: %s, Factory Type: %s", bot_id, has_factory, factory_type)
         # -------------------------
         self.active_dashboards: Dict[int, DashboardController] = {}  # channel_id -> dashboard controller
         self.dashboard_types: Dict[str, Type[DashboardController]] = {}  # Maps type string to controller class (adjust if needed)
@@ -45,6 +47,7 @@ class DashboardRegistry:
             
         self.initialized = False
         self.logger = logger
+        self.refresh_scheduler = DashboardRefreshScheduler()
         self._refresh_active_dashboards_loop.start()
         
     async def initialize(self):
@@ -86,6 +89,7 @@ class DashboardRegistry:
                 
                 # Remove from registry
                 del self.active_dashboards[ch_id]
+                self.refresh_scheduler.forget(ch_id)
                 
                 self.logger.info(f"Deactivated dashboard in channel {ch_id}")
                 
@@ -105,16 +109,17 @@ class DashboardRegistry:
                                            dashboard_type: str,
                                            config_data: Dict[str, Any],
                                            active_dashboard_id: int, # ID of the ActiveDashboardEntity
-                                           message_id: Optional[str] # Message ID from ActiveDashboardEntity
+                                           message_id: Optional[str], # Message ID from ActiveDashboardEntity
+                                           render_hash: Optional[str] = None # Render fingerprint stored with message_id
                                            ) -> bool:
         """Ensures a dashboard controller is active for the channel, using the provided configuration."""
 
-        logger.debug(f"[Activate/Update AD_ID:{active_dashboard_id} Ch:{channel_id}] Ensuring controller is active for type '{dashboard_type}'.")
+        logger.debug("[Activate/Update AD_ID:%s Ch:%s] Ensuring controller is active for type '%s'.", active_dashboard_id, channel_id, dashboard_type)
         # --- Corrected DEBUG LOG ---
         bot_id = getattr(self.bot.user, 'id', 'N/A')
         has_factory = hasattr(self.bot, 'service_factory')
         factory_type = type(getattr(self.bot, 'service_factory', None)).__name__
-        logger.debug(f"[DEBUG registry.activate] Using self.bot. Bot ID: {bot_id}, Has service_factory: {has_factory}, Factory Type: {factory_type}")
+        logger.debug("[DEBUG registry.activate] Using self.bot. Bot ID: %s, Has service_factory: %s, Factory Type: %s", bot_id, has_factory, factory_type)
         # -------------------------
 
         # Check if channel exists on Discord
@@ -130,12 +135,13 @@ class DashboardRegistry:
         existing_controller: Optional[DashboardController] = self.active_dashboards.get(channel_id)
 
         if existing_controller:
-            logger.debug(f"[Activate/Update AD_ID:{active_dashboard_id} Ch:{channel_id}] Controller already exists. Updating...")
+            logger.debug("[Activate/Update AD_ID:%s Ch:%s] Controller already exists. Updating...", active_dashboard_id, channel_id)
             try:
                 # Update existing controller's state
                 existing_controller.dashboard_id = active_dashboard_id # Update with ActiveDashboardEntity ID
                 existing_controller.dashboard_type = dashboard_type
                 existing_controller.message_id = message_id
+                existing_controller.render_hash = render_hash
                 existing_controller.config = config_data # Update config
                 # Get title/description from config_data or use defaults
                 existing_controller.title = config_data.get('metadata', {}).get('title', dashboard_type.replace('_', ' ').title())
@@ -143,14 +149,16 @@ class DashboardRegistry:
 
                 # Trigger a redisplay which should use the latest config/data
                 await existing_controller.display_dashboard()
-                logger.debug(f"[Activate/Update AD_ID:{active_dashboard_id} Ch:{channel_id}] Successfully updated and redisplayed dashboard.")
+                # Interval may have changed with the new config
+                self.refresh_scheduler.schedule(channel_id, existing_controller)
+                logger.debug("[Activate/Update AD_ID:%s Ch:%s] Successfully updated and redisplayed dashboard.", active_dashboard_id, channel_id)
                 return True
             except Exception as e:
                 logger.error(f"[Activate/Update AD_ID:{active_dashboard_id} Ch:{channel_id}] Error updating existing controller: {e}", exc_info=True)
                 # TODO: Potentially set error state in ActiveDashboardEntity?
                 return False
         else:
-            logger.debug(f"[Activate/Update AD_ID:{active_dashboard_id} Ch:{channel_id}] No existing controller. Activating new one...")
+            logger.debug("[Activate/Update AD_ID:%s Ch:%s] No existing controller. Activating new one...", active_dashboard_id, channel_id)
             try:
                 # Fetch data_service from self.service_factory
                 data_service = None
@@ -166,7 +174,7 @@ class DashboardRegistry:
 
                 # ADDED CHECK AND INITIALIZATION CALL
                 if not hasattr(data_service, 'initialized') or not data_service.initialized:
-                    logger.debug(f"[Activate/Update AD_ID:{active_dashboard_id} Ch:{channel_id}] Initializing DashboardDataService as it's not initialized.")
+                    logger.debug("[Activate/Update AD_ID:%s Ch:%s] Initializing DashboardDataService as it's not initialized.", active_dashboard_id, channel_id)
                     await data_service.initialize()
 
                 # Create dashboard controller using the new parameters
@@ -179,6 +187,7 @@ class DashboardRegistry:
                     dashboard_type=dashboard_type,
                     guild_id=guild_id,
                     message_id=message_id,
+                    render_hash=render_hash,
                     config=config_data,
                     title=title,
                     description=description,
@@ -204,11 +213,11 @@ class DashboardRegistry:
                 else:
                     # Update the controller's message_id with the actual ID from the newly created message
                     controller.message_id = str(msg_object.id)
-                    logger.debug(f"[Activate/Update AD_ID:{active_dashboard_id} Ch:{channel_id}] Dashboard displayed successfully. Message ID: {controller.message_id}")
+                    logger.debug("[Activate/Update AD_ID:%s Ch:%s] Dashboard displayed successfully. Message ID: %s", active_dashboard_id, channel_id, controller.message_id)
 
                 # Register in active dashboards
                 self.active_dashboards[channel_id] = controller
-                logger.debug(f"[Activate/Update AD_ID:{active_dashboard_id} Ch:{channel_id}] Activated '{dashboard_type}' dashboard.")
+                logger.debug("[Activate/Update AD_ID:%s Ch:%s] Activated '%s' dashboard.", active_dashboard_id, channel_id, dashboard_type)
                 return True
 
             except Exception as e:
@@ -223,33 +232,21 @@ class DashboardRegistry:
                 return controller
         return None
 
+    async def shutdown(self) -> None:
+        """Stops the refresh loop and waits for running refreshes to be cancelled."""
+        self._refresh_active_dashboards_loop.cancel()
+        await self.refresh_scheduler.shutdown()
+
     # --- Background Refresh Task ---
-    @tasks.loop(seconds=60) # Refresh every 60 seconds
+    @tasks.loop(seconds=DASHBOARD_REFRESH_TICK) # Check for due dashboards every tick
     async def _refresh_active_dashboards_loop(self):
-        """Periodically refresh all active dashboards."""
-        active_dashboard_ids = list(self.active_dashboards.keys())
-        if not active_dashboard_ids:
-            # logger.debug("No active dashboards in registry to refresh.")
+        """Starts refreshes for all active dashboards whose interval has elapsed."""
+        if not self.active_dashboards:
             return
-            
-        logger.debug(f"Registry: Starting refresh cycle for {len(active_dashboard_ids)} active dashboards...")
-        refreshed_count = 0
-        failed_count = 0
-        
-        for channel_id, controller in list(self.active_dashboards.items()): # Use list() for safe iteration
-            try:
-                logger.debug(f"Registry: Refreshing dashboard in channel {channel_id} (Controller: {controller})...")
-                await controller.refresh_data() # Fetch new data
-                await controller.display_dashboard() # Update the message
-                refreshed_count += 1
-                logger.debug(f"Registry: Successfully refreshed dashboard in channel {channel_id}.")
-            except Exception as e:
-                failed_count += 1
-                logger.error(f"Registry: Error refreshing dashboard in channel {channel_id} during loop: {e}", exc_info=True)
-                # Optionally, consider deactivating the controller here if it fails repeatedly
-                
-        if refreshed_count > 0 or failed_count > 0:
-            logger.debug(f"Registry: Finished refresh cycle. Refreshed: {refreshed_count}, Failed: {failed_count}/{len(active_dashboard_ids)}")
+        try:
+            self.refresh_scheduler.tick(self.active_dashboards)
+        except Exception as e:
+            logger.error(f"Registry: Error scheduling dashboard refreshes: {e}", exc_info=True)
             
     @_refresh_active_dashboards_loop.before_loop
     async def before_refresh_loop(self):
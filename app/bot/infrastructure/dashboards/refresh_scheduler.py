@@ -0,0 +1,134 @@
+# app/bot/infrastructure/dashboards/refresh_scheduler.py
+import asyncio
+import random
+import time
+from typing import Dict, Any, Optional, Callable
+
+from app.shared.interfaces.logging.api import get_bot_logger
+from app.bot.infrastructure.config.constants import (
+    DASHBOARD_REFRESH_INTERVAL,
+    DASHBOARD_REFRESH_CONCURRENCY,
+    DASHBOARD_REFRESH_JITTER,
+)
+logger = get_bot_logger()
+
+
+class DashboardRefreshScheduler:
+    """
+    Schedules periodic dashboard refreshes with bounded parallelism.
+
+    Every controller gets its own next-due timestamp derived from its config
+    (`metadata.refresh_interval`, falling back to the default interval) plus a
+    random jitter. A tick only starts refreshes that are due and not already
+    running; each refresh is a single fetch-and-render pass through
+    `controller.display_dashboard()`.
+    """
+
+    def __init__(self,
+                 max_concurrency: int = DASHBOARD_REFRESH_CONCURRENCY,
+                 default_interval: float = DASHBOARD_REFRESH_INTERVAL,
+                 jitter: float = DASHBOARD_REFRESH_JITTER,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.default_interval = default_interval
+        self.jitter = max(0.0, float(jitter))
+        self._clock = clock
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._next_due: Dict[int, float] = {}  # channel_id -> monotonic due time
+        self._in_flight: Dict[int, asyncio.Task] = {}  # channel_id -> running refresh
+        self.stats = {"refreshed": 0, "failed": 0, "skipped_in_flight": 0}
+
+    def get_interval(self, controller) -> Optional[float]:
+        """Returns the refresh interval for a controller, or None if periodic refresh is disabled."""
+        config = getattr(controller, 'config', None) or {}
+        interval = config.get('metadata', {}).get('refresh_interval', self.default_interval)
+        try:
+            interval = float(interval)
+        except (TypeError, ValueError):
+            logger.warning(f"Scheduler: Invalid refresh_interval '{interval}' for dashboard {getattr(controller, 'dashboard_id', '?')}. Using default.")
+            interval = float(self.default_interval)
+        return interval if interval > 0 else None
+
+    def schedule(self, channel_id: int, controller, now: Optional[float] = None) -> None:
+        """(Re)schedules the next refresh of a dashboard one interval (plus jitter) from now."""
+        interval = self.get_interval(controller)
+        if interval is None:
+            self._next_due.pop(channel_id, None)
+            return
+        now = self._clock() if now is None else now
+        self._next_due[channel_id] = now + interval + random.uniform(0, self.jitter)
+
+    def forget(self, channel_id: int) -> None:
+        """Drops scheduling state for a dashboard that was deactivated."""
+        self._next_due.pop(channel_id, None)
+        task = self._in_flight.pop(channel_id, None)
+        if task and not task.done():
+            task.cancel()
+
+    def tick(self, active_dashboards: Dict[int, Any]) -> int:
+        """
+        Starts refreshes for all due dashboards and returns how many were started.
+        Does not wait for the refreshes to finish; the semaphore bounds parallelism.
+        """
+        now = self._clock()
+
+        # Drop state for dashboards that are no longer active
+        for channel_id in list(self._next_due.keys()):
+            if channel_id not in active_dashboards:
+                self.forget(channel_id)
+
+        started = 0
+        for channel_id, controller in list(active_dashboards.items()):
+            if channel_id not in self._next_due:
+                # Newly seen dashboards were just displayed on activation
+                self.schedule(channel_id, controller, now)
+                continue
+            if self._next_due[channel_id] > now:
+                continue
+            if channel_id in self._in_flight:
+                self.stats["skipped_in_flight"] += 1
+                continue
+
+            self.schedule(channel_id, controller, now)
+            task = asyncio.create_task(self._refresh(channel_id, controller))
+            self._in_flight[channel_id] = task
+            task.add_done_callback(lambda t, ch=channel_id: self._on_done(ch, t))
+            started += 1
+
+        if started:
+            logger.debug("Scheduler: Started %s dashboard refreshes (%s in flight, limit %s).", started, len(self._in_flight), self.max_concurrency)
+        return started
+
+    async def _refresh(self, channel_id: int, controller) -> None:
+        async with self._semaphore:
+            try:
+                message = await controller.display_dashboard()
+                if message is None:
+                    self.stats["failed"] += 1
+                    logger.warning(f"Scheduler: Refresh of dashboard in channel {channel_id} produced no message.")
+                else:
+                    self.stats["refreshed"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["failed"] += 1
+                logger.error(f"Scheduler: Error refreshing dashboard in channel {channel_id}: {e}", exc_info=True)
+
+    def _on_done(self, channel_id: int, task: asyncio.Task) -> None:
+        if self._in_flight.get(channel_id) is task:
+            del self._in_flight[channel_id]
+
+    async def wait_idle(self) -> None:
+        """Waits for all currently running refreshes to finish."""
+        if self._in_flight:
+            await asyncio.gather(*list(self._in_flight.values()), return_exceptions=True)
+
+    async def shutdown(self) -> None:
+        """Cancels running refreshes and clears all scheduling state."""
+        tasks = list(self._in_flight.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._in_flight.clear()
+        self._next_due.clear()
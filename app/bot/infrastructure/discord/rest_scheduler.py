@@ -0,0 +1,321 @@
+# app/bot/infrastructure/discord/rest_scheduler.py
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+import nextcord
+
+from app.shared.interfaces.logging.api import get_bot_logger
+from app.bot.infrastructure.config.constants import (
+    DISCORD_REST_CONCURRENCY,
+    DISCORD_GLOBAL_RATE_LIMIT,
+    DISCORD_REST_MAX_RETRIES,
+)
+logger = get_bot_logger()
+
+LATENCY_SAMPLES = 500  # kept per priority for the percentiles in metrics()
+DEFAULT_RETRY_AFTER = 1.0  # seconds, if a 429 carries no Retry-After
+
+
+class RequestPriority(IntEnum):
+    """
+    Order in which queued Discord calls are started (lower first).
+
+    INTERACTION is for command responses sent over the bot's own REST budget,
+    i.e. DMs to the invoking user. Interaction callbacks and followups
+    (interaction.response / interaction.followup) are deliberately not routed
+    through the scheduler: Discord exempts them from the global limit, and the
+    initial response has a 3 second deadline that must not wait behind
+    queued work.
+    """
+    INTERACTION = 0
+    TEMPLATE = 1
+    DASHBOARD = 2
+    CLEANUP = 3
+
+
+def rest_route(method: str, path: str, major_id: Any = None) -> str:
+    """
+    Route key following Discord's bucket model: method, path template and the
+    major parameter (channel_id, guild_id or webhook_id) of the call.
+    Calls with the same key share a rate limit bucket.
+    """
+    return f"{method} {path}:{major_id}" if major_id is not None else f"{method} {path}"
+
+
+class _Job:
+    __slots__ = ("call", "route", "priority", "coalesce_key", "futures", "enqueued_at", "attempts")
+
+    def __init__(self, call, route, priority, coalesce_key, future, enqueued_at):
+        self.call = call
+        self.route = route
+        self.priority = priority
+        self.coalesce_key = coalesce_key
+        self.futures: List[asyncio.Future] = [future]
+        self.enqueued_at = enqueued_at
+        self.attempts = 0
+
+
+class _RouteBucket:
+    __slots__ = ("busy", "blocked_until")
+
+    def __init__(self):
+        self.busy = False
+        self.blocked_until = 0.0
+
+
+def _retry_after(error: nextcord.HTTPException) -> float:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+def _percentiles(samples: Deque[float]) -> Optional[Dict[str, float]]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return {
+        "p50": round(ordered[len(ordered) // 2], 1),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+        "max": round(ordered[-1], 1),
+    }
+
+
+class DiscordRestScheduler:
+    """
+    Bot-wide queue for outgoing Discord REST calls.
+
+    Callers submit a zero-argument callable returning the awaitable (called once
+    per attempt) together with its route key and a priority. The scheduler starts
+    queued calls by priority, runs at most one call per route at a time, keeps the
+    global request rate below Discord's limit and holds a route back after a 429
+    until its Retry-After has passed, then retries the call. Header-level bucket
+    bookkeeping stays with nextcord's HTTP client; this layer decides which work
+    goes first when the budget is tight.
+
+    Calls submitted with a coalesce_key replace a queued call with the same key
+    (e.g. an older edit of the same dashboard message); all callers get the
+    result of the call that actually ran.
+    """
+
+    def __init__(self,
+                 max_concurrency: int = DISCORD_REST_CONCURRENCY,
+                 global_rate: float = DISCORD_GLOBAL_RATE_LIMIT,
+                 max_retries: int = DISCORD_REST_MAX_RETRIES,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.global_rate = max(1.0, float(global_rate))
+        self.max_retries = max_retries
+        self._clock = clock
+        self._queue: List[Tuple[int, int, _Job]] = []  # heap of (priority, seq, job)
+        self._seq = itertools.count()
+        self._pending_by_key: Dict[Hashable, _Job] = {}
+        self._buckets: Dict[str, _RouteBucket] = {}
+        self._in_flight: set = set()
+        self._tokens = self.global_rate
+        self._tokens_at = clock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "coalesced": 0, "rate_limited": 0, "retried": 0}
+        self._wait_ms: Dict[RequestPriority, Deque[float]] = {p: deque(maxlen=LATENCY_SAMPLES) for p in RequestPriority}
+        self._run_ms: Dict[RequestPriority, Deque[float]] = {p: deque(maxlen=LATENCY_SAMPLES) for p in RequestPriority}
+
+    def start(self) -> None:
+        """Starts the dispatcher on the running loop (restarting it if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and not self._worker.done() and self._loop is loop:
+            return
+        if self._loop is not loop:
+            # Work queued on another (closed) loop can never complete
+            self._queue.clear()
+            self._pending_by_key.clear()
+            self._buckets.clear()
+            self._in_flight.clear()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._worker = loop.create_task(self._run())
+
+    async def submit(self,
+                     call: Callable[[], Awaitable[Any]],
+                     route: str,
+                     priority: RequestPriority = RequestPriority.DASHBOARD,
+                     coalesce_key: Optional[Hashable] = None) -> Any:
+        """Queues a Discord call and returns its result (or raises its exception)."""
+        self.start()
+        future = self._loop.create_future()
+        self.stats["submitted"] += 1
+
+        pending = self._pending_by_key.get(coalesce_key) if coalesce_key is not None else None
+        if pending is not None:
+            # Superseded: only the newest call for this key is sent
+            pending.call = call
+            pending.futures.append(future)
+            self.stats["coalesced"] += 1
+        else:
+            job = _Job(call, route, RequestPriority(priority), coalesce_key, future, self._clock())
+            if coalesce_key is not None:
+                self._pending_by_key[coalesce_key] = job
+            self._push(job)
+        return await future
+
+    def _push(self, job: _Job) -> None:
+        heapq.heappush(self._queue, (job.priority, next(self._seq), job))
+        self._wakeup.set()
+
+    def _pop_ready(self, now: float) -> Tuple[Optional[_Job], Optional[float]]:
+        """Highest priority job whose route is free, else (None, seconds until a blocked route frees)."""
+        skipped = []
+        found = None
+        earliest = None
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            bucket = self._buckets.get(entry[2].route)
+            if bucket is not None and (bucket.busy or bucket.blocked_until > now):
+                skipped.append(entry)
+                if not bucket.busy:
+                    earliest = bucket.blocked_until if earliest is None else min(earliest, bucket.blocked_until)
+                continue
+            found = entry[2]
+            break
+        for entry in skipped:
+            heapq.heappush(self._queue, entry)
+        return found, (max(0.0, earliest - now) if earliest is not None else None)
+
+    async def _next_job(self) -> _Job:
+        while True:
+            job, delay = self._pop_ready(self._clock())
+            if job is not None:
+                return job
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _acquire_global_token(self) -> None:
+        while True:
+            now = self._clock()
+            self._tokens = min(self.global_rate, self._tokens + (now - self._tokens_at) * self.global_rate)
+            self._tokens_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.global_rate)
+
+    async def _run(self) -> None:
+        while True:
+            await self._slots.acquire()
+            try:
+                job = await self._next_job()
+                if job.coalesce_key is not None and self._pending_by_key.get(job.coalesce_key) is job:
+                    del self._pending_by_key[job.coalesce_key]
+                self._buckets.setdefault(job.route, _RouteBucket()).busy = True
+                await self._acquire_global_token()
+            except BaseException:
+                self._slots.release()
+                raise
+            task = self._loop.create_task(self._execute(job))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _execute(self, job: _Job) -> None:
+        started = self._clock()
+        self._wait_ms[job.priority].append((started - job.enqueued_at) * 1000)
+        bucket = self._buckets[job.route]
+        try:
+            result = await job.call()
+        except nextcord.HTTPException as e:
+            if e.status == 429:
+                self.stats["rate_limited"] += 1
+                retry_after = _retry_after(e)
+                bucket.blocked_until = self._clock() + retry_after
+                if job.attempts < self.max_retries:
+                    job.attempts += 1
+                    self.stats["retried"] += 1
+                    logger.warning(f"Discord rate limit on {job.route}, retrying in {retry_after:.2f}s (attempt {job.attempts}).")
+                    self._push(job)
+                    return
+            self._finish(job, error=e)
+        except asyncio.CancelledError:
+            for future in job.futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            self._finish(job, error=e)
+        else:
+            self._finish(job, result=result)
+        finally:
+            self._run_ms[job.priority].append((self._clock() - started) * 1000)
+            bucket.busy = False
+            if bucket.blocked_until <= self._clock():
+                self._buckets.pop(job.route, None)
+            self._slots.release()
+            self._wakeup.set()
+
+    def _finish(self, job: _Job, result: Any = None, error: Optional[BaseException] = None) -> None:
+        self.stats["failed" if error is not None else "completed"] += 1
+        for future in job.futures:
+            if future.done():
+                continue  # caller gave up waiting
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def queue_depth(self) -> Dict[str, int]:
+        """Number of queued (not yet started) calls per priority."""
+        depth = {priority.name.lower(): 0 for priority in RequestPriority}
+        for priority, _, _ in self._queue:
+            depth[RequestPriority(priority).name.lower()] += 1
+        return depth
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, in-flight calls, counters and wait/run latency percentiles (ms) per priority."""
+        now = self._clock()
+        return {
+            "queue_depth": self.queue_depth(),
+            "in_flight": len(self._in_flight),
+            "blocked_routes": sum(1 for bucket in self._buckets.values() if bucket.blocked_until > now),
+            "stats": dict(self.stats),
+            "wait_ms": {p.name.lower(): _percentiles(self._wait_ms[p]) for p in RequestPriority},
+            "run_ms": {p.name.lower(): _percentiles(self._run_ms[p]) for p in RequestPriority},
+        }
+
+    async def shutdown(self) -> None:
+        """Stops dispatching, cancels running calls and the callers still waiting in the queue."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        tasks = list(self._in_flight)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for _, _, job in self._queue:
+            for future in job.futures:
+                future.cancel()
+        self._queue.clear()
+        self._pending_by_key.clear()
+        self._buckets.clear()
+
+
+# Singleton instance
+_rest_scheduler = None
+
+def get_rest_scheduler() -> DiscordRestScheduler:
+    """Returns the bot-wide Discord REST scheduler."""
+    global _rest_scheduler
+    if _rest_scheduler is None:
+        _rest_scheduler = DiscordRestScheduler()
+    return _rest_scheduler
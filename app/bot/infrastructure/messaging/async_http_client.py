@@ -0,0 +1,101 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from app.shared.interfaces.logging.api import get_bot_logger
+logger = get_bot_logger()
+
+# Pool limits for the shared connector
+HTTP_POOL_LIMIT = 100
+HTTP_POOL_LIMIT_PER_HOST = 10
+HTTP_DNS_CACHE_TTL = 300  # seconds
+HTTP_DEFAULT_TIMEOUT = 10  # seconds
+
+
+class AsyncHttpClient:
+    """
+    Shared aiohttp session for the bot.
+
+    One connection-pooled ClientSession is created lazily and reused by every
+    caller, so health checks, IP lookups and API fetches keep connections and
+    DNS results alive instead of opening a new session per call. The session is
+    tied to the event loop it was created on and is recreated if that loop changes.
+    """
+
+    def __init__(self,
+                 limit: int = HTTP_POOL_LIMIT,
+                 limit_per_host: int = HTTP_POOL_LIMIT_PER_HOST,
+                 default_timeout: float = HTTP_DEFAULT_TIMEOUT):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.default_timeout = default_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Returns the shared session, creating it on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.default_timeout),
+            )
+            self._loop = loop
+            logger.debug("Shared aiohttp session created")
+        return self._session
+
+    async def get_json(self, url: str, timeout: Optional[float] = None, **kwargs) -> Any:
+        """GETs url and returns the decoded JSON body. Raises for HTTP errors."""
+        session = self.get_session()
+        request_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
+        async with session.get(url, timeout=request_timeout, **kwargs) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def check_url(self, url: str, timeout: float = 5.0, **kwargs) -> Dict[str, Any]:
+        """
+        Requests url and reports its status and latency.
+
+        Returns {'status': int | None, 'latency_ms': float, 'error': str | None};
+        'error' is 'timeout' when the request did not finish within timeout.
+        """
+        session = self.get_session()
+        start = time.perf_counter()
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs) as response:
+                return {
+                    'status': response.status,
+                    'latency_ms': round((time.perf_counter() - start) * 1000, 1),
+                    'error': None,
+                }
+        except asyncio.TimeoutError:
+            error = 'timeout'
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        return {
+            'status': None,
+            'latency_ms': round((time.perf_counter() - start) * 1000, 1),
+            'error': error,
+        }
+
+    async def close(self) -> None:
+        """Closes the shared session (called on bot shutdown)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+
+# Singleton instance
+_async_http_client = AsyncHttpClient()
+
+def get_async_http_client() -> AsyncHttpClient:
+    """Get the shared aiohttp client instance"""
+    return _async_http_client
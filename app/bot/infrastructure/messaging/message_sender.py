@@ -2,6 +2,21 @@ import nextcord
 import os
 from app.bot.infrastructure.messaging.chunk_manager import chunk_message
 from app.bot.infrastructure.messaging.response_mode import ResponseMode, ACTIVE_RESPONSE_MODE
+from app.bot.infrastructure.discord.rest_scheduler import get_rest_scheduler, rest_route, RequestPriority
+
+async def send_to_author(ctx, make_kwargs):
+    """
+    DM to the command author via the REST scheduler at INTERACTION priority;
+    make_kwargs builds fresh send() kwargs per attempt. ctx.send (interaction
+    responses) stays outside the scheduler, see RequestPriority.
+    """
+    dm_channel = ctx.author.dm_channel
+    major_id = dm_channel.id if dm_channel else f"@me:{ctx.author.id}"
+    return await get_rest_scheduler().submit(
+        lambda: ctx.author.send(**make_kwargs()),
+        rest_route("POST", "/channels/{channel_id}/messages", major_id),
+        RequestPriority.INTERACTION,
+    )
 
 async def send_response(ctx, response):
     if not response:
@@ -20,9 +35,9 @@ async def send_dm(ctx, response):
     if len(response) > 1800:
         chunks = [chunk async for chunk in chunk_message(response)]
         for chunk in chunks:
-            await ctx.author.send(chunk)
+            await send_to_author(ctx, lambda chunk=chunk: {"content": chunk})
     else:
-        await ctx.author.send(response)
+        await send_to_author(ctx, lambda: {"content": response})
 
 async def send_ephemeral(ctx, response):
     await ctx.send(response, ephemeral=True)
@@ -48,10 +63,10 @@ async def send_file_response(ctx, file_path):
         encrypted_file_path = await encryption.encrypt_file(file_path)
         
         try:
-            await ctx.author.send(file=nextcord.File(encrypted_file_path))
+            await send_to_author(ctx, lambda: {"file": nextcord.File(encrypted_file_path)})
         finally:
             if os.path.exists(encrypted_file_path):
                 os.remove(encrypted_file_path)
     else:
-        await ctx.author.send(file=nextcord.File(file_path))
+        await send_to_author(ctx, lambda: {"file": nextcord.File(file_path)})
 
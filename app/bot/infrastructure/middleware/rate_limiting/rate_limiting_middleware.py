@@ -1,6 +1,5 @@
 from nextcord.ext import commands
 import nextcord
-import asyncio
 from app.shared.interfaces.logging.api import get_bot_logger
 logger = get_bot_logger()
 
@@ -97,10 +96,5 @@ class RateLimitingMiddleware(commands.Cog):
 
     @commands.Cog.listener()
     async def on_error(self, event, *args, **kwargs):
-        """Handle Discord rate limit errors"""
-        if isinstance(event, nextcord.errors.RateLimited):
-            retry_after = event.retry_after
-            logger.warning(f"Rate-Limited by Discord! Retry after {retry_after:.2f} seconds.")
-            await asyncio.sleep(retry_after)
-        else:
-            logger.error(f"Unhandled error: {event}")
+        """Log unhandled event errors. Discord rate limits are handled by the REST scheduler, not here."""
+        logger.error(f"Unhandled error in event {event}")
@@ -1,14 +1,22 @@
 # This file allows imports from the checkers module
 from .web_service_checker import check_web_services
 from .game_service_checker import check_pufferpanel_games, check_standalone_games
-from .port_checker import check_tcp_port
+from .port_checker import check_tcp_port, check_tcp_port_async
+from .port_prober import PortProber, get_port_prober
 from .docker_utils import get_container_ip, get_all_containers
+from .container_inventory import ContainerInventory, ContainerInfo, get_container_inventory
 
 __all__ = [
     'check_web_services',
     'check_pufferpanel_games',
     'check_standalone_games',
     'check_tcp_port',
+    'check_tcp_port_async',
+    'PortProber',
+    'get_port_prober',
     'get_container_ip',
-    'get_all_containers'
+    'get_all_containers',
+    'ContainerInventory',
+    'ContainerInfo',
+    'get_container_inventory'
 ]
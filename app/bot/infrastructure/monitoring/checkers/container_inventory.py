@@ -0,0 +1,258 @@
+"""Long-lived Docker client and in-memory container inventory"""
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+import docker
+from docker.errors import NotFound
+
+logger = logging.getLogger('homelab_bot')
+
+# Vollständiger Abgleich, wenn der Event-Stream nicht läuft und der Stand älter ist
+INVENTORY_MAX_AGE = 30  # Sekunden
+EVENT_RECONNECT_DELAY = 5  # Sekunden
+
+# Container events that change state, ports or networks; exec_*/attach/etc. are ignored
+RELEVANT_EVENTS = {
+    "create", "start", "restart", "stop", "die", "kill", "oom",
+    "pause", "unpause", "rename", "update", "health_status", "destroy",
+}
+
+
+@dataclass
+class ContainerInfo:
+    """Snapshot of one container, built from its inspect data."""
+    id: str
+    name: str
+    status: str
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_attrs(cls, attrs: Dict[str, Any]) -> "ContainerInfo":
+        return cls(
+            id=attrs.get("Id", ""),
+            name=attrs.get("Name", "").lstrip("/"),
+            status=attrs.get("State", {}).get("Status", "unknown"),
+            attrs=attrs,
+        )
+
+    @property
+    def ip_address(self) -> Optional[str]:
+        """Erste verfügbare IP-Adresse des Containers"""
+        networks = self.attrs.get("NetworkSettings", {}).get("Networks") or {}
+        for network in networks.values():
+            if network.get("IPAddress"):
+                return network["IPAddress"]
+        return None
+
+
+class ContainerInventory:
+    """
+    Keeps one Docker client for the lifetime of the process and an in-memory
+    view of all containers.
+
+    The inventory is loaded once with a full listing (in a worker thread) and
+    then kept current by a background thread that follows the Docker events
+    stream and re-inspects only the container an event refers to. Checkers read
+    the snapshot without touching the Docker daemon. If the events stream is
+    down, the snapshot is re-listed once it is older than max_age.
+    """
+
+    def __init__(self, client_factory=docker.from_env, max_age: float = INVENTORY_MAX_AGE,
+                 watch_events: bool = True):
+        self._client_factory = client_factory
+        self._client = None
+        self._client_lock = threading.Lock()
+        self.max_age = max_age
+        self.watch_events = watch_events
+
+        self._containers: Dict[str, ContainerInfo] = {}  # id -> info
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._last_refresh: Optional[float] = None
+
+        self._watcher: Optional[threading.Thread] = None
+        self._stream = None
+        self._stop_event = threading.Event()
+        self.stats = {"full_refreshes": 0, "events": 0, "inspects": 0}
+
+    @property
+    def client(self):
+        """The shared Docker client, created on first use."""
+        with self._client_lock:
+            if self._client is None:
+                self._client = self._client_factory()
+                logger.debug("Docker-Client erstellt.")
+            return self._client
+
+    @property
+    def loaded(self) -> bool:
+        return self._last_refresh is not None
+
+    @property
+    def watching(self) -> bool:
+        return self._watcher is not None and self._watcher.is_alive()
+
+    def _is_stale(self) -> bool:
+        if not self.loaded:
+            return True
+        if self.watching:
+            return False
+        return time.monotonic() - self._last_refresh > self.max_age
+
+    # --- Blocking operations (worker thread) ---
+
+    def refresh(self) -> None:
+        """Re-lists all containers. Blocking; concurrent callers share one listing."""
+        requested_at = time.monotonic()
+        with self._refresh_lock:
+            if self._last_refresh is not None and self._last_refresh >= requested_at:
+                return
+            containers = self.client.containers.list(all=True)
+            snapshot = {}
+            for container in containers:
+                info = ContainerInfo.from_attrs(container.attrs)
+                snapshot[info.id] = info
+            with self._lock:
+                self._containers = snapshot
+            self._last_refresh = time.monotonic()
+            self.stats["full_refreshes"] += 1
+            logger.debug("Container-Inventar geladen: %s Container", len(snapshot))
+
+    def apply_event(self, event: Dict[str, Any]) -> None:
+        """Updates the inventory for a single Docker container event. Blocking."""
+        if event.get("Type", "container") != "container":
+            return
+        action = (event.get("Action") or event.get("status") or "").split(":")[0].strip()
+        if action not in RELEVANT_EVENTS:
+            return
+        container_id = event.get("Actor", {}).get("ID") or event.get("id")
+        if not container_id:
+            return
+        self.stats["events"] += 1
+
+        if action == "destroy":
+            with self._lock:
+                self._containers.pop(container_id, None)
+            return
+
+        try:
+            attrs = self.client.api.inspect_container(container_id)
+            self.stats["inspects"] += 1
+        except NotFound:
+            with self._lock:
+                self._containers.pop(container_id, None)
+            return
+        info = ContainerInfo.from_attrs(attrs)
+        with self._lock:
+            self._containers[info.id] = info
+
+    def _watch(self, since: int) -> None:
+        """Follows the Docker events stream until close() is called."""
+        while not self._stop_event.is_set():
+            try:
+                self._stream = self.client.events(decode=True, filters={"type": "container"}, since=since)
+                for event in self._stream:
+                    since = event.get("time", since)
+                    try:
+                        self.apply_event(event)
+                    except Exception as e:
+                        logger.debug("Fehler beim Verarbeiten des Docker-Events %s: %s", event.get('Action'), e)
+            except Exception as e:
+                if self._stop_event.is_set():
+                    break
+                logger.warning(f"Docker-Event-Stream unterbrochen: {e}")
+            if self._stop_event.wait(EVENT_RECONNECT_DELAY):
+                break
+            # Events may have been missed while disconnected
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.debug("Container-Inventar konnte nicht neu geladen werden: %s", e)
+        self._stream = None
+
+    def _start_watcher(self, since: int) -> None:
+        if not self.watch_events or self.watching:
+            return
+        self._stop_event.clear()
+        self._watcher = threading.Thread(target=self._watch, args=(since,), name="docker-events", daemon=True)
+        self._watcher.start()
+        logger.debug("Docker-Event-Watcher gestartet.")
+
+    def _load(self) -> None:
+        # Subscribe from just before the listing so no event between the two is lost
+        since = int(time.time())
+        self.refresh()
+        self._start_watcher(since)
+
+    # --- Async API ---
+
+    async def get_containers(self, raise_on_error: bool = False) -> Dict[str, ContainerInfo]:
+        """Returns {name: ContainerInfo}, loading the inventory in a worker thread if needed."""
+        if self._is_stale():
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(None, self._load)
+            except Exception as e:
+                if raise_on_error:
+                    raise
+                logger.debug("Fehler beim Abrufen der Container: %s", e)
+                if not self.loaded:
+                    return {}
+        return self.snapshot()
+
+    async def get_container(self, name: str) -> Optional[ContainerInfo]:
+        return (await self.get_containers()).get(name)
+
+    async def exec_run(self, container_name: str, command: Union[str, List[str]]):
+        """Runs a command in a container via the shared client. Returns (exit_code, output).
+
+        A string is run through `sh -c` (so pipes work), a list is executed directly.
+        """
+        argv = ["sh", "-c", command] if isinstance(command, str) else list(command)
+
+        def _exec():
+            container = self.client.containers.get(container_name)
+            result = container.exec_run(argv)
+            return result.exit_code, result.output.decode("utf-8", errors="replace")
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _exec)
+
+    # --- In-memory reads ---
+
+    def snapshot(self) -> Dict[str, ContainerInfo]:
+        """Returns the current inventory as {name: ContainerInfo} without contacting Docker."""
+        with self._lock:
+            return {info.name: info for info in self._containers.values()}
+
+    def close(self) -> None:
+        """Stops the events watcher and closes the Docker client."""
+        self._stop_event.set()
+        stream = self._stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+        if self._watcher is not None:
+            self._watcher.join(timeout=2)
+            self._watcher = None
+        with self._client_lock:
+            if self._client is not None:
+                try:
+                    self._client.close()
+                except Exception:
+                    pass
+                self._client = None
+
+
+# Global inventory instance
+_container_inventory = ContainerInventory()
+
+def get_container_inventory() -> ContainerInventory:
+    """Gibt die globale ContainerInventory-Instanz zurück"""
+    return _container_inventory
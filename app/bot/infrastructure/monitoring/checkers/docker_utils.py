@@ -1,30 +1,27 @@
 """Utilities for Docker container operations"""
-import docker
 import logging
 
+from .container_inventory import get_container_inventory
+
 logger = logging.getLogger('homelab_bot')
 
 def get_container_ip(container_name):
-    """Ermittelt die IP-Adresse eines Docker Containers mit der Docker API"""
-    try:
-        client = docker.from_env()
-        container = client.containers.get(container_name)
-        # Hole die erste verfügbare IP
-        networks = container.attrs['NetworkSettings']['Networks']
-        for network in networks.values():
-            if network.get('IPAddress'):
-                return network['IPAddress']
-        return None
-    except Exception as e:
-        logger.debug(f"Fehler beim Ermitteln der Container-IP für {container_name}: {e}")
-        return None
+    """Ermittelt die IP-Adresse eines Docker Containers aus dem Container-Inventar"""
+    container = get_all_containers().get(container_name)
+    return container.ip_address if container else None
         
 def get_all_containers():
-    """Returns a dictionary of all containers {name: container}"""
+    """Returns a dictionary of all containers {name: ContainerInfo}
+
+    Served from the shared container inventory; only the very first call (before
+    the inventory is loaded) or a stale inventory contacts the Docker daemon.
+    Async callers should use `await get_container_inventory().get_containers()`.
+    """
+    inventory = get_container_inventory()
     try:
-        client = docker.from_env()
-        containers = client.containers.list(all=True)
-        return {container.name: container for container in containers}
+        if not inventory.loaded:
+            inventory.refresh()
+        return inventory.snapshot()
     except Exception as e:
-        logger.debug(f"Fehler beim Abrufen der Container: {e}")
-        return {}
\ No newline at end of file
+        logger.debug("Fehler beim Abrufen der Container: %s", e)
+        return {}
@@ -1,11 +1,10 @@
 """Check game services running in containers"""
 import logging
-import socket
-import subprocess
 import asyncio
 import aiohttp
-from .docker_utils import get_container_ip, get_all_containers
-from .port_checker import check_tcp_port
+from .container_inventory import get_container_inventory
+from .port_prober import get_port_prober
+from app.bot.infrastructure.messaging.async_http_client import get_async_http_client
 from app.shared.interfaces.logging.api import get_bot_logger
 logger = get_bot_logger()
 from app.bot.infrastructure.monitoring.collectors.game_servers.minecraft_server_collector_impl import MinecraftServerFetcher
@@ -13,68 +12,39 @@ from app.bot.infrastructure.monitoring.collectors.game_servers.minecraft_server_
 async def get_public_ip():
     """Get the public IP address of the server"""
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get('https://ipinfo.io/json', timeout=2) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.debug(f"Public IP: {data['ip']}")
-                    return data['ip']
+        session = get_async_http_client().get_session()
+        async with session.get('https://ipinfo.io/json', timeout=aiohttp.ClientTimeout(total=2)) as response:
+            if response.status == 200:
+                data = await response.json()
+                logger.debug("Public IP: %s", data['ip'])
+                return data['ip']
     except Exception as e:
-        logger.debug(f"Error getting public IP: {e}")
+        logger.debug("Error getting public IP: %s", e)
     return None
 
 async def check_minecraft_server(ip, port, timeout=3.0):
     """Check if a Minecraft server is running at the given IP and port"""
-    try:
-        # Simple socket connection (Minecraft responds even without a full handshake)
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        result = sock.connect_ex((ip, port))
-        if result == 0:
-            # Connection succeeded
-            logger.debug(f"Minecraft port {port} is open at {ip}")
-            sock.close()
-            return True
-        sock.close()
-        return False
-    except Exception as e:
-        logger.debug(f"Minecraft check failed for {ip}:{port} - {str(e)}")
-        return False
+    # Simple TCP connection (Minecraft responds even without a full handshake)
+    is_open = await get_port_prober().probe(ip, port, timeout=timeout)
+    if is_open:
+        logger.debug("Minecraft port %s is open at %s", port, ip)
+    return is_open
 
 async def check_pufferpanel_games(services_list):
     """Check games managed by PufferPanel"""
     logger.debug(f"======== STARTING PUFFERPANEL GAMES CHECK ========")
     results = {}
-    containers = get_all_containers()
+    inventory = get_container_inventory()
+    containers = await inventory.get_containers()
     
-    logger.debug(f"Found containers: {list(containers.keys())}")
+    logger.debug("Found containers: %s", list(containers.keys()))
     
     pufferpanel_container = containers.get("pufferpanel")
     if not pufferpanel_container or pufferpanel_container.status != "running":
         logger.debug("PufferPanel container not running or not found")
         return {service["name"]: "❌ Pufferpanel offline" for service in services_list}
     
-    logger.debug(f"PufferPanel container status: {pufferpanel_container.status}")
-    
-    # Check directly if the game servers are running
-    logger.debug("Checking for direct evidence of running game servers...")
-    try:
-        # Direct check to see what processes are running in the container
-        cmd = "docker exec pufferpanel ps aux"
-        ps_result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        logger.debug(f"Process listing result: {ps_result.returncode}")
-        logger.debug(f"Process list output: {ps_result.stdout}")
-    except Exception as e:
-        logger.debug(f"Error checking processes: {e}")
-    
-    # Get all listening ports on the system
-    logger.debug("Checking all listening ports on the system...")
-    try:
-        listening_cmd = "ss -tulnp"
-        listening_result = subprocess.run(listening_cmd, shell=True, capture_output=True, text=True)
-        logger.debug(f"All listening ports: {listening_result.stdout}")
-    except Exception as e:
-        logger.debug(f"Error checking listening ports: {e}")
+    logger.debug("PufferPanel container status: %s", pufferpanel_container.status)
     
     # Get the container ports mapped to host
     exposed_ports = {}
@@ -85,7 +55,7 @@ async def check_pufferpanel_games(services_list):
                 continue
                 
             port_str, protocol = container_port.split('/') if '/' in container_port else (container_port, 'tcp')
-            logger.debug(f"Processing port mapping: {port_str}/{protocol} -> {host_bindings}")
+            logger.debug("Processing port mapping: %s/%s -> %s", port_str, protocol, host_bindings)
             
             # Handle port ranges (e.g. "25565-25575/tcp")
             if '-' in port_str:
@@ -97,9 +67,9 @@ async def check_pufferpanel_games(services_list):
                             'host_port': host_port,
                             'protocol': protocol
                         }
-                        logger.debug(f"Added range port mapping: {port} -> {host_port} ({protocol})")
+                        logger.debug("Added range port mapping: %s -> %s (%s)", port, host_port, protocol)
                 except (ValueError, IndexError, KeyError) as e:
-                    logger.debug(f"Error processing port range {port_str}: {e}")
+                    logger.debug("Error processing port range %s: %s", port_str, e)
                     continue
             else:
                 try:
@@ -109,65 +79,43 @@ async def check_pufferpanel_games(services_list):
                         'host_port': host_port,
                         'protocol': protocol
                     }
-                    logger.debug(f"Added single port mapping: {port} -> {host_port} ({protocol})")
+                    logger.debug("Added single port mapping: %s -> %s (%s)", port, host_port, protocol)
                 except (ValueError, IndexError, KeyError) as e:
-                    logger.debug(f"Error processing port {port_str}: {e}")
+                    logger.debug("Error processing port %s: %s", port_str, e)
                     continue
     
-    logger.debug(f"Found {len(exposed_ports)} exposed ports in PufferPanel: {exposed_ports}")
-    
-    # Get established connections (players currently connected)
-    try:
-        logger.debug("Checking for established connections...")
-        cmd = "netstat -tn | grep ESTABLISHED"
-        established_result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        logger.debug(f"Established connections result: {established_result.returncode}")
-        logger.debug(f"Established connections output: {established_result.stdout}")
-        
-        established_ports = set()
-        if established_result.returncode == 0:
-            for line in established_result.stdout.splitlines():
-                parts = line.split()
-                logger.debug(f"Processing established connection line: {line}")
-                if len(parts) >= 4:
-                    local_addr = parts[3]  # Format: IP:PORT
-                    logger.debug(f"Local address: {local_addr}")
-                    if ':' in local_addr:
-                        try:
-                            port = int(local_addr.split(':')[-1])
-                            established_ports.add(port)
-                            logger.debug(f"Added established port: {port}")
-                        except ValueError as e:
-                            logger.debug(f"Error parsing port from {local_addr}: {e}")
-                            pass
-        
-        logger.debug(f"Found {len(established_ports)} established connections on ports: {sorted(established_ports)}")
-    except Exception as e:
-        logger.debug(f"Error checking established connections: {e}")
-        established_ports = set()
-    
-    # Get all UDP connections
-    try:
-        logger.debug("Checking for UDP connections...")
-        udp_cmd = "netstat -un"
-        udp_result = subprocess.run(udp_cmd, shell=True, capture_output=True, text=True)
-        logger.debug(f"UDP connections output: {udp_result.stdout}")
-    except Exception as e:
-        logger.debug(f"Error checking UDP connections: {e}")
+    logger.debug("Found %s exposed ports in PufferPanel: %s", len(exposed_ports), exposed_ports)
     
     # Get public IP for external checking
     public_ip = await get_public_ip()
     if not public_ip:
         logger.debug("Could not determine public IP for external checks")
     else:
-        logger.debug(f"Using public IP for external checks: {public_ip}")
+        logger.debug("Using public IP for external checks: %s", public_ip)
+    
+    # Probe every exposed host port of every service at once, so the whole
+    # range costs as much as the slowest single probe
+    port_status = {}
+    if public_ip:
+        host_ports = set()
+        for service in services_list:
+            try:
+                port_start, port_end = service["port_range"]
+            except (KeyError, ValueError, TypeError):
+                continue
+            for port in range(port_start, port_end + 1):
+                if port in exposed_ports:
+                    host_ports.add(exposed_ports[port]['host_port'])
+        logger.debug("Probing %s host ports at %s concurrently", len(host_ports), public_ip)
+        probe_results = await get_port_prober().probe_many(((public_ip, port) for port in host_ports), timeout=2.0)
+        port_status = {port: is_open for (_, port), is_open in probe_results.items()}
     
     # Check each service
     for service in services_list:
-        logger.debug(f"====== Checking service: {service['name']} ======")
+        logger.debug("====== Checking service: %s ======", service['name'])
         try:
             port_start, port_end = service["port_range"]
-            logger.debug(f"Port range: {port_start}-{port_end}")
+            logger.debug("Port range: %s-%s", port_start, port_end)
             active_ports = set()
             
             # Get all exposed ports for this service
@@ -176,46 +124,23 @@ async def check_pufferpanel_games(services_list):
                 if port in exposed_ports:
                     exposed_service_ports[port] = exposed_ports[port]
             
-            logger.debug(f"Service {service['name']} has {len(exposed_service_ports)} exposed ports: {exposed_service_ports}")
+            logger.debug("Service %s has %s exposed ports: %s", service['name'], len(exposed_service_ports), exposed_service_ports)
             
             # If public IP is available, prioritize external checks
             if public_ip:
-                logger.debug(f"Performing external checks for {service['name']} using public IP")
+                logger.debug("Performing external checks for %s using public IP", service['name'])
                 for port in exposed_service_ports.values():
                     host_port = port['host_port']
-                    logger.debug(f"Checking external access for port {host_port} at {public_ip}")
-                    
-                    # Try TCP connection to public IP
-                    try:
-                        if check_tcp_port(public_ip, host_port, timeout=2.0):
-                            active_ports.add(host_port)
-                            logger.debug(f"TCP port {host_port} is accessible from outside at {public_ip}")
-                        else:
-                            logger.debug(f"TCP port {host_port} is NOT accessible from outside")
-                            
-                            # Special check for UDP ports that might be open
-                            protocol = port['protocol']
-                            if protocol == 'udp':
-                                logger.debug(f"UDP port {host_port} - assuming it might be open")
-                                # Try TCP on the same port as a fallback check
-                                # or if we have other evidence the server is running
-                                if check_tcp_port(public_ip, host_port, timeout=2.0):
-                                    logger.debug(f"TCP port {host_port} is accessible, assuming UDP is available too")
-                                    active_ports.add(host_port)
-                                else:
-                                    # For Minecraft specifically, try to check if the server responds
-                                    if "Minecraft" in service["name"] and host_port == 25565:
-                                        # Try a simple check for the primary Minecraft port
-                                        if await check_minecraft_server(public_ip, host_port):
-                                            logger.debug(f"Minecraft server detected on port {host_port}")
-                                            active_ports.add(host_port)
-                                            break  # One confirmed port is enough for Minecraft
-                    except Exception as e:
-                        logger.debug(f"Error checking port {host_port}: {str(e)}")
+                    # UDP-only games are treated as reachable when the same TCP port answers
+                    if port_status.get(host_port):
+                        active_ports.add(host_port)
+                        logger.debug("Port %s (%s) is accessible from outside at %s", host_port, port['protocol'], public_ip)
+                    else:
+                        logger.debug("Port %s (%s) is NOT accessible from outside", host_port, port['protocol'])
             
             # Final determination based on external checks
             if active_ports:
-                logger.debug(f"{service['name']}: Found externally accessible ports: {active_ports}")
+                logger.debug("%s: Found externally accessible ports: %s", service['name'], active_ports)
                 results[service["name"]] = f"✅ Online auf Port(s): {', '.join(map(str, sorted(active_ports)))}"
             else:
                 # Only if external check fails, try to detect if process is running
@@ -224,41 +149,41 @@ async def check_pufferpanel_games(services_list):
                 
                 # Check for running process
                 for cmd in [
-                    f"docker exec pufferpanel ps aux | grep -i {game_name} | grep -v grep",
-                    f"docker exec pufferpanel pgrep -f {game_name}",
-                    f"docker exec pufferpanel ls -la /tmp/pufferd/servers/ | grep -i {game_name}"
+                    f"ps aux | grep -i {game_name} | grep -v grep",
+                    ["pgrep", "-f", game_name],
+                    f"ls -la /tmp/pufferd/servers/ | grep -i {game_name}"
                 ]:
                     try:
-                        logger.debug(f"Running command: {cmd}")
-                        ps_result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                        if ps_result.returncode == 0 and ps_result.stdout.strip():
-                            logger.debug(f"Process detected for {game_name}: {ps_result.stdout}")
+                        logger.debug("Running command in pufferpanel: %s", cmd)
+                        exit_code, output = await inventory.exec_run("pufferpanel", cmd)
+                        if exit_code == 0 and output.strip():
+                            logger.debug("Process detected for %s: %s", game_name, output)
                             process_detected = True
                             break
                         else:
-                            logger.debug(f"No process detected with command: {cmd}")
+                            logger.debug("No process detected with command: %s", cmd)
                     except Exception as e:
-                        logger.debug(f"Error running {cmd}: {e}")
+                        logger.debug("Error running %s: %s", cmd, e)
                 
                 if process_detected:
-                    logger.debug(f"{service['name']}: Process detected but no accessible ports from outside")
+                    logger.debug("%s: Process detected but no accessible ports from outside", service['name'])
                     results[service["name"]] = "✅ Online (standby)"
                 else:
-                    logger.debug(f"{service['name']}: No accessible ports or processes detected")
+                    logger.debug("%s: No accessible ports or processes detected", service['name'])
                     results[service["name"]] = "❌ Offline"
                 
         except Exception as e:
-            logger.debug(f"Fehler bei {service['name']}: {str(e)}")
+            logger.debug("Fehler bei %s: %s", service['name'], str(e))
             results[service["name"]] = "⚠️ Fehler"
     
-    logger.debug(f"Final PufferPanel game server results: {results}")
+    logger.debug("Final PufferPanel game server results: %s", results)
     logger.debug(f"======== FINISHED PUFFERPANEL GAMES CHECK ========")
     return results
 
 async def check_standalone_games(services_list):
     """Check standalone game servers"""
     results = {}
-    containers = get_all_containers()
+    containers = await get_container_inventory().get_containers()
     
     for service in services_list:
         try:
@@ -274,6 +199,7 @@ async def check_standalone_games(services_list):
             port_start, port_end = service["port_range"]
             active_ports = set()
             
+            probe_targets = {}  # host_port -> (check_ip, is_udp)
             if container.attrs.get('NetworkSettings', {}).get('Ports'):
                 for container_port, host_bindings in container.attrs['NetworkSettings']['Ports'].items():
                     if not host_bindings:
@@ -284,23 +210,19 @@ async def check_standalone_games(services_list):
                     if port_start <= container_port_num <= port_end:
                         host_ip = host_bindings[0]['HostIp'] or 'localhost'
                         host_port = int(host_bindings[0]['HostPort'])
-                        
-                        try:
-                            check_ip = '127.0.0.1' if host_ip in ('0.0.0.0', '') else host_ip
-                            
-                            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                            sock.settimeout(2)
-                            result = sock.connect_ex((check_ip, host_port))
-                            sock.close()
-                            
-                            if result == 0:
-                                active_ports.add(host_port)
-                            else:
-                                protocol = container_port.split('/')[1] if '/' in container_port else 'tcp'
-                                if protocol == 'udp' or service["protocol"] == "udp":
-                                    active_ports.add(host_port)
-                        except Exception as e:
-                            logger.debug(f"Socket check failed for {host_ip}:{host_port} - {str(e)}")
+                        check_ip = '127.0.0.1' if host_ip in ('0.0.0.0', '') else host_ip
+                        protocol = container_port.split('/')[1] if '/' in container_port else 'tcp'
+                        probe_targets[host_port] = (check_ip, protocol == 'udp' or service.get("protocol") == "udp")
+
+            if probe_targets:
+                probe_results = await get_port_prober().probe_many(
+                    ((check_ip, host_port) for host_port, (check_ip, _) in probe_targets.items()),
+                    timeout=2.0
+                )
+                for host_port, (check_ip, is_udp) in probe_targets.items():
+                    # UDP cannot be confirmed with a TCP connect; keep treating it as active
+                    if probe_results.get((check_ip, host_port)) or is_udp:
+                        active_ports.add(host_port)
 
             if active_ports:
                 results[service["name"]] = f"✅ Online auf Port(s): {', '.join(map(str, sorted(active_ports)))}"
@@ -308,9 +230,9 @@ async def check_standalone_games(services_list):
                 results[service["name"]] = "❌ Keine aktiven Ports"
                 
         except Exception as e:
-            logger.debug(f"Fehler bei {service['name']}: {str(e)}")
+            logger.debug("Fehler bei %s: %s", service['name'], str(e))
             results[service["name"]] = "⚠️ Fehler"
             
-    logger.debug(f"Final standalone game server results: {results}")
+    logger.debug("Final standalone game server results: %s", results)
     logger.debug(f"======== FINISHED STANDALONE GAMES CHECK ========")
     return results
\ No newline at end of file
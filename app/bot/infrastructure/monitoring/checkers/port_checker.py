@@ -1,6 +1,7 @@
 """Port availability checking utilities"""
 import socket
 import logging
+from .port_prober import get_port_prober
 
 logger = logging.getLogger('homelab_bot')
 
@@ -13,5 +14,9 @@ def check_tcp_port(ip, port, timeout=0.5):
         sock.close()
         return result == 0
     except Exception as e:
-        logger.debug(f"Error checking TCP port {port} on {ip}: {str(e)}")
-        return False
\ No newline at end of file
+        logger.debug("Error checking TCP port %s on %s: %s", port, ip, str(e))
+        return False
+
+async def check_tcp_port_async(ip, port, timeout=0.5):
+    """Check if a TCP port is open without blocking the event loop"""
+    return await get_port_prober().probe(ip, port, timeout=timeout)
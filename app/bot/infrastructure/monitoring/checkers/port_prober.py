@@ -0,0 +1,102 @@
+"""Asynchronous, pooled TCP port probing"""
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger('homelab_bot')
+
+Target = Tuple[str, int]
+
+# Defaults: global cap on open probes, cap per host, and how long a result is reused
+MAX_CONCURRENT_PROBES = 64
+MAX_PROBES_PER_HOST = 16
+RESULT_TTL = 10  # Sekunden
+
+
+class PortProber:
+    """
+    Probes TCP ports with asyncio.open_connection instead of blocking sockets.
+
+    Probes run concurrently, bounded by a global and a per-host limit, so a port
+    range takes roughly as long as its slowest probe. Results are cached for a
+    short TTL and concurrent probes of the same target share one connection attempt.
+    """
+
+    def __init__(self,
+                 max_concurrency: int = MAX_CONCURRENT_PROBES,
+                 per_host_limit: int = MAX_PROBES_PER_HOST,
+                 result_ttl: float = RESULT_TTL):
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.result_ttl = result_ttl
+        self._global_semaphore: Optional[asyncio.Semaphore] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._cache: Dict[Target, Tuple[float, bool]] = {}  # target -> (expires_at, is_open)
+        self._in_flight: Dict[Target, asyncio.Task] = {}
+        self.stats = {"probes": 0, "cache_hits": 0, "open": 0, "closed": 0}
+
+    def _semaphores(self, host: str) -> Tuple[asyncio.Semaphore, asyncio.Semaphore]:
+        if self._global_semaphore is None:
+            self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        host_semaphore = self._host_semaphores.get(host)
+        if host_semaphore is None:
+            host_semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._global_semaphore, host_semaphore
+
+    async def probe(self, host: str, port: int, timeout: float = 0.5, use_cache: bool = True) -> bool:
+        """Returns True if a TCP connection to host:port can be established within timeout."""
+        target = (host, int(port))
+        if use_cache:
+            cached = self._cache.get(target)
+            if cached and cached[0] > time.monotonic():
+                self.stats["cache_hits"] += 1
+                return cached[1]
+
+        task = self._in_flight.get(target)
+        if task is None:
+            task = asyncio.create_task(self._probe(target, timeout))
+            self._in_flight[target] = task
+            task.add_done_callback(lambda _t, t=target: self._in_flight.pop(t, None))
+        return await asyncio.shield(task)
+
+    async def _probe(self, target: Target, timeout: float) -> bool:
+        host, port = target
+        global_semaphore, host_semaphore = self._semaphores(host)
+        async with global_semaphore, host_semaphore:
+            self.stats["probes"] += 1
+            is_open = False
+            try:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=timeout)
+                is_open = True
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except Exception:
+                    pass
+            except (asyncio.TimeoutError, OSError) as e:
+                logger.debug("Port %s on %s closed or unreachable: %r", port, host, e)
+            except Exception as e:
+                logger.debug("Error probing TCP port %s on %s: %s", port, host, e)
+
+        self.stats["open" if is_open else "closed"] += 1
+        if self.result_ttl > 0:
+            self._cache[target] = (time.monotonic() + self.result_ttl, is_open)
+        return is_open
+
+    async def probe_many(self, targets: Iterable[Target], timeout: float = 0.5) -> Dict[Target, bool]:
+        """Probes all targets concurrently and returns {(host, port): is_open}."""
+        unique_targets = list(dict.fromkeys((host, int(port)) for host, port in targets))
+        results = await asyncio.gather(*(self.probe(host, port, timeout) for host, port in unique_targets))
+        return dict(zip(unique_targets, results))
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+
+# Global prober instance
+_port_prober = PortProber()
+
+def get_port_prober() -> PortProber:
+    """Gibt die globale PortProber-Instanz zurück"""
+    return _port_prober
@@ -1,28 +1,49 @@
 """Check web services via HTTP/HTTPS"""
 import asyncio
-import aiohttp
 import logging
+from typing import Dict
+
+from app.bot.infrastructure.messaging.async_http_client import get_async_http_client
 
 logger = logging.getLogger('homelab_bot')
 
+# Per-service timeout; stays below the 5s budget check_services_status gives all web checks
+WEB_CHECK_TIMEOUT = 4.0
+
+# Letzte gemessene Antwortzeiten in ms, je Service-Name
+_last_latencies: Dict[str, float] = {}
+
+def get_web_service_latencies() -> Dict[str, float]:
+    """Returns the latency (ms) of the most recent check per service name"""
+    return dict(_last_latencies)
+
+def _format_status(response: dict) -> str:
+    if response['error'] == 'timeout':
+        return "⏱️ Timeout"
+    if response['error']:
+        return "❌ Offline"
+    status = response['status']
+    if status < 400:
+        return "✅ Online"  # Latenz separat (get_web_service_latencies), damit der Status-Text stabil bleibt
+    if status in [401, 403]:
+        return "🔒 Geschützt"
+    return f"❌ Status {status}"
+
 async def check_web_services(services_list):
-    """Check HTTP/HTTPS web services"""
-    results = {}
-    
-    async with aiohttp.ClientSession() as session:
-        for service in services_list:
-            try:
-                async with session.get(service["url"], timeout=5, ssl=False) as response:
-                    if response.status < 400:
-                        results[service["name"]] = "✅ Online"
-                    elif response.status in [401, 403]:
-                        results[service["name"]] = "🔒 Geschützt"
-                    else:
-                        results[service["name"]] = f"❌ Status {response.status}"
-            except asyncio.TimeoutError:
-                results[service["name"]] = "⏱️ Timeout"
-            except Exception as e:
-                logger.debug(f"Fehler bei {service['name']}: {str(e)}")
-                results[service["name"]] = "❌ Offline"
-    
-    return results
\ No newline at end of file
+    """Check HTTP/HTTPS web services concurrently over the shared HTTP session.
+
+    Each service may set its own "timeout" (seconds); a slow endpoint only
+    times out itself instead of delaying every service after it.
+    """
+    client = get_async_http_client()
+
+    async def check(service):
+        timeout = service.get("timeout", WEB_CHECK_TIMEOUT)
+        response = await client.check_url(service["url"], timeout=timeout, ssl=False)
+        if response['error'] and response['error'] != 'timeout':
+            logger.debug("Fehler bei %s: %s", service['name'], response['error'])
+        _last_latencies[service["name"]] = response['latency_ms']
+        return _format_status(response)
+
+    statuses = await asyncio.gather(*(check(service) for service in services_list))
+    return {service["name"]: status for service, status in zip(services_list, statuses)}
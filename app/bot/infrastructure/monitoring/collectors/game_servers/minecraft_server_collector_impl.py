@@ -4,6 +4,8 @@ from typing import Dict, Any, List, Tuple
 from datetime import datetime
 import logging
 
+from app.bot.infrastructure.messaging.async_http_client import get_async_http_client
+
 logger = logging.getLogger("homelab_bot")
 
 class MinecraftServerFetcher:
@@ -23,7 +25,7 @@ class MinecraftServerFetcher:
         Returns:
             Dictionary mapping server_key to server data
         """
-        logger.debug(f"🎮 MinecraftServerFetcher: Fetching data for {len(servers)} servers")
+        logger.debug("🎮 MinecraftServerFetcher: Fetching data for %s servers", len(servers))
         
         tasks = []
         for address, port in servers:
@@ -68,51 +70,51 @@ class MinecraftServerFetcher:
         url = f"{MinecraftServerFetcher.API_BASE_URL}{server_address}:{port}"
         
         try:
-            logger.debug(f"🎮 MinecraftServerFetcher: Fetching data from {url}")
+            logger.debug("🎮 MinecraftServerFetcher: Fetching data from %s", url)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=MinecraftServerFetcher.TIMEOUT) as response:
-                    if response.status != 200:
-                        logger.warning(f"🎮 MinecraftServerFetcher: Failed to fetch data: HTTP {response.status}")
-                        return {
-                            "online": False,
-                            "error": f"API returned status code {response.status}",
-                            "address": server_address,
-                            "port": port
-                        }
-                    
-                    data = await response.json()
-                    logger.debug(f"🎮 MinecraftServerFetcher: Raw API response: {data}")
-                    
-                    # Extract player information
-                    player_data = data.get("players", {})
-                    player_count = player_data.get("online", 0)
-                    max_players = player_data.get("max", 0)
-                    player_list_raw = player_data.get("list", [])
-                    
-                    # Extract player names
-                    player_list = []
-                    for player in player_list_raw:
-                        name = player.get("name_clean", player.get("name_raw", "Unknown"))
-                        player_list.append(name)
-                    
-                    logger.debug(f"🎮 MinecraftServerFetcher: Extracted {player_count} players: {player_list}")
-                    
-                    # Build the result
-                    result = {
-                        "online": data.get("online", False),
+            session = get_async_http_client().get_session()
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=MinecraftServerFetcher.TIMEOUT)) as response:
+                if response.status != 200:
+                    logger.warning(f"🎮 MinecraftServerFetcher: Failed to fetch data: HTTP {response.status}")
+                    return {
+                        "online": False,
+                        "error": f"API returned status code {response.status}",
                         "address": server_address,
-                        "port": port,
-                        "version": data.get("version", {}).get("name_clean", "Unknown"),
-                        "player_count": player_count,
-                        "max_players": max_players,
-                        "players": player_list,
-                        "motd": data.get("motd", {}).get("clean", "A Minecraft Server"),
-                        "retrieved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        "port": port
                     }
-                    
-                    return result
-                    
+                
+                data = await response.json()
+                logger.debug("🎮 MinecraftServerFetcher: Raw API response: %s", data)
+                
+                # Extract player information
+                player_data = data.get("players", {})
+                player_count = player_data.get("online", 0)
+                max_players = player_data.get("max", 0)
+                player_list_raw = player_data.get("list", [])
+                
+                # Extract player names
+                player_list = []
+                for player in player_list_raw:
+                    name = player.get("name_clean", player.get("name_raw", "Unknown"))
+                    player_list.append(name)
+                
+                logger.debug("🎮 MinecraftServerFetcher: Extracted %s players: %s", player_count, player_list)
+                
+                # Build the result
+                result = {
+                    "online": data.get("online", False),
+                    "address": server_address,
+                    "port": port,
+                    "version": data.get("version", {}).get("name_clean", "Unknown"),
+                    "player_count": player_count,
+                    "max_players": max_players,
+                    "players": player_list,
+                    "motd": data.get("motd", {}).get("clean", "A Minecraft Server"),
+                    "retrieved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                }
+                
+                return result
+                
         except Exception as e:
             logger.error(f"🎮 MinecraftServerFetcher: Error: {str(e)}")
             return {
@@ -1,11 +1,15 @@
-from .base import collect_service_data
+from .base import collect_service_data, collect_service_snapshot, ServiceSnapshot
 from .docker import get_docker_status
-from .security import get_ssh_attempts
+from .security import get_ssh_attempts, AuthLogTailer, get_auth_log_tailer
 from .services import check_services_status
 
 __all__ = [
     'collect_service_data',
+    'collect_service_snapshot',
+    'ServiceSnapshot',
     'get_docker_status',
     'get_ssh_attempts',
+    'AuthLogTailer',
+    'get_auth_log_tailer',
     'check_services_status'
 ]
\ No newline at end of file
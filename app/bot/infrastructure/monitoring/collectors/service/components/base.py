@@ -1,5 +1,8 @@
 import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict
 
 from .docker import get_docker_status
 from .security import get_ssh_attempts
@@ -7,11 +10,33 @@ from .services import check_services_status
 
 logger = logging.getLogger('homelab_bot')
 
-async def collect_service_data():
-    """Sammelt alle Service-Daten und gibt sie als Dictionary zurück"""
+@dataclass
+class ServiceSnapshot:
+    """Ergebnis eines einzelnen Service-Sammellaufs (Docker, SSH, Dienste)"""
+    timestamp: float
+    docker_running: Any = "N/A"
+    docker_errors: Any = "N/A"
+    docker_details: str = "Docker nicht verfügbar"
+    ssh_attempts: Any = "N/A"
+    last_ssh_ip: Any = "N/A"
+    services: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dictionary-Form, wie sie collect_service_data liefert"""
+        return {
+            'docker_running': self.docker_running,
+            'docker_errors': self.docker_errors,
+            'docker_details': self.docker_details,
+            'ssh_attempts': self.ssh_attempts,
+            'last_ssh_ip': self.last_ssh_ip,
+            'services': self.services,
+        }
+
+async def collect_service_snapshot() -> ServiceSnapshot:
+    """Sammelt Docker-Status, SSH-Versuche und Dienst-Status genau einmal"""
     logger.info("Sammle Service-Daten...")
     
-    data = {}
+    snapshot = ServiceSnapshot(timestamp=time.time())
     
     # Service-Daten parallel sammeln
     tasks = [
@@ -22,17 +47,17 @@ async def collect_service_data():
     
     results = await asyncio.gather(*tasks, return_exceptions=True)
     
-    # Ergebnisse dem Daten-Dictionary hinzufügen
     if not isinstance(results[0], Exception):
-        data['docker_running'], data['docker_errors'], data['docker_details'] = results[0]
-    else:
-        data['docker_running'], data['docker_errors'], data['docker_details'] = "N/A", "N/A", "Docker nicht verfügbar"
+        snapshot.docker_running, snapshot.docker_errors, snapshot.docker_details = results[0]
     
     if not isinstance(results[1], Exception):
-        data['ssh_attempts'], data['last_ssh_ip'] = results[1]
-    else:
-        data['ssh_attempts'], data['last_ssh_ip'] = "N/A", "N/A"
+        snapshot.ssh_attempts, snapshot.last_ssh_ip = results[1]
     
-    data['services'] = results[2] if not isinstance(results[2], Exception) else {}
+    if not isinstance(results[2], Exception) and isinstance(results[2], dict):
+        snapshot.services = results[2]
     
-    return data
\ No newline at end of file
+    return snapshot
+
+async def collect_service_data():
+    """Sammelt alle Service-Daten und gibt sie als Dictionary zurück"""
+    return (await collect_service_snapshot()).to_dict()
@@ -1,14 +1,14 @@
-import docker
 import subprocess
 import logging
 
+from app.bot.infrastructure.monitoring.checkers.container_inventory import get_container_inventory
+
 logger = logging.getLogger('homelab_bot')
 
 async def get_docker_status():
     """Holt Docker-Container Status mit tatsächlichen Daten oder Fallback."""
     try:
-        client = docker.from_env()
-        containers = client.containers.list(all=True)
+        containers = (await get_container_inventory().get_containers(raise_on_error=True)).values()
         
         running = 0
         errors = 0
@@ -1,38 +1,136 @@
+import asyncio
 import os
 import platform
-import subprocess
+import re
+import threading
 import logging
+from collections import Counter, deque
+from typing import Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger('homelab_bot')
 
+LOG_FILES = [
+    "/var/log/auth.log",       # Debian/Ubuntu
+    "/var/log/secure",         # RHEL/CentOS
+    "/var/log/audit/audit.log" # Einige Systeme
+]
+
+READ_CHUNK_SIZE = 64 * 1024
+RECENT_IP_WINDOW = 100  # Anzahl der letzten fehlgeschlagenen Versuche, deren IP gemerkt wird
+
+FAILED_PASSWORD = "Failed password"
+IP_PATTERN = re.compile(r'from ((?:[0-9]{1,3}\.){3}[0-9]{1,3}|[0-9a-fA-F:]+:[0-9a-fA-F:]*)')
+
+
+class AuthLogTailer:
+    """
+    Incrementally scans an auth log for failed SSH logins.
+
+    Remembers the byte offset and inode of the file, so each scan reads only the
+    bytes appended since the previous one. A changed inode or a shrunken file is
+    treated as log rotation: the remainder of the rotated file (if still present
+    as '<path>.1') is read, then scanning restarts at the beginning of the new file.
+    """
+
+    def __init__(self, path: str, recent_window: int = RECENT_IP_WINDOW):
+        self.path = path
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._lock = threading.Lock()
+
+        self.file_failed = 0    # Fehlversuche in der aktuellen Logdatei
+        self.total_failed = 0   # Fehlversuche seit Start des Tailers (über Rotationen hinweg)
+        self.last_ip: Optional[str] = None
+        self.recent_ips: Deque[str] = deque(maxlen=recent_window)
+        self.stats = {"scans": 0, "bytes_read": 0, "rotations": 0}
+
+    def scan(self) -> Tuple[int, Optional[str]]:
+        """Reads new lines and returns (failed attempts in current file, last IP). Blocking."""
+        with self._lock:
+            self.stats["scans"] += 1
+            stat = os.stat(self.path)
+
+            if self._inode is not None and (stat.st_ino != self._inode or stat.st_size < self._offset):
+                self._handle_rotation(stat.st_ino)
+
+            self._inode = stat.st_ino
+            if stat.st_size > self._offset:
+                self._offset = self._read_from(self.path, self._offset)
+            return self.file_failed, self.last_ip
+
+    def _handle_rotation(self, new_inode: int) -> None:
+        self.stats["rotations"] += 1
+        rotated = f"{self.path}.1"
+        try:
+            if new_inode != self._inode and os.stat(rotated).st_ino == self._inode:
+                # Lines written between our last scan and the rotation
+                self._read_from(rotated, self._offset)
+        except OSError:
+            pass
+        logger.debug("Log-Rotation erkannt für %s", self.path)
+        self._offset = 0
+        self.file_failed = 0
+
+    def _read_from(self, path: str, offset: int) -> int:
+        """Parses complete lines from offset on and returns the offset after the last complete line."""
+        with open(path, "rb") as f:
+            f.seek(offset)
+            remainder = b""
+            while True:
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.stats["bytes_read"] += len(chunk)
+                data = remainder + chunk
+                lines = data.split(b"\n")
+                remainder = lines.pop()
+                for line in lines:
+                    self._parse_line(line)
+                offset += len(data) - len(remainder)
+        # An unterminated last line is left for the next scan
+        return offset
+
+    def _parse_line(self, raw_line: bytes) -> None:
+        if FAILED_PASSWORD.encode() not in raw_line:
+            return
+        self.file_failed += 1
+        self.total_failed += 1
+        match = IP_PATTERN.search(raw_line.decode("utf-8", errors="replace"))
+        if match:
+            self.last_ip = match.group(1)
+            self.recent_ips.append(self.last_ip)
+
+    def top_ips(self, limit: int = 5) -> List[Tuple[str, int]]:
+        """Most frequent source IPs among the recent failed attempts."""
+        return Counter(self.recent_ips).most_common(limit)
+
+
+# Ein Tailer je Logdatei, damit Offsets zwischen Sammelläufen erhalten bleiben
+_tailers: Dict[str, AuthLogTailer] = {}
+
+def get_auth_log_tailer(path: str) -> AuthLogTailer:
+    """Gibt den AuthLogTailer für eine Logdatei zurück"""
+    tailer = _tailers.get(path)
+    if tailer is None:
+        tailer = _tailers[path] = AuthLogTailer(path)
+    return tailer
+
 async def get_ssh_attempts():
     """Ermittelt fehlgeschlagene SSH-Anmeldeversuche."""
     try:
         if platform.system() != "Linux":
             return "N/A (nur Linux)", "N/A"
-        
-        log_files = [
-            "/var/log/auth.log",       # Debian/Ubuntu
-            "/var/log/secure",         # RHEL/CentOS
-            "/var/log/audit/audit.log" # Einige Systeme
-        ]
-        
-        log_file = next((f for f in log_files if os.path.exists(f)), None)
-        
+
+        log_file = next((f for f in LOG_FILES if os.path.exists(f)), None)
+
         if not log_file:
             return "Log nicht gefunden", "N/A"
-        
-        cmd = f"grep 'Failed password' {log_file} | wc -l"
-        attempts = subprocess.check_output(cmd, shell=True).decode('utf-8').strip()
-        
-        # Use raw string for the regex pattern to avoid invalid escape sequence warning
-        ip_cmd = fr"grep 'Failed password' {log_file} | tail -1 | grep -oE r'([0-9]{{1,3}}\.?){{4}}'"
-        try:
-            last_ip = subprocess.check_output(ip_cmd, shell=True).decode('utf-8').strip()
-        except subprocess.CalledProcessError:
-            last_ip = "Keine"
-        
-        return attempts, last_ip
+
+        tailer = get_auth_log_tailer(log_file)
+        loop = asyncio.get_running_loop()
+        attempts, last_ip = await loop.run_in_executor(None, tailer.scan)
+
+        return attempts, last_ip or "Keine"
     except Exception as e:
         logger.error(f"Fehler beim Abrufen der SSH-Versuche: {e}")
-        return "N/A", "N/A"
\ No newline at end of file
+        return "N/A", "N/A"
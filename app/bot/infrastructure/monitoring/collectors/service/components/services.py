@@ -65,5 +65,5 @@ async def check_services_status(include_private=False):
         return results
         
     except Exception as e:
-        logger.debug(f"Fehler bei check_services_status: {str(e)}")
+        logger.debug("Fehler bei check_services_status: %s", str(e))
         return {"error": "⚠️ Fehler beim Überprüfen der Dienste"}
@@ -1,122 +1,141 @@
 import asyncio
 import logging
+import time
+from collections import deque
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Deque, Optional
 
 from app.shared.infrastructure.models import MetricModel
-from .components import docker
-from .components import security  
-from .components import services
-from .components.base import collect_service_data
+from app.shared.infrastructure.repositories.monitoring import get_metric_store
+from .components.base import ServiceSnapshot, collect_service_snapshot
 from app.shared.interfaces.logging.api import get_bot_logger
 logger = get_bot_logger()
 from app.shared.domain.monitoring.collectors import ServiceCollectorInterface
 
+SNAPSHOT_MAX_AGE = 15  # seconds a snapshot is reused by metrics and dashboards
+HISTORY_SIZE = 60
+
 class ServiceCollector(ServiceCollectorInterface):
+    """
+    Collects service state once per snapshot and derives everything else from it.
+
+    Metrics (collect_all), dashboard data (collect_game_services) and the
+    snapshot history all read the same ServiceSnapshot. A snapshot younger than
+    max_age is reused, and concurrent callers share one collection run.
+    """
+
+    def __init__(self, max_age: float = SNAPSHOT_MAX_AGE, history_size: int = HISTORY_SIZE):
+        self.max_age = max_age
+        self._last_snapshot: Optional[ServiceSnapshot] = None
+        self._in_flight: Optional[asyncio.Task] = None
+        self._history: Deque[ServiceSnapshot] = deque(maxlen=history_size)
+
+    async def collect_snapshot(self, max_age: Optional[float] = None) -> ServiceSnapshot:
+        """Returns a snapshot no older than max_age, collecting a new one if needed."""
+        max_age = self.max_age if max_age is None else max_age
+        snapshot = self._last_snapshot
+        if snapshot is not None and time.time() - snapshot.timestamp < max_age:
+            return snapshot
+
+        task = self._in_flight
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._in_flight = asyncio.create_task(self._collect())
+        return await asyncio.shield(task)
+
+    async def _collect(self) -> ServiceSnapshot:
+        snapshot = await collect_service_snapshot()
+        self._last_snapshot = snapshot
+        self._history.append(snapshot)
+        # Each snapshot is persisted once, however often it is read
+        get_metric_store().record_many(self.build_metrics(snapshot))
+        return snapshot
+
+    def history(self, limit: Optional[int] = None) -> List[ServiceSnapshot]:
+        """Returns the collected snapshots, oldest first (optionally only the last `limit`)."""
+        snapshots = list(self._history)
+        return snapshots[-limit:] if limit else snapshots
+
     async def collect_all(self) -> List[MetricModel]:
         """Implements the base collect_all method"""
         return await self.collect_service_metrics()
-        
+
     async def collect_game_services(self) -> Dict[str, Any]:
         """Collects game service status"""
-        return await services.check_services_status(include_private=False)
-    
+        return (await self.collect_snapshot()).services
+
     async def collect_service_metrics(self) -> List[MetricModel]:
         """Collects service metrics and returns them as a list of MetricModel objects"""
         logger.info("Collecting service metrics...")
-        
-        # Get raw data from your service collector
-        data = await collect_service_data()
-        
+        metrics = self.build_metrics(await self.collect_snapshot())
+        logger.info(f"Collected {len(metrics)} service metrics")
+        return metrics
+
+    @staticmethod
+    def build_metrics(snapshot: ServiceSnapshot) -> List[MetricModel]:
+        """Converts a ServiceSnapshot into MetricModel objects"""
         metrics = []
-        
-        # Use data to create metrics
-        # ... process docker_running, docker_errors, docker_details from data
-        # ... process ssh_attempts, last_ssh_ip from data
-        # ... process services from data
-        
-        # Collect service data in parallel
-        tasks = [
-            docker.get_docker_status(),
-            security.get_ssh_attempts(),
-            services.check_services_status(include_private=False)
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
+
         # Process Docker status
-        if not isinstance(results[0], Exception):
-            docker_running, docker_errors, docker_details = results[0]
-            
-            if isinstance(docker_running, int):
-                metrics.append(MetricModel(
-                    name="docker_running",
-                    value=docker_running,
-                    unit="count",
-                    metadata_json={"type": "service", "component": "docker"}
-                ))
-            
-            if isinstance(docker_errors, int):
-                metrics.append(MetricModel(
-                    name="docker_errors",
-                    value=docker_errors,
-                    unit="count",
-                    metadata_json={"type": "service", "component": "docker"}
-                ))
-            
-            # Process container details
-            if isinstance(docker_details, str):
-                for line in docker_details.strip().split("\n"):
-                    if ": " in line:
-                        container_name, status = line.split(": ", 1)
-                        metrics.append(MetricModel(
-                            name="container_status",
-                            value=1 if "Running" in status or "Up" in status else 0,
-                            unit="status",
-                            metadata_json={
-                                "type": "service", 
-                                "component": "docker",
-                                "container": container_name,
-                                "status_text": status
-                            }
-                        ))
-        
-        # Process SSH attempts
-        if not isinstance(results[1], Exception):
-            ssh_attempts, last_ssh_ip = results[1]
-            
-            if ssh_attempts not in ("N/A", "N/A (nur Linux)"):
-                try:
-                    ssh_attempts_val = int(ssh_attempts)
+        if isinstance(snapshot.docker_running, int):
+            metrics.append(MetricModel(
+                name="docker_running",
+                value=snapshot.docker_running,
+                unit="count",
+                metric_data={"type": "service", "component": "docker"}
+            ))
+
+        if isinstance(snapshot.docker_errors, int):
+            metrics.append(MetricModel(
+                name="docker_errors",
+                value=snapshot.docker_errors,
+                unit="count",
+                metric_data={"type": "service", "component": "docker"}
+            ))
+
+        # Process container details
+        if isinstance(snapshot.docker_details, str):
+            for line in snapshot.docker_details.strip().split("\n"):
+                if ": " in line:
+                    container_name, status = line.split(": ", 1)
                     metrics.append(MetricModel(
-                        name="ssh_attempts",
-                        value=ssh_attempts_val,
-                        unit="count",
-                        metadata_json={
-                            "type": "service", 
-                            "component": "security",
-                            "last_ip": last_ssh_ip
+                        name="container_status",
+                        value=1 if "Running" in status or "Up" in status else 0,
+                        unit="status",
+                        metric_data={
+                            "type": "service",
+                            "component": "docker",
+                            "container": container_name,
+                            "status_text": status
                         }
                     ))
-                except (ValueError, TypeError):
-                    pass
-        
-        # Process service status checks
-        if not isinstance(results[2], Exception) and isinstance(results[2], dict):
-            service_status = results[2]
-            
-            for service_name, status in service_status.items():
+
+        # Process SSH attempts
+        if snapshot.ssh_attempts not in ("N/A", "N/A (nur Linux)"):
+            try:
                 metrics.append(MetricModel(
-                    name="service_status",
-                    value=1 if any(x in status for x in ["Online", "✅", "✓"]) else 0,
-                    unit="status",
-                    metadata_json={
+                    name="ssh_attempts",
+                    value=int(snapshot.ssh_attempts),
+                    unit="count",
+                    metric_data={
                         "type": "service",
-                        "service_name": service_name,
-                        "status_text": status
+                        "component": "security",
+                        "last_ip": snapshot.last_ssh_ip
                     }
                 ))
-        
-        logger.info(f"Collected {len(metrics)} service metrics")
-        return metrics
+            except (ValueError, TypeError):
+                pass
+
+        # Process service status checks
+        for service_name, status in snapshot.services.items():
+            metrics.append(MetricModel(
+                name="service_status",
+                value=1 if any(x in status for x in ["Online", "✅", "✓"]) else 0,
+                unit="status",
+                metric_data={
+                    "type": "service",
+                    "service_name": service_name,
+                    "status_text": status
+                }
+            ))
 
+        return metrics
@@ -2,7 +2,7 @@ from .base import collect_system_data
 from .network import fetch_public_ip, get_network_stats
 from .storage import get_disk_usage_all
 from .system import get_system_uptime, get_cpu_temperature
-from .hardware import get_hardware_info
+from .hardware import get_hardware_info, get_static_hardware_info, get_dynamic_hardware_info
 
 __all__ = [
     'collect_system_data',
@@ -11,5 +11,7 @@ __all__ = [
     'get_disk_usage_all',
     'get_system_uptime',
     'get_cpu_temperature',
-    'get_hardware_info'
+    'get_hardware_info',
+    'get_static_hardware_info',
+    'get_dynamic_hardware_info'
 ]
\ No newline at end of file
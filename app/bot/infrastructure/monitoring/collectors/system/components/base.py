@@ -9,6 +9,7 @@ from .network import fetch_public_ip, get_network_stats
 from .storage import get_disk_usage_all
 from .system import get_system_uptime, get_cpu_temperature
 from .hardware import get_hardware_info
+from .sampler import get_system_sampler
 
 logger = logging.getLogger('homelab_bot')
 
@@ -21,11 +22,18 @@ async def collect_system_data():
     
     data = {}
     
-    # Basis-Systemdaten
-    data['cpu'] = psutil.cpu_percent(interval=1)
-    data['memory'] = psutil.virtual_memory()
-    data['swap'] = psutil.swap_memory()
-    data['disk'] = psutil.disk_usage('/')
+    # Basis-Systemdaten aus dem Hintergrund-Sampler (blockiert den Event-Loop nicht)
+    sampler = get_system_sampler()
+    sample = await sampler.get_latest()
+    data['cpu'] = sample.cpu_percent
+    data['memory'] = sample.memory
+    data['swap'] = sample.swap
+    data['disk'] = sample.disk
+    data['net_rates'] = {'sent': sample.net_sent_rate, 'recv': sample.net_recv_rate}
+    data['disk_io_rates'] = {'read': sample.disk_read_rate, 'write': sample.disk_write_rate}
+    # Trends über die gepufferte Historie
+    data['cpu_trend'] = sampler.summary('cpu_percent')
+    data['memory_trend'] = sampler.summary('memory_percent')
     data['platform'] = platform.system()
     data['release'] = platform.release()
     data['domain'] = DOMAIN
@@ -1,63 +1,83 @@
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, Optional
 import logging
-from .cpu import get_cpu_info
+from .cpu import get_cpu_info, get_cpu_static_info, get_cpu_dynamic_info
+from .gpu import get_gpu_static_info
 from .memory import get_memory_info
 from .network import get_network_info
 from .system import get_system_info
 from .power import get_power_info
-from .sensors import get_sensor_info
+from .sensors import get_sensor_info, get_sensor_inventory
 
 logger = logging.getLogger('homelab_bot')
 
-async def get_hardware_info() -> Dict[str, Any]:
-    """Sammelt alle Hardware-Informationen"""
-    try:
-        hardware_info = {}
-        
-        # Sammle Informationen von allen Modulen mit Logging
-        try:
-            cpu_info = await get_cpu_info()
-            logger.debug(f"CPU Info erhalten: {cpu_info}")
-            hardware_info.update(cpu_info)
-        except Exception as e:
-            logger.error(f"Error collecting CPU info during aggregation: {e}", exc_info=True)
+# Statisches Hardware-Inventar: wird einmal pro Prozess ermittelt
+_static_hardware_info: Optional[Dict[str, Any]] = None
+_static_hardware_lock: Optional[asyncio.Lock] = None
 
+def _collect_static_inventory_sync() -> Dict[str, Any]:
+    """Collects the blocking parts of the inventory (cpuinfo, GPUtil, sensor discovery). Runs in a worker thread."""
+    inventory = {}
+    for name, collector in (("CPU", get_cpu_static_info), ("GPU", get_gpu_static_info), ("Sensor", get_sensor_inventory)):
         try:
-            memory_info = await get_memory_info()
-            logger.debug(f"Memory Info erhalten: {memory_info}")
-            hardware_info.update(memory_info)
+            inventory.update(collector())
         except Exception as e:
-            logger.error(f"Error collecting Memory info during aggregation: {e}", exc_info=True)
+            logger.error(f"Error collecting static {name} info: {e}", exc_info=True)
+    return inventory
 
-        try:
-            network_info = await get_network_info()
-            logger.debug(f"Network Info erhalten: {network_info}")
-            hardware_info.update(network_info)
-        except Exception as e:
-            logger.error(f"Error collecting Network info during aggregation: {e}", exc_info=True)
+async def get_static_hardware_info(refresh: bool = False) -> Dict[str, Any]:
+    """Gibt das statische Hardware-Inventar zurück (CPU-Modell, Kerne, Threads, GPU, Sensoren, System).
 
-        try:
-            system_info = await get_system_info()
-            logger.debug(f"System Info erhalten: {system_info}")
-            hardware_info.update(system_info)
-        except Exception as e:
-            logger.error(f"Error collecting System info during aggregation: {e}", exc_info=True)
+    Computed once and cached for the lifetime of the process; concurrent first
+    callers share one collection. Pass refresh=True to re-read the inventory.
+    """
+    global _static_hardware_info, _static_hardware_lock
+    if _static_hardware_info is not None and not refresh:
+        return _static_hardware_info
 
-        try:
-            power_info = await get_power_info()
-            logger.debug(f"Power Info erhalten: {power_info}")
-            hardware_info.update(power_info)
-        except Exception as e:
-            logger.error(f"Error collecting Power info during aggregation: {e}", exc_info=True)
+    if _static_hardware_lock is None:
+        _static_hardware_lock = asyncio.Lock()
+    async with _static_hardware_lock:
+        if _static_hardware_info is not None and not refresh:
+            return _static_hardware_info
 
+        logger.debug("Ermittle statisches Hardware-Inventar...")
+        loop = asyncio.get_running_loop()
+        static_info = await loop.run_in_executor(None, _collect_static_inventory_sync)
         try:
-            sensor_info = await get_sensor_info()
-            logger.debug(f"Sensor Info erhalten: {sensor_info}")
-            hardware_info.update(sensor_info)
+            static_info.update(await get_system_info())
         except Exception as e:
-            logger.error(f"Error collecting Sensor info during aggregation: {e}", exc_info=True)
+            logger.error(f"Error collecting System info during inventory: {e}", exc_info=True)
+
+        _static_hardware_info = static_info
+        logger.debug("Statisches Hardware-Inventar: %s", static_info)
+        return _static_hardware_info
+
+async def get_dynamic_hardware_info() -> Dict[str, Any]:
+    """Sammelt die sich ändernden Hardware-Werte (Frequenz, Speicher, Netzwerk, Power, Temperaturen)"""
+    collectors = {
+        'CPU': get_cpu_dynamic_info(),
+        'Memory': get_memory_info(),
+        'Network': get_network_info(),
+        'Power': get_power_info(),
+        'Sensor': get_sensor_info(),
+    }
+    results = await asyncio.gather(*collectors.values(), return_exceptions=True)
 
-        logger.debug(f"Finale Hardware Info: {hardware_info}")
+    dynamic_info = {}
+    for name, result in zip(collectors.keys(), results):
+        if isinstance(result, Exception):
+            logger.error(f"Error collecting {name} info during aggregation: {result}", exc_info=result)
+            continue
+        dynamic_info.update(result)
+    return dynamic_info
+
+async def get_hardware_info() -> Dict[str, Any]:
+    """Sammelt alle Hardware-Informationen"""
+    try:
+        hardware_info = dict(await get_static_hardware_info())
+        hardware_info.update(await get_dynamic_hardware_info())
+        logger.debug("Finale Hardware Info: %s", hardware_info)
         return hardware_info
 
     except Exception as e:
@@ -68,4 +88,4 @@ async def get_hardware_info() -> Dict[str, Any]:
             'cpu_threads': "N/A",
             'ram_total': 0,
             'error': str(e)
-        }
\ No newline at end of file
+        }
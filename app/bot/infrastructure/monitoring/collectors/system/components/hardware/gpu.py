@@ -0,0 +1,27 @@
+import logging
+from typing import Dict, Any
+
+logger = logging.getLogger('homelab_bot')
+
+def get_gpu_static_info() -> Dict[str, Any]:
+    """Sammelt das GPU-Inventar (Name, VRAM). Blocking: GPUtil ruft nvidia-smi auf."""
+    try:
+        import GPUtil
+    except ImportError:
+        logger.debug("GPUtil nicht installiert, überspringe GPU-Inventar.")
+        return {}
+
+    try:
+        gpus = GPUtil.getGPUs()
+    except Exception as e:
+        logger.debug("Keine GPU-Informationen verfügbar: %s", e)
+        return {}
+
+    if not gpus:
+        return {'gpu_count': 0}
+
+    return {
+        'gpu_count': len(gpus),
+        'gpu_models': [gpu.name for gpu in gpus],
+        'gpu_memory_total': [f"{gpu.memoryTotal / 1024:.1f} GB" for gpu in gpus],
+    }
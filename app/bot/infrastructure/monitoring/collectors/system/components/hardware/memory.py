@@ -19,7 +19,7 @@ async def get_memory_info() -> Dict[str, Any]:
             'swap_percent': swap.percent
         }
         
-        logger.debug(f"Gesammelte Memory Informationen: {memory_info}")
+        logger.debug("Gesammelte Memory Informationen: %s", memory_info)
         return memory_info
     except Exception as e:
         logger.error(f"Error collecting memory information: {e}", exc_info=True)
@@ -12,7 +12,7 @@ def read_sysfs_file(path: str) -> str:
         with open(path, 'r') as f:
             return f.read().strip()
     except Exception as e:
-        logger.debug(f"Konnte {path} nicht lesen: {e}")
+        logger.debug("Konnte %s nicht lesen: %s", path, e)
         return None
 
 async def get_power_info() -> Dict[str, Any]:
@@ -32,7 +32,7 @@ async def get_power_info() -> Dict[str, Any]:
                     power_info['battery_remaining'] = f"{minutes} Minuten"
                 power_status.append(f"Batterie: {power_info['battery_percent']} ({power_info['battery_status']})")
         except Exception as e:
-            logger.debug(f"Keine Batterie gefunden: {e}")
+            logger.debug("Keine Batterie gefunden: %s", e)
 
         # CPU Power
         try:
@@ -48,7 +48,7 @@ async def get_power_info() -> Dict[str, Any]:
                         power_status.append(f"CPU Verbrauch: {power_info['cpu_power']}")
                         break
         except Exception as e:
-            logger.debug(f"Kein CPU Power-Monitoring verfügbar: {e}")
+            logger.debug("Kein CPU Power-Monitoring verfügbar: %s", e)
 
         # PSU Status
         try:
@@ -64,7 +64,7 @@ async def get_power_info() -> Dict[str, Any]:
                             power_info['psu_status'] = status
                             power_status.append(f"Netzteil: {status}")
         except Exception as e:
-            logger.debug(f"Kein PSU-Status verfügbar: {e}")
+            logger.debug("Kein PSU-Status verfügbar: %s", e)
 
         # Finale Power-Status Zusammenfassung
         if power_status:
@@ -4,6 +4,21 @@ from typing import Dict, Any
 
 logger = logging.getLogger('homelab_bot')
 
+def get_sensor_inventory() -> Dict[str, Any]:
+    """Ermittelt, welche Temperatur- und Lüftersensoren vorhanden sind (ändert sich zur Laufzeit nicht)"""
+    inventory = {'temperature_sensors': [], 'fan_sensors': []}
+    try:
+        temps = psutil.sensors_temperatures() if hasattr(psutil, "sensors_temperatures") else {}
+        inventory['temperature_sensors'] = sorted(temps.keys()) if temps else []
+    except Exception as e:
+        logger.debug("Keine Temperatursensoren gefunden: %s", e)
+    try:
+        fans = psutil.sensors_fans() if hasattr(psutil, "sensors_fans") else {}
+        inventory['fan_sensors'] = sorted(fans.keys()) if fans else []
+    except Exception as e:
+        logger.debug("Keine Lüftersensoren gefunden: %s", e)
+    return inventory
+
 async def get_sensor_info() -> Dict[str, Any]:
     """Sammelt Sensor-Informationen (Temperaturen, Lüfter etc.)"""
     try:
@@ -17,9 +17,9 @@ async def get_system_info() -> Dict[str, Any]:
         try:
             with open('/etc/hostname', 'r') as f:
                 real_hostname = f.read().strip()
-                logger.debug(f"Hostname aus /etc/hostname gelesen: {real_hostname}")
+                logger.debug("Hostname aus /etc/hostname gelesen: %s", real_hostname)
         except Exception as e:
-            logger.debug(f"Konnte /etc/hostname nicht lesen: {e}")
+            logger.debug("Konnte /etc/hostname nicht lesen: %s", e)
 
         # 2. Versuche NixOS config wenn noch kein Hostname gefunden
         if not real_hostname:
@@ -31,14 +31,14 @@ async def get_system_info() -> Dict[str, Any]:
                     hostname_match = re.search(r'hostName\s*=\s*"([^"]+)"', config_content)
                     if hostname_match:
                         real_hostname = hostname_match.group(1)
-                        logger.debug(f"Hostname aus NixOS config gelesen: {real_hostname}")
+                        logger.debug("Hostname aus NixOS config gelesen: %s", real_hostname)
             except Exception as e:
-                logger.debug(f"Konnte NixOS config nicht lesen: {e}")
+                logger.debug("Konnte NixOS config nicht lesen: %s", e)
 
         # 3. Fallback auf platform.node() wenn immer noch kein Hostname
         if not real_hostname:
             real_hostname = platform.node()
-            logger.debug(f"Fallback auf platform.node(): {real_hostname}")
+            logger.debug("Fallback auf platform.node(): %s", real_hostname)
             
         return {
             'system_platform': platform.platform(),
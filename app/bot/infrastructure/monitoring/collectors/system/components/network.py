@@ -1,7 +1,7 @@
-import aiohttp
 import psutil
 import logging
 from app.bot.infrastructure.config.feature_flags import OFFLINE_MODE
+from app.bot.infrastructure.messaging.async_http_client import get_async_http_client
 
 logger = logging.getLogger('homelab_bot')
 
@@ -10,14 +10,12 @@ async def fetch_public_ip():
     if OFFLINE_MODE:
         return "127.0.0.1 (Offline Mode)"
         
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get("https://api.ipify.org?format=json") as resp:
-                data = await resp.json()
-                return data.get("ip", "N/A")
-        except Exception as e:
-            logger.error(f"Error fetching public IP: {e}")
-            return "N/A"
+    try:
+        data = await get_async_http_client().get_json("https://api.ipify.org?format=json", timeout=5)
+        return data.get("ip", "N/A")
+    except Exception as e:
+        logger.error(f"Error fetching public IP: {e}")
+        return "N/A"
 
 async def get_network_stats():
     """Ermittelt Netzwerkstatistiken."""
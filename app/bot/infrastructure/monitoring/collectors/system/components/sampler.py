@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+import psutil
+
+logger = logging.getLogger('homelab_bot')
+
+SAMPLE_INTERVAL = 5    # Sekunden zwischen zwei Messungen
+HISTORY_SIZE = 120     # Anzahl gespeicherter Messungen (10 Minuten bei 5s)
+
+
+@dataclass
+class SystemSample:
+    """One point-in-time reading of the fast-changing system metrics."""
+    timestamp: float
+    cpu_percent: float
+    memory: Any  # psutil svmem
+    swap: Any    # psutil sswap
+    disk: Any    # psutil sdiskusage for '/'
+    net_sent_rate: float = 0.0   # bytes/s since previous sample
+    net_recv_rate: float = 0.0
+    disk_read_rate: float = 0.0
+    disk_write_rate: float = 0.0
+
+    @property
+    def memory_percent(self) -> float:
+        return self.memory.percent
+
+
+class SystemSampler:
+    """
+    Samples CPU, memory, network and disk in the background and keeps the
+    readings in a ring buffer. psutil is called from a worker thread so the
+    event loop never blocks, and readers get the latest sample in O(1).
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, history_size: int = HISTORY_SIZE):
+        self.interval = interval
+        self._history: Deque[SystemSample] = deque(maxlen=history_size)
+        self._task: Optional[asyncio.Task] = None
+        self._first_sample: Optional[asyncio.Future] = None
+        self._prev_counters = None  # (timestamp, net_io, disk_io)
+
+    @property
+    def running(self) -> bool:
+        if self._task is None or self._task.done():
+            return False
+        try:
+            # A task bound to another (e.g. already closed) loop will never run again
+            return self._task.get_loop() is asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+
+    def start(self) -> None:
+        """Starts the background sampling task on the running loop (idempotent)."""
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._first_sample = loop.create_future()
+        self._task = loop.create_task(self._run())
+        logger.debug("SystemSampler gestartet (Intervall %ss, Historie %s).", self.interval, self._history.maxlen)
+
+    async def stop(self) -> None:
+        """Stops the background sampling task."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        # The first reading measures over a short blocking window (in the worker
+        # thread) because cpu_percent(interval=None) has no baseline yet.
+        first = True
+        while True:
+            try:
+                sample = await loop.run_in_executor(None, self._take_sample, 0.1 if first else None)
+                self._history.append(sample)
+                if first and self._first_sample and not self._first_sample.done():
+                    self._first_sample.set_result(sample)
+                first = False
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Fehler beim System-Sampling: {e}", exc_info=True)
+                if first and self._first_sample and not self._first_sample.done():
+                    self._first_sample.set_exception(e)
+                    first = False
+            await asyncio.sleep(self.interval)
+
+    def _take_sample(self, cpu_interval: Optional[float] = None) -> SystemSample:
+        """Reads all fast-changing metrics. Runs in a worker thread."""
+        now = time.monotonic()
+        cpu = psutil.cpu_percent(interval=cpu_interval)
+        net_io = psutil.net_io_counters()
+        try:
+            disk_io = psutil.disk_io_counters()
+        except Exception:
+            disk_io = None
+
+        sample = SystemSample(
+            timestamp=time.time(),
+            cpu_percent=cpu,
+            memory=psutil.virtual_memory(),
+            swap=psutil.swap_memory(),
+            disk=psutil.disk_usage('/'),
+        )
+
+        if self._prev_counters:
+            prev_ts, prev_net, prev_disk = self._prev_counters
+            elapsed = now - prev_ts
+            if elapsed > 0:
+                if net_io and prev_net:
+                    sample.net_sent_rate = (net_io.bytes_sent - prev_net.bytes_sent) / elapsed
+                    sample.net_recv_rate = (net_io.bytes_recv - prev_net.bytes_recv) / elapsed
+                if disk_io and prev_disk:
+                    sample.disk_read_rate = (disk_io.read_bytes - prev_disk.read_bytes) / elapsed
+                    sample.disk_write_rate = (disk_io.write_bytes - prev_disk.write_bytes) / elapsed
+        self._prev_counters = (now, net_io, disk_io)
+        return sample
+
+    def latest(self) -> Optional[SystemSample]:
+        """Returns the most recent sample or None if nothing was sampled yet."""
+        return self._history[-1] if self._history else None
+
+    async def get_latest(self) -> SystemSample:
+        """Returns the most recent sample, starting the sampler and waiting for its first reading if needed."""
+        self.start()
+        sample = self.latest()
+        if sample is not None:
+            return sample
+        return await asyncio.shield(self._first_sample)
+
+    def history(self, limit: Optional[int] = None) -> List[SystemSample]:
+        """Returns the buffered samples, oldest first (optionally only the last `limit`)."""
+        samples = list(self._history)
+        return samples[-limit:] if limit else samples
+
+    def summary(self, attribute: str, limit: Optional[int] = None) -> Dict[str, float]:
+        """Returns min/max/avg of a numeric sample attribute over the buffered history."""
+        values = [getattr(s, attribute) for s in self.history(limit)]
+        values = [v for v in values if isinstance(v, (int, float))]
+        if not values:
+            return {}
+        return {
+            'min': round(min(values), 1),
+            'max': round(max(values), 1),
+            'avg': round(sum(values) / len(values), 1),
+            'samples': len(values),
+        }
+
+
+# Global sampler instance
+_system_sampler = SystemSampler()
+
+def get_system_sampler() -> SystemSampler:
+    """Gibt die globale SystemSampler-Instanz zurück"""
+    return _system_sampler
@@ -8,6 +8,7 @@ from typing import List
 from dotenv import load_dotenv
 
 from app.shared.infrastructure.models import MetricModel
+from app.shared.infrastructure.repositories.monitoring import get_metric_store
 from app.shared.domain.monitoring.collectors import SystemCollectorInterface
 from app.shared.interfaces.logging.api import get_bot_logger
 logger = get_bot_logger()
@@ -68,6 +69,17 @@ class SystemCollector(SystemCollectorInterface):
             metric_data={"type": "system", "component": "cpu"}
         ))
         
+        # CPU/Memory trends over the sampler's rolling history
+        for metric_name, trend_key in (("cpu_usage_avg", 'cpu_trend'), ("memory_percent_avg", 'memory_trend')):
+            trend = data.get(trend_key) or {}
+            if trend:
+                metrics.append(MetricModel(
+                    name=metric_name,
+                    value=trend['avg'],
+                    unit="percent",
+                    metric_data={"type": "system", "component": "trend", "min": trend['min'], "max": trend['max'], "samples": trend['samples']}
+                ))
+        
         # Add CPU hardware information from hardware_info
         if isinstance(data.get('hardware_info', {}), dict):
             # CPU model
@@ -203,7 +215,9 @@ class SystemCollector(SystemCollectorInterface):
                 unit="mbps",
                 metric_data={"type": "system", "component": "network"}
             ))
-        logger.debug(f"Collected {len(metrics)} system metrics")
+        logger.debug("Collected %s system metrics", len(metrics))
+        # Persist measurements for history charts (info metrics without unit carry no value)
+        get_metric_store().record_many(m for m in metrics if m.unit)
         return metrics
 
 
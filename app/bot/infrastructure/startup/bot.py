@@ -14,6 +14,12 @@ from .setup_hooks import (
 from app.bot.interfaces.commands.checks import check_guild_approval
 from app.bot.application.interfaces.bot import Bot as BotInterface
 from app.bot.application.interfaces.service_factory import ServiceFactory as ServiceFactoryInterface
+from app.bot.infrastructure.messaging.async_http_client import get_async_http_client
+from app.bot.infrastructure.discord.rest_scheduler import get_rest_scheduler
+from app.shared.infrastructure.repositories.monitoring import get_metric_store
+from app.bot.infrastructure.monitoring.collectors.system.components.sampler import get_system_sampler
+from app.shared.infrastructure.database.retention import get_retention_service
+from app.shared.infrastructure.logging.handlers.db_handler import close_database_handler
 
 logger = get_bot_logger()
 
@@ -107,6 +113,11 @@ class FoundryCord(commands.Bot, BotInterface):
                  logger.warning("on_ready: Cannot activate DB dashboards - DashboardWorkflow or LifecycleService not available/initialized.")
             # --- End Activation ---
 
+            # Persist collected metrics in batches from now on
+            get_metric_store().start()
+            # Prune expired metrics, alerts, snapshots and logs periodically
+            get_retention_service().start()
+
             # Start the internal API server only if initialization was successful
             if hasattr(self, 'internal_api_server') and self.internal_api_server:
                 await self.internal_api_server.start()
@@ -164,7 +175,15 @@ class FoundryCord(commands.Bot, BotInterface):
         if hasattr(self, 'workflow_manager') and self.workflow_manager:
             await self.workflow_manager.cleanup_all()
 
+        await get_rest_scheduler().shutdown()
+        await get_async_http_client().close()
+        await get_system_sampler().stop()
+        await get_metric_store().close()
+        await get_retention_service().stop()
+
         logger.info("Bot resources cleaned up successfully")
+        # Last, so the shutdown messages above still reach the database
+        await close_database_handler()
 
     async def setup_hook(self):
         """Setup hook called when bot is starting up. ServiceFactory moved to __init__."""
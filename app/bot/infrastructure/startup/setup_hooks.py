@@ -14,6 +14,7 @@ from app.bot.application.workflows.channel_workflow import ChannelWorkflow
 from app.bot.application.workflows.dashboard_workflow import DashboardWorkflow
 from app.bot.application.workflows.task_workflow import TaskWorkflow
 from app.bot.application.workflows.user_workflow import UserWorkflow
+from app.bot.application.services.member_sync import MemberSyncListener
 from app.bot.application.workflows.guild_template_workflow import GuildTemplateWorkflow
 from app.bot.application.services.bot_control_service import BotControlService
 from app.bot.application.services.dashboard.component_loader_service import ComponentLoaderService
@@ -207,6 +208,9 @@ def register_workflows(bot):
         bot.workflow_manager.register_workflow(task_workflow, ['database'])
         bot.workflow_manager.register_workflow(user_workflow, ['database'])
 
+        # Member events feed the incremental member sync
+        bot.add_cog(MemberSyncListener(bot, user_workflow.member_sync))
+
         # Set explicit initialization order
         bot.workflow_manager.set_initialization_order([
             'database', 'guild', 'guild_template', 'category', 'channel',
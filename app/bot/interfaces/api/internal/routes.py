@@ -1,9 +1,10 @@
 import asyncio
 import os 
-import logging # Added
-import logging.handlers # Added
+import json
 from aiohttp import web
 from app.shared.interfaces.logging.api import get_bot_logger
+from app.shared.infrastructure.logging.handlers.ring_buffer_handler import get_ring_buffer_handler
+from app.bot.infrastructure.discord.rest_scheduler import get_rest_scheduler
 from typing import Optional, List # Added
 # Assuming the main bot class is accessible or passed in
 # from app.bot.core.main import FoundryCord 
@@ -16,41 +17,58 @@ logger = get_bot_logger()
 # async def read_last_n_lines(...):
 # def _sync_read_last_n_lines(...):
 
-# --- Helper to find MemoryHandler --- 
-def get_memory_handler() -> Optional[logging.handlers.MemoryHandler]:
-    """Finds the configured MemoryHandler instance."""
-    root_logger = logging.getLogger()
-    for handler in root_logger.handlers:
-        if isinstance(handler, logging.handlers.MemoryHandler):
-            return handler
-    logger.warning("No MemoryHandler found in root logger configuration.")
-    return None
+LOG_PAGE_LIMIT = 500          # max lines per /internal/logs response
+LOG_STREAM_KEEPALIVE = 15.0   # seconds between SSE keep-alive comments
+
+def _parse_cursor(value: Optional[str]) -> Optional[int]:
+    """Parses a ?since= / Last-Event-ID cursor; invalid values mean 'no cursor'."""
+    try:
+        return int(value) if value not in (None, "") else None
+    except ValueError:
+        return None
 
 # --- Handler for fetching logs --- 
 async def handle_get_logs(request: web.Request):
-    """Handles GET /internal/logs by reading from MemoryHandler."""
-    logger.debug("Internal API: Received /internal/logs request")
+    """Handles GET /internal/logs[?since=<seq>&limit=<n>] by reading from the log ring buffer."""
     try:
-        memory_handler = get_memory_handler()
-        if not memory_handler:
-            return web.json_response({"error": "Log buffering not configured"}, status=501) # 501 Not Implemented
-
-        # Get records from buffer and format them
-        log_records = memory_handler.buffer
-        # Ensure we have a formatter (use handler's target formatter or create default)
-        formatter = memory_handler.target.formatter if memory_handler.target and memory_handler.target.formatter else logging.Formatter()
-        
-        # Format records in reverse order (newest first) if desired, or keep original order
-        # formatted_logs = [formatter.format(record) for record in reversed(log_records)]
-        formatted_logs = [formatter.format(record) for record in log_records]
-
-        response_body = {"logs": formatted_logs}
-        return web.json_response(response_body, status=200)
-        
+        ring = get_ring_buffer_handler()
+        since = _parse_cursor(request.query.get('since'))
+        limit = min(_parse_cursor(request.query.get('limit')) or LOG_PAGE_LIMIT, LOG_PAGE_LIMIT)
+        page = ring.entries_since(since, limit=limit)
+        # 'logs' keeps the plain line list for existing clients
+        page['logs'] = [entry['line'] for entry in page['entries']]
+        return web.json_response(page, status=200)
+
     except Exception as e:
-        logger.error(f"Error retrieving logs from memory handler: {e}", exc_info=True)
+        logger.error(f"Error retrieving logs from ring buffer: {e}", exc_info=True)
         return web.json_response({"error": "Failed to retrieve logs from memory"}, status=500)
 
+# --- Handler for streaming logs (Server-Sent Events) --- 
+async def handle_stream_logs(request: web.Request):
+    """Handles GET /internal/logs/stream: sends new log lines as SSE events, resumable via Last-Event-ID."""
+    ring = get_ring_buffer_handler()
+    since = _parse_cursor(request.headers.get('Last-Event-ID') or request.query.get('since'))
+    response = web.StreamResponse(headers={
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+    await response.prepare(request)
+    # No per-event logging here: every log line would produce another event
+    try:
+        while True:
+            page = ring.entries_since(since, limit=LOG_PAGE_LIMIT)
+            if page['missed']:
+                await response.write(f"event: missed\ndata: {json.dumps({'count': page['missed']})}\n\n".encode())
+            for entry in page['entries']:
+                await response.write(f"id: {entry['seq']}\nevent: log\ndata: {json.dumps(entry)}\n\n".encode())
+            since = page['next']
+            if not page['entries'] and not await ring.wait_for_entries(since, timeout=LOG_STREAM_KEEPALIVE):
+                await response.write(b": keep-alive\n\n")
+    except ConnectionResetError:
+        logger.debug("Internal API: Log stream client disconnected")
+    return response
+
 # --- Handler for triggering Guild Approval Workflow --- 
 async def handle_trigger_approve_guild(request: web.Request):
     """Handles POST /internal/trigger/approve_guild/{guild_id}"""
@@ -115,6 +133,11 @@ async def handle_ping(request: web.Request):
     logger.debug("Internal API: Sending 200 response for /internal/ping")
     return web.json_response(response_body, status=200)
 
+# --- Handler for Discord REST scheduler metrics ---
+async def handle_get_rest_metrics(request: web.Request):
+    """Handles GET /internal/rest-scheduler: queue depth, counters and latencies of outgoing Discord calls"""
+    return web.json_response(get_rest_scheduler().metrics(), status=200)
+
 # --- NEW: Handler for triggering Template Application Workflow --- 
 async def handle_apply_guild_template(request: web.Request):
     """Handles POST /guilds/{guild_id}/apply_template"""
@@ -174,6 +197,8 @@ def setup_internal_routes(app: web.Application):
     router.add_post('/internal/trigger/approve_guild/{guild_id}', handle_trigger_approve_guild)
     router.add_get('/internal/ping', handle_ping)
     router.add_get('/internal/logs', handle_get_logs)
+    router.add_get('/internal/logs/stream', handle_stream_logs)
+    router.add_get('/internal/rest-scheduler', handle_get_rest_metrics)
     # --- NEW ROUTE --- 
     router.add_post('/guilds/{guild_id}/apply_template', handle_apply_guild_template)
     # -----------------
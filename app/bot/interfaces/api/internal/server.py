@@ -10,14 +10,16 @@ logger = get_bot_logger()
 @web.middleware
 async def request_logger_middleware(request: web.Request, handler):
     """Logs basic information about each incoming request."""
+    # Log tail requests are logged at DEBUG, otherwise every poll would show up in the tail itself
+    log = logger.debug if request.path.startswith('/internal/logs') else logger.info
     # Log before handling the request
-    logger.info(f"Internal API: Received request - Method={request.method}, Path={request.path}, Peer={request.remote}")
+    log(f"Internal API: Received request - Method={request.method}, Path={request.path}, Peer={request.remote}")
     start_time = asyncio.get_event_loop().time()
     try:
         response = await handler(request)
         # Log after handling the request
         duration = (asyncio.get_event_loop().time() - start_time) * 1000 # duration in ms
-        logger.info(f"Internal API: Responded to {request.method} {request.path} with status {response.status} in {duration:.2f}ms")
+        log(f"Internal API: Responded to {request.method} {request.path} with status {response.status} in {duration:.2f}ms")
         return response
     except web.HTTPException as http_exc:
         # Log HTTP exceptions specifically (like 404 Not Found, 400 Bad Request, etc.)
@@ -1,7 +1,7 @@
 import os
 import nextcord
 import functools
-from app.bot.infrastructure.messaging.message_sender import send_response, send_file_response, send_encrypted_ephemeral, send_ephemeral, send_dm
+from app.bot.infrastructure.messaging.message_sender import send_response, send_file_response, send_encrypted_ephemeral, send_ephemeral, send_dm, send_to_author
 
 def respond_in_channel():
     """Decorator: Responds directly in the channel."""
@@ -48,7 +48,7 @@ def respond_encrypted_in_dm():
                 if not encryption:
                     raise RuntimeError("Encryption service not loaded")
                 encrypted_data = await encryption.encrypt_data(response)
-                await ctx.author.send(f"🔐 Encrypted message:\n```\n{encrypted_data}\n```")
+                await send_to_author(ctx, lambda: {"content": f"🔐 Encrypted message:\n```\n{encrypted_data}\n```"})
         return wrapper
     return decorator
 
@@ -88,7 +88,7 @@ def respond_encrypted_file_in_dm():
                     f.write(encrypted_data)
                 
                 # Send encrypted file
-                await ctx.author.send(file=nextcord.File(encrypted_file_path))
+                await send_to_author(ctx, lambda: {"file": nextcord.File(encrypted_file_path)})
                 
                 # Clean up temporary file
                 os.remove(encrypted_file_path)
@@ -28,7 +28,7 @@ class GenericButtonComponent(BaseComponent):
         if self.config.get("custom_id") is None:
              self.config["custom_id"] = self.config.get("instance_id")
 
-        logger.debug(f"Initialized GenericButtonComponent for instance_id: {self.config.get('instance_id')}")
+        logger.debug("Initialized GenericButtonComponent for instance_id: %s", self.config.get('instance_id'))
 
 
     def build(self) -> Optional[nextcord.ui.Button]:
@@ -37,7 +37,7 @@ class GenericButtonComponent(BaseComponent):
             return None
 
         try:
-            logger.debug(f"[DIAGNOSTIC Button Build] Building button with self.config: {self.config}") # Changed to debug
+            logger.debug("[DIAGNOSTIC Button Build] Building button with self.config: %s", self.config) # Changed to debug
             
 
             # Now self.config should have the correct values merged from base definition
@@ -1,60 +1,153 @@
 """Dashboard embed component for displaying dashboard content."""
 
 import nextcord
-from typing import Optional, Dict, Any, ClassVar, List, Union
+from typing import Optional, Dict, Any, ClassVar, List, Union, NamedTuple
 
 from app.shared.interfaces.logging.api import get_bot_logger
 from app.bot.interfaces.dashboards.components.base_component import BaseComponent
+from app.bot.interfaces.dashboards.components.common.embeds.embed_template import (
+    CompiledTemplate,
+    compile_template,
+    format_list_to_string,
+)
 
 logger = get_bot_logger()
 
-def format_list_to_string(items: List[Any]) -> str:
-    """Formats a list into a bulleted string representation."""
-    if not items:
-        return "*Keine Einträge vorhanden*"
-    
-    formatted_items = []
-    for item in items:
-        # Attempt to get a meaningful representation
-        if hasattr(item, 'name'):
-            formatted_items.append(f"- {getattr(item, 'name')}")
-        elif hasattr(item, 'title'):
-            formatted_items.append(f"- {getattr(item, 'title')}")
-        elif isinstance(item, str):
-            formatted_items.append(f"- {item}")
-        elif isinstance(item, (int, float)):
-             formatted_items.append(f"- {str(item)}")
-        else:
-            # Fallback to generic string representation
-            try:
-                 item_str = str(item)
-                 # Optional: Truncate long representations
-                 if len(item_str) > 50:
-                      item_str = item_str[:47] + "..."
-                 formatted_items.append(f"- {item_str}")
-            except Exception:
-                 formatted_items.append("- *[Fehler bei Darstellung]*")
-            
-    return "\n".join(formatted_items)
-
 def format_string(template_string: Optional[str], data: Dict[str, Any]) -> str:
-    # This function now only needs to handle dict data, 
-    # as list data is handled directly in the build method.
+    # Templates are compiled once (see embed_template) and rendered in a single pass.
+    # List data is handled directly in the build method.
     if not template_string:
         return ""
     try:
-        formatted_string = template_string
-        if data and isinstance(data, dict): # Ensure data is a dictionary
-            for key, value in data.items():
-                placeholder = f'{{{{{key}}}}}' 
-                replacement_value = str(value) # Simple string conversion for dict values
-                formatted_string = formatted_string.replace(placeholder, replacement_value)
-        
-        return formatted_string
+        return compile_template(template_string).render(data if isinstance(data, dict) else None)
     except Exception as e:
-        logger.error(f"Error formatting string '{template_string[:50]}...' with dict data: {e}", exc_info=True)
+        logger.error(f"Error formatting string '{str(template_string)[:50]}...' with dict data: {e}", exc_info=True)
         return template_string # Return original on error
 
+
+class FieldPlan(NamedTuple):
+    """Compiled field config"""
+    name: CompiledTemplate
+    value: CompiledTemplate
+    inline: bool
+    is_single_placeholder: bool # Template is exactly one {{key}}, list data renders as bullets
+
+
+class EmbedRenderPlan(NamedTuple):
+    """Compiled templates of an embed config, built once per component instance"""
+    title: CompiledTemplate
+    description: CompiledTemplate
+    color: Any
+    fields: List[FieldPlan]
+    image_url: Optional[CompiledTemplate]
+    thumbnail_url: Optional[CompiledTemplate]
+    footer: Optional[Dict[str, Optional[CompiledTemplate]]]
+    author: Optional[Dict[str, Optional[CompiledTemplate]]]
+    timestamp: bool
+
+
+def _compile_optional(template: Optional[str]) -> Optional[CompiledTemplate]:
+    return compile_template(template) if template else None
+
+
+def compile_embed_plan(config: Dict[str, Any]) -> EmbedRenderPlan:
+    """Parses all templates of an embed config into an EmbedRenderPlan."""
+    instance_id = config.get('instance_id', 'UNKNOWN_INSTANCE')
+    fields = []
+    config_fields = config.get("fields", [])
+    if isinstance(config_fields, list):
+        for i, field in enumerate(config_fields):
+            if not isinstance(field, dict):
+                logger.warning(f"[{instance_id}] Field {i+1} in config is not a dict: {field}. Skipping.")
+                continue
+            value_template = field.get("value", "") # The template like {{projects}} or {{hostname}}
+            if not isinstance(value_template, str):
+                value_template = str(value_template)
+            fields.append(FieldPlan(
+                name=compile_template(field.get("name", "\u200b")),
+                value=compile_template(value_template),
+                inline=field.get("inline", True),
+                is_single_placeholder=value_template.startswith("{{") and value_template.endswith("}}") and value_template.count('{') == 2
+            ))
+    else:
+        logger.warning(f"[{instance_id}] 'fields' in config is not a list: {config_fields}. Skipping fields.")
+
+    footer = config.get("footer")
+    if isinstance(footer, dict):
+        footer = {"text": compile_template(footer.get("text", "")), "icon_url": _compile_optional(footer.get("icon_url"))}
+    elif isinstance(footer, str):
+        footer = {"text": compile_template(footer)}
+    else:
+        footer = None
+
+    author = config.get("author")
+    if isinstance(author, dict):
+        author = {
+            "name": compile_template(author.get("name", "")),
+            "url": _compile_optional(author.get("url")),
+            "icon_url": _compile_optional(author.get("icon_url")),
+        }
+    elif isinstance(author, str):
+        author = {"name": compile_template(author)}
+    else:
+        author = None
+
+    return EmbedRenderPlan(
+        title=compile_template(config.get("title", "Default Title")),
+        description=compile_template(config.get("description", "")),
+        color=config.get("color", nextcord.Color.blurple().value),
+        fields=fields,
+        image_url=_compile_optional(config.get("image_url")),
+        thumbnail_url=_compile_optional(config.get("thumbnail_url")),
+        footer=footer,
+        author=author,
+        timestamp=bool(config.get("timestamp", True)),
+    )
+
+
+def _render(template: Optional[CompiledTemplate], data: Optional[Dict[str, Any]]) -> str:
+    return template.render(data) if template is not None else ""
+
+
+def _format_projects(project_list: List[Any]) -> str:
+    if not project_list:
+        return "No projects found."
+    # Ensure project items are dictionaries before accessing .get()
+    formatted_lines = []
+    for p in project_list:
+        if isinstance(p, dict):
+            formatted_lines.append(f"- {p.get('name', 'N/A')} ({p.get('status', 'N/A')})")
+        else:
+            # Handle cases where items in the list might not be dicts
+            formatted_lines.append(f"- {str(p)}")
+    return "\\n".join(formatted_lines)
+
+
+def _format_server_status_summary(service_statuses: Dict[str, Any]) -> str:
+    online_count = 0
+    offline_count = 0
+    other_count = 0
+    for status in service_statuses.values():
+        if isinstance(status, str):
+            if 'online' in status.lower():
+                online_count += 1
+            elif 'offline' in status.lower():
+                offline_count += 1
+            else:
+                other_count += 1
+        else:
+            other_count += 1
+
+    summary_parts = []
+    if online_count > 0:
+        summary_parts.append(f"Online: {online_count}")
+    if offline_count > 0:
+        summary_parts.append(f"Offline: {offline_count}")
+    if other_count > 0:
+        summary_parts.append(f"Other: {other_count}")
+    return " | ".join(summary_parts) if summary_parts else "N/A"
+
+
 class DashboardEmbed(BaseComponent):
     """Main dashboard embed for displaying dashboard content."""
     
@@ -72,161 +165,91 @@ class DashboardEmbed(BaseComponent):
         """
         # Call the updated BaseComponent __init__ which handles the config merging
         super().__init__(bot=bot, instance_config=instance_config)
-        # No component-specific init logic needed here anymore, config is merged in base.
-        # logger.debug(f"Initialized DashboardEmbed component for instance_id: {self.config.get('instance_id')}")
+        # Compiled on first build, reset whenever the config changes
+        self._render_plan: Optional[EmbedRenderPlan] = None
+
+    @property
+    def render_plan(self) -> EmbedRenderPlan:
+        if self._render_plan is None:
+            self._render_plan = compile_embed_plan(self.config)
+        return self._render_plan
+
+    def update_config(self, new_config: Dict[str, Any]) -> None:
+        super().update_config(new_config)
+        self._render_plan = None
     
     def build(self, data: Optional[Union[Dict[str, Any], List[Any]]] = None) -> nextcord.Embed: # Allow data to be list or dict
         """Build and return the Discord embed object using the merged config and provided data."""
         instance_id = self.config.get('instance_id', 'UNKNOWN_INSTANCE')
         # Keep log minimal
-        data_type_log = type(data).__name__ if data is not None else 'None'
-        logger.debug(f"[{instance_id}] Building embed with data type: {data_type_log}") 
+        logger.debug("[%s] Building embed with data type: %s", instance_id, type(data).__name__ if data is not None else 'None')
         try:
-             title = self.config.get("title", "Default Title")
-             # Title/Description usually don't use list data directly
-             formatted_title = format_string(title, data if isinstance(data, dict) else {}) 
-             description = self.config.get("description", "")
-             formatted_description = format_string(description, data if isinstance(data, dict) else {})
-             color_value = self.config.get("color", nextcord.Color.blurple().value)
+             plan = self.render_plan
+             # Title, description and the other templates usually don't use list data directly
+             dict_data = data if isinstance(data, dict) else None
              embed = nextcord.Embed(
-                 title=formatted_title, 
-                 description=formatted_description, 
-                 color=color_value 
+                 title=plan.title.render(dict_data),
+                 description=plan.description.render(dict_data),
+                 color=plan.color
              )
 
-             fields = self.config.get("fields", [])
-             if isinstance(fields, list):
-                  for i, field in enumerate(fields):
-                      if isinstance(field, dict):
-                            field_name = field.get("name", "\u200b")
-                            field_value_template = field.get("value", "") # The template like {{projects}} or {{hostname}}
-                            field_inline = field.get("inline", True)
-                            
-                            formatted_field_value = "" # Default value
-
-                            # --- START SPECIAL LIST HANDLING ---
-                            # Check if data is a list AND the template looks like a simple placeholder {{key}}
-                            if isinstance(data, list) and field_value_template.startswith("{{") and field_value_template.endswith("}}") and field_value_template.count('{') == 2: 
-                                logger.debug(f"[{instance_id}] Field '{field_name}' processing as list data.")
-                                formatted_field_value = format_list_to_string(data) # Format the list directly
-                            # --- END SPECIAL LIST HANDLING ---
-                            
-                            # --- ELSE: Handle as dictionary (or if template is complex) ---
-                            elif isinstance(data, dict):
-                                logger.debug(f"[{instance_id}] Field '{field_name}' processing as dict data using format_string.")
-                                # --- START: Python formatting for 'projects' list --- 
-                                if field_value_template == '{{projects}}' and 'projects' in data and isinstance(data.get('projects'), list):
-                                    project_list = data.get('projects', [])
-                                    if project_list:
-                                        # Ensure project items are dictionaries before accessing .get()
-                                        formatted_lines = []
-                                        for p in project_list:
-                                            if isinstance(p, dict):
-                                                name = p.get('name', 'N/A')
-                                                status = p.get('status', 'N/A')
-                                                formatted_lines.append(f"- {name} ({status})")
-                                            else:
-                                                # Handle cases where items in the list might not be dicts
-                                                formatted_lines.append(f"- {str(p)}") 
-                                        formatted_field_value = "\\n".join(formatted_lines)
-                                    else:
-                                        formatted_field_value = "No projects found."
-                                    logger.debug(f"[{instance_id}] Field '{field_name}' formatted as project list: {formatted_field_value[:50]}...")
-                                # --- START: Python formatting for 'server_status_summary' (Keep this too) ---
-                                elif field_value_template == '{{server_status_summary}}' and 'services' in data and isinstance(data.get('services'), dict):
-                                    service_statuses = data.get('services', {})
-                                    online_count = 0
-                                    offline_count = 0
-                                    other_count = 0
-                                    for status in service_statuses.values():
-                                        if isinstance(status, str):
-                                            if 'online' in status.lower():
-                                                online_count += 1
-                                            elif 'offline' in status.lower():
-                                                offline_count += 1
-                                            else:
-                                                other_count += 1
-                                        else: 
-                                            other_count += 1
-                                            
-                                    summary_parts = []
-                                    if online_count > 0:
-                                        summary_parts.append(f"Online: {online_count}")
-                                    if offline_count > 0:
-                                        summary_parts.append(f"Offline: {offline_count}")
-                                    if other_count > 0:
-                                        summary_parts.append(f"Other: {other_count}")
-                                    
-                                    formatted_field_value = " | ".join(summary_parts) if summary_parts else "N/A"
-                                    logger.debug(f"[{instance_id}] Field '{field_name}' formatted as server status summary: {formatted_field_value}")
-                                else:
-                                    # --- ELSE: Fallback to generic format_string ---
-                                    try:
-                                        formatted_field_value = format_string(field_value_template, data)
-                                        logger.debug(f"[{instance_id}] Field '{field_name}' processed using format_string. Result: {formatted_field_value[:100]}...") 
-                                    except Exception as fmt_e:
-                                        logger.warning(f"[{instance_id}] Failed to format field '{field_name}' with template '{field_value_template}' using format_string: {fmt_e}", exc_info=False)
-                                        formatted_field_value = f"Error formatting field '{field_name}'"
-                                # --- END: Python formatting blocks ---
-                            # --- END ELSE ---
-                            
-                            else: # Fallback if data is not dict or list, or if template didn't match list pattern
-                                 logger.debug(f"[{instance_id}] Field '{field_name}' using template directly as data type ('{data_type_log}') was unexpected.")
-                                 formatted_field_value = field_value_template # Use template string as fallback
-
-                            embed.add_field(
-                                name=format_string(field_name, data if isinstance(data, dict) else {}), # Format name only with dict data
-                                value=formatted_field_value,
-                                inline=field_inline
-                            )
-                      else:
-                          logger.warning(f"[{instance_id}] Field {i+1} in config is not a dict: {field}. Skipping.")
-             else:
-                  logger.warning(f"[{instance_id}] 'fields' in config is not a list: {fields}. Skipping fields.")
+             for field in plan.fields:
+                 # --- START SPECIAL LIST HANDLING ---
+                 if isinstance(data, list) and field.is_single_placeholder:
+                     formatted_field_value = format_list_to_string(data) # Format the list directly
+                 # --- ELSE: Handle as dictionary ---
+                 elif dict_data is not None:
+                     template = field.value.source
+                     if template == '{{projects}}' and isinstance(data.get('projects'), list):
+                         formatted_field_value = _format_projects(data['projects'])
+                     elif template == '{{server_status_summary}}' and isinstance(data.get('services'), dict):
+                         formatted_field_value = _format_server_status_summary(data['services'])
+                     else:
+                         try:
+                             formatted_field_value = field.value.render(data)
+                         except Exception as fmt_e:
+                             logger.warning(f"[{instance_id}] Failed to format field '{field.name.source}' with template '{template}': {fmt_e}", exc_info=False)
+                             formatted_field_value = f"Error formatting field '{field.name.source}'"
+                 else: # Fallback if data is not dict or list, or if template didn't match list pattern
+                     formatted_field_value = field.value.source # Use template string as fallback
+
+                 embed.add_field(
+                     name=field.name.render(dict_data), # Format name only with dict data
+                     value=formatted_field_value,
+                     inline=field.inline
+                 )
  
              # Set image if provided
-             image_url = self.config.get("image_url")
-             if image_url:
-                 embed.set_image(url=format_string(image_url, data if isinstance(data, dict) else {}))
+             if plan.image_url is not None:
+                 embed.set_image(url=plan.image_url.render(dict_data))
  
              # Set thumbnail if provided
-             thumbnail_url = self.config.get("thumbnail_url")
-             if thumbnail_url:
-                 embed.set_thumbnail(url=format_string(thumbnail_url, data if isinstance(data, dict) else {}))
+             if plan.thumbnail_url is not None:
+                 embed.set_thumbnail(url=plan.thumbnail_url.render(dict_data))
  
              # Add footer if provided
-             footer_data = self.config.get("footer")
-             if isinstance(footer_data, dict):
-                  footer_text = footer_data.get("text", "")
-                  formatted_footer_text = format_string(footer_text, data if isinstance(data, dict) else {})
-                  footer_icon_url = footer_data.get("icon_url")
-                  embed.set_footer(
-                      text=formatted_footer_text,
-                      icon_url=format_string(footer_icon_url, data if isinstance(data, dict) else {})
-                  )
-             elif isinstance(footer_data, str): 
-                  embed.set_footer(text=format_string(footer_data, data if isinstance(data, dict) else {}))
+             if plan.footer is not None:
+                  if "icon_url" in plan.footer:
+                      embed.set_footer(text=plan.footer["text"].render(dict_data), icon_url=_render(plan.footer["icon_url"], dict_data))
+                  else:
+                      embed.set_footer(text=plan.footer["text"].render(dict_data))
  
              # Add author if provided
-             author_data = self.config.get("author")
-             if isinstance(author_data, dict):
-                   author_name = author_data.get("name", "")
-                   formatted_author_name = format_string(author_name, data if isinstance(data, dict) else {})
-                   author_url = author_data.get("url")
-                   author_icon_url = author_data.get("icon_url")
-                   embed.set_author(
-                       name=formatted_author_name,
-                       url=format_string(author_url, data if isinstance(data, dict) else {}),
-                       icon_url=format_string(author_icon_url, data if isinstance(data, dict) else {})
-                   )
-             elif isinstance(author_data, str): 
-                  embed.set_author(name=format_string(author_data, data if isinstance(data, dict) else {}))
+             if plan.author is not None:
+                   if "url" in plan.author:
+                       embed.set_author(
+                           name=plan.author["name"].render(dict_data),
+                           url=_render(plan.author["url"], dict_data),
+                           icon_url=_render(plan.author["icon_url"], dict_data)
+                       )
+                   else:
+                       embed.set_author(name=plan.author["name"].render(dict_data))
  
              # Add timestamp if configured
-             if self.config.get("timestamp", True):
+             if plan.timestamp:
                    embed.timestamp = nextcord.utils.utcnow()
  
-             logger.debug(f"[{instance_id}] Embed build successful.")
+             logger.debug("[%s] Embed build successful.", instance_id)
              return embed
  
         except Exception as e:
@@ -242,16 +265,19 @@ class DashboardEmbed(BaseComponent):
         """Add a field to the embed configuration."""
         if "fields" not in self.config or not isinstance(self.config["fields"], list):
             self.config["fields"] = []
+        self._render_plan = None
 
         self.config["fields"].append({
             "name": name,
             "value": value,
             "inline": inline
         })
+        self._render_plan = None
 
     def clear_fields(self) -> None:
         """Clear all fields from the embed configuration."""
         self.config["fields"] = []
+        self._render_plan = None
 
     @classmethod
     def deserialize(cls, data: Dict[str, Any], bot=None) -> 'DashboardEmbed':
@@ -0,0 +1,141 @@
+"""Compiled {{placeholder}} templates for dashboard embeds."""
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# {{key}}, {{nested.key}}, {{key|formatter}} or {{key|formatter:arg}}
+PLACEHOLDER_PATTERN = re.compile(r"\{\{([^{}|]+?)(?:\|([a-z_]+)(?::([^{}]*))?)?\}\}")
+
+TEMPLATE_CACHE_SIZE = 2048
+
+_MISSING = object()
+
+
+def format_list_to_string(items: List[Any]) -> str:
+    """Formats a list into a bulleted string representation."""
+    if not items:
+        return "*Keine Einträge vorhanden*"
+
+    formatted_items = []
+    for item in items:
+        # Attempt to get a meaningful representation
+        if hasattr(item, 'name'):
+            formatted_items.append(f"- {getattr(item, 'name')}")
+        elif hasattr(item, 'title'):
+            formatted_items.append(f"- {getattr(item, 'title')}")
+        elif isinstance(item, str):
+            formatted_items.append(f"- {item}")
+        elif isinstance(item, (int, float)):
+             formatted_items.append(f"- {str(item)}")
+        else:
+            # Fallback to generic string representation
+            try:
+                 item_str = str(item)
+                 # Optional: Truncate long representations
+                 if len(item_str) > 50:
+                      item_str = item_str[:47] + "..."
+                 formatted_items.append(f"- {item_str}")
+            except Exception:
+                 formatted_items.append("- *[Fehler bei Darstellung]*")
+
+    return "\n".join(formatted_items)
+
+
+def _format_bytes(value: Any, arg: Optional[str]) -> str:
+    size = float(value)
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if abs(size) < 1024 or unit == "TB":
+            break
+        size /= 1024
+    return f"{size:.{int(arg or 1)}f} {unit}"
+
+
+# Formatter name -> callable(value, arg). A failing formatter falls back to str(value).
+FORMATTERS: Dict[str, Callable[[Any, Optional[str]], str]] = {
+    "round": lambda value, arg: f"{float(value):.{int(arg or 0)}f}",
+    "percent": lambda value, arg: f"{float(value):.{int(arg or 1)}f}%",
+    "bytes": _format_bytes,
+    "list": lambda value, arg: format_list_to_string(value),
+    "upper": lambda value, arg: str(value).upper(),
+    "lower": lambda value, arg: str(value).lower(),
+    "default": lambda value, arg: str(value) if value not in (None, "") else (arg or ""),
+}
+
+
+class Placeholder:
+    """A single {{...}} occurrence: lookup path plus optional formatter"""
+
+    __slots__ = ("source", "key", "path", "formatter", "formatter_name", "arg")
+
+    def __init__(self, source: str, key: str, formatter_name: Optional[str] = None, arg: Optional[str] = None):
+        self.source = source
+        self.key = key
+        self.path: Tuple[str, ...] = tuple(key.split(".")) if "." in key else ()
+        self.formatter_name = formatter_name
+        self.formatter = FORMATTERS.get(formatter_name) if formatter_name else None
+        self.arg = arg
+
+    def lookup(self, data: Dict[str, Any]) -> Any:
+        if self.key in data:
+            return data[self.key]
+        current: Any = data
+        for part in self.path:
+            if isinstance(current, dict):
+                current = current.get(part, _MISSING)
+            elif isinstance(current, (list, tuple)) and part.isdigit() and int(part) < len(current):
+                current = current[int(part)]
+            else:
+                return _MISSING
+            if current is _MISSING:
+                return _MISSING
+        return current if self.path else _MISSING
+
+    def render(self, data: Dict[str, Any]) -> str:
+        value = self.lookup(data)
+        if value is _MISSING:
+            # Unknown keys stay visible, like the old str.replace based formatting
+            return (self.arg or "") if self.formatter_name == "default" else self.source
+        if self.formatter is None:
+            return str(value)
+        try:
+            return self.formatter(value, self.arg)
+        except (TypeError, ValueError):
+            return str(value)
+
+
+class CompiledTemplate:
+    """
+    A template string parsed once into literal text and placeholders.
+    render() is a single join over the parts instead of one str.replace per data key.
+    """
+
+    __slots__ = ("source", "parts", "placeholders")
+
+    def __init__(self, source: str):
+        self.source = source
+        parts: List[Any] = []
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            if match.start() > position:
+                parts.append(source[position:match.start()])
+            parts.append(Placeholder(match.group(0), match.group(1).strip(), match.group(2), match.group(3)))
+            position = match.end()
+        if position < len(source):
+            parts.append(source[position:])
+        self.parts = tuple(parts)
+        self.placeholders = tuple(part for part in parts if isinstance(part, Placeholder))
+
+    @property
+    def is_static(self) -> bool:
+        return not self.placeholders
+
+    def render(self, data: Optional[Dict[str, Any]]) -> str:
+        if not self.placeholders or not data:
+            return self.source
+        return "".join(part if part.__class__ is str else part.render(data) for part in self.parts)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(source: Optional[str]) -> CompiledTemplate:
+    """Returns the compiled form of a template string (cached per distinct string)."""
+    return CompiledTemplate(source or "")
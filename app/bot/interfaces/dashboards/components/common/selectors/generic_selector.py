@@ -31,7 +31,49 @@ class GenericSelectorComponent(BaseComponent):
         if self.config.get("custom_id") is None:
              self.config["custom_id"] = self.config.get("instance_id")
 
-        logger.debug(f"Initialized GenericSelectorComponent for instance_id: {self.config.get('instance_id')}")
+        # Validated options, built on first use; the component is reused across refreshes
+        self._select_options: Optional[List[nextcord.SelectOption]] = None
+
+        logger.debug("Initialized GenericSelectorComponent for instance_id: %s", self.config.get('instance_id'))
+
+    def update_config(self, new_config: Dict[str, Any]) -> None:
+        super().update_config(new_config)
+        self._select_options = None
+
+    def _get_select_options(self, instance_id: str) -> Optional[List[nextcord.SelectOption]]:
+        """Validates the configured options once; None if 'options' is not a list."""
+        if self._select_options is not None:
+            return self._select_options
+
+        options_data = self.config.get("options", [])
+        if not isinstance(options_data, list):
+            logger.error(f"[Selector Build - {instance_id}] 'options' in config is not a list: {options_data}. Cannot build selector.")
+            return None
+
+        select_options: List[nextcord.SelectOption] = []
+        for option_dict in options_data:
+            if not isinstance(option_dict, dict):
+                logger.warning(f"[Selector Build - {instance_id}] Skipping invalid option (not a dict): {option_dict}")
+                continue
+
+            label = option_dict.get("label")
+            value = option_dict.get("value")
+            if not label or not value:
+                 logger.warning(f"[Selector Build - {instance_id}] Skipping option with missing label or value: {option_dict}")
+                 continue
+
+            select_options.append(
+                nextcord.SelectOption(
+                    label=str(label),
+                    value=str(value),
+                    description=option_dict.get("description"),
+                    emoji=option_dict.get("emoji"),
+                    default=option_dict.get("default", False)
+                )
+            )
+
+        self._select_options = select_options
+        return select_options
 
     def build(self) -> Optional[nextcord.ui.Select]:
         """ Builds the nextcord.ui.Select instance based on the merged configuration. """
@@ -40,36 +82,11 @@ class GenericSelectorComponent(BaseComponent):
 
         try:
             instance_id = self.config.get('instance_id', 'UNKNOWN_INSTANCE')
-            logger.debug(f"[DIAGNOSTIC Selector Build - {instance_id}] Building selector with self.config: {self.config}")
+            logger.debug("[DIAGNOSTIC Selector Build - %s] Building selector with self.config: %s", instance_id, self.config)
 
-            options_data = self.config.get("options", [])
-            select_options: List[nextcord.SelectOption] = []
-
-            if not isinstance(options_data, list):
-                logger.error(f"[Selector Build - {instance_id}] 'options' in config is not a list: {options_data}. Cannot build selector.")
+            select_options = self._get_select_options(instance_id)
+            if select_options is None:
                 return None
-
-            for option_dict in options_data:
-                if not isinstance(option_dict, dict):
-                    logger.warning(f"[Selector Build - {instance_id}] Skipping invalid option (not a dict): {option_dict}")
-                    continue
-                
-                label = option_dict.get("label")
-                value = option_dict.get("value")
-                if not label or not value:
-                     logger.warning(f"[Selector Build - {instance_id}] Skipping option with missing label or value: {option_dict}")
-                     continue
-
-                select_options.append(
-                    nextcord.SelectOption(
-                        label=str(label),
-                        value=str(value),
-                        description=option_dict.get("description"),
-                        emoji=option_dict.get("emoji"),
-                        default=option_dict.get("default", False)
-                    )
-                )
-                
             if not select_options:
                  logger.warning(f"[Selector Build - {instance_id}] No valid options found after processing. Cannot build selector.")
                  return None
@@ -79,12 +96,12 @@ class GenericSelectorComponent(BaseComponent):
                 placeholder=self.config.get("placeholder", "Select an option..."),
                 min_values=self.config.get("min_values", 1),
                 max_values=self.config.get("max_values", 1),
-                options=select_options,
+                options=list(select_options),
                 row=self.config.get("row"), # Let nextcord handle default if None
                 disabled=not self.is_enabled()
             )
             
-            logger.debug(f"[Selector Build - {instance_id}] Successfully built selector.")
+            logger.debug("[Selector Build - %s] Successfully built selector.", instance_id)
             return select_menu
 
         except Exception as e:
@@ -1,7 +1,10 @@
 import nextcord
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, NamedTuple
+import hashlib
+import json
 import logging
 import asyncio
+from functools import partial
 from datetime import datetime
 
 # Interface Imports
@@ -9,10 +12,45 @@ from app.bot.application.interfaces.bot import Bot as BotInterface
 from app.bot.application.interfaces.service_factory import ServiceFactory as ServiceFactoryInterface
 from app.bot.application.interfaces.component_registry import ComponentRegistry as ComponentRegistryInterface
 from app.bot.application.services.dashboard.dashboard_data_service import DashboardDataService
+from app.shared.infrastructure.database.session.context import session_context
+from app.shared.infrastructure.repositories.dashboards.active_dashboard_repository_impl import ActiveDashboardRepositoryImpl
+from app.bot.infrastructure.discord.rest_scheduler import get_rest_scheduler, rest_route, RequestPriority
 
 from app.shared.interfaces.logging.api import get_bot_logger
 logger = get_bot_logger()
 
+
+def render_fingerprint(embed: Optional[nextcord.Embed], view: Optional[nextcord.ui.View]) -> str:
+    """
+    Stable hash of what a dashboard message shows: the embed dict and the component layout.
+    The embed timestamp is left out, it changes on every build; on a skipped edit the
+    message keeps the timestamp of its last visible change.
+    """
+    embed_dict = embed.to_dict() if embed else None
+    if embed_dict:
+        embed_dict.pop('timestamp', None)
+    components = view.to_components() if view else None
+    payload = json.dumps({'embed': embed_dict, 'components': components}, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+class ViewComponentPlan(NamedTuple):
+    """An interactive component resolved and instantiated for the build plan"""
+    instance_id: Any
+    config: Dict[str, Any]
+    component: Any
+
+
+class DashboardBuildPlan(NamedTuple):
+    """Everything build_embed/build_view need that only depends on the config"""
+    config: Dict[str, Any] # The config object the plan was compiled from
+    component_registry: Any
+    embed_component: Any # None if the config has no embed component
+    embed_component_key: Optional[str]
+    embed_error: Optional[str] # Message for an error embed instead of the component
+    embed_data_key: Optional[str] # First data source, passed to the embed
+    view_components: List[ViewComponentPlan]
+    complete: bool # False if something could not be resolved; such plans are not cached
+
 # TODO: Need access to ComponentRegistry, potentially passed during initialization or via bot
 # from app.bot.core.registries.component_registry import ComponentRegistry 
 
@@ -52,6 +90,10 @@ class DashboardController:
         self.bot = bot # Injected
         self.message_id = kwargs.get('message_id', None)
         self.message: Optional[nextcord.Message] = None
+        self.render_hash: Optional[str] = kwargs.get('render_hash', None) # Fingerprint of the content shown in message_id
+        self._confirmed_message_id: Optional[int] = None # Message this process has sent, edited or fetched
+        self.render_stats = {"sent": 0, "skipped": 0}
+        self._build_plan: Optional[DashboardBuildPlan] = None
         self.initialized = False
         self.rate_limits = {}
         
@@ -59,7 +101,7 @@ class DashboardController:
         self.component_registry = component_registry
         self.data_service = data_service
         
-        logger.debug(f"Initialized dashboard controller for {dashboard_type} dashboard {self.dashboard_id} with injected dependencies.")
+        logger.debug("Initialized dashboard controller for %s dashboard %s with injected dependencies.", dashboard_type, self.dashboard_id)
     
     async def initialize(self): # Removed bot parameter, as it's injected in __init__
         """Initialize the dashboard controller"""
@@ -86,7 +128,7 @@ class DashboardController:
         self.register_standard_handlers()
         
         self.initialized = True
-        logger.debug(f"Dashboard {self.dashboard_id} initialization complete.")
+        logger.debug("Dashboard %s initialization complete.", self.dashboard_id)
         return True
     
     
@@ -99,7 +141,7 @@ class DashboardController:
             'fields': fields or [],
             'footer': footer
         }
-        logger.debug(f"Registered embed {embed_id} for dashboard {self.dashboard_id}")
+        logger.debug("Registered embed %s for dashboard %s", embed_id, self.dashboard_id)
     
     def register_button(self, button_id, label, style="primary", emoji=None, row=0, disabled=False):
         """Register a button configuration"""
@@ -110,12 +152,12 @@ class DashboardController:
             'row': row,
             'disabled': disabled
         }
-        logger.debug(f"Registered button {button_id} for dashboard {self.dashboard_id}")
+        logger.debug("Registered button %s for dashboard %s", button_id, self.dashboard_id)
     
     def register_handler(self, component_id, handler_func):
         """Register a handler function for a component"""
         self.registered_handlers[component_id] = handler_func
-        logger.debug(f"Registered handler for {component_id} on dashboard {self.dashboard_id}")
+        logger.debug("Registered handler for %s on dashboard %s", component_id, self.dashboard_id)
     
     def register_standard_handlers(self):
         """Register standard handlers for common components"""
@@ -131,7 +173,7 @@ class DashboardController:
         await interaction.response.defer(ephemeral=True)
         
         # Refresh the dashboard
-        await self.display_dashboard()
+        await self.display_dashboard(force=True)
         
         await interaction.followup.send("Dashboard refreshed!", ephemeral=True)
     
@@ -166,10 +208,10 @@ class DashboardController:
 
         return await self.build_view(data)
     
-    async def display_dashboard(self):
-        """Display or update the dashboard in the channel"""
+    async def display_dashboard(self, force: bool = False):
+        """Display or update the dashboard in the channel. force=True edits even if the content is unchanged."""
         # --- ADD DEBUG LOG ---
-        logger.debug(f"[{self.dashboard_id}] display_dashboard: Method started.")
+        logger.debug("[%s] display_dashboard: Method started.", self.dashboard_id)
         # --- END DEBUG LOG ---
         try:
             if not self.initialized:
@@ -181,7 +223,7 @@ class DashboardController:
                 return None
 
             # --- ADD DEBUG LOG ---
-            logger.debug(f"[{self.dashboard_id}] display_dashboard: Checking data_service...")
+            logger.debug("[%s] display_dashboard: Checking data_service...", self.dashboard_id)
             # --- END DEBUG LOG ---
             if not self.data_service:
                 logger.error(f"[{self.dashboard_id}] display_dashboard: DataService not available.")
@@ -189,14 +231,14 @@ class DashboardController:
                 if channel:
                      await channel.send(embed=self.create_error_embed("Data service unavailable.", title="Display Error"))
                 return None
-            logger.debug(f"[{self.dashboard_id}] display_dashboard: DataService check passed.")
+            logger.debug("[%s] display_dashboard: DataService check passed.", self.dashboard_id)
 
             # --- ADD DEBUG LOG ---
-            logger.debug(f"[{self.dashboard_id}] display_dashboard: Calling fetch_dashboard_data...")
+            logger.debug("[%s] display_dashboard: Calling fetch_dashboard_data...", self.dashboard_id)
             # --- END DEBUG LOG ---
             data = await self.fetch_dashboard_data()
             # --- ADD DEBUG LOG ---
-            logger.debug(f"[{self.dashboard_id}] display_dashboard: fetch_dashboard_data returned: {data is not None}")
+            logger.debug("[%s] display_dashboard: fetch_dashboard_data returned: %s", self.dashboard_id, data is not None)
             # --- END DEBUG LOG ---
 
             if data is None: # Check if fetch failed critically
@@ -208,10 +250,10 @@ class DashboardController:
                      # Try to update existing message or send new one
                      await self._send_or_edit(channel, error_embed, None) # Send error embed, no view
                  return None
-            logger.debug(f"[{self.dashboard_id}] display_dashboard: Data fetched successfully.")
+            logger.debug("[%s] display_dashboard: Data fetched successfully.", self.dashboard_id)
             
             # --- ADDED DEBUG LOG --- #
-            logger.debug(f"[{self.dashboard_id}] DEBUG DATA BEFORE BUILD: {data}")
+            logger.debug("[%s] DEBUG DATA BEFORE BUILD: %s", self.dashboard_id, data)
             # --- END DEBUG LOG --- #
             
             # --- END Data Fetch ---
@@ -223,12 +265,11 @@ class DashboardController:
                 return None
 
             # --- ADDED DEBUG LOG & TRY/EXCEPT --- #
-            logger.debug(f"[{self.dashboard_id}] display_dashboard: Calling build_embed...")
+            logger.debug("[%s] display_dashboard: Calling build_embed...", self.dashboard_id)
             embed = None
             try:
                 embed = await self.build_embed(data)
-                embed_type = type(embed).__name__ if embed else 'None'
-                logger.debug(f"[{self.dashboard_id}] display_dashboard: build_embed returned type: {embed_type}")
+                logger.debug("[%s] display_dashboard: build_embed returned type: %s", self.dashboard_id, type(embed).__name__ if embed else 'None')
             except Exception as build_embed_err:
                 logger.error(f"[{self.dashboard_id}] display_dashboard: Error during build_embed: {build_embed_err}", exc_info=True)
                 # Optionally return an error embed here?
@@ -236,12 +277,11 @@ class DashboardController:
             # --- END DEBUG LOG & TRY/EXCEPT ---
 
             # --- ADDED DEBUG LOG & TRY/EXCEPT --- #
-            logger.debug(f"[{self.dashboard_id}] display_dashboard: Calling build_view...")
+            logger.debug("[%s] display_dashboard: Calling build_view...", self.dashboard_id)
             view = None
             try:
                 view = await self.build_view(data)
-                view_type = type(view).__name__ if view else 'None'
-                logger.debug(f"[{self.dashboard_id}] display_dashboard: build_view returned type: {view_type}")
+                logger.debug("[%s] display_dashboard: build_view returned type: %s", self.dashboard_id, type(view).__name__ if view else 'None')
             except Exception as build_view_err:
                  logger.error(f"[{self.dashboard_id}] display_dashboard: Error during build_view: {build_view_err}", exc_info=True)
                  # If embed exists but view fails, should we still send the embed?
@@ -250,17 +290,17 @@ class DashboardController:
             # --- END DEBUG LOG & TRY/EXCEPT ---
 
             # --- Send or Edit Message --- #
-            logger.debug(f"[{self.dashboard_id}] display_dashboard: Calling _send_or_edit...")
-            message_object = await self._send_or_edit(channel, embed, view)
+            logger.debug("[%s] display_dashboard: Calling _send_or_edit...", self.dashboard_id)
+            message_object = await self._send_or_edit(channel, embed, view, force=force)
             # --- END Send or Edit ---
 
             if message_object:
                 # Update internal message ID if changed/set
                 if self.message_id != str(message_object.id):
-                    logger.debug(f"[{self.dashboard_id}] display_dashboard: Updating internal message ID to {message_object.id}")
+                    logger.debug("[%s] display_dashboard: Updating internal message ID to %s", self.dashboard_id, message_object.id)
                     self.message_id = str(message_object.id)
                 
-                logger.debug(f"[{self.dashboard_id}] Dashboard displayed/updated. Message ID: {self.message_id}")
+                logger.debug("[%s] Dashboard displayed/updated. Message ID: %s", self.dashboard_id, self.message_id)
                 return message_object # Return the message object
             else:
                 logger.error(f"[{self.dashboard_id}] display_dashboard: _send_or_edit failed to return a message object.")
@@ -271,56 +311,65 @@ class DashboardController:
             return None
 
     # Helper for sending/editing message
-    async def _send_or_edit(self, channel: nextcord.TextChannel, embed: Optional[nextcord.Embed], view: Optional[nextcord.ui.View]) -> Optional[nextcord.Message]:
-        """Handles sending a new message or editing an existing one."""
+    async def _send_or_edit(self, channel: nextcord.TextChannel, embed: Optional[nextcord.Embed], view: Optional[nextcord.ui.View], force: bool = False) -> Optional[nextcord.Message]:
+        """Handles sending a new message or editing an existing one. Unchanged content is skipped unless force is set."""
         # --- ADD DEBUG LOG ---
-        current_msg_id = self.message.id if self.message else self.message_id
-        logger.debug(f"[{self.dashboard_id}] _send_or_edit: Started. Channel: {channel.id}, Current Msg Obj: {self.message is not None}, Current Msg ID: {current_msg_id}, Has Embed: {embed is not None}, Has View: {view is not None}")
+        if logger.debug_enabled:
+            current_msg_id = self.message.id if self.message else self.message_id
+            logger.debug("[%s] _send_or_edit: Started. Channel: %s, Current Msg Obj: %s, Current Msg ID: %s, Has Embed: %s, Has View: %s", self.dashboard_id, channel.id, self.message is not None, current_msg_id, embed is not None, view is not None)
         # --- END DEBUG LOG ---
+        fingerprint = render_fingerprint(embed, view)
+        if not force and fingerprint == self.render_hash:
+            unchanged_message = await self._unchanged_message(channel, view)
+            if unchanged_message is not None:
+                self.render_stats["skipped"] += 1
+                logger.debug("[%s] _send_or_edit: Content unchanged, skipped edit of message %s (sent: %s, skipped: %s).", self.dashboard_id, unchanged_message.id, self.render_stats["sent"], self.render_stats["skipped"])
+                return unchanged_message
+
         message_to_return = None
         if self.message:
             try:
                 # --- ADD DEBUG LOG ---
-                logger.debug(f"[{self.dashboard_id}] _send_or_edit: Attempting to edit existing message object {self.message.id}...")
+                logger.debug("[%s] _send_or_edit: Attempting to edit existing message object %s...", self.dashboard_id, self.message.id)
                 # --- END DEBUG LOG ---
-                await self.message.edit(embed=embed, view=view)
+                await self._edit_message(self.message, embed, view)
                 message_to_return = self.message
-                logger.debug(f"[{self.dashboard_id}] _send_or_edit: Edited existing message object {self.message.id} successfully.")
+                logger.debug("[%s] _send_or_edit: Edited existing message object %s successfully.", self.dashboard_id, self.message.id)
             except (nextcord.NotFound, nextcord.HTTPException) as e:
                 logger.warning(f"[{self.dashboard_id}] _send_or_edit: Failed to edit message object {self.message_id}: {e}. Sending new message.")
                 self.message = None # Reset message object
                 self.message_id = None # Reset message id
                 try:
                      # --- ADD DEBUG LOG ---
-                     logger.debug(f"[{self.dashboard_id}] _send_or_edit: Attempting to send new message after edit failure...")
+                     logger.debug("[%s] _send_or_edit: Attempting to send new message after edit failure...", self.dashboard_id)
                      # --- END DEBUG LOG ---
-                     message_to_return = await channel.send(embed=embed, view=view)
-                     logger.debug(f"[{self.dashboard_id}] _send_or_edit: Sent new message (ID: {message_to_return.id}) after edit failure.")
+                     message_to_return = await self._send_message(channel, embed, view)
+                     logger.debug("[%s] _send_or_edit: Sent new message (ID: %s) after edit failure.", self.dashboard_id, message_to_return.id)
                 except Exception as send_err:
                      logger.error(f"[{self.dashboard_id}] _send_or_edit: Failed to send new message after edit failure: {send_err}", exc_info=True)
         elif self.message_id:
             try:
                 # --- ADD DEBUG LOG ---
-                logger.debug(f"[{self.dashboard_id}] _send_or_edit: Attempting to fetch message {self.message_id}...")
+                logger.debug("[%s] _send_or_edit: Attempting to fetch message %s...", self.dashboard_id, self.message_id)
                 # --- END DEBUG LOG ---
-                msg = await channel.fetch_message(int(self.message_id))
+                msg = await self._fetch_message(channel, int(self.message_id))
                 # --- ADD DEBUG LOG ---
-                logger.debug(f"[{self.dashboard_id}] _send_or_edit: Fetched message {self.message_id}. Attempting to edit...")
+                logger.debug("[%s] _send_or_edit: Fetched message %s. Attempting to edit...", self.dashboard_id, self.message_id)
                 # --- END DEBUG LOG ---
-                await msg.edit(embed=embed, view=view)
+                await self._edit_message(msg, embed, view)
                 self.message = msg # Store fetched message object
                 message_to_return = msg
-                logger.debug(f"[{self.dashboard_id}] _send_or_edit: Fetched and edited message {self.message_id} successfully.")
+                logger.debug("[%s] _send_or_edit: Fetched and edited message %s successfully.", self.dashboard_id, self.message_id)
             except (nextcord.NotFound, nextcord.HTTPException) as e:
                 logger.warning(f"[{self.dashboard_id}] _send_or_edit: Failed to fetch/edit message {self.message_id}: {e}. Sending new message.")
                 self.message = None # Reset message object
                 self.message_id = None # Reset message id
                 try:
                     # --- ADD DEBUG LOG ---
-                    logger.debug(f"[{self.dashboard_id}] _send_or_edit: Attempting to send new message after fetch/edit failure...")
+                    logger.debug("[%s] _send_or_edit: Attempting to send new message after fetch/edit failure...", self.dashboard_id)
                     # --- END DEBUG LOG ---
-                    message_to_return = await channel.send(embed=embed, view=view)
-                    logger.debug(f"[{self.dashboard_id}] _send_or_edit: Sent new message (ID: {message_to_return.id}) after fetch/edit failure.")
+                    message_to_return = await self._send_message(channel, embed, view)
+                    logger.debug("[%s] _send_or_edit: Sent new message (ID: %s) after fetch/edit failure.", self.dashboard_id, message_to_return.id)
                 except Exception as send_err:
                     logger.error(f"[{self.dashboard_id}] _send_or_edit: Failed to send new message after fetch/edit failure: {send_err}", exc_info=True)
             except ValueError:
@@ -329,29 +378,104 @@ class DashboardController:
                  self.message_id = None
                  try:
                     # --- ADD DEBUG LOG ---
-                    logger.debug(f"[{self.dashboard_id}] _send_or_edit: Attempting to send new message after invalid ID format...")
+                    logger.debug("[%s] _send_or_edit: Attempting to send new message after invalid ID format...", self.dashboard_id)
                     # --- END DEBUG LOG ---
-                    message_to_return = await channel.send(embed=embed, view=view)
-                    logger.debug(f"[{self.dashboard_id}] _send_or_edit: Sent new message (ID: {message_to_return.id}) after invalid ID format.")
+                    message_to_return = await self._send_message(channel, embed, view)
+                    logger.debug("[%s] _send_or_edit: Sent new message (ID: %s) after invalid ID format.", self.dashboard_id, message_to_return.id)
                  except Exception as send_err:
                      logger.error(f"[{self.dashboard_id}] _send_or_edit: Failed to send new message after invalid ID format: {send_err}", exc_info=True)
         else:
             # No existing message, create new one
             try:
                 # --- ADD DEBUG LOG ---
-                logger.debug(f"[{self.dashboard_id}] _send_or_edit: No message ID found. Attempting to send new message...")
+                logger.debug("[%s] _send_or_edit: No message ID found. Attempting to send new message...", self.dashboard_id)
                 # --- END DEBUG LOG ---
-                message_to_return = await channel.send(embed=embed, view=view)
-                logger.debug(f"[{self.dashboard_id}] _send_or_edit: Sent new message (ID: {message_to_return.id}) successfully.")
+                message_to_return = await self._send_message(channel, embed, view)
+                logger.debug("[%s] _send_or_edit: Sent new message (ID: %s) successfully.", self.dashboard_id, message_to_return.id)
             except Exception as send_err:
                 logger.error(f"[{self.dashboard_id}] _send_or_edit: Failed to send initial message: {send_err}", exc_info=True)
 
+        if message_to_return:
+            self._confirmed_message_id = message_to_return.id
+            self.render_stats["sent"] += 1
+            await self._remember_render(str(message_to_return.id), fingerprint)
+        else:
+            self.render_hash = None
+
         # --- ADD DEBUG LOG ---
-        return_msg_id = message_to_return.id if message_to_return else 'None'
-        logger.debug(f"[{self.dashboard_id}] _send_or_edit: Finished. Returning message object with ID: {return_msg_id}")
+        if logger.debug_enabled:
+            return_msg_id = message_to_return.id if message_to_return else 'None'
+            logger.debug("[%s] _send_or_edit: Finished. Returning message object with ID: %s", self.dashboard_id, return_msg_id)
         # --- END DEBUG LOG ---
         return message_to_return
 
+    async def _edit_message(self, message: nextcord.Message, embed: Optional[nextcord.Embed], view: Optional[nextcord.ui.View]):
+        """Edits a dashboard message through the REST scheduler; a newer edit of the same message supersedes a queued one."""
+        return await get_rest_scheduler().submit(
+            partial(message.edit, embed=embed, view=view),
+            rest_route("PATCH", "/channels/{channel_id}/messages/{message_id}", self.channel_id),
+            RequestPriority.DASHBOARD,
+            coalesce_key=("dashboard_edit", self.channel_id, message.id),
+        )
+
+    async def _fetch_message(self, channel: nextcord.TextChannel, message_id: int) -> nextcord.Message:
+        return await get_rest_scheduler().submit(
+            partial(channel.fetch_message, message_id),
+            rest_route("GET", "/channels/{channel_id}/messages/{message_id}", channel.id),
+            RequestPriority.DASHBOARD,
+        )
+
+    async def _send_message(self, channel: nextcord.TextChannel, embed: Optional[nextcord.Embed], view: Optional[nextcord.ui.View]) -> nextcord.Message:
+        return await get_rest_scheduler().submit(
+            partial(channel.send, embed=embed, view=view),
+            rest_route("POST", "/channels/{channel_id}/messages", channel.id),
+            RequestPriority.DASHBOARD,
+        )
+
+    async def _unchanged_message(self, channel: nextcord.TextChannel, view: Optional[nextcord.ui.View]):
+        """
+        The current message if it already shows the rendered content.
+
+        Without an API call only for a message this process has sent, edited or fetched.
+        A message known only from the database (e.g. after a restart) is fetched once to
+        make sure it still exists; returns None if it does not, so the caller's
+        edit/send path recreates it.
+        """
+        message = self.message
+        if message is None or message.id != self._confirmed_message_id:
+            if not self.message_id:
+                return None
+            try:
+                message = await self._fetch_message(channel, int(self.message_id))
+            except (nextcord.HTTPException, ValueError, TypeError) as e:
+                logger.debug("[%s] Stored message %s could not be confirmed: %s", self.dashboard_id, self.message_id, e)
+                return None
+            self.message = message
+            self._confirmed_message_id = message.id
+        if view is not None:
+            # An edit would have registered the fresh view for this message; keep that behaviour
+            try:
+                self.bot.add_view(view, message_id=message.id)
+            except Exception as e:
+                logger.debug("[%s] Could not register view for unchanged message %s: %s", self.dashboard_id, message.id, e)
+        return message
+
+    async def _remember_render(self, message_id: str, fingerprint: str):
+        """Stores the fingerprint of the content now shown in message_id, persisting it if it changed."""
+        if fingerprint == self.render_hash and message_id == self.message_id:
+            return
+        self.message_id = message_id
+        self.render_hash = fingerprint
+        try:
+            instance_id = int(self.dashboard_id)
+        except (TypeError, ValueError):
+            return # Not backed by an ActiveDashboardEntity
+        try:
+            async with session_context() as session:
+                await ActiveDashboardRepositoryImpl(session).set_render_state(instance_id, message_id, fingerprint)
+        except Exception as e:
+            logger.warning(f"[{self.dashboard_id}] Failed to persist render state for message {message_id}: {e}")
+
     async def cleanup(self):
         """Clean up resources"""
         logger.info(f"Cleaning up dashboard {self.dashboard_id}")
@@ -363,140 +487,231 @@ class DashboardController:
         self.initialized = False
         self.message = None # Remove reference
 
+    # --- Build plan: component resolution done once per config --- 
+
+    def get_build_plan(self) -> 'DashboardBuildPlan':
+        """
+        Returns the build plan for the current config, compiling it if the config or
+        component registry object changed. Plans that hit resolution problems are not
+        kept, so components registered later are picked up on the next refresh.
+        """
+        plan = self._build_plan
+        if plan is None or plan.config is not self.config or plan.component_registry is not self.component_registry:
+            plan = self._compile_build_plan()
+            self._build_plan = plan if plan.complete else None
+        return plan
+
+    def invalidate_build_plan(self):
+        """Drops the cached build plan, e.g. after the config dict was modified in place."""
+        self._build_plan = None
+
+    def _compile_build_plan(self) -> 'DashboardBuildPlan':
+        config = self.config
+        component_registry = self.component_registry
+        complete = True
+        embed_component = None
+        embed_component_key = None
+        embed_error = None
+
+        if not config or 'components' not in config:
+            logger.warning(f"Dashboard {self.dashboard_id}: Config is missing or has no components key.")
+            embed_error = "Dashboard configuration is missing components."
+        else:
+            embed_component_config = None
+            # Find the first component definition that resolves to an embed type
+            for comp_config in config.get('components', []):
+                key = comp_config.get('component_key')
+                if not key:
+                    logger.warning(f"Dashboard {self.dashboard_id}: Component config missing 'component_key': {comp_config}")
+                    continue
+
+                if not component_registry:
+                    logger.error(f"Dashboard {self.dashboard_id}: Cannot build embed, ComponentRegistry is not available.")
+                    embed_error = "Internal Error: Component Registry unavailable."
+                    break
+
+                # Check the type of the component referenced by the key
+                definition_wrapper = component_registry.get_definition_by_key(key)
+                if definition_wrapper and definition_wrapper.get('type') == 'embed':
+                    # Found the primary embed component configuration
+                    embed_component_config = comp_config
+                    embed_component_key = key
+                    logger.debug("Dashboard %s: Found embed component config with key '%s' and instance_id '%s'", self.dashboard_id, key, comp_config.get('instance_id'))
+                    break # Use the first one found
+
+            if embed_error is None and embed_component_config is None:
+                logger.warning(f"Dashboard {self.dashboard_id}: No component with type 'embed' found in configuration.")
+            elif embed_error is None:
+                # Get the implementation class for 'embed'
+                component_class = component_registry.get_component_class('embed')
+                if not component_class:
+                    logger.error(f"Dashboard {self.dashboard_id}: No implementation class registered for component type 'embed'.")
+                    embed_error = "Internal Error: Embed component class not found."
+                else:
+                    try:
+                        # The component's __init__ (via BaseComponent) fetches the base definition
+                        # using component_key and merges it with instance settings.
+                        embed_component = component_class(self.bot, embed_component_config)
+                    except Exception as e:
+                        logger.error(f"Dashboard {self.dashboard_id}: Failed to instantiate embed component {embed_component_key}: {e}", exc_info=True)
+                        embed_error = f"Error building dashboard content ({embed_component_key})."
+        if embed_error:
+            complete = False
+
+        # Assumption: The first embed component uses the data from the first defined data source.
+        data_sources_config = config.get('data_sources', {}) if config else {}
+        embed_data_key = next(iter(data_sources_config), None) if data_sources_config else None
+
+        view_components: List[ViewComponentPlan] = []
+        interactive_components_ids = config.get('interactive_components', []) if config else [] # List of instance_ids
+        component_configs = config.get('components', []) if config else [] # Full definitions list
+        if interactive_components_ids and component_configs:
+            configs_by_instance_id: Dict[Any, Dict[str, Any]] = {}
+            for component_config in component_configs:
+                configs_by_instance_id.setdefault(component_config.get('instance_id'), component_config)
+
+            for instance_id_to_add in interactive_components_ids:
+                component_config = configs_by_instance_id.get(instance_id_to_add)
+                if not component_config:
+                    logger.warning(f"Interactive component config not found for instance_id '{instance_id_to_add}' in 'components' list for dashboard {self.dashboard_id}")
+                    continue
+                entry = self._resolve_view_component(component_config)
+                if entry is None:
+                    complete = False
+                else:
+                    view_components.append(entry)
+
+        return DashboardBuildPlan(
+            config=config,
+            component_registry=component_registry,
+            embed_component=embed_component,
+            embed_component_key=embed_component_key,
+            embed_error=embed_error,
+            embed_data_key=embed_data_key,
+            view_components=view_components,
+            complete=complete
+        )
+
+    def _resolve_view_component(self, component_config: Dict[str, Any]) -> Optional['ViewComponentPlan']:
+        """Resolves and instantiates an interactive component, or returns None (logged) if that fails."""
+        if not self.component_registry:
+            logger.error(f"[{self.dashboard_id}] Component Registry not available in add_component_to_view")
+            return None
+
+        component_key = component_config.get('component_key')
+        if not component_key:
+            instance_id = component_config.get('instance_id', 'N/A')
+            logger.warning(f"[{self.dashboard_id}] Component config (instance_id: {instance_id}) missing 'component_key': {component_config}")
+            return None
+
+        component_type = None
+        try:
+            if not hasattr(self.component_registry, 'get_type_by_key'):
+                 logger.error(f"[{self.dashboard_id}] ComponentRegistry is missing the required 'get_type_by_key' method.")
+                 return None
+            component_type = self.component_registry.get_type_by_key(component_key)
+            if not component_type:
+                logger.error(f"[{self.dashboard_id}] Component type not found in registry for key: {component_key}")
+                return None
+            logger.debug("[%s] Resolved component key '%s' to type '%s'.", self.dashboard_id, component_key, component_type)
+
+            component_impl_class = self.component_registry.get_component_class(component_type)
+            if not component_impl_class:
+                logger.error(f"[{self.dashboard_id}] Component implementation class not found in registry for type: {component_type} (from key: {component_key})")
+                return None
+
+            logger.debug("[DIAGNOSTIC Controller] Config passed to %s for key '%s' (Instance: %s): %s", component_impl_class.__name__, component_key, component_config.get('instance_id'), component_config)
+
+            # Pass the **entire instance config**, which includes component_key, instance_id, and settings
+            component = component_impl_class(self.bot, component_config)
+            component.dashboard_id = self.dashboard_id # Assign dashboard ID for context
+            if not (hasattr(component, 'add_to_view') and callable(component.add_to_view)):
+                logger.warning(f"Component type {component_type} does not have add_to_view method.")
+                return None
+            return ViewComponentPlan(component_config.get('instance_id'), component_config, component)
+
+        except Exception as e:
+            logger.error(f"[{self.dashboard_id}] Error adding component (key: {component_key}, type: {component_type}) to view: {e}", exc_info=True)
+            return None
+
     # --- Methods moved/adapted from DashboardBuilderService --- 
 
     async def build_embed(self, data: Dict[str, Any]) -> Optional[nextcord.Embed]:
         """
-        Builds the main embed for the dashboard by finding the first configured
-        embed component and calling its build() method.
+        Builds the main embed for the dashboard by binding data to the embed
+        component of the build plan (the first configured embed component).
         Assumes only one primary embed component per dashboard message.
         """
-        if not self.config or 'components' not in self.config:
-            logger.warning(f"Dashboard {self.dashboard_id}: Config is missing or has no components key.")
-            return self.create_error_embed("Dashboard configuration is missing components.")
-
-        embed_component_config = None
-        component_key = None
-
-        # Find the first component definition that resolves to an embed type
-        for comp_config in self.config.get('components', []):
-            key = comp_config.get('component_key')
-            if not key:
-                logger.warning(f"Dashboard {self.dashboard_id}: Component config missing 'component_key': {comp_config}")
-                continue
-
-            if not self.component_registry:
-                 logger.error(f"Dashboard {self.dashboard_id}: Cannot build embed, ComponentRegistry is not available.")
-                 return self.create_error_embed("Internal Error: Component Registry unavailable.")
-
-            # Check the type of the component referenced by the key
-            definition_wrapper = self.component_registry.get_definition_by_key(key)
-            if definition_wrapper and definition_wrapper.get('type') == 'embed':
-                 # Found the primary embed component configuration
-                 embed_component_config = comp_config
-                 component_key = key
-                 logger.debug(f"Dashboard {self.dashboard_id}: Found embed component config with key '{key}' and instance_id '{comp_config.get('instance_id')}'")
-                 break # Use the first one found
-
-        if not embed_component_config or not component_key:
-            logger.warning(f"Dashboard {self.dashboard_id}: No component with type 'embed' found in configuration.")
-            # Maybe return None or a default embed indicating no content?
+        plan = self.get_build_plan()
+        if plan.embed_error:
+            return self.create_error_embed(plan.embed_error)
+        if plan.embed_component is None:
             return None # No embed component defined
 
-        # Get the implementation class for 'embed'
-        component_class = self.component_registry.get_component_class('embed')
-        if not component_class:
-            logger.error(f"Dashboard {self.dashboard_id}: No implementation class registered for component type 'embed'.")
-            return self.create_error_embed("Internal Error: Embed component class not found.")
-
+        component_key = plan.embed_component_key
         try:
-            # Instantiate the component using the specific instance config from the layout
-            # The component's __init__ (via BaseComponent) will fetch the base definition
-            # using component_key and merge it with instance settings.
-            component_instance = component_class(self.bot, embed_component_config)
-
             # --- Extract the relevant data for the embed ---
-            # Assumption: The first embed component uses the data from the first defined data source.
             embed_data_to_pass = {}
-            data_sources_config = self.config.get('data_sources', {})
-            if data_sources_config and data: # Ensure config and fetched data exist
-                first_data_source_key = next(iter(data_sources_config), None)
-                if first_data_source_key and first_data_source_key in data:
-                    embed_data_to_pass = data.get(first_data_source_key, {})
-                    logger.debug(f"Dashboard {self.dashboard_id}: Extracted data for key '{first_data_source_key}' to pass to embed build.")
+            if plan.embed_data_key is not None and data: # Ensure config and fetched data exist
+                if plan.embed_data_key in data:
+                    embed_data_to_pass = data.get(plan.embed_data_key, {})
+                    logger.debug("Dashboard %s: Extracted data for key '%s' to pass to embed build.", self.dashboard_id, plan.embed_data_key)
                 else:
-                     logger.warning(f"Dashboard {self.dashboard_id}: First data source key '{first_data_source_key}' not found in fetched data keys: {list(data.keys())}. Passing empty dict to embed.")
+                     logger.warning(f"Dashboard {self.dashboard_id}: First data source key '{plan.embed_data_key}' not found in fetched data keys: {list(data.keys())}. Passing empty dict to embed.")
             else:
-                 logger.debug(f"Dashboard {self.dashboard_id}: No data sources configured or no data fetched. Passing empty dict to embed.")
+                 logger.debug("Dashboard %s: No data sources configured or no data fetched. Passing empty dict to embed.", self.dashboard_id)
             # --- End data extraction ---
 
             # --- Add Log for Extracted Data --- 
-            hostname_val = embed_data_to_pass.get('hostname', 'NOT_FOUND')
-            cpu_val = embed_data_to_pass.get('cpu_percent', 'NOT_FOUND')
-            logger.debug(f"[DIAGNOSTIC Controller - build_embed] Data to pass to embed: Hostname={hostname_val}, CPU={cpu_val}, Full Dict Keys: {list(embed_data_to_pass.keys())}")
+            if logger.debug_enabled:
+                hostname_val = embed_data_to_pass.get('hostname', 'NOT_FOUND')
+                cpu_val = embed_data_to_pass.get('cpu_percent', 'NOT_FOUND')
+                logger.debug("[DIAGNOSTIC Controller - build_embed] Data to pass to embed: Hostname=%s, CPU=%s, Full Dict Keys: %s", hostname_val, cpu_val, list(embed_data_to_pass.keys()))
             # --- End Log --- 
 
             # --- MODIFICATION START: Adapt data structure for template --- 
             final_data_for_build = embed_data_to_pass
             if 'items' in embed_data_to_pass and isinstance(embed_data_to_pass['items'], list):
-                logger.debug(f"Dashboard {self.dashboard_id}: Adapting data structure: found 'items' key. Renaming to 'projects' for template.")
+                logger.debug("Dashboard %s: Adapting data structure: found 'items' key. Renaming to 'projects' for template.", self.dashboard_id)
                 # Create a new dict matching the template's expected variable name
                 final_data_for_build = {'projects': embed_data_to_pass['items']}
             else:
-                logger.debug(f"Dashboard {self.dashboard_id}: Data structure already suitable or no 'items' key found. Passing as is.")
+                logger.debug("Dashboard %s: Data structure already suitable or no 'items' key found. Passing as is.", self.dashboard_id)
             # --- MODIFICATION END ---
 
             # Build the embed using the component's own build method
-            # --- MODIFIED: Pass the potentially adapted data dictionary ---
-            built_embed = component_instance.build(data=final_data_for_build) 
+            built_embed = plan.embed_component.build(data=final_data_for_build) 
 
             if not isinstance(built_embed, nextcord.Embed):
                  logger.error(f"Dashboard {self.dashboard_id}: Component {component_key} build() method did not return a nextcord.Embed object.")
                  return self.create_error_embed("Internal Error: Failed to build embed content.")
 
-            # Apply standard footer or dynamic data if needed (optional)
-            # Example: self.apply_standard_footer(built_embed)
-            # Example: Add dynamic data to description/fields if necessary
-            # built_embed.description = f"{built_embed.description}\\nLast updated: {datetime.now()}" # Example dynamic data
-
-            # --- MODIFICATION START: Change log level ---
-            logger.debug(f"Dashboard {self.dashboard_id}: Successfully built embed using component {component_key}.")
-            # --- MODIFICATION END ---
+            logger.debug("Dashboard %s: Successfully built embed using component %s.", self.dashboard_id, component_key)
             return built_embed
 
         except Exception as e:
-            logger.error(f"Dashboard {self.dashboard_id}: Failed to instantiate or build embed component {component_key}: {e}", exc_info=True)
+            logger.error(f"Dashboard {self.dashboard_id}: Failed to build embed component {component_key}: {e}", exc_info=True)
             return self.create_error_embed(f"Error building dashboard content ({component_key}).")
 
     async def build_view(self, data: Dict[str, Any]) -> Optional[nextcord.ui.View]:
-        """Build a view from configuration and data."""
+        """Build a view by binding data to the interactive components of the build plan."""
         try:
-            interactive_components_ids = self.config.get('interactive_components', []) # List of instance_ids
-            component_configs = self.config.get('components', []) # Full definitions list
-
-            if not interactive_components_ids or not component_configs:
+            plan = self.get_build_plan()
+            if not plan.view_components:
                 return None
 
             view = nextcord.ui.View(timeout=None)
-
-            # Add components to view based on interactive_components list
-            for instance_id_to_add in interactive_components_ids:
-                # Find the full config using instance_id
-                # --- ENSURE THIS LINE USES 'instance_id' ---
-                component_config = next((c for c in component_configs if c.get('instance_id') == instance_id_to_add), None)
-                # --- END ENSURE ---
-
-                if not component_config:
-                    logger.warning(f"Interactive component config not found for instance_id '{instance_id_to_add}' in 'components' list for dashboard {self.dashboard_id}")
-                    continue
-
-                # Create and add component to view
-                await self.add_component_to_view(view, component_config, data)
+            for entry in plan.view_components:
+                try:
+                    # Pass component_config (contains instance_id, key, settings) and fetched data
+                    await entry.component.add_to_view(view, data, entry.config)
+                except Exception as e:
+                    logger.error(f"[{self.dashboard_id}] Error adding component (instance_id: {entry.instance_id}) to view: {e}", exc_info=True)
 
             if len(view.children) > 0:
                 return view
             else:
-                logger.debug(f"View built but no components added for dashboard {self.dashboard_id}")
+                logger.debug("View built but no components added for dashboard %s", self.dashboard_id)
                 return None
 
         except Exception as e:
@@ -504,53 +719,14 @@ class DashboardController:
             return None
             
     async def add_component_to_view(self, view: nextcord.ui.View, component_config: Dict[str, Any], data: Dict[str, Any]):
-        """Add a component to a view."""
-        if not self.component_registry:
-            logger.error(f"[{self.dashboard_id}] Component Registry not available in add_component_to_view")
+        """Add a single component to a view, resolving it outside of the build plan."""
+        entry = self._resolve_view_component(component_config)
+        if entry is None:
             return
-
-        # --- MODIFIED: Get component_key instead of type ---
-        component_key = component_config.get('component_key')
-        if not component_key:
-            instance_id = component_config.get('instance_id', 'N/A')
-            logger.warning(f"[{self.dashboard_id}] Component config (instance_id: {instance_id}) missing 'component_key': {component_config}")
-            return
-
         try:
-
-            if not hasattr(self.component_registry, 'get_type_by_key'):
-                 logger.error(f"[{self.dashboard_id}] ComponentRegistry is missing the required 'get_type_by_key' method.")
-                 return
-            component_type = self.component_registry.get_type_by_key(component_key)
-            if not component_type:
-                logger.error(f"[{self.dashboard_id}] Component type not found in registry for key: {component_key}")
-                return
-            logger.debug(f"[{self.dashboard_id}] Resolved component key '{component_key}' to type '{component_type}'.")
-
-            component_impl_class = self.component_registry.get_component_class(component_type)
-
-
-            if not component_impl_class:
-                logger.error(f"[{self.dashboard_id}] Component implementation class not found in registry for type: {component_type} (from key: {component_key})")
-                return
-
-
-            logger.debug(f"[DIAGNOSTIC Controller] Config passed to {component_impl_class.__name__} for key '{component_key}' (Instance: {component_config.get('instance_id')}): {component_config}")
-
-
-            # Create component instance and add to view
-            # Pass the **entire instance config** found earlier, which includes component_key, instance_id, and settings
-            component = component_impl_class(self.bot, component_config)
-            component.dashboard_id = self.dashboard_id # Assign dashboard ID for context
-            # Check if the component has the add_to_view method
-            if hasattr(component, 'add_to_view') and callable(component.add_to_view):
-                 # Pass component_config (contains instance_id, key, settings) and fetched data
-                await component.add_to_view(view, data, component_config) # Pass config dict
-            else:
-                logger.warning(f"Component type {component_type} does not have add_to_view method.")
-
+            await entry.component.add_to_view(view, data, component_config)
         except Exception as e:
-            logger.error(f"[{self.dashboard_id}] Error adding component (key: {component_key}, type: {component_type}) to view: {e}", exc_info=True)
+            logger.error(f"[{self.dashboard_id}] Error adding component (instance_id: {entry.instance_id}) to view: {e}", exc_info=True)
             
     # --- Original methods below (load_components, display_dashboard etc remain largely the same) --- 
 
@@ -569,7 +745,7 @@ class DashboardController:
     async def fetch_dashboard_data(self) -> Optional[Dict[str, Any]]:
         """Fetches data required for this dashboard using the DashboardDataService."""
         # --- ADD DEBUG LOG ---
-        logger.debug(f"[{self.dashboard_id}] fetch_dashboard_data: Method started.")
+        logger.debug("[%s] fetch_dashboard_data: Method started.", self.dashboard_id)
         # --- END DEBUG LOG ---
         if not self.data_service:
             logger.error(f"[{self.dashboard_id}] fetch_dashboard_data: DashboardDataService not available.")
@@ -577,15 +753,15 @@ class DashboardController:
             
         data_sources = self.config.get('data_sources', {})
         # --- ADD DEBUG LOG ---
-        logger.debug(f"[{self.dashboard_id}] fetch_dashboard_data: Configured data sources: {data_sources}")
+        logger.debug("[%s] fetch_dashboard_data: Configured data sources: %s", self.dashboard_id, data_sources)
         # --- END DEBUG LOG ---
         if not data_sources:
-            logger.debug(f"[{self.dashboard_id}] fetch_dashboard_data: No data sources defined.")
+            logger.debug("[%s] fetch_dashboard_data: No data sources defined.", self.dashboard_id)
             return {} # Return empty dict if no sources defined
             
         try:
             # --- ADD DEBUG LOG ---
-            logger.debug(f"[{self.dashboard_id}] fetch_dashboard_data: Fetching data using data_service...")
+            logger.debug("[%s] fetch_dashboard_data: Fetching data using data_service...", self.dashboard_id)
             # --- END DEBUG LOG ---
             if not self.data_service:
                 logger.error(f"[{self.dashboard_id}] fetch_dashboard_data: DashboardDataService is not initialized.")
@@ -595,7 +771,7 @@ class DashboardController:
             context = {
                 'guild_id': self.guild_id
             }
-            logger.debug(f"[{self.dashboard_id}] fetch_dashboard_data: Passing context: {context}")
+            logger.debug("[%s] fetch_dashboard_data: Passing context: %s", self.dashboard_id, context)
             # Pass context to the data service fetch method
             data = await self.data_service.fetch_data(
                 data_sources_config=data_sources,
@@ -604,8 +780,9 @@ class DashboardController:
             # --- MODIFICATION END ---
             
             # --- ADD DEBUG LOG ---
-            data_keys = list(data.keys()) if data else 'None'
-            logger.debug(f"[{self.dashboard_id}] fetch_dashboard_data: Data fetched successfully. Keys: {data_keys}")
+            if logger.debug_enabled:
+                data_keys = list(data.keys()) if data else 'None'
+                logger.debug("[%s] fetch_dashboard_data: Data fetched successfully. Keys: %s", self.dashboard_id, data_keys)
             # --- END DEBUG LOG ---
             return data
         except Exception as e:
@@ -686,11 +863,11 @@ class DashboardController:
         logger.info(f"Refreshing dashboard {self.dashboard_id}")
         # No separate refresh_data needed if display_dashboard fetches fresh data
         # await self.refresh_data() # Removed call to non-existent method
-        return await self.display_dashboard()
+        return await self.display_dashboard(force=True)
 
     async def refresh_data(self):
         """Fetches new data and updates the displayed dashboard message."""
-        logger.debug(f"Dashboard {self.dashboard_id}: Starting data refresh.")
+        logger.debug("Dashboard %s: Starting data refresh.", self.dashboard_id)
         try:
             data = await self.fetch_dashboard_data()
             if data is None:
@@ -707,7 +884,7 @@ class DashboardController:
 
             await self.update_display(embed=embed, view=view)
             # --- MODIFICATION START: Change log level ---
-            logger.debug(f"Dashboard {self.dashboard_id}: Successfully refreshed and updated display.")
+            logger.debug("Dashboard %s: Successfully refreshed and updated display.", self.dashboard_id)
             # --- MODIFICATION END ---
 
         except Exception as e:
@@ -728,12 +905,22 @@ class DashboardController:
                 logger.error(f"Dashboard {self.dashboard_id}: Could not find channel {self.channel_id} to update display.")
                 return
 
+            fingerprint = render_fingerprint(embed, view)
+            if fingerprint == self.render_hash and await self._unchanged_message(channel, view) is not None:
+                self.render_stats["skipped"] += 1
+                logger.debug("Dashboard %s: Content unchanged, skipped edit of message %s.", self.dashboard_id, self.message_id)
+                return
+
             # Fetch the existing message
-            message = await channel.fetch_message(self.message_id)
+            message = await self._fetch_message(channel, int(self.message_id))
             
             # Edit the message
-            await message.edit(embed=embed, view=view)
-            logger.debug(f"Dashboard {self.dashboard_id}: Successfully edited message {self.message_id} in channel {self.channel_id}.")
+            await self._edit_message(message, embed, view)
+            self.message = message
+            self._confirmed_message_id = message.id
+            self.render_stats["sent"] += 1
+            await self._remember_render(str(self.message_id), fingerprint)
+            logger.debug("Dashboard %s: Successfully edited message %s in channel %s.", self.dashboard_id, self.message_id, self.channel_id)
 
         except nextcord.NotFound:
             logger.error(f"Dashboard {self.dashboard_id}: Message {self.message_id} not found in channel {self.channel_id}. Cannot update display. Maybe it was deleted?", exc_info=True)
@@ -22,6 +22,10 @@ class LoggingConfig:
     max_bytes: int = 1_000_000
     backup_count: int = 5
     
+    # Ring buffer for the owner console (sequence-numbered, 0 disables it)
+    ring_capacity: int = 2000
+    ring_level: str = "INFO"
+
     # Database logging
     log_to_db: bool = False
     db_level: str = "WARNING"
@@ -35,10 +39,11 @@ class LoggingConfig:
         # Clear existing handlers first to prevent duplicates on reconfigure
         root_logger.handlers.clear()
         
-        # --- MODIFICATION 1 & 4: Set root logger level directly to DEBUG ---
-        # We set it to DEBUG so that all messages are processed and can reach handlers (like MemoryHandler)
-        # Handlers themselves will filter based on their own configured levels.
-        root_logger.setLevel(logging.DEBUG)
+        # --- Root logger level: the lowest level any handler will actually output ---
+        # Handlers still filter on their own levels. Records below every handler level
+        # (e.g. DEBUG with console at INFO) are rejected by the logger's cached level
+        # check before a LogRecord is built; MemoryHandler only forwards to the console.
+        root_logger.setLevel(self.effective_level())
 
         # --- Suppress DEBUG logs from noisy libraries ---
         logging.getLogger("docker").setLevel(logging.WARNING)
@@ -85,6 +90,25 @@ class LoggingConfig:
         #     configured_handlers.append(file_handler)
         #     min_level = min(min_level, file_level_num)
 
+        # --- Setup Ring Buffer Handler (live log tail for the owner console) ---
+        if self.ring_capacity > 0:
+            # Lazy import: keeps this module free of infrastructure imports at load time
+            from app.shared.infrastructure.logging.handlers.ring_buffer_handler import get_ring_buffer_handler
+            ring_handler = get_ring_buffer_handler()
+            ring_handler.set_capacity(self.ring_capacity)
+            ring_handler.setFormatter(formatter)
+            ring_handler.setLevel(getattr(logging, self.ring_level, logging.INFO))
+            configured_handlers.append(ring_handler)
+
+        # --- Setup Database Handler (batched, written by a task on the event loop) ---
+        if self.log_to_db or "db" in self.handlers:
+            # Lazy import: the handler pulls in the database layer only when it writes
+            from app.shared.infrastructure.logging.handlers.db_handler import get_database_handler
+            db_handler = get_database_handler()
+            db_handler.setFormatter(formatter)
+            db_handler.setLevel(getattr(logging, self.db_level, logging.WARNING))
+            configured_handlers.append(db_handler)
+
         # Add all configured handlers to the root logger
         for handler in configured_handlers:
             root_logger.addHandler(handler)
@@ -92,6 +116,15 @@ class LoggingConfig:
         # --- MODIFICATION 5: Update final log message ---
         logging.info(f"Logging configured with handlers: {[h.__class__.__name__ for h in configured_handlers]}. Console level: {self.console_level}")
         
+    def effective_level(self) -> int:
+        """Lowest level among the enabled handlers"""
+        levels = [getattr(logging, self.console_level, logging.INFO)]
+        if self.ring_capacity > 0:
+            levels.append(getattr(logging, self.ring_level, logging.INFO))
+        if self.log_to_db or "db" in self.handlers:
+            levels.append(getattr(logging, self.db_level, logging.WARNING))
+        return min(levels)
+
     def update(self, config: Dict[str, Any]) -> None:
         """Update configuration with provided values"""
         for key, value in config.items():
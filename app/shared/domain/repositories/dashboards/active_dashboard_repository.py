@@ -48,6 +48,11 @@ class ActiveDashboardRepository(ABC):
         """Sets or updates the message_id for an active dashboard instance."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def set_render_state(self, instance_id: int, message_id: Optional[str], render_hash: Optional[str]) -> bool:
+        """Sets the message_id together with the render fingerprint of its content."""
+        raise NotImplementedError
+
     @abstractmethod
     async def set_active_status(self, instance_id: int, is_active: bool) -> bool:
         """Sets the active status for a dashboard instance."""
@@ -11,6 +11,13 @@ from .connection import (
     set_config
 )
 
+# Import from engine_registry.py
+from .engine_registry import (
+    EngineRegistry,
+    EngineSettings,
+    get_engine_registry
+)
+
 # Import from credential_provider.py
 from .credentials import (
     DatabaseCredentialManager, 
@@ -45,6 +52,11 @@ __all__ = [
     "get_config",
     "set_config",
     
+    # From engine_registry.py
+    "EngineRegistry",
+    "EngineSettings",
+    "get_engine_registry",
+    
     # From credential_provider.py
     "DatabaseCredentialManager",
     "AUTO_DB_CREDENTIAL_MANAGEMENT",
@@ -1,10 +1,12 @@
 """Database configuration."""
 import os
 from app.shared.interfaces.logging.api import get_bot_logger
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 import asyncio
 
+from .engine_registry import get_engine_registry
+
 logger = get_bot_logger()
 
 def get_database_url():
@@ -57,18 +59,10 @@ async def create_db_engine(url=None, max_retries=5, retry_interval=5):
         safe_url = url.replace(password, '[HIDDEN]')
     logger.info(f"Creating database engine with URL: {safe_url}")
     
-    # Make sure SQLAlchemy is properly imported
-    from sqlalchemy.ext.asyncio import create_async_engine
-    
     retries = 0
     while retries < max_retries:
         try:
-            engine = create_async_engine(
-                url,
-                echo=False,
-                pool_pre_ping=True,
-                future=True
-            )
+            engine = get_engine_registry().get_engine(url)
             
             # Test connection
             async with engine.begin() as conn:
@@ -99,11 +93,7 @@ async def initialize_session():
     if engine is None:
         engine = await initialize_engine()
     
-    async_session = sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False
-    )
+    async_session = get_engine_registry().get_session_factory(engine.url.render_as_string(hide_password=False))
     return async_session
 
 async def get_session():
@@ -121,21 +111,7 @@ async def get_session():
     finally:
         logger.debug("Database session closed")
 
-async def get_async_session():
+async def get_async_session() -> AsyncSession:
     """Create and return a new async session for isolated processes"""
-    # Erstellt eine isolierte Session mit eigener Verbindung
-    engine = create_async_engine(
-        DATABASE_URL,
-        echo=False,
-        future=True,
-        pool_pre_ping=True  # Prüft, ob die Verbindung noch funktioniert
-    )
-    
-    # Eigene Session-Factory pro Aufruf
-    session_factory = sessionmaker(
-        engine, 
-        class_=AsyncSession, 
-        expire_on_commit=False
-    )
-    
-    return session_factory()
\ No newline at end of file
+    # Eigene Session, aber aus dem gemeinsamen Pool statt mit eigener Engine pro Aufruf
+    return get_engine_registry().get_session_factory()()
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 Connection management for database operations.
 """
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 from contextlib import asynccontextmanager
 from sqlalchemy import select, update, text
@@ -11,6 +11,7 @@ import asyncio
 from app.shared.interfaces.logging.api import get_bot_logger
 from app.shared.infrastructure.models import ConfigEntity
 from .config import get_database_url
+from .engine_registry import get_engine_registry
 
 logger = get_bot_logger()
 
@@ -100,20 +101,10 @@ class DatabaseConnection:
             
         logger.info(f"Initializing database connection")
         
-        # Create engine with proper SQLAlchemy imports
-        from sqlalchemy.ext.asyncio import create_async_engine
-            
-        self._engine = create_async_engine(
-            connection_string, 
-            echo=False,
-            future=True
-        )
-        
-        self._session_factory = sessionmaker(
-            self._engine,
-            expire_on_commit=False,
-            class_=AsyncSession
-        )
+        # Shared engine and pool from the process-wide registry
+        registry = get_engine_registry()
+        self._engine = registry.get_engine(connection_string)
+        self._session_factory = registry.get_session_factory(connection_string)
         
         logger.info("Database connection initialized successfully")
         
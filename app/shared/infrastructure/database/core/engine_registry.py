@@ -0,0 +1,238 @@
+"""
+Process-wide registry of SQLAlchemy async engines.
+
+Every session helper (DatabaseConnection, DatabaseService, SessionFactory,
+core.config and models.base) obtains its engine here, so a process keeps one
+connection pool per database URL instead of one per helper.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.shared.interfaces.logging.api import get_db_logger
+
+logger = get_db_logger()
+
+
+@dataclass
+class EngineSettings:
+    """Pool configuration shared by all engines of the process."""
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_recycle: int = 1800          # seconds before a connection is replaced
+    pool_timeout: float = 30          # seconds to wait for a free connection
+    statement_cache_size: int = 100   # asyncpg prepared statements per connection
+    pool_pre_ping: bool = True
+    echo: bool = False
+
+    @classmethod
+    def from_env(cls) -> "EngineSettings":
+        """Reads DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_POOL_TIMEOUT and DB_STATEMENT_CACHE_SIZE."""
+        return cls(
+            pool_size=int(os.getenv('DB_POOL_SIZE', cls.pool_size)),
+            max_overflow=int(os.getenv('DB_MAX_OVERFLOW', cls.max_overflow)),
+            pool_recycle=int(os.getenv('DB_POOL_RECYCLE', cls.pool_recycle)),
+            pool_timeout=float(os.getenv('DB_POOL_TIMEOUT', cls.pool_timeout)),
+            statement_cache_size=int(os.getenv('DB_STATEMENT_CACHE_SIZE', cls.statement_cache_size)),
+            echo=os.getenv('DB_ECHO', 'false').lower() == 'true',
+        )
+
+
+class PoolMetrics:
+    """Counters for one connection pool."""
+
+    def __init__(self):
+        self.connects = 0          # new DBAPI connections (TCP + auth handshakes)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self._lock = threading.Lock()
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_time_total += seconds
+            self.wait_time_max = max(self.wait_time_max, seconds)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long each checkout waited for a connection."""
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep counting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def _registry_key(url: str) -> str:
+    return make_url(url).render_as_string(hide_password=False)
+
+
+class EngineRegistry:
+    """Creates one AsyncEngine (and session factory) per database URL and hands out the shared instances."""
+
+    def __init__(self, settings: Optional[EngineSettings] = None):
+        self.settings = settings or EngineSettings.from_env()
+        self._engines: Dict[str, AsyncEngine] = {}
+        self._session_factories: Dict[str, sessionmaker] = {}
+        self._lock = threading.Lock()
+
+    def _resolve_url(self, url: Optional[str]) -> str:
+        if url is None:
+            from .config import get_database_url
+            url = get_database_url()
+        return url
+
+    def _create_engine(self, url: str) -> AsyncEngine:
+        settings = self.settings
+        connect_args: Dict[str, Any] = {}
+        if make_url(url).drivername == "postgresql+asyncpg":
+            connect_args["prepared_statement_cache_size"] = settings.statement_cache_size
+
+        engine = create_async_engine(
+            url,
+            echo=settings.echo,
+            future=True,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_recycle=settings.pool_recycle,
+            pool_timeout=settings.pool_timeout,
+            pool_pre_ping=settings.pool_pre_ping,
+            connect_args=connect_args,
+        )
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            pool = engine.sync_engine.pool
+            if isinstance(pool, InstrumentedAsyncQueuePool):
+                pool.metrics.record_connect()
+
+        logger.info(
+            f"Created shared database engine for {make_url(url).render_as_string(hide_password=True)} "
+            f"(pool_size={settings.pool_size}, max_overflow={settings.max_overflow}, recycle={settings.pool_recycle}s)"
+        )
+        return engine
+
+    def get_engine(self, url: Optional[str] = None) -> AsyncEngine:
+        """Returns the shared engine for url (default: the configured application database)."""
+        url = self._resolve_url(url)
+        key = _registry_key(url)
+        engine = self._engines.get(key)
+        if engine is None:
+            with self._lock:
+                engine = self._engines.get(key)
+                if engine is None:
+                    engine = self._engines[key] = self._create_engine(url)
+        return engine
+
+    def get_session_factory(self, url: Optional[str] = None) -> sessionmaker:
+        """Returns the shared AsyncSession factory bound to the engine for url."""
+        url = self._resolve_url(url)
+        key = _registry_key(url)
+        factory = self._session_factories.get(key)
+        if factory is None:
+            engine = self.get_engine(url)
+            with self._lock:
+                factory = self._session_factories.get(key)
+                if factory is None:
+                    factory = self._session_factories[key] = sessionmaker(
+                        engine,
+                        class_=AsyncSession,
+                        expire_on_commit=False
+                    )
+        return factory
+
+    def get_pool_metrics(self, url: Optional[str] = None) -> Dict[str, Any]:
+        """Returns live pool figures for the engine of url (empty if no engine was created yet)."""
+        key = _registry_key(self._resolve_url(url))
+        engine = self._engines.get(key)
+        return self._describe(engine) if engine is not None else {}
+
+    def get_all_pool_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Returns pool figures for every registered engine, keyed by the password-masked URL."""
+        return {
+            engine.url.render_as_string(hide_password=True): self._describe(engine)
+            for engine in list(self._engines.values())
+        }
+
+    @staticmethod
+    def _describe(engine: AsyncEngine) -> Dict[str, Any]:
+        pool = engine.sync_engine.pool
+        data = {
+            "pool_class": type(pool).__name__,
+        }
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            data.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(0, pool.overflow()),
+                "max_overflow": pool._max_overflow,
+            })
+        metrics = getattr(pool, "metrics", None)
+        if metrics is not None:
+            waits = metrics.checkouts + metrics.timeouts
+            data.update({
+                "connects": metrics.connects,
+                "checkouts": metrics.checkouts,
+                "timeouts": metrics.timeouts,
+                "wait_ms_avg": round(metrics.wait_time_total / waits * 1000, 3) if waits else 0.0,
+                "wait_ms_max": round(metrics.wait_time_max * 1000, 3),
+            })
+        return data
+
+    async def dispose(self, url: Optional[str] = None) -> None:
+        """Closes pooled connections of one engine (or all). Engines stay registered and reconnect on demand."""
+        if url is not None:
+            engine = self._engines.get(_registry_key(url))
+            engines = [engine] if engine is not None else []
+        else:
+            engines = list(self._engines.values())
+        for engine in engines:
+            await engine.dispose()
+
+
+# Singleton instance
+_engine_registry: Optional[EngineRegistry] = None
+
+def get_engine_registry() -> EngineRegistry:
+    """Get the process-wide engine registry"""
+    global _engine_registry
+    if _engine_registry is None:
+        _engine_registry = EngineRegistry()
+    return _engine_registry
@@ -0,0 +1,28 @@
+"""Add member_sync_hash to discord_guilds
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    print(f"Applying migration {revision}: Add member_sync_hash to discord_guilds")
+    # Hash of the member set written by the last full member sync; NULL forces the next reconciliation
+    op.add_column('discord_guilds', sa.Column('member_sync_hash', sa.String(length=64), nullable=True))
+    print(f"Migration {revision} applied successfully.")
+
+
+def downgrade() -> None:
+    print(f"Reverting migration {revision}: Drop member_sync_hash from discord_guilds")
+    op.drop_column('discord_guilds', 'member_sync_hash')
+    print(f"Migration {revision} reverted successfully.")
@@ -0,0 +1,63 @@
+"""Create metrics storage: (name, timestamp) index and metric_rollups table
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    print(f"Applying migration {revision}: Create metrics storage")
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('metrics'):
+        op.create_table(
+            'metrics',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.Column('category', sa.String(length=50), nullable=False, index=True),
+            sa.Column('value', sa.Float(), nullable=False),
+            sa.Column('unit', sa.String(length=20), nullable=True),
+            sa.Column('timestamp', sa.DateTime(), nullable=False, server_default=sa.text('now()'), index=True),
+            sa.Column('host', sa.String(length=100), nullable=True, index=True),
+            sa.Column('service', sa.String(length=100), nullable=True, index=True),
+            sa.Column('metric_data', sa.JSON(), nullable=True),
+        )
+    op.create_index('ix_metrics_name_timestamp', 'metrics', ['name', 'timestamp'], unique=False)
+
+    op.create_table(
+        'metric_rollups',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('resolution', sa.String(length=4), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('sample_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('value_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('min_value', sa.Float(), nullable=False),
+        sa.Column('max_value', sa.Float(), nullable=False),
+        # Also serves (resolution, name, time range) queries
+        sa.UniqueConstraint('resolution', 'name', 'bucket_start', name='uq_metric_rollup_bucket'),
+    )
+    print(f"Migration {revision} applied successfully.")
+
+
+def downgrade() -> None:
+    """
+    Drops metric_rollups and the (name, timestamp) index, but keeps the metrics
+    table on purpose: upgrade() only creates it where it is missing, older
+    deployments got it outside the migrations, and it holds the raw samples.
+    A following upgrade() sees the existing table and only re-adds the index
+    and metric_rollups, so downgrade 013 / upgrade 014 round-trips cleanly.
+    """
+    print(f"Reverting migration {revision}: Drop metrics storage (keeping the metrics table)")
+    op.drop_table('metric_rollups')
+    op.drop_index('ix_metrics_name_timestamp', table_name='metrics')
+    print(f"Migration {revision} reverted successfully.")
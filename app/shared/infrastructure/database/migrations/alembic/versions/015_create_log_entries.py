@@ -0,0 +1,42 @@
+"""Create log_entries table for the database log handler
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    print(f"Applying migration {revision}: Create log_entries table")
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table('log_entries'):
+        print("Table log_entries already exists, skipping.")
+        return
+    op.create_table(
+        'log_entries',
+        sa.Column('id', sa.Integer(), primary_key=True, index=True),
+        sa.Column('timestamp', sa.DateTime(), nullable=True, index=True),
+        sa.Column('level', sa.String(length=10), nullable=True, index=True),
+        sa.Column('logger_name', sa.String(length=100), nullable=True, index=True),
+        sa.Column('message', sa.Text(), nullable=True),
+        sa.Column('module', sa.String(length=100), nullable=True),
+        sa.Column('function', sa.String(length=100), nullable=True),
+        sa.Column('line_num', sa.Integer(), nullable=True),
+        sa.Column('exception', sa.Text(), nullable=True),
+    )
+    print(f"Migration {revision} applied successfully.")
+
+
+def downgrade() -> None:
+    print(f"Reverting migration {revision}: Drop log_entries table")
+    op.drop_table('log_entries')
+    print(f"Migration {revision} reverted successfully.")
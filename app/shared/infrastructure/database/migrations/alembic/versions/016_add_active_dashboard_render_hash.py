@@ -0,0 +1,32 @@
+"""Add render_hash to active_dashboards
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    print(f"Applying migration {revision}: Add render_hash to active_dashboards")
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name'] for column in inspector.get_columns('active_dashboards')}
+    if 'render_hash' in columns:
+        print("Column active_dashboards.render_hash already exists, skipping.")
+        return
+    op.add_column('active_dashboards', sa.Column('render_hash', sa.String(length=64), nullable=True))
+    print(f"Migration {revision} applied successfully.")
+
+
+def downgrade() -> None:
+    print(f"Reverting migration {revision}: Drop render_hash from active_dashboards")
+    op.drop_column('active_dashboards', 'render_hash')
+    print(f"Migration {revision} reverted successfully.")
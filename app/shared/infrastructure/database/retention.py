@@ -0,0 +1,257 @@
+"""
+Retention for time-series and log tables.
+
+Expired rows are removed with chunked, set-based DELETEs: each chunk deletes
+at most `batch_size` rows selected by primary key and is committed on its
+own, so no run keeps a long transaction open or loads rows into memory.
+Policies are configured per table via RETENTION_<POLICY>_DAYS (0 disables a
+policy), the chunk size via RETENTION_BATCH_SIZE.
+"""
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import Column, DateTime, MetaData, Table, delete, inspect, select
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.interfaces.logging.api import get_db_logger
+from app.shared.infrastructure.database.session import session_context
+
+logger = get_db_logger()
+
+RETENTION_BATCH_SIZE = int(os.getenv('RETENTION_BATCH_SIZE', 5000))
+RETENTION_CHUNK_PAUSE = float(os.getenv('RETENTION_CHUNK_PAUSE', 0.05))  # seconds between chunks
+RETENTION_INTERVAL_HOURS = float(os.getenv('RETENTION_INTERVAL_HOURS', 6))
+
+# Tables created by migrations without an ORM model; only the columns retention needs.
+# Kept out of Base.metadata so create_all/autogenerate do not pick them up.
+unmapped_metadata = MetaData()
+Table(
+    'state_snapshots', unmapped_metadata,   # migration 010
+    Column('id', UUID(as_uuid=True), primary_key=True),
+    Column('timestamp', DateTime(timezone=True), nullable=False),
+)
+
+
+@dataclass
+class RetentionPolicy:
+    """How long rows of one table (optionally one slice of it) are kept."""
+    name: str                       # also the env suffix: RETENTION_<NAME>_DAYS
+    table: str
+    timestamp_column: str
+    max_age_days: float
+    filters: Dict[str, Any] = field(default_factory=dict)  # column == value restrictions
+    batch_size: int = RETENTION_BATCH_SIZE
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age_days > 0
+
+    def with_env_overrides(self) -> "RetentionPolicy":
+        days = os.getenv(f"RETENTION_{self.name.upper()}_DAYS")
+        if days is None:
+            return self
+        return RetentionPolicy(self.name, self.table, self.timestamp_column, float(days),
+                               dict(self.filters), self.batch_size)
+
+
+DEFAULT_POLICIES: List[RetentionPolicy] = [
+    RetentionPolicy('metrics', 'metrics', 'timestamp', 30),
+    RetentionPolicy('metric_rollups_1m', 'metric_rollups', 'bucket_start', 7, {'resolution': '1m'}),
+    RetentionPolicy('metric_rollups_1h', 'metric_rollups', 'bucket_start', 180, {'resolution': '1h'}),
+    RetentionPolicy('metric_rollups_1d', 'metric_rollups', 'bucket_start', 1825, {'resolution': '1d'}),
+    RetentionPolicy('alerts', 'alerts', 'created_at', 90),
+    RetentionPolicy('state_snapshots', 'state_snapshots', 'timestamp', 14),
+    RetentionPolicy('log_entries', 'log_entries', 'timestamp', 30),
+    RetentionPolicy('audit_logs', 'audit_logs', 'created_at', 365),
+]
+
+
+def load_policies() -> List[RetentionPolicy]:
+    """Default policies with RETENTION_<NAME>_DAYS overrides applied."""
+    return [policy.with_env_overrides() for policy in DEFAULT_POLICIES]
+
+
+@dataclass
+class TableRetentionResult:
+    policy: str
+    table: str
+    cutoff: Optional[datetime] = None
+    deleted: int = 0
+    chunks: int = 0
+    duration: float = 0.0
+    status: str = "pending"     # pending, running, done, disabled, missing, error
+    error: Optional[str] = None
+
+
+@dataclass
+class RetentionReport:
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    results: List[TableRetentionResult] = field(default_factory=list)
+
+    @property
+    def deleted(self) -> int:
+        return sum(result.deleted for result in self.results)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'started_at': self.started_at.isoformat(),
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'deleted': self.deleted,
+            'tables': [
+                {
+                    'policy': r.policy, 'table': r.table, 'status': r.status, 'deleted': r.deleted,
+                    'chunks': r.chunks, 'duration_s': round(r.duration, 3), 'error': r.error,
+                    'cutoff': r.cutoff.isoformat() if r.cutoff else None,
+                }
+                for r in self.results
+            ],
+        }
+
+
+async def delete_in_chunks(session: AsyncSession, table: Table, *conditions,
+                           batch_size: int = RETENTION_BATCH_SIZE,
+                           pause: float = 0.0,
+                           on_chunk: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Deletes all rows matching conditions, at most batch_size per statement.
+
+    Every chunk is committed separately. Returns the number of deleted rows.
+    """
+    pk = list(table.primary_key.columns)[0]
+    total = 0
+    while True:
+        ids = select(pk).where(*conditions).limit(batch_size).scalar_subquery()
+        result = await session.execute(delete(table).where(pk.in_(ids)))
+        await session.commit()
+        deleted = result.rowcount or 0
+        total += deleted
+        if on_chunk is not None:
+            on_chunk(deleted)
+        if deleted < batch_size:
+            return total
+        if pause:
+            await asyncio.sleep(pause)
+
+
+class RetentionService:
+    """Applies retention policies and keeps the report of the last run."""
+
+    def __init__(self, policies: Optional[List[RetentionPolicy]] = None,
+                 session_provider=session_context,
+                 chunk_pause: float = RETENTION_CHUNK_PAUSE):
+        self.policies = policies if policies is not None else load_policies()
+        self.session_provider = session_provider
+        self.chunk_pause = chunk_pause
+        self.current_report: Optional[RetentionReport] = None
+        self.last_report: Optional[RetentionReport] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _get_table(name: str) -> Optional[Table]:
+        # Importing the models registers every table in Base.metadata
+        from app.shared.infrastructure.models import Base
+        table = Base.metadata.tables.get(name)
+        return table if table is not None else unmapped_metadata.tables.get(name)
+
+    async def run(self, now: Optional[datetime] = None) -> RetentionReport:
+        """Prunes all tables once. Runs are serialized; progress is visible in current_report."""
+        async with self._lock:
+            now = now or datetime.utcnow()
+            report = self.current_report = RetentionReport(started_at=now)
+            report.results = [TableRetentionResult(p.name, p.table) for p in self.policies]
+
+            for policy, result in zip(self.policies, report.results):
+                await self._apply(policy, result, now)
+
+            report.finished_at = datetime.utcnow()
+            self.last_report, self.current_report = report, None
+            logger.info(
+                f"Retention run finished: {report.deleted} rows deleted "
+                f"({', '.join(f'{r.policy}={r.deleted}' for r in report.results if r.deleted) or 'nothing expired'})"
+            )
+            return report
+
+    async def _apply(self, policy: RetentionPolicy, result: TableRetentionResult, now: datetime) -> None:
+        if not policy.enabled:
+            result.status = "disabled"
+            return
+        table = self._get_table(policy.table)
+        if table is None:
+            result.status, result.error = "error", f"Unknown table {policy.table}"
+            return
+
+        result.cutoff = now - timedelta(days=policy.max_age_days)
+        timestamp_column = table.c[policy.timestamp_column]
+        cutoff = result.cutoff
+        if getattr(timestamp_column.type, 'timezone', False):
+            cutoff = cutoff.replace(tzinfo=timezone.utc)
+        conditions = [timestamp_column < cutoff]
+        conditions += [table.c[column] == value for column, value in policy.filters.items()]
+
+        def on_chunk(deleted: int) -> None:
+            result.chunks += 1
+            result.deleted += deleted
+            logger.debug(f"Retention {policy.name}: chunk {result.chunks} deleted {deleted} rows ({result.deleted} total)")
+
+        start = time.perf_counter()
+        result.status = "running"
+        try:
+            async with self.session_provider() as session:
+                exists = await session.run_sync(
+                    lambda sync_session: inspect(sync_session.connection()).has_table(policy.table)
+                )
+                if not exists:
+                    result.status = "missing"
+                    return
+                await delete_in_chunks(
+                    session, table, *conditions,
+                    batch_size=policy.batch_size, pause=self.chunk_pause, on_chunk=on_chunk
+                )
+            result.status = "done"
+        except Exception as e:
+            result.status, result.error = "error", str(e)
+            logger.error(f"Retention {policy.name} failed after {result.deleted} deleted rows: {e}")
+        finally:
+            result.duration = time.perf_counter() - start
+            if result.deleted:
+                logger.info(f"Retention {policy.name}: deleted {result.deleted} rows older than {result.cutoff:%Y-%m-%d %H:%M} in {result.chunks} chunk(s)")
+
+    async def _run_periodically(self, interval: float) -> None:
+        while True:
+            try:
+                await self.run()
+            except Exception as e:
+                logger.error(f"Error in retention loop: {e}", exc_info=True)
+            await asyncio.sleep(interval)
+
+    def start(self, interval_hours: float = RETENTION_INTERVAL_HOURS) -> None:
+        """Runs retention now and then every interval_hours (requires a running event loop)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run_periodically(interval_hours * 3600))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+
+# Singleton instance
+_retention_service: Optional[RetentionService] = None
+
+def get_retention_service() -> RetentionService:
+    """Get the process-wide retention service"""
+    global _retention_service
+    if _retention_service is None:
+        _retention_service = RetentionService()
+    return _retention_service
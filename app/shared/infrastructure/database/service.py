@@ -4,7 +4,7 @@ Database service for managing database sessions and connections.
 from typing import Optional, Callable, ContextManager
 from contextlib import contextmanager
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool
 import logging
@@ -12,6 +12,7 @@ import logging
 from app.shared.interfaces.logging.api import get_db_logger
 from app.shared.infrastructure.database.session.factory import get_session, initialize_session
 from app.shared.infrastructure.database.core.config import get_database_url
+from app.shared.infrastructure.database.core.engine_registry import get_engine_registry
 from app.shared.infrastructure.database.migrations.wait_for_postgres import wait_for_postgres
 
 logger = get_db_logger()
@@ -43,12 +44,9 @@ class DatabaseService:
                 logger.error("No database URL available")
                 return False
                 
-            self._engine = create_async_engine(
-                database_url,
-                echo=False,
-                future=True,
-                pool_pre_ping=True
-            )
+            registry = get_engine_registry()
+            self._engine = registry.get_engine(database_url)
+            self._session_factory = registry.get_session_factory(database_url)
             
             # Test connection
             async with self._engine.begin() as conn:
@@ -93,6 +91,7 @@ class DatabaseService:
     async def close(self):
         """Close database connections."""
         if self._engine:
+            # The engine is shared; dispose closes its pooled connections, the registry keeps it usable
             await self._engine.dispose()
             self._engine = None
         self._initialized = False
@@ -131,4 +130,4 @@ class DatabaseService:
             
     async def async_session(self) -> AsyncSession:
         """Get an async database session"""
-        return self._async_session_factory() 
\ No newline at end of file
+        return self._session_factory()
\ No newline at end of file
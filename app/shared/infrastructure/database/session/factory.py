@@ -1,8 +1,8 @@
 """Database session management."""
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.shared.interfaces.logging.api import get_db_logger
 from app.shared.infrastructure.database.core.config import get_database_url
+from app.shared.infrastructure.database.core.engine_registry import get_engine_registry
 from typing import AsyncGenerator
 
 logger = get_db_logger()
@@ -27,19 +27,11 @@ class SessionFactory:
             database_url = get_database_url()
             # Log the URL being used
             logger.debug(f"Attempting to initialize SessionFactory with database URL: {database_url}") 
-            self._engine = create_async_engine(
-                database_url,
-                echo=False,
-                future=True,
-                pool_pre_ping=True
-            )
+            registry = get_engine_registry()
+            self._engine = registry.get_engine(database_url)
             
-            # Create session factory
-            self._async_session_factory = sessionmaker(
-                self._engine,
-                class_=AsyncSession,
-                expire_on_commit=False
-            )
+            # Shared session factory bound to the registry's engine
+            self._async_session_factory = registry.get_session_factory(database_url)
             
             # Test connection
             async with self._engine.begin() as conn:
@@ -1,82 +1,245 @@
-import logging
 import asyncio
+import contextvars
+import logging
+import os
+import threading
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Deque, Dict, List, Optional
+
+# Set inside the writer task: records logged while writing (SQLAlchemy, asyncpg,
+# session errors) must not be queued again
+_in_writer: contextvars.ContextVar[bool] = contextvars.ContextVar("db_log_writer", default=False)
+
+DB_LOG_BATCH_SIZE = int(os.getenv('DB_LOG_BATCH_SIZE', 200))
+DB_LOG_FLUSH_INTERVAL_MS = int(os.getenv('DB_LOG_FLUSH_INTERVAL_MS', 500))
+DB_LOG_MAX_QUEUE = int(os.getenv('DB_LOG_MAX_QUEUE', 10000))
+DB_LOG_OVERFLOW = os.getenv('DB_LOG_OVERFLOW', 'drop_oldest')  # drop_oldest, drop_newest, block
+
+OVERFLOW_POLICIES = ('drop_oldest', 'drop_newest', 'block')
+
 
 class DatabaseHandler(logging.Handler):
     """
-    Logging handler that stores log records in database.
-    Uses a queue to avoid blocking the application while writing to DB.
+    Logging handler that stores log records in the log_entries table in batches.
+
+    emit() only formats the record and appends it to a bounded, thread-safe
+    buffer, so it can be called from any thread and before an event loop exists.
+    A writer task on the event loop drains up to batch_size records, or whatever
+    arrived within flush_interval_ms, and bulk-inserts them through the shared
+    engine pool. The writer binds to the first running loop that emits a record
+    (or to the loop passed to start()).
+
+    When the buffer is full, overflow decides: 'drop_oldest' discards the oldest
+    record, 'drop_newest' the new one, and 'block' makes threads other than the
+    loop thread wait up to block_timeout before dropping. Drops are counted in
+    stats.
     """
-    def __init__(self, max_queue_size=1000):
-        super().__init__()
-        self.queue = asyncio.Queue(maxsize=max_queue_size)
-        self.task = None
-        self._start_worker()
-    
-    def _start_worker(self):
-        """Start the async worker to process logs in background"""
-        loop = asyncio.get_event_loop()
-        self.task = loop.create_task(self._process_queue())
-    
-    async def _process_queue(self):
-        """Process log records from the queue"""
-        while True:
+
+    def __init__(self, level: int = logging.WARNING,
+                 batch_size: int = DB_LOG_BATCH_SIZE,
+                 flush_interval_ms: int = DB_LOG_FLUSH_INTERVAL_MS,
+                 max_queue_size: int = DB_LOG_MAX_QUEUE,
+                 overflow: str = DB_LOG_OVERFLOW,
+                 block_timeout: float = 0.05,
+                 session_provider=None):
+        super().__init__(level)
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}', expected one of {OVERFLOW_POLICIES}")
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_queue_size = max(self.batch_size, max_queue_size)
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self._session_provider = session_provider
+
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._cond = threading.Condition(threading.Lock())
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._closed = False
+        self.stats = {'emitted': 0, 'written': 0, 'dropped': 0, 'batches': 0, 'errors': 0}
+
+    # --- Producer side (any thread) ---
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Add log record to the buffer; never blocks the event loop"""
+        if self._closed or _in_writer.get():
+            return
+        try:
+            row = self._to_row(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        loop = self._running_loop()
+        if self._loop is None and loop is not None:
+            self.start(loop)
+
+        with self._cond:
+            if len(self._buffer) >= self.max_queue_size and not self._make_room(in_loop=loop is not None):
+                self.stats['dropped'] += 1
+                return
+            self._buffer.append(row)
+            self.stats['emitted'] += 1
+            wake = len(self._buffer) == self.batch_size
+        if wake:
+            self._wake()
+
+    def _make_room(self, in_loop: bool) -> bool:
+        """Called with the lock held on a full buffer; returns whether the new record may be added"""
+        if self.overflow == 'drop_oldest':
+            self._buffer.popleft()
+            self.stats['dropped'] += 1
+            return True
+        if self.overflow == 'block' and not in_loop and self._loop is not None:
+            self._cond.wait_for(lambda: len(self._buffer) < self.max_queue_size, timeout=self.block_timeout)
+            return len(self._buffer) < self.max_queue_size
+        return False
+
+    def _to_row(self, record: logging.LogRecord) -> Dict[str, Any]:
+        message = self.format(record)
+        exception = None
+        if record.exc_info:
+            exception = logging.Formatter().formatException(record.exc_info)
+        return {
+            'timestamp': datetime.fromtimestamp(record.created),
+            'level': record.levelname[:10],
+            'logger_name': record.name[:100],
+            'message': message,
+            'module': (record.module or '')[:100],
+            'function': (record.funcName or '')[:100],
+            'line_num': record.lineno,
+            'exception': exception,
+        }
+
+    @staticmethod
+    def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _wake(self) -> None:
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        if self._running_loop() is loop:
+            wakeup.set()
+        else:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    # --- Writer side (event loop) ---
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Binds the writer to loop (default: the running loop)."""
+        if self._task is not None and not self._task.done():
+            return
+        loop = loop or asyncio.get_running_loop()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        # The writer's context carries the flag, so its own log output is not re-queued
+        context = contextvars.copy_context()
+        context.run(_in_writer.set, True)
+        self._task = loop.create_task(self._run(), context=context)
+
+    async def _run(self) -> None:
+        while not self._closed:
             try:
-                record = await self.queue.get()
-                await self._write_to_db(record)
-                self.queue.task_done()
-            except Exception as e:
-                print(f"Error processing log record: {e}")
-                await asyncio.sleep(1)  # Avoid tight loop on error
-    
-    async def _write_to_db(self, log_data: Dict[str, Any]):
-        """Write log record to database"""
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.aflush()
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        with self._cond:
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            self._cond.notify_all()
+        return batch
+
+    async def aflush(self) -> int:
+        """Writes all buffered records in batches. Returns the number written."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        token = _in_writer.set(True)
+        written = 0
+        try:
+            async with self._flush_lock:
+                while True:
+                    batch = self._take_batch()
+                    if not batch:
+                        break
+                    written += await self._write_batch(batch)
+        finally:
+            _in_writer.reset(token)
+        return written
+
+    async def _write_batch(self, batch: List[Dict[str, Any]]) -> int:
+        """Bulk-inserts one batch; a failed batch is dropped (log storms must not pile up)"""
         try:
             # Lazy import to avoid circular dependencies
-            from app.shared.infrastructure.database import get_async_session
-            from app.shared.infrastructure.models.log_models import LogEntry
-            from sqlalchemy.ext.asyncio import AsyncSession
-            
-            async with get_async_session() as session:
-                session: AsyncSession
-                log_entry = LogEntry(
-                    timestamp=log_data["created"],
-                    level=log_data["levelname"],
-                    logger_name=log_data["name"],
-                    message=log_data["message"],
-                    module=log_data.get("module", ""),
-                    function=log_data.get("funcName", ""),
-                    line_num=log_data.get("lineno", 0),
-                    exception=log_data.get("exc_info", "")
-                )
-                session.add(log_entry)
+            from sqlalchemy import insert
+            from app.shared.infrastructure.models import LogEntryEntity
+
+            provider = self._session_provider
+            if provider is None:
+                from app.shared.infrastructure.database.session import session_context
+                provider = session_context
+            async with provider() as session:
+                await session.execute(insert(LogEntryEntity.__table__), batch)
                 await session.commit()
         except Exception as e:
-            print(f"Failed to write log to database: {e}")
-    
-    def emit(self, record):
-        """Add log record to queue for processing"""
-        try:
-            # Convert record to dict for easier serialization
-            log_data = {
-                "created": datetime.fromtimestamp(record.created),
-                "name": record.name,
-                "levelname": record.levelname,
-                "levelno": record.levelno,
-                "message": self.format(record),
-                "module": record.module,
-                "funcName": record.funcName,
-                "lineno": record.lineno,
-                "exc_info": record.exc_info
-            }
-            
-            # Try to add to queue, drop if queue is full
+            self.stats['errors'] += 1
+            self.stats['dropped'] += len(batch)
+            print(f"Failed to write {len(batch)} log records to database: {e}")
+            return 0
+        self.stats['batches'] += 1
+        self.stats['written'] += len(batch)
+        return len(batch)
+
+    async def aclose(self) -> None:
+        """Stops the writer and writes the remaining records."""
+        self._closed = True
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        await self.aflush()
+
+    def close(self) -> None:
+        """Synchronous close for logging.shutdown(): flushes if the writer's loop is usable."""
+        loop = self._loop
+        if not self._closed and loop is not None and loop.is_running() and self._running_loop() is not loop:
             try:
-                if not self.queue.full():
-                    asyncio.create_task(self.queue.put(log_data))
+                asyncio.run_coroutine_threadsafe(self.aclose(), loop).result(timeout=5)
             except Exception:
                 pass
-                
-        except Exception as e:
-            print(f"Error in DB logging handler: {e}")
\ No newline at end of file
+        self._closed = True
+        super().close()
+
+
+# Singleton instance
+_database_handler: Optional[DatabaseHandler] = None
+
+def get_database_handler() -> DatabaseHandler:
+    """Get the process-wide database log handler"""
+    global _database_handler
+    if _database_handler is None or _database_handler._closed:
+        _database_handler = DatabaseHandler()
+    return _database_handler
+
+async def close_database_handler() -> None:
+    """Flushes and stops the database log handler, if one was created"""
+    if _database_handler is not None and not _database_handler._closed:
+        await _database_handler.aclose()
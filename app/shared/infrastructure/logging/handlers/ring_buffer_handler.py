@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+DEFAULT_RING_CAPACITY = 2000
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Keeps the most recent formatted log lines in memory for the owner console.
+
+    Every record gets a monotonically increasing sequence number, so readers can
+    ask for everything after the last line they saw (entries_since) instead of
+    re-reading the whole buffer. Unlike MemoryHandler the buffer is never
+    flushed or cleared; once full, the oldest lines fall out and readers whose
+    cursor is older than first_seq are told that lines were missed.
+
+    emit() may be called from any thread; async readers wait for new lines with
+    wait_for_entries().
+    """
+
+    def __init__(self, capacity: int = DEFAULT_RING_CAPACITY, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.capacity = max(1, capacity)
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=self.capacity)
+        self._seq = 0
+        self._entries_lock = threading.Lock()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest line (0 while empty)."""
+        return self._seq
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest line still buffered."""
+        with self._entries_lock:
+            return self._entries[0]['seq'] if self._entries else self._seq + 1
+
+    def set_capacity(self, capacity: int) -> None:
+        """Changes the capacity, keeping the newest lines."""
+        with self._entries_lock:
+            self.capacity = max(1, capacity)
+            self._entries = deque(self._entries, maxlen=self.capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self._entries_lock:
+            self._seq += 1
+            self._entries.append({
+                'seq': self._seq,
+                'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+                'level': record.levelname,
+                'logger': record.name,
+                'line': line,
+            })
+            waiters, self._waiters = self._waiters, []
+        for loop, event in waiters:
+            if loop.is_closed():
+                continue
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:  # loop closed in the meantime
+                pass
+
+    def entries_since(self, since: Optional[int] = None, limit: int = 500) -> Dict[str, Any]:
+        """
+        Lines with seq > since (oldest first, at most limit).
+
+        Without a cursor the newest `limit` lines are returned. `next` is the
+        cursor for the following call; `missed` counts lines that were already
+        evicted between since and the oldest returned line.
+        """
+        limit = max(1, limit)
+        with self._entries_lock:
+            entries = list(self._entries)
+            last_seq = self._seq
+        first_seq = entries[0]['seq'] if entries else last_seq + 1
+
+        if since is None:
+            selected = entries[-limit:]
+            missed = 0
+        else:
+            if since > last_seq:  # cursor from before a restart: start over
+                since = 0
+            since = max(0, since)
+            start = max(0, since + 1 - first_seq)  # seq numbers are contiguous within the buffer
+            selected = entries[start:start + limit]
+            missed = max(0, first_seq - since - 1)
+
+        return {
+            'entries': selected,
+            'next': selected[-1]['seq'] if selected else (last_seq if since is None else since),
+            'first_seq': first_seq,
+            'last_seq': last_seq,
+            'missed': missed,
+        }
+
+    async def wait_for_entries(self, since: int, timeout: Optional[float] = None) -> bool:
+        """Waits until a line newer than since exists. Returns False on timeout."""
+        if self._seq > since:
+            return True
+        event = asyncio.Event()
+        with self._entries_lock:
+            if self._seq > since:
+                return True
+            self._waiters.append((asyncio.get_running_loop(), event))
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            with self._entries_lock:
+                self._waiters = [w for w in self._waiters if w[1] is not event]
+            return False
+        return True
+
+
+# Singleton instance
+_ring_buffer_handler: Optional[RingBufferHandler] = None
+
+def get_ring_buffer_handler() -> RingBufferHandler:
+    """Get the process-wide log ring buffer"""
+    global _ring_buffer_handler
+    if _ring_buffer_handler is None:
+        _ring_buffer_handler = RingBufferHandler()
+    return _ring_buffer_handler
@@ -5,34 +5,74 @@ from app.shared.infrastructure.logging.services.logging_service import LoggingSe
 from app.shared.infrastructure.logging.models import LogEntry
 from app.shared.application.logging.log_config import get_config
 
+_LEVELS = {'DEBUG': logging.DEBUG, 'INFO': logging.INFO, 'WARNING': logging.WARNING,
+           'ERROR': logging.ERROR, 'CRITICAL': logging.CRITICAL}
+
+# Debug output is limited to the development environment; read once instead of on every call
+_debug_allowed: Optional[bool] = None
+
+def debug_logging_allowed() -> bool:
+    """Whether debug messages may be logged at all (ENVIRONMENT=development)"""
+    global _debug_allowed
+    if _debug_allowed is None:
+        _debug_allowed = os.getenv('ENVIRONMENT', '').lower() == 'development'
+    return _debug_allowed
+
+def reset_debug_logging_cache() -> None:
+    """Re-read ENVIRONMENT on the next debug call (tests, reconfiguration)"""
+    global _debug_allowed
+    _debug_allowed = None
+
 class BaseLoggingService(LoggingService):
-    """Base implementation of the logging service that uses Python's logging"""
+    """
+    Base implementation of the logging service that uses Python's logging.
+
+    Messages are evaluated lazily: pass %-style args (logger.debug("x=%s", x))
+    or a callable returning the message; neither is formatted or called unless
+    the level is enabled. For expensive preparation, check is_enabled_for() /
+    debug_enabled first. Both rely on the cached enabled level of the logger.
+    """
     
     def __init__(self, logger_name: str):
         self.logger = logging.getLogger(logger_name)
         # Configure logging if not already done
         if not logging.getLogger().handlers:
             get_config().configure_logging()
-    
-    def log(self, message: str, level: str, **context) -> None:
-        """Log a message with the specified level and context"""
-        level_num = getattr(logging, level.upper())
-        extra = context or {}
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Cheap check whether a message at level would be logged"""
+        if level <= logging.DEBUG and not debug_logging_allowed():
+            return False
+        return self.logger.isEnabledFor(level)
+
+    @property
+    def debug_enabled(self) -> bool:
+        return self.is_enabled_for(logging.DEBUG)
+
+    def _log(self, level_num: int, message, args: tuple, extra: Dict[str, Any]) -> None:
+        if callable(message):
+            message = message()
         # Prevent potential exc_info conflict even in basic log calls if context might contain it
         if 'exc_info' in extra:
              self.logger.warning("Removed conflicting 'exc_info' from context in basic log call.", extra={'original_context': extra.copy()})
              extra.pop('exc_info')
-        self.logger.log(level_num, message, extra=extra)
+        self.logger.log(level_num, message, *args, extra=extra)
+    
+    def log(self, message: str, level: str, *args, **context) -> None:
+        """Log a message with the specified level and context"""
+        level_num = _LEVELS.get(level.upper()) or getattr(logging, level.upper())
+        if self.is_enabled_for(level_num):
+            self._log(level_num, message, args, context)
     
-    def debug(self, message: str, **context) -> None:
-        """Log a debug message"""
-        # Only log debug messages in development environment
-        if os.getenv('ENVIRONMENT', '').lower() == 'development':
-            self.log(message, "DEBUG", **context)
+    def debug(self, message: str, *args, **context) -> None:
+        """Log a debug message (development environment only)"""
+        if self.is_enabled_for(logging.DEBUG):
+            self._log(logging.DEBUG, message, args, context)
     
-    def info(self, message: str, **context) -> None:
+    def info(self, message: str, *args, **context) -> None:
         """Log an info message"""
-        self.log(message, "INFO", **context)
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, message, args, context)
     
     def error(self, message: str, exception: Optional[Exception] = None, **context) -> None:
         """Log an error message, handling potential exc_info conflict."""
@@ -67,9 +107,10 @@ class BaseLoggingService(LoggingService):
         # Call logger.exception with guaranteed clean context and correct exc_info value
         self.logger.exception(message, exc_info=final_exc_info, extra=extra)
     
-    def warning(self, message: str, **context) -> None:
+    def warning(self, message: str, *args, **context) -> None:
         """Log a warning message"""
-        self.log(message, "WARNING", **context)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, message, args, context)
     
     def critical(self, message: str, exception: Optional[Exception] = None, **context) -> None:
         """Log a critical message, handling potential exc_info conflict."""
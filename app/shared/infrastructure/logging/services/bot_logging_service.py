@@ -27,17 +27,20 @@ class BotLoggingService(commands.Cog):
                   exception=error, author=str(ctx.author), command=str(ctx.command))
                   
     # Add these delegate methods to maintain the same interface
-    def info(self, message, **context):
-        return self.logger.info(message, **context)
+    def info(self, message, *args, **context):
+        return self.logger.info(message, *args, **context)
         
     def error(self, message, exception=None, **context):
         return self.logger.error(message, exception=exception, **context)
         
-    def debug(self, message, **context):
-        return self.logger.debug(message, **context)
+    def debug(self, message, *args, **context):
+        return self.logger.debug(message, *args, **context)
         
-    def warning(self, message, **context):
-        return self.logger.warning(message, **context)
+    def warning(self, message, *args, **context):
+        return self.logger.warning(message, *args, **context)
+
+    def is_enabled_for(self, level):
+        return self.logger.is_enabled_for(level)
 
     def critical(self, message, exception=None, **context):
         return self.logger.critical(message, exception=exception, **context)
\ No newline at end of file
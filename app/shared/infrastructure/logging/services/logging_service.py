@@ -4,13 +4,17 @@ from typing import Optional
 class LoggingService(ABC):
     """Domain service interface for logging capabilities"""
     
+    def is_enabled_for(self, level: int) -> bool:
+        """Whether a message at level would be logged (guard for expensive messages)"""
+        return True
+
     @abstractmethod
-    def log(self, message: str, level: str, **context) -> None:
+    def log(self, message: str, level: str, *args, **context) -> None:
         """Log a message with the specified level and context"""
         pass
     
     @abstractmethod
-    def info(self, message: str, **context) -> None:
+    def info(self, message: str, *args, **context) -> None:
         """Log an informational message"""
         pass
     
@@ -20,12 +24,12 @@ class LoggingService(ABC):
         pass
 
     @abstractmethod
-    def debug(self, message: str, **context) -> None:
+    def debug(self, message: str, *args, **context) -> None:
         """Log a debug message"""
         pass
 
     @abstractmethod
-    def warning(self, message: str, **context) -> None:
+    def warning(self, message: str, *args, **context) -> None:
         """Log a warning message"""
         pass
 
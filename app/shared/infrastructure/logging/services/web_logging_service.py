@@ -1,33 +1,52 @@
-from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from .base_logging_service import BaseLoggingService
 
+class RequestLoggingMiddleware:
+    """Pure ASGI middleware logging each request at DEBUG level"""
+
+    def __init__(self, app: ASGIApp, service: BaseLoggingService):
+        self.app = app
+        self.service = service
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.service.debug_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        method, path = scope["method"], scope["path"]
+        client = scope.get("client")
+        client_host = client[0] if client else "unknown"
+        self.service.debug("Request started: %s %s", method, path,
+                 method=method, path=path,
+                 client=client_host)
+
+        status_code = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        self.service.debug("Request completed: %s %s -> %s", method, path, status_code,
+                status_code=status_code,
+                method=method, path=path,
+                client=client_host)
+
 class WebLoggingService(BaseLoggingService):
     """Logging service for the web application"""
-    
+
     def __init__(self, app: FastAPI):
         super().__init__("homelab.web")
         self.app = app
-    
+
     def setup_request_logging(self):
         """Set up request logging middleware"""
-        self.app.add_middleware(BaseHTTPMiddleware, dispatch=self.log_request_info)
-    
-    async def log_request_info(self, request: Request, call_next):
-        """Log the request information using DEBUG level"""
-        client_host = request.client.host if request.client else "unknown"
-        self.debug(f"Request started: {request.method} {request.url.path}",
-                 method=request.method, path=request.url.path,
-                 client=client_host)
-        
-        response = await call_next(request)
-        
-        self.debug(f"Request completed: {request.method} {request.url.path} -> {response.status_code}",
-                status_code=response.status_code,
-                method=request.method, path=request.url.path,
-                client=client_host)
-        return response 
+        self.app.add_middleware(RequestLoggingMiddleware, service=self)
 
     # Add explicit delegate method for clarity
     def critical(self, message, exception=None, **context):
-        return super().critical(message, exception=exception, **context) 
\ No newline at end of file
+        return super().critical(message, exception=exception, **context)
@@ -58,7 +58,8 @@ from .project import (
 # Monitoring models
 from .monitoring import (
     MetricModel, 
-    AlertModel
+    AlertModel,
+    MetricRollupModel
 )
 
 # UI Models
@@ -102,6 +103,7 @@ __all__ = [
     # Monitoring models
     'MetricModel', 
     'AlertModel',
+    'MetricRollupModel',
     # UI Models
     'UILayoutEntity',
 ]
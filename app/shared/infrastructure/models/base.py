@@ -1,6 +1,6 @@
 """Base model for SQLAlchemy ORM."""
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 import os
 
@@ -25,13 +25,9 @@ async def initialize_engine(connection_string=None):
     logger.info(f"Initializing database engine with connection string")
     
     try:
-        engine = create_async_engine(
-            connection_string,
-            echo=False,
-            future=True,
-            pool_pre_ping=True,
-            pool_recycle=3600,
-        )
+        # Imported here: the database package imports the models on load
+        from app.shared.infrastructure.database.core.engine_registry import get_engine_registry
+        engine = get_engine_registry().get_engine(connection_string)
         _initialized = True
         logger.info("Database engine created successfully")
         return engine
@@ -14,6 +14,7 @@ class ActiveDashboardEntity(Base):
     guild_id = Column(String(length=30), nullable=False, index=True) # Match migration length
     channel_id = Column(String(length=30), nullable=False, unique=True, index=True) # Match migration length, assuming one active dashboard per channel
     message_id = Column(BIGINT, nullable=True, index=True) # The ID of the Discord message displaying the dashboard
+    render_hash = Column(String(length=64), nullable=True) # Fingerprint of the embed/components last sent to message_id
     is_active = Column(Boolean, default=True, nullable=False, index=True)
     last_updated = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     error_state = Column(Boolean, default=False, nullable=False, index=True)
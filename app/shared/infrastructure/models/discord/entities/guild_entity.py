@@ -33,6 +33,9 @@ class GuildEntity(Base):
     enable_automod = Column(Boolean, nullable=False, server_default='false')
     enable_welcome = Column(Boolean, nullable=False, server_default='false')
 
+    # Member Sync
+    member_sync_hash = Column(String(64), nullable=True)  # SHA-256 of the member set written by the last full sync
+
     # Relationships
     user_roles = relationship("DiscordGuildUserEntity", back_populates="guild", cascade="all, delete")
     config = relationship("GuildConfigEntity", back_populates="guild", uselist=False, cascade="all, delete")
@@ -3,8 +3,10 @@ System monitoring models for metrics and alerts.
 """
 from .metric import MetricModel
 from .alert import AlertModel
+from .metric_rollup import MetricRollupModel
 
 __all__ = [
     'MetricModel',
-    'AlertModel'
+    'AlertModel',
+    'MetricRollupModel'
 ] 
\ No newline at end of file
@@ -1,13 +1,17 @@
 """
 Metric model for system monitoring.
 """
-from sqlalchemy import Column, Integer, String, DateTime, Float, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Float, JSON, Index
 from sqlalchemy.sql import func
 from app.shared.infrastructure.models import Base
 
 class MetricModel(Base):
     """System metric measurement model"""
     __tablename__ = "metrics"
+    __table_args__ = (
+        # Range and average queries always filter by name and time
+        Index('ix_metrics_name_timestamp', 'name', 'timestamp'),
+    )
     
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
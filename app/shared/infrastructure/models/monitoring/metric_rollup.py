@@ -0,0 +1,28 @@
+"""
+Downsampled metric aggregates.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, Float, UniqueConstraint
+from app.shared.infrastructure.models import Base
+
+class MetricRollupModel(Base):
+    """Aggregate of all samples of one metric within a time bucket (1m, 1h or 1d)"""
+    __tablename__ = "metric_rollups"
+    __table_args__ = (
+        UniqueConstraint('resolution', 'name', 'bucket_start', name='uq_metric_rollup_bucket'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    resolution = Column(String(4), nullable=False)  # '1m', '1h', '1d'
+    name = Column(String(100), nullable=False)
+    bucket_start = Column(DateTime, nullable=False)
+    sample_count = Column(Integer, nullable=False, default=0)
+    value_sum = Column(Float, nullable=False, default=0.0)
+    min_value = Column(Float, nullable=False)
+    max_value = Column(Float, nullable=False)
+
+    @property
+    def avg_value(self) -> float:
+        return self.value_sum / self.sample_count if self.sample_count else 0.0
+
+    def __repr__(self):
+        return f"<MetricRollupModel(resolution='{self.resolution}', name='{self.name}', bucket_start='{self.bucket_start}')>"
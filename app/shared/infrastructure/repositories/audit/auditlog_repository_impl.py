@@ -4,6 +4,7 @@ from app.shared.infrastructure.models import AuditLogEntity
 from app.shared.infrastructure.repositories.base_repository_impl import BaseRepositoryImpl
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
+from app.shared.infrastructure.database.retention import delete_in_chunks
 from app.shared.domain.repositories.audit.audit_log_repository import AuditLogRepository
 
 class AuditLogRepositoryImpl(BaseRepositoryImpl[AuditLogEntity], AuditLogRepository):
@@ -53,13 +54,5 @@ class AuditLogRepositoryImpl(BaseRepositoryImpl[AuditLogEntity], AuditLogReposit
     
     async def delete_older_than(self, days: int) -> int:
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        result = await self.session.execute(
-            select(AuditLogEntity).where(AuditLogEntity.timestamp < cutoff_date)
-        )
-        old_logs = result.scalars().all()
-        
-        count = len(old_logs)
-        for log in old_logs:
-            await super().delete(log)
-        
-        return count
\ No newline at end of file
+        audit_logs = AuditLogEntity.__table__
+        return await delete_in_chunks(self.session, audit_logs, audit_logs.c.created_at < cutoff_date)
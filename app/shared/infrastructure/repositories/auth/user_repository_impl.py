@@ -1,15 +1,18 @@
-from sqlalchemy import select, text, update
+from sqlalchemy import select, text, update, delete, literal_column, Boolean, String, all_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from app.shared.infrastructure.repositories.base_repository_impl import BaseRepositoryImpl
 from app.shared.infrastructure.models import AppUserEntity, AppRoleEntity, DiscordGuildUserEntity
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 from app.shared.domain.repositories.auth.user_repository import UserRepository
 from app.shared.interfaces.logging.api import get_db_logger
 
 logger = get_db_logger()
 
+DEFAULT_SYNC_CHUNK_SIZE = 1000
+
 class UserRepositoryImpl(BaseRepositoryImpl[AppUserEntity], UserRepository):
     def __init__(self, session: AsyncSession):
         super().__init__(AppUserEntity, session)
@@ -229,3 +232,175 @@ class UserRepositoryImpl(BaseRepositoryImpl[AppUserEntity], UserRepository):
             await self.session.rollback()
             logger.error(f"Error creating/updating user: {e}")
             raise
+
+    async def get_or_create_role_id(self, role_name: str = 'USER') -> int:
+        """Returns the id of a role by name, creating the role if it does not exist"""
+        result = await self.session.execute(
+            select(AppRoleEntity.id).where(AppRoleEntity.name == role_name)
+        )
+        role_id = result.scalar_one_or_none()
+        if role_id is None:
+            role = AppRoleEntity(name=role_name, description='Standard user role')
+            self.session.add(role)
+            await self.session.flush()
+            role_id = role.id
+        return role_id
+
+    async def bulk_upsert_guild_members(self, guild_id: str, members: List[Dict[str, Any]],
+                                        chunk_size: int = DEFAULT_SYNC_CHUNK_SIZE) -> Dict[str, int]:
+        """
+        Inserts or updates many guild members with a few set-based statements per chunk.
+
+        For each chunk, app_users is upserted with INSERT ... ON CONFLICT (discord_id)
+        DO UPDATE, touching only rows whose username or avatar changed. Missing
+        discord_guild_users rows are added with the USER role, and existing guild
+        roles are kept. Each chunk is committed on its own; a failing chunk is
+        rolled back and counted in 'errors'.
+
+        Args:
+            guild_id: Discord guild id
+            members: dicts with 'discord_id', 'username' and optionally 'avatar'
+            chunk_size: members per statement/commit
+
+        Returns:
+            Counts: inserted, updated, unchanged (app_users), guild_links_added, errors
+        """
+        stats = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'guild_links_added': 0, 'errors': 0}
+        guild_id = str(guild_id)
+
+        # Last entry wins if a member appears twice; ON CONFLICT cannot touch a row twice per statement
+        rows_by_id = {}
+        for member in members:
+            discord_id = str(member['discord_id'])
+            rows_by_id[discord_id] = {
+                'discord_id': discord_id,
+                'username': member.get('username'),
+                'avatar': member.get('avatar'),
+            }
+        rows = list(rows_by_id.values())
+        if not rows:
+            return stats
+
+        role_id = await self.get_or_create_role_id('USER')
+        chunk_size = max(1, chunk_size)
+
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            try:
+                chunk_stats = await self._upsert_member_chunk(guild_id, chunk, role_id)
+                await self.session.commit()
+                for key, value in chunk_stats.items():
+                    stats[key] += value
+            except Exception as e:
+                await self.session.rollback()
+                stats['errors'] += len(chunk)
+                logger.error(f"[Guild:{guild_id}] Bulk member upsert failed for chunk at {start} ({len(chunk)} rows): {e}", exc_info=True)
+                # The rollback may have discarded a just-created role
+                role_id = await self.get_or_create_role_id('USER')
+
+        return stats
+
+    async def _upsert_member_chunk(self, guild_id: str, chunk: List[Dict[str, Any]], role_id: int) -> Dict[str, int]:
+        users = AppUserEntity.__table__
+        insert_stmt = pg_insert(users).values(chunk)
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[users.c.discord_id],
+            set_={'username': insert_stmt.excluded.username, 'avatar': insert_stmt.excluded.avatar},
+            # Skip rows that would not change so they are neither rewritten nor returned
+            where=(users.c.username.is_distinct_from(insert_stmt.excluded.username)
+                   | users.c.avatar.is_distinct_from(insert_stmt.excluded.avatar)),
+        ).returning(
+            users.c.id,
+            users.c.discord_id,
+            # xmax is 0 for freshly inserted tuples and set for updated ones
+            literal_column('(xmax = 0)', type_=Boolean).label('inserted'),
+        )
+        result = await self.session.execute(upsert_stmt)
+        touched = result.all()
+
+        user_ids = {row.discord_id: row.id for row in touched}
+        inserted = sum(1 for row in touched if row.inserted)
+        updated = len(touched) - inserted
+
+        unchanged_ids = [row['discord_id'] for row in chunk if row['discord_id'] not in user_ids]
+        if unchanged_ids:
+            result = await self.session.execute(
+                select(users.c.id, users.c.discord_id).where(users.c.discord_id.in_(unchanged_ids))
+            )
+            user_ids.update({row.discord_id: row.id for row in result.all()})
+
+        guild_users = DiscordGuildUserEntity.__table__
+        link_stmt = pg_insert(guild_users).values([
+            {'guild_id': guild_id, 'user_id': user_id, 'role_id': role_id}
+            for user_id in user_ids.values()
+        ]).on_conflict_do_nothing(constraint='uq_guild_user').returning(guild_users.c.id)
+        result = await self.session.execute(link_stmt)
+        links_added = len(result.all())
+
+        return {
+            'inserted': inserted,
+            'updated': updated,
+            'unchanged': len(unchanged_ids),
+            'guild_links_added': links_added,
+        }
+
+    async def remove_guild_members(self, guild_id: str, discord_ids: List[Any]) -> int:
+        """
+        Removes the guild links of the given users with a single DELETE.
+
+        The app_users rows are kept, since users may still be members of other guilds.
+
+        Returns:
+            Number of discord_guild_users rows deleted
+        """
+        discord_ids = list({str(discord_id) for discord_id in discord_ids})
+        if not discord_ids:
+            return 0
+
+        users = AppUserEntity.__table__
+        guild_users = DiscordGuildUserEntity.__table__
+        stmt = delete(guild_users).where(
+            guild_users.c.guild_id == str(guild_id),
+            guild_users.c.user_id.in_(select(users.c.id).where(users.c.discord_id.in_(discord_ids))),
+        ).returning(guild_users.c.id)
+        try:
+            result = await self.session.execute(stmt)
+            removed = len(result.all())
+            await self.session.commit()
+            return removed
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"[Guild:{guild_id}] Failed to remove {len(discord_ids)} guild members: {e}", exc_info=True)
+            raise
+
+    async def remove_departed_guild_members(self, guild_id: str, present_discord_ids: List[Any]) -> int:
+        """
+        Removes the guild links of all users that are no longer in present_discord_ids.
+
+        Used by full member syncs, so members whose leave event was missed or
+        could not be written do not stay linked to the guild. The present IDs are
+        bound as one array parameter (discord_id != ALL(:present_discord_ids)), so
+        large guilds stay below the driver's bind parameter limit.
+
+        Returns:
+            Number of discord_guild_users rows deleted
+        """
+        present_discord_ids = list({str(discord_id) for discord_id in present_discord_ids})
+
+        users = AppUserEntity.__table__
+        guild_users = DiscordGuildUserEntity.__table__
+        stmt = delete(guild_users).where(
+            guild_users.c.guild_id == str(guild_id),
+            guild_users.c.user_id.in_(select(users.c.id).where(
+                users.c.discord_id != all_(bindparam('present_discord_ids', present_discord_ids, type_=ARRAY(String)))
+            )),
+        ).returning(guild_users.c.id)
+        try:
+            result = await self.session.execute(stmt)
+            removed = len(result.all())
+            await self.session.commit()
+            return removed
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"[Guild:{guild_id}] Failed to remove departed guild members: {e}", exc_info=True)
+            raise
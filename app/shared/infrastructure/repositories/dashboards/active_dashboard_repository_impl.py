@@ -25,6 +25,7 @@ class ActiveDashboardRepository:
     async def update(self, instance_id: int, update_data: Dict[str, Any]) -> Optional[ActiveDashboardEntity]: raise NotImplementedError
     async def delete(self, instance_id: int) -> bool: raise NotImplementedError
     async def set_message_id(self, instance_id: int, message_id: Optional[str]) -> bool: raise NotImplementedError
+    async def set_render_state(self, instance_id: int, message_id: Optional[str], render_hash: Optional[str]) -> bool: raise NotImplementedError
     async def set_active_status(self, instance_id: int, is_active: bool) -> bool: raise NotImplementedError
 
 class ActiveDashboardRepositoryImpl(BaseRepositoryImpl[ActiveDashboardEntity], ActiveDashboardRepository):
@@ -182,6 +183,27 @@ class ActiveDashboardRepositoryImpl(BaseRepositoryImpl[ActiveDashboardEntity], A
             logger.warning(f"Repository: Failed to update message_id for instance {instance_id} (not found or no change)")
             return False
 
+    async def set_render_state(self, instance_id: int, message_id: Optional[str], render_hash: Optional[str]) -> bool:
+        """Sets the message_id together with the render fingerprint of the content sent to it."""
+        logger.debug("Repository: Setting message_id=%s, render_hash=%s for ActiveDashboardEntity ID: %s", message_id, render_hash, instance_id)
+        try:
+            message_id_value = int(message_id) if message_id is not None else null()
+        except (ValueError, TypeError):
+            logger.warning(f"Repository SetRenderState: Invalid message_id '{message_id}' for instance {instance_id}. Setting to NULL.")
+            message_id_value = null()
+            render_hash = None # A hash without its message is meaningless
+
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.id == instance_id)
+            .values(message_id=message_id_value, render_hash=render_hash)
+        )
+        await self.session.flush()
+        if result.rowcount > 0:
+            return True
+        logger.warning(f"Repository: Failed to update render state for instance {instance_id} (not found)")
+        return False
+
     async def set_active_status(self, instance_id: int, is_active: bool) -> bool:
         """Sets the active status for a dashboard instance."""
         logger.debug(f"Repository: Setting is_active={is_active} for ActiveDashboardEntity ID: {instance_id}")
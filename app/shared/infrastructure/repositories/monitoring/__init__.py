@@ -1,4 +1,5 @@
 """Monitoring repository implementations"""
 from .monitoring_repository_impl import MonitoringRepositoryImpl
+from .metric_store import MetricStore, get_metric_store
 
-__all__ = ['MonitoringRepositoryImpl']
\ No newline at end of file
+__all__ = ['MonitoringRepositoryImpl', 'MetricStore', 'get_metric_store']
@@ -0,0 +1,157 @@
+"""
+Buffered time-series storage for metrics.
+
+Samples are collected in memory and written in batches through
+MonitoringRepositoryImpl.save_metrics, which also maintains the 1m/1h/1d
+rollups. Range and average queries pick the resolution matching the
+requested time span.
+"""
+import asyncio
+import os
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+from app.shared.interfaces.logging.api import get_db_logger
+from app.shared.infrastructure.database.session import session_context
+from .monitoring_repository_impl import MonitoringRepositoryImpl, DEFAULT_MAX_POINTS, metric_sample
+
+logger = get_db_logger()
+
+METRIC_BATCH_SIZE = int(os.getenv('METRIC_BATCH_SIZE', 500))           # samples per INSERT
+METRIC_FLUSH_INTERVAL = float(os.getenv('METRIC_FLUSH_INTERVAL', 30))  # seconds between background flushes
+METRIC_MAX_BUFFER = int(os.getenv('METRIC_MAX_BUFFER', 20000))         # oldest samples are dropped beyond this
+
+
+class MetricStore:
+    """Buffers metric samples and writes them in batches; serves series and averages from rollups."""
+
+    def __init__(self, batch_size: int = METRIC_BATCH_SIZE,
+                 flush_interval: float = METRIC_FLUSH_INTERVAL,
+                 max_buffer: int = METRIC_MAX_BUFFER,
+                 session_provider=session_context):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.session_provider = session_provider
+        self._buffer: Deque[Dict[str, Any]] = deque(maxlen=max(self.batch_size, max_buffer))
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._background: Optional[asyncio.Task] = None
+        self.stats = {'recorded': 0, 'written': 0, 'dropped': 0, 'flushes': 0, 'errors': 0}
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def running(self) -> bool:
+        return self._background is not None and not self._background.done()
+
+    # --- Writing ---
+
+    def record(self, name: str, value: float, unit: str = None, timestamp: datetime = None,
+               category: str = None, host: str = None, service: str = None,
+               metric_data: Dict[str, Any] = None) -> None:
+        """Queues one sample. Non-numeric values are ignored."""
+        try:
+            sample = metric_sample(name, value, unit, timestamp, category, host, service, metric_data)
+        except (TypeError, ValueError):
+            return
+        self._append(sample)
+
+    def record_many(self, metrics: Iterable[Any]) -> None:
+        """Queues MetricModel-like objects (name, value, unit, timestamp, metric_data, ...)."""
+        for metric in metrics:
+            self.record(
+                metric.name, metric.value, getattr(metric, 'unit', None),
+                timestamp=getattr(metric, 'timestamp', None),
+                category=getattr(metric, 'category', None),
+                host=getattr(metric, 'host', None),
+                service=getattr(metric, 'service', None),
+                metric_data=getattr(metric, 'metric_data', None),
+            )
+
+    def _append(self, sample: Dict[str, Any]) -> None:
+        if len(self._buffer) == self._buffer.maxlen:
+            self.stats['dropped'] += 1
+        self._buffer.append(sample)
+        self.stats['recorded'] += 1
+        # Without a running store (tests, CLI tools) samples only accumulate
+        if self.running and len(self._buffer) >= self.batch_size:
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+
+    async def flush(self) -> int:
+        """Writes all buffered samples in batches of batch_size. Returns the number written."""
+        written = 0
+        async with self._flush_lock:
+            while self._buffer:
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                try:
+                    async with self.session_provider() as session:
+                        written += await MonitoringRepositoryImpl(session).save_metrics(batch)
+                except Exception as e:
+                    # Put the batch back (as far as space allows) and retry on the next flush
+                    self.stats['errors'] += 1
+                    room = self._buffer.maxlen - len(self._buffer)
+                    self._buffer.extendleft(reversed(batch[-room:] if room else []))
+                    self.stats['dropped'] += len(batch) - min(room, len(batch))
+                    logger.error(f"Failed to write {len(batch)} metric samples: {e}")
+                    break
+            if written:
+                self.stats['flushes'] += 1
+                self.stats['written'] += written
+        return written
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error in metric flush loop: {e}", exc_info=True)
+
+    def start(self) -> None:
+        """Starts the background flush loop (requires a running event loop)."""
+        if not self.running:
+            self._background = asyncio.get_running_loop().create_task(self._flush_periodically())
+            logger.debug(f"Metric store started (batch_size={self.batch_size}, interval={self.flush_interval}s)")
+
+    async def close(self) -> None:
+        """Stops the background loop and writes the remaining samples."""
+        if self._background is not None:
+            self._background.cancel()
+            try:
+                await self._background
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._background = None
+        if self._buffer:
+            await self.flush()
+
+    # --- Reading ---
+
+    async def get_series(self, name: str, start_time: datetime, end_time: datetime,
+                         resolution: Optional[str] = None,
+                         max_points: int = DEFAULT_MAX_POINTS) -> List[Dict[str, Any]]:
+        """Time series of a metric from raw samples or the matching rollup resolution."""
+        async with self.session_provider() as session:
+            return await MonitoringRepositoryImpl(session).get_metric_series(
+                name, start_time, end_time, resolution=resolution, max_points=max_points
+            )
+
+    async def get_average(self, name: str, hours: int = 24) -> Optional[float]:
+        """Average of a metric over the last `hours`, served from rollups for longer ranges."""
+        async with self.session_provider() as session:
+            return await MonitoringRepositoryImpl(session).get_metric_average(name, hours=hours)
+
+
+# Singleton instance
+_metric_store: Optional[MetricStore] = None
+
+def get_metric_store() -> MetricStore:
+    """Get the process-wide metric store"""
+    global _metric_store
+    if _metric_store is None:
+        _metric_store = MetricStore()
+    return _metric_store
@@ -1,8 +1,81 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc, func
-from app.shared.infrastructure.models import MetricModel, AlertModel
-from typing import List, Optional, Dict, Any
+from sqlalchemy import select, and_, desc, func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.shared.infrastructure.models import MetricModel, AlertModel, MetricRollupModel
+from typing import List, Optional, Dict, Any, Iterable
 from datetime import datetime, timedelta
+from app.shared.infrastructure.database.retention import delete_in_chunks
+
+# Rollup resolutions, finest first
+ROLLUP_RESOLUTIONS = {
+    '1m': timedelta(minutes=1),
+    '1h': timedelta(hours=1),
+    '1d': timedelta(days=1),
+}
+RAW_QUERY_MAX_SPAN = timedelta(hours=1)  # shorter ranges are answered from raw samples
+DEFAULT_MAX_POINTS = 720
+
+
+def bucket_start(timestamp: datetime, resolution: str) -> datetime:
+    """Start of the rollup bucket containing timestamp"""
+    if resolution == '1m':
+        return timestamp.replace(second=0, microsecond=0)
+    if resolution == '1h':
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    if resolution == '1d':
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unknown rollup resolution: {resolution}")
+
+
+def choose_resolution(span: timedelta, max_points: int = DEFAULT_MAX_POINTS) -> Optional[str]:
+    """Coarsest resolution needed so a range of `span` yields at most max_points points (None = raw)"""
+    if span <= RAW_QUERY_MAX_SPAN:
+        return None
+    for resolution, step in ROLLUP_RESOLUTIONS.items():
+        if span / step <= max_points:
+            return resolution
+    return '1d'
+
+
+def aggregate_rollups(samples: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Folds samples into one rollup row per (resolution, name, bucket)"""
+    buckets: Dict[tuple, Dict[str, Any]] = {}
+    for sample in samples:
+        value = sample['value']
+        for resolution in ROLLUP_RESOLUTIONS:
+            key = (resolution, sample['name'], bucket_start(sample['timestamp'], resolution))
+            row = buckets.get(key)
+            if row is None:
+                buckets[key] = {
+                    'resolution': key[0], 'name': key[1], 'bucket_start': key[2],
+                    'sample_count': 1, 'value_sum': value, 'min_value': value, 'max_value': value,
+                }
+            else:
+                row['sample_count'] += 1
+                row['value_sum'] += value
+                row['min_value'] = min(row['min_value'], value)
+                row['max_value'] = max(row['max_value'], value)
+    return list(buckets.values())
+
+
+def metric_sample(name: str, value: float, unit: str = None, timestamp: datetime = None,
+                  category: str = None, host: str = None, service: str = None,
+                  metric_data: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Row data for the metrics table; category defaults to metric_data['component'] or the name prefix"""
+    metric_data = metric_data or {}
+    if not category:
+        category = metric_data.get('component') or name.replace('.', '_').split('_', 1)[0]
+    return {
+        'name': name,
+        'category': category[:50],
+        'value': float(value),
+        'unit': unit,
+        'timestamp': timestamp or datetime.utcnow(),
+        'host': host,
+        'service': service,
+        'metric_data': metric_data,
+    }
+
 
 class MonitoringRepositoryImpl:
     def __init__(self, session: AsyncSession):
@@ -13,16 +86,40 @@ class MonitoringRepositoryImpl:
     async def save_metric(self, name: str, value: float, unit: str, 
                           timestamp: datetime = None, metadata_json: Dict[str, Any] = None) -> MetricModel:
         """Save a new metric to the database"""
-        db_metric = MetricModel(
-            name=name,
-            value=value,
-            unit=unit,
-            timestamp=timestamp or datetime.utcnow(),
-            metadata_json=metadata_json or {}
-        )
+        db_metric = MetricModel(**metric_sample(name, value, unit, timestamp, metric_data=metadata_json))
         self.session.add(db_metric)
+        await self._upsert_rollups([metric_sample(name, value, unit, db_metric.timestamp)])
         await self.session.commit()
         return db_metric
+
+    async def save_metrics(self, samples: List[Dict[str, Any]]) -> int:
+        """
+        Inserts many samples (see metric_sample) with one executemany INSERT and
+        folds them into the 1m/1h/1d rollups in the same transaction.
+        """
+        if not samples:
+            return 0
+        await self.session.execute(insert(MetricModel.__table__), samples)
+        await self._upsert_rollups(samples)
+        await self.session.commit()
+        return len(samples)
+
+    async def _upsert_rollups(self, samples: List[Dict[str, Any]]) -> None:
+        rows = aggregate_rollups(samples)
+        if not rows:
+            return
+        rollups = MetricRollupModel.__table__
+        stmt = pg_insert(rollups).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint='uq_metric_rollup_bucket',
+            set_={
+                'sample_count': rollups.c.sample_count + stmt.excluded.sample_count,
+                'value_sum': rollups.c.value_sum + stmt.excluded.value_sum,
+                'min_value': func.least(rollups.c.min_value, stmt.excluded.min_value),
+                'max_value': func.greatest(rollups.c.max_value, stmt.excluded.max_value),
+            }
+        )
+        await self.session.execute(stmt)
     
     async def get_latest_metrics(self, names: List[str] = None, limit: int = 10) -> List[MetricModel]:
         """Get the latest metrics, optionally filtered by name"""
@@ -37,7 +134,7 @@ class MonitoringRepositoryImpl:
     
     async def get_metrics_by_timerange(self, start_time: datetime, end_time: datetime, 
                                       names: List[str] = None) -> List[MetricModel]:
-        """Get metrics within a specific time range"""
+        """Get raw metrics within a specific time range (use get_metric_series for charts)"""
         query = select(MetricModel).where(
             and_(
                 MetricModel.timestamp >= start_time,
@@ -50,19 +147,73 @@ class MonitoringRepositoryImpl:
             
         result = await self.session.execute(query)
         return result.scalars().all()
+
+    async def get_metric_series(self, name: str, start_time: datetime, end_time: datetime,
+                                resolution: Optional[str] = None,
+                                max_points: int = DEFAULT_MAX_POINTS) -> List[Dict[str, Any]]:
+        """
+        Get a metric as a time series, oldest first.
+
+        Without an explicit resolution, short ranges are served from raw samples
+        and longer ranges from the finest rollup that stays within max_points.
+        Each point has timestamp, avg, min, max and count.
+        """
+        if resolution is None:
+            resolution = choose_resolution(end_time - start_time, max_points)
+        elif resolution != 'raw' and resolution not in ROLLUP_RESOLUTIONS:
+            raise ValueError(f"Unknown rollup resolution: {resolution}")
+
+        if resolution in (None, 'raw'):
+            result = await self.session.execute(
+                select(MetricModel.timestamp, MetricModel.value).where(
+                    MetricModel.name == name,
+                    MetricModel.timestamp >= start_time,
+                    MetricModel.timestamp <= end_time
+                ).order_by(MetricModel.timestamp)
+            )
+            return [
+                {'timestamp': row.timestamp, 'avg': row.value, 'min': row.value, 'max': row.value, 'count': 1}
+                for row in result.all()
+            ]
+
+        result = await self.session.execute(
+            select(MetricRollupModel).where(
+                MetricRollupModel.resolution == resolution,
+                MetricRollupModel.name == name,
+                MetricRollupModel.bucket_start >= bucket_start(start_time, resolution),
+                MetricRollupModel.bucket_start <= end_time
+            ).order_by(MetricRollupModel.bucket_start)
+        )
+        return [
+            {'timestamp': rollup.bucket_start, 'avg': rollup.avg_value, 'min': rollup.min_value,
+             'max': rollup.max_value, 'count': rollup.sample_count}
+            for rollup in result.scalars().all()
+        ]
     
     async def get_metric_average(self, name: str, hours: int = 24) -> Optional[float]:
         """Get the average value of a metric over the specified time period"""
         end_time = datetime.utcnow()
         start_time = end_time - timedelta(hours=hours)
+        resolution = choose_resolution(end_time - start_time)
         
-        query = select(func.avg(MetricModel.value)).where(
-            and_(
-                MetricModel.name == name,
-                MetricModel.timestamp >= start_time,
-                MetricModel.timestamp <= end_time
+        if resolution is None:
+            query = select(func.avg(MetricModel.value)).where(
+                and_(
+                    MetricModel.name == name,
+                    MetricModel.timestamp >= start_time,
+                    MetricModel.timestamp <= end_time
+                )
+            )
+        else:
+            # Sample-weighted average over the buckets; the first bucket may start before start_time
+            query = select(
+                func.sum(MetricRollupModel.value_sum) / func.nullif(func.sum(MetricRollupModel.sample_count), 0)
+            ).where(
+                MetricRollupModel.resolution == resolution,
+                MetricRollupModel.name == name,
+                MetricRollupModel.bucket_start >= bucket_start(start_time, resolution),
+                MetricRollupModel.bucket_start <= end_time
             )
-        )
         
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
@@ -232,16 +383,7 @@ class MonitoringRepositoryImpl:
     # === Cleanup Methods ===
     
     async def cleanup_old_metrics(self, days: int = 30) -> int:
-        """Delete metrics older than the specified number of days"""
+        """Delete metrics older than the specified number of days (chunked, without loading rows)"""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        query = select(MetricModel).where(MetricModel.timestamp < cutoff_date)
-        
-        result = await self.session.execute(query)
-        old_metrics = result.scalars().all()
-        
-        count = len(old_metrics)
-        for metric in old_metrics:
-            await self.session.delete(metric)
-        
-        await self.session.commit()
-        return count
\ No newline at end of file
+        metrics = MetricModel.__table__
+        return await delete_in_chunks(self.session, metrics, metrics.c.timestamp < cutoff_date)
@@ -0,0 +1,70 @@
+"""Micro-benchmark: rendering a 25-field monitoring embed with compiled templates."""
+import time
+
+import pytest
+
+from app.bot.interfaces.dashboards.components.common.embeds.dashboard_embed import DashboardEmbed
+
+RENDERS = 10_000
+
+DATA = {f"metric_{i}": round(i * 1.7, 2) for i in range(25)}
+DATA.update({"hostname": "homelab-01", "uptime": "12d 4h", "platform": "Linux", "version": "1.4.2",
+             "load_avg": "0.42, 0.37, 0.30", "cpu_percent": 12.5, "memory_percent": 48.1})
+
+CONFIG = {
+    "title": "📊 {{hostname}} Monitoring",
+    "description": "Uptime {{uptime}} • {{platform}} • v{{version}}",
+    "fields": [{"name": f"Metric {i}", "value": f"{{{{metric_{i}}}}} (load {{{{load_avg}}}})", "inline": True} for i in range(25)],
+    "footer": {"text": "CPU {{cpu_percent}}% • RAM {{memory_percent}}%"},
+    "timestamp": False,
+}
+
+
+def _legacy_format_string(template_string, data):
+    """The previous implementation: one str.replace over the template per data key."""
+    if not template_string:
+        return ""
+    formatted_string = template_string
+    for key, value in data.items():
+        formatted_string = formatted_string.replace(f'{{{{{key}}}}}', str(value))
+    return formatted_string
+
+
+def _legacy_render(config, data):
+    rendered = [_legacy_format_string(config["title"], data), _legacy_format_string(config["description"], data)]
+    for field in config["fields"]:
+        if isinstance(field, dict):
+            rendered.append(_legacy_format_string(field.get("name", "\u200b"), data))
+            rendered.append(_legacy_format_string(field.get("value", ""), data))
+    rendered.append(_legacy_format_string(config["footer"]["text"], data))
+    return rendered
+
+
+def _compiled_render(plan, data):
+    rendered = [plan.title.render(data), plan.description.render(data)]
+    for field in plan.fields:
+        rendered.append(field.name.render(data))
+        rendered.append(field.value.render(data))
+    rendered.append(plan.footer["text"].render(data))
+    return rendered
+
+
+def _seconds(fn) -> float:
+    start = time.perf_counter()
+    for _ in range(RENDERS):
+        fn()
+    return time.perf_counter() - start
+
+
+@pytest.mark.performance
+def test_embed_template_rendering():
+    embed = DashboardEmbed(None, CONFIG)
+    assert _compiled_render(embed.render_plan, DATA) == _legacy_render(CONFIG, DATA)
+
+    legacy = _seconds(lambda: _legacy_render(CONFIG, DATA))
+    compiled = _seconds(lambda: _compiled_render(embed.render_plan, DATA))
+    build = _seconds(lambda: embed.build(DATA))
+
+    print(f"\n{RENDERS} renders of a 25-field embed: legacy str.replace {legacy:.2f}s, "
+          f"compiled templates {compiled:.2f}s, full DashboardEmbed.build {build:.2f}s")
+    assert compiled * 3 < legacy
@@ -0,0 +1,77 @@
+"""Micro-benchmark: per-call cost of debug logging that ends up disabled."""
+import logging
+import time
+
+import pytest
+
+from app.shared.infrastructure.logging.services import base_logging_service
+from app.shared.infrastructure.logging.services.base_logging_service import BaseLoggingService
+
+CALLS = 5000
+
+# Roughly the size of a dashboard component config dumped by the old "[DIAGNOSTIC Controller]" log
+PAYLOAD = {f"setting_{i}": {"value": i, "label": f"Setting {i}", "enabled": bool(i % 2)} for i in range(40)}
+
+
+def _per_call_ns(fn) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(CALLS):
+        fn()
+    return (time.perf_counter_ns() - start) / CALLS
+
+
+@pytest.fixture
+def bench_logger():
+    logger = BaseLoggingService("homelab.bot.benchmark")
+    logger.logger.setLevel(logging.INFO)
+    yield logger
+    logger.logger.setLevel(logging.NOTSET)
+    base_logging_service.reset_debug_logging_cache()
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("environment", ["production", "development"])
+def test_disabled_debug_logging_overhead(bench_logger, monkeypatch, environment):
+    monkeypatch.setenv("ENVIRONMENT", environment)
+    base_logging_service.reset_debug_logging_cache()
+    logger = bench_logger
+    dashboard_id = 42
+    assert not logger.debug_enabled  # production: env gate, development: logger level INFO
+
+    eager = _per_call_ns(lambda: logger.debug(f"[{dashboard_id}] Config passed to component: {PAYLOAD}"))
+    lazy = _per_call_ns(lambda: logger.debug("[%s] Config passed to component: %s", dashboard_id, PAYLOAD))
+    guarded = _per_call_ns(lambda: logger.debug_enabled and logger.debug("[%s] %s", dashboard_id, list(PAYLOAD)))
+
+    print(f"\ndisabled debug ({environment}): eager f-string {eager:.0f} ns/call, "
+          f"lazy args {lazy:.0f} ns/call, guarded {guarded:.0f} ns/call")
+
+    # The f-string renders the whole payload even though nothing is logged
+    assert lazy * 5 < eager
+    assert guarded * 5 < eager
+
+
+def test_lazy_message_is_only_built_when_enabled(bench_logger, monkeypatch):
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    base_logging_service.reset_debug_logging_cache()
+    calls = []
+
+    def message():
+        calls.append(1)
+        return "expensive"
+
+    bench_logger.debug(message)
+    assert calls == []
+
+    bench_logger.logger.setLevel(logging.DEBUG)
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    bench_logger.logger.addHandler(handler)
+    try:
+        bench_logger.debug(message)
+        bench_logger.debug("value=%s", 5)
+    finally:
+        bench_logger.logger.removeHandler(handler)
+
+    assert calls == [1]
+    assert [r.getMessage() for r in records] == ["expensive", "value=5"]
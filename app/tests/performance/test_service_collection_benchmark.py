@@ -0,0 +1,34 @@
+"""Micro-benchmark: how many probes one service-metrics call triggers."""
+import time
+
+import pytest
+from unittest.mock import AsyncMock
+
+import app.shared.infrastructure.models.guild_templates  # noqa: F401  (registers mappers MetricModel's registry needs)
+from app.bot.infrastructure.monitoring.collectors.service.components import base
+from app.bot.infrastructure.monitoring.collectors.service.impl import ServiceCollector
+
+CALLS = 50
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_probe_count_per_service_metrics_call(mocker):
+    probes = [
+        mocker.patch.object(base, "get_docker_status", AsyncMock(return_value=(3, 0, "a: ✅ Running\n"))),
+        mocker.patch.object(base, "get_ssh_attempts", AsyncMock(return_value=(0, "Keine"))),
+        mocker.patch.object(base, "check_services_status", AsyncMock(return_value={"web": "✅ Online"})),
+    ]
+    collector = ServiceCollector(max_age=0)
+
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        await collector.collect_service_metrics()
+    elapsed = time.perf_counter() - start
+
+    total_probes = sum(probe.await_count for probe in probes)
+    probes_per_call = total_probes / CALLS
+    print(f"\nservice metrics: {probes_per_call:.1f} probes/call, {elapsed / CALLS * 1e6:.0f} µs/call over {CALLS} calls")
+
+    # One Docker, one SSH and one service check per call (was 6 before the snapshot pipeline)
+    assert probes_per_call == 3
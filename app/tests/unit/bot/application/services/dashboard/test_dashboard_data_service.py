@@ -1,6 +1,8 @@
+import asyncio
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch, call, Mock
 from app.bot.application.services.dashboard.dashboard_data_service import DashboardDataService
+from app.bot.application.services.dashboard.data_source_cache import DataSourceCache
 
 # --- Fixtures ---
 
@@ -18,8 +20,8 @@ def mock_service_factory():
 
 @pytest.fixture
 def data_service(mock_bot, mock_service_factory):
-    """Provides a DashboardDataService instance with mock dependencies."""
-    return DashboardDataService(bot=mock_bot, service_factory=mock_service_factory)
+    """Provides a DashboardDataService instance with mock dependencies and a private cache."""
+    return DashboardDataService(bot=mock_bot, service_factory=mock_service_factory, data_cache=DataSourceCache())
 
 # --- Test __init__ and initialize ---
 
@@ -418,4 +420,104 @@ async def test_fetch_data_service_collector_exception_in_game_services(
     assert "Error fetching data from ServiceCollector" in mock_logger_error.call_args[0][0]
     assert result["games"] == {"error": "Game Collector Error!"}
 
-# Final placeholder removed, all main paths for fetch_data covered. 
\ No newline at end of file
+# Final placeholder removed, all main paths for fetch_data covered. 
+# --- Test fetch_data: Shared data source cache ---
+
+@pytest.mark.asyncio
+async def test_fetch_data_reuses_cached_system_collection(data_service, mock_service_factory, mock_system_collector):
+    """Two dashboards asking for the same source within its TTL trigger one collection."""
+    await data_service.initialize()
+    mock_service_factory.get_service.return_value = mock_system_collector
+
+    config = {"sys_metrics": {"type": "system_collector"}}
+    first = await data_service.fetch_data(config)
+    second = await data_service.fetch_data(config)
+
+    mock_system_collector.collect_all.assert_awaited_once()
+    assert first == second
+    stats = data_service.get_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_fetch_data_does_not_cache_failures(data_service, mock_service_factory, mock_system_collector):
+    """A failed collection is retried on the next fetch instead of being served from cache."""
+    await data_service.initialize()
+    mock_system_collector.collect_all.side_effect = [Exception("Collector Error!"), []]
+    mock_service_factory.get_service.return_value = mock_system_collector
+
+    config = {"sys_metrics": {"type": "system_collector"}}
+    first = await data_service.fetch_data(config)
+    second = await data_service.fetch_data(config)
+
+    assert first["sys_metrics"] == {"error": "Collector Error!"}
+    assert second["sys_metrics"] == {}
+    assert mock_system_collector.collect_all.await_count == 2
+
+@pytest.mark.asyncio
+async def test_fetch_data_cache_ttl_zero_bypasses_cache(data_service, mock_service_factory, mock_system_collector):
+    """cache_ttl: 0 in the source config disables caching for that source."""
+    await data_service.initialize()
+    mock_service_factory.get_service.return_value = mock_system_collector
+
+    config = {"sys_metrics": {"type": "system_collector", "cache_ttl": 0}}
+    await data_service.fetch_data(config)
+    await data_service.fetch_data(config)
+
+    assert mock_system_collector.collect_all.await_count == 2
+
+# --- Test fetch_data: Concurrent sources ---
+
+@pytest.mark.asyncio
+async def test_fetch_data_slow_source_times_out_alone(data_service, mock_service_factory, mock_system_collector, mock_service_collector):
+    """A source exceeding its timeout errors only its own key; the others are returned."""
+    await data_service.initialize()
+
+    release = asyncio.Event()
+
+    async def hanging_game_services():
+        await release.wait()
+        return {}
+
+    mock_service_collector.collect_game_services.side_effect = hanging_game_services
+    mock_service_factory.get_service.side_effect = lambda name: {
+        "system_collector": mock_system_collector,
+        "service_collector": mock_service_collector,
+    }[name]
+
+    config = {
+        "sys_metrics": {"type": "system_collector"},
+        "games": {"type": "service_collector", "timeout": 0.05},
+    }
+    result = await data_service.fetch_data(config)
+
+    assert list(result.keys()) == ["sys_metrics", "games"]
+    assert result["sys_metrics"]["cpu_percent"] == 75.5
+    assert result["games"] == {"error": "Timed out after 0.05s"}
+
+    # The shielded collection keeps running for later callers; let it finish
+    release.set()
+    await asyncio.sleep(0)
+
+@pytest.mark.asyncio
+async def test_fetch_data_runs_sources_concurrently(data_service, mock_service_factory, mock_service_collector):
+    """Total latency is that of the slowest source, not the sum of all sources."""
+    await data_service.initialize()
+
+    async def slow_game_services():
+        await asyncio.sleep(0.05)
+        return {"Minecraft": "Online"}
+
+    mock_service_collector.collect_game_services.side_effect = slow_game_services
+    mock_service_factory.get_service.return_value = mock_service_collector
+
+    # Distinct params give distinct cache keys, so each source really collects
+    config = {name: {"type": "service_collector", "server": name} for name in ("a", "b", "c")}
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await data_service.fetch_data(config)
+    elapsed = loop.time() - started
+
+    assert mock_service_collector.collect_game_services.await_count == 3
+    assert elapsed < 0.12
+    assert result == {name: {"services": {"Minecraft": "Online"}} for name in ("a", "b", "c")}
@@ -0,0 +1,92 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from app.bot.application.services.dashboard.data_source_cache import DataSourceCache
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def cache(clock):
+    return DataSourceCache(clock=clock)
+
+def test_make_key_ignores_param_order():
+    key_a = DataSourceCache.make_key("db_repository", "get", {"a": 1, "b": 2}, 5)
+    key_b = DataSourceCache.make_key("db_repository", "get", {"b": 2, "a": 1}, 5)
+    assert key_a == key_b
+    assert key_a != DataSourceCache.make_key("db_repository", "get", {"a": 1, "b": 2}, 6)
+
+def test_get_ttl_uses_per_source_defaults_and_overrides(cache):
+    assert cache.get_ttl("system_collector") == DataSourceCache.DEFAULT_TTLS["system_collector"]
+    assert cache.get_ttl("unknown_source") == DataSourceCache.DEFAULT_TTL
+    assert cache.get_ttl("system_collector", 3) == 3.0
+
+@pytest.mark.asyncio
+async def test_entry_expires_after_ttl(cache, clock):
+    fetcher = AsyncMock(side_effect=["first", "second"])
+    key = DataSourceCache.make_key("system_collector")
+
+    assert await cache.get_or_fetch(key, fetcher, ttl=10) == "first"
+    clock.now = 9
+    assert await cache.get_or_fetch(key, fetcher, ttl=10) == "first"
+    clock.now = 10
+    assert await cache.get_or_fetch(key, fetcher, ttl=10) == "second"
+    assert fetcher.await_count == 2
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_collection(cache):
+    """Single-flight: concurrent misses for the same key run the fetcher once."""
+    calls = 0
+
+    async def slow_fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"cpu": 1}
+
+    key = DataSourceCache.make_key("system_collector", "collect_all")
+    results = await asyncio.gather(*(cache.get_or_fetch(key, slow_fetch, ttl=10) for _ in range(5)))
+
+    assert calls == 1
+    assert all(r == {"cpu": 1} for r in results)
+    stats = cache.get_stats()
+    assert stats["misses"] == 1
+    assert stats["coalesced"] == 4
+
+@pytest.mark.asyncio
+async def test_failure_propagates_to_all_waiters_and_is_not_cached(cache):
+    async def failing_fetch():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("down")
+
+    key = DataSourceCache.make_key("service_collector", "collect_game_services")
+    results = await asyncio.gather(*(cache.get_or_fetch(key, failing_fetch, ttl=10) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.get_stats()["entries"] == 0
+    assert cache.get_stats()["errors"] == 1
+
+@pytest.mark.asyncio
+async def test_invalidate_by_guild(cache):
+    await cache.get_or_fetch(DataSourceCache.make_key("db_repository", "m", None, 1), AsyncMock(return_value=1), ttl=10)
+    await cache.get_or_fetch(DataSourceCache.make_key("db_repository", "m", None, 2), AsyncMock(return_value=2), ttl=10)
+
+    assert cache.invalidate(guild_id=1) == 1
+    assert cache.get_stats()["entries"] == 1
+
+@pytest.mark.asyncio
+async def test_max_entries_is_enforced(clock):
+    cache = DataSourceCache(max_entries=2, clock=clock)
+    for i in range(3):
+        await cache.get_or_fetch(DataSourceCache.make_key("db_repository", "m", None, i), AsyncMock(return_value=i), ttl=10 + i)
+    assert cache.get_stats()["entries"] == 2
@@ -0,0 +1,183 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.bot.application.services.member_sync import member_sync_service
+from app.bot.application.services.member_sync.member_sync_service import (
+    MemberSyncService, compute_member_hash, member_payload
+)
+
+
+def _member(member_id, name, bot=False, avatar=None):
+    return SimpleNamespace(
+        id=member_id, name=name, bot=bot,
+        avatar=SimpleNamespace(url=avatar) if avatar else None
+    )
+
+
+def _guild(guild_id, members):
+    return SimpleNamespace(id=guild_id, members=members)
+
+
+@pytest.fixture
+def user_repo(mocker):
+    repo = MagicMock()
+    repo.bulk_upsert_guild_members = AsyncMock(
+        side_effect=lambda guild_id, members, chunk_size: {
+            'inserted': len(members), 'updated': 0, 'unchanged': 0, 'guild_links_added': 0, 'errors': 0
+        }
+    )
+    repo.remove_guild_members = AsyncMock(side_effect=lambda guild_id, ids: len(ids))
+    mocker.patch.object(member_sync_service, "UserRepositoryImpl", return_value=repo)
+
+    context = AsyncMock()
+    context.__aenter__.return_value = MagicMock(name="MockDbSession")
+    mocker.patch.object(member_sync_service, "session_context", return_value=context)
+    return repo
+
+
+@pytest.fixture
+def full_sync():
+    return AsyncMock(return_value={'inserted': 0, 'updated': 1, 'unchanged': 2, 'guild_links_added': 0, 'errors': 0})
+
+
+@pytest.fixture
+def service(full_sync):
+    return MemberSyncService(full_sync=full_sync, debounce=0.01, max_batch=100, chunk_size=50)
+
+
+def test_member_hash_ignores_order_and_bots():
+    alice, bob, bot = _member(1, "alice"), _member(2, "bob", avatar="b.png"), _member(3, "helper", bot=True)
+    payloads = [member_payload(m) for m in (alice, bob, bot)]
+    assert payloads[2] is None
+
+    first = compute_member_hash(p for p in payloads if p)
+    second = compute_member_hash([member_payload(bob), member_payload(alice)])
+    assert first == second
+    assert compute_member_hash([member_payload(alice), member_payload(_member(2, "bobby", avatar="b.png"))]) != first
+
+
+@pytest.mark.asyncio
+async def test_events_are_coalesced_into_one_write_per_guild(service, user_repo):
+    service.enqueue_upsert(10, _member(1, "alice"))
+    service.enqueue_upsert(10, _member(1, "alice2"))       # replaces the first change
+    service.enqueue_upsert(10, _member(2, "bob"))
+    service.enqueue_removal(10, 2)                          # left again before the flush
+    service.enqueue_removal(10, 3)
+    service.enqueue_upsert(20, _member(9, "helper", bot=True))
+    assert service.pending == 3
+
+    await asyncio.sleep(0.05)
+
+    user_repo.bulk_upsert_guild_members.assert_awaited_once()
+    guild_id, members = user_repo.bulk_upsert_guild_members.await_args.args
+    assert guild_id == "10"
+    assert [(m['discord_id'], m['username']) for m in members] == [(1, "alice2")]
+    user_repo.remove_guild_members.assert_awaited_once_with("10", {"2", "3"})
+    assert service.pending == 0
+    assert service.stats['flushes'] == 1
+    assert service.stats['upserted'] == 1 and service.stats['removed'] == 2
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting(full_sync, user_repo):
+    service = MemberSyncService(full_sync=full_sync, debounce=60, max_batch=3)
+    for member_id in range(3):
+        service.enqueue_upsert(10, _member(member_id, f"user{member_id}"))
+
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    user_repo.bulk_upsert_guild_members.assert_awaited_once()
+    assert len(user_repo.bulk_upsert_guild_members.await_args.args[1]) == 3
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_write_is_counted(service, user_repo):
+    user_repo.bulk_upsert_guild_members.side_effect = RuntimeError("connection lost")
+    service.enqueue_upsert(10, _member(1, "alice"))
+    service.enqueue_upsert(10, _member(2, "bob"))
+
+    result = await service.flush()
+
+    assert result == {'upserted': 0, 'removed': 0, 'errors': 2}
+
+
+@pytest.mark.asyncio
+async def test_reconcile_skips_guilds_with_unchanged_hash(service, full_sync, mocker):
+    guild = _guild(10, [_member(1, "alice"), _member(2, "bob")])
+    stored = {}
+    mocker.patch.object(service, "_load_stored_hash", AsyncMock(side_effect=lambda gid: stored.get(gid)))
+    mocker.patch.object(service, "_store_hash", AsyncMock(side_effect=lambda gid, h: stored.__setitem__(gid, h)))
+
+    first = await service.reconcile_guild(guild)
+    second = await service.reconcile_guild(guild)
+
+    assert first['updated'] == 1
+    assert second == {'skipped': True}
+    full_sync.assert_awaited_once_with(guild)
+
+    # A changed member invalidates the hash
+    guild.members[1] = _member(2, "bobby")
+    summary = await service.reconcile_all([guild])
+    assert summary == {'synced': 1, 'skipped': 0, 'failed': 0}
+    assert full_sync.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_sync_does_not_store_hash(service, full_sync, mocker):
+    guild = _guild(10, [_member(1, "alice")])
+    mocker.patch.object(service, "_load_stored_hash", AsyncMock(return_value=None))
+    store = mocker.patch.object(service, "_store_hash", AsyncMock())
+    full_sync.return_value = None
+
+    assert await service.reconcile_guild(guild) is None
+    store.assert_not_awaited()
+    assert (await service.reconcile_all([guild]))['failed'] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_guild_write_clears_hash_and_spares_other_guilds(service, user_repo, mocker):
+    async def upsert(guild_id, members, chunk_size):
+        if guild_id == "10":
+            raise RuntimeError("connection lost")
+        return {'inserted': len(members), 'updated': 0, 'unchanged': 0, 'guild_links_added': 0, 'errors': 0}
+    user_repo.bulk_upsert_guild_members.side_effect = upsert
+    store = mocker.patch.object(service, "_store_hash", AsyncMock())
+    service.enqueue_upsert(10, _member(1, "alice"))
+    service.enqueue_upsert(20, _member(2, "bob"))
+
+    result = await service.flush()
+
+    assert result == {'upserted': 1, 'removed': 0, 'errors': 1}
+    # Separate session per guild
+    assert member_sync_service.session_context.call_count == 2
+    store.assert_awaited_once_with("10", None)
+
+
+@pytest.mark.asyncio
+async def test_successful_flush_refreshes_hash_of_synced_guild(full_sync, user_repo, mocker):
+    guild = _guild(10, [_member(1, "alice"), _member(2, "bob")])
+    service = MemberSyncService(full_sync=full_sync, guild_lookup=lambda guild_id: guild, debounce=60)
+    service._stored_hashes["10"] = "hash-from-last-full-sync"
+    store = mocker.patch.object(service, "_store_hash", AsyncMock())
+
+    service.enqueue_upsert(10, guild.members[1])
+    await service.flush()
+
+    store.assert_awaited_once_with("10", compute_member_hash(member_payload(m) for m in guild.members))
+
+
+@pytest.mark.asyncio
+async def test_flush_leaves_hash_of_unsynced_guild_alone(full_sync, user_repo, mocker):
+    guild = _guild(10, [_member(1, "alice")])
+    service = MemberSyncService(full_sync=full_sync, guild_lookup=lambda guild_id: guild, debounce=60)
+    store = mocker.patch.object(service, "_store_hash", AsyncMock())
+
+    service.enqueue_removal(10, 2)
+    await service.flush()
+
+    store.assert_not_awaited()
@@ -0,0 +1,134 @@
+import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import nextcord
+import pytest
+
+from app.bot.application.tasks.cleanup_engine import ChannelCleanupEngine
+from app.bot.application.tasks.cleanup_task import cleanup_homelab_channel
+from app.bot.infrastructure.discord.rest_scheduler import get_rest_scheduler
+
+BOT_ID = 1
+NOW = nextcord.utils.utcnow()
+
+
+@pytest.fixture(autouse=True)
+async def rest_scheduler():
+    yield
+    await get_rest_scheduler().shutdown()
+
+
+def _message(message_id, age, author_id=BOT_ID, content="status"):
+    message = MagicMock(id=message_id, content=content, reference=None, created_at=NOW - age)
+    message.author.id = author_id
+    message.delete = AsyncMock()
+    return message
+
+
+def _channel(messages, spec=nextcord.TextChannel):
+    channel = MagicMock(spec=spec)
+    channel.id = 42
+    channel.delete_messages = AsyncMock()
+    channel.history_calls = []
+
+    def history(**kwargs):
+        channel.history_calls.append(kwargs)
+        after, limit = kwargs.get("after"), kwargs.get("limit")
+        selected = [m for m in sorted(messages, key=lambda m: m.id, reverse=not kwargs.get("oldest_first"))
+                    if after is None or m.id > after.id]
+
+        async def iterate():
+            for message in selected[:limit]:
+                yield message
+        return iterate()
+
+    channel.history = history
+    return channel
+
+
+def _own(message):
+    return message.author.id == BOT_ID
+
+
+@pytest.mark.asyncio
+async def test_recent_messages_are_bulk_deleted_and_old_ones_singly():
+    recent = [_message(i, datetime.timedelta(days=1)) for i in range(1, 151)]
+    old = _message(200, datetime.timedelta(days=30))
+    foreign = _message(201, datetime.timedelta(days=1), author_id=2)
+    channel = _channel(recent + [old, foreign])
+
+    result = await ChannelCleanupEngine().cleanup_channel(channel, datetime.timedelta(hours=3), _own)
+
+    assert [len(call.args[0]) for call in channel.delete_messages.await_args_list] == [100, 50]
+    old.delete.assert_awaited_once()
+    foreign.delete.assert_not_awaited()
+    assert result.bulk_deleted == 150 and result.single_deleted == 1 and result.scanned == 152
+
+
+@pytest.mark.asyncio
+async def test_dm_channels_fall_back_to_single_deletes():
+    message = _message(1, datetime.timedelta(hours=5))
+    channel = _channel([message], spec=nextcord.DMChannel)
+
+    result = await ChannelCleanupEngine().cleanup_channel(channel, datetime.timedelta(hours=3), _own)
+
+    message.delete.assert_awaited_once()
+    assert result.single_deleted == 1 and result.bulk_deleted == 0
+
+
+@pytest.mark.asyncio
+async def test_high_water_mark_makes_next_scan_incremental():
+    engine = ChannelCleanupEngine()
+    messages = [_message(10, datetime.timedelta(hours=4), author_id=2), _message(11, datetime.timedelta(hours=5), author_id=2)]
+    channel = _channel(messages)
+
+    await engine.cleanup_channel(channel, datetime.timedelta(hours=3), _own)
+    assert engine.high_water_mark(42) == 11
+    assert "after" not in channel.history_calls[0]
+
+    messages.append(_message(12, datetime.timedelta(hours=4)))
+    result = await engine.cleanup_channel(channel, datetime.timedelta(hours=3), _own)
+
+    assert channel.history_calls[1]["after"].id == 11
+    assert result.scanned == 1 and result.deleted == 1
+    assert engine.high_water_mark(42) == 12
+
+
+@pytest.mark.asyncio
+async def test_failed_delete_keeps_high_water_mark():
+    engine = ChannelCleanupEngine()
+    message = _message(5, datetime.timedelta(days=20))
+    message.delete.side_effect = RuntimeError("boom")
+
+    result = await engine.cleanup_channel(_channel([message]), datetime.timedelta(hours=3), _own)
+
+    assert result.failed == 1
+    assert engine.high_water_mark(42) is None
+
+
+@pytest.mark.asyncio
+async def test_command_reply_from_bot_is_deleted_once():
+    message = _message(7, datetime.timedelta(days=20), content="!status")
+    channel = _channel([message])
+    bot = MagicMock()
+    bot.user.id = BOT_ID
+    bot.get_channel.return_value = channel
+
+    await cleanup_homelab_channel(bot, 42)
+
+    message.delete.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_backlog_beyond_scan_limit_is_worked_off_over_several_runs():
+    engine = ChannelCleanupEngine()
+    backlog = [_message(i, datetime.timedelta(days=20)) for i in range(1, 6)]
+    channel = _channel(backlog)
+
+    deleted = [(await engine.cleanup_channel(channel, datetime.timedelta(hours=3), _own, scan_limit=2)).deleted
+               for _ in range(3)]
+
+    assert deleted == [2, 2, 1]
+    assert all(message.delete.await_count == 1 for message in backlog)
+    assert all(call["oldest_first"] for call in channel.history_calls)
+    assert engine.high_water_mark(42) == 5
@@ -69,6 +69,10 @@ def user_workflow_no_patch(mock_db_workflow, mock_bot):
 def mock_user_repo_instance():
     repo = AsyncMock(spec=UserRepositoryImpl)
     repo.create_or_update = AsyncMock()
+    repo.bulk_upsert_guild_members = AsyncMock(return_value={
+        'inserted': 1, 'updated': 0, 'unchanged': 0, 'guild_links_added': 1, 'errors': 0
+    })
+    repo.remove_departed_guild_members = AsyncMock(return_value=2)
     return repo
 
 @pytest.fixture
@@ -188,12 +192,12 @@ async def test_sync_guild_to_database_update_guild(user_workflow_no_patch, mock_
 
 @pytest.mark.asyncio
 async def test_sync_guild_members_success(user_workflow_no_patch, mock_guild, mock_member, mock_bot_member, mock_session_context, mock_user_repository_impl_class, mock_user_repo_instance, mocker):
-    """Test syncing members, including skipping bots and calling create_or_update."""
+    """Test syncing members in bulk, skipping bots and reporting counts."""
     workflow = user_workflow_no_patch
     # Mock the sync_guild_to_database call within sync_guild_members
     mock_sync_guild_db = mocker.patch.object(workflow, 'sync_guild_to_database', new_callable=AsyncMock)
     
-    await workflow.sync_guild_members(mock_guild)
+    stats = await workflow.sync_guild_members(mock_guild)
     
     # Check sync_guild_to_database was called
     mock_sync_guild_db.assert_awaited_once_with(mock_guild)
@@ -204,31 +208,51 @@ async def test_sync_guild_members_success(user_workflow_no_patch, mock_guild, mo
     # Check repo was initialized
     mock_user_repository_impl_class.assert_called_once_with(mock_session_context.return_value.__aenter__.return_value)
     
-    # Check create_or_update was called ONLY for the non-bot member
-    mock_user_repo_instance.create_or_update.assert_awaited_once()
-    call_args, call_kwargs = mock_user_repo_instance.create_or_update.await_args
-    user_data = call_args[0]
-    assert user_data['discord_id'] == mock_member.id
-    assert user_data['username'] == mock_member.name
-    assert user_data['is_bot'] is False
-    assert user_data['guild_id'] == str(mock_guild.id)
-    # Check it wasn't called for the bot member (await_count should still be 1)
-    assert mock_user_repo_instance.create_or_update.await_count == 1
+    # One bulk call for the whole guild, containing ONLY the non-bot member
+    mock_user_repo_instance.bulk_upsert_guild_members.assert_awaited_once()
+    call_args, call_kwargs = mock_user_repo_instance.bulk_upsert_guild_members.await_args
+    guild_id, members_data = call_args
+    assert guild_id == str(mock_guild.id)
+    assert [m['discord_id'] for m in members_data] == [mock_member.id]
+    assert members_data[0]['username'] == mock_member.name
+    assert call_kwargs['chunk_size'] > 0
+    # The per-member path is no longer used
+    mock_user_repo_instance.create_or_update.assert_not_awaited()
+    
+    assert stats['inserted'] == 1
+    assert stats['skipped_bots'] == 1
+    # Links of members no longer in the guild are dropped
+    mock_user_repo_instance.remove_departed_guild_members.assert_awaited_once_with(
+        str(mock_guild.id), [mock_member.id, mock_bot_member.id]
+    )
+    assert stats['guild_links_removed'] == 2
+
+@pytest.mark.asyncio
+async def test_sync_guild_members_keeps_links_without_full_member_list(user_workflow_no_patch, mock_guild, mock_session_context, mock_user_repository_impl_class, mock_user_repo_instance, mocker):
+    """Test that departed members are not removed while the member cache is incomplete."""
+    workflow = user_workflow_no_patch
+    mocker.patch.object(workflow, 'sync_guild_to_database', new_callable=AsyncMock)
+    mock_guild.chunked = False
+
+    stats = await workflow.sync_guild_members(mock_guild)
+
+    mock_user_repo_instance.remove_departed_guild_members.assert_not_awaited()
+    assert stats['guild_links_removed'] == 0
 
 @pytest.mark.asyncio
 async def test_sync_guild_members_handles_repo_error(user_workflow_no_patch, mock_guild, mock_session_context, mock_user_repository_impl_class, mock_user_repo_instance, mocker):
-    """Test that sync continues if create_or_update fails for one member."""
+    """Test that a failing bulk sync is logged and reported as None."""
     workflow = user_workflow_no_patch
     mock_sync_guild_db = mocker.patch.object(workflow, 'sync_guild_to_database', new_callable=AsyncMock)
     mock_logger_error = mocker.patch("app.bot.application.workflows.user_workflow.logger.error")
     
-    # Make create_or_update fail
-    mock_user_repo_instance.create_or_update.side_effect = Exception("DB Write Error!")
+    # Make the bulk upsert fail
+    mock_user_repo_instance.bulk_upsert_guild_members.side_effect = Exception("DB Write Error!")
     
-    await workflow.sync_guild_members(mock_guild)
+    stats = await workflow.sync_guild_members(mock_guild)
     
-    # Check it was still called for the non-bot member
-    assert mock_user_repo_instance.create_or_update.await_count == 1 
+    assert stats is None
+    assert mock_user_repo_instance.bulk_upsert_guild_members.await_count == 1
     # Check error was logged
     mock_logger_error.assert_called_once()
-    assert "Failed to sync member TestUser" in mock_logger_error.call_args[0][0] 
\ No newline at end of file
+    assert "Failed to sync members for guild SyncGuild" in mock_logger_error.call_args[0][0]
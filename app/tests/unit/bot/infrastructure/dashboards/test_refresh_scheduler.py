@@ -0,0 +1,152 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from app.bot.infrastructure.dashboards.refresh_scheduler import DashboardRefreshScheduler
+
+# --- Helpers ---
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def make_controller(dashboard_id, refresh_interval=None, display=None):
+    controller = MagicMock(name=f"Controller_{dashboard_id}")
+    controller.dashboard_id = dashboard_id
+    controller.config = {'metadata': {'refresh_interval': refresh_interval}} if refresh_interval is not None else {}
+    controller.display_dashboard = display or AsyncMock(return_value=MagicMock())
+    return controller
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def scheduler(clock):
+    return DashboardRefreshScheduler(max_concurrency=2, default_interval=60, jitter=0, clock=clock)
+
+# --- Tests ---
+
+@pytest.mark.asyncio
+async def test_new_dashboards_are_scheduled_not_refreshed(scheduler):
+    """A dashboard seen for the first time was just displayed, so it is only scheduled."""
+    controller = make_controller("d1")
+    started = scheduler.tick({1: controller})
+    assert started == 0
+    controller.display_dashboard.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_due_dashboard_refreshes_once_per_tick(scheduler, clock):
+    """A due dashboard gets exactly one display_dashboard() pass."""
+    controller = make_controller("d1")
+    scheduler.tick({1: controller})
+    clock.now += 60
+    assert scheduler.tick({1: controller}) == 1
+    await scheduler.wait_idle()
+    controller.display_dashboard.assert_awaited_once()
+    controller.refresh_data.assert_not_called()
+    assert scheduler.stats["refreshed"] == 1
+
+@pytest.mark.asyncio
+async def test_per_dashboard_interval(scheduler, clock):
+    """Intervals are taken from the dashboard config metadata."""
+    fast = make_controller("fast", refresh_interval=10)
+    slow = make_controller("slow")
+    dashboards = {1: fast, 2: slow}
+    scheduler.tick(dashboards)
+    clock.now += 10
+    assert scheduler.tick(dashboards) == 1
+    await scheduler.wait_idle()
+    fast.display_dashboard.assert_awaited_once()
+    slow.display_dashboard.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_zero_interval_disables_refresh(scheduler, clock):
+    controller = make_controller("static", refresh_interval=0)
+    scheduler.tick({1: controller})
+    clock.now += 3600
+    assert scheduler.tick({1: controller}) == 0
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded(scheduler, clock):
+    """No more than max_concurrency refreshes run at the same time."""
+    running = 0
+    peak = 0
+
+    async def slow_display():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return MagicMock()
+
+    dashboards = {i: make_controller(f"d{i}", display=AsyncMock(side_effect=slow_display)) for i in range(6)}
+    scheduler.tick(dashboards)
+    clock.now += 60
+    assert scheduler.tick(dashboards) == 6
+    await scheduler.wait_idle()
+    assert peak == 2
+    assert scheduler.stats["refreshed"] == 6
+
+@pytest.mark.asyncio
+async def test_in_flight_refresh_is_not_started_twice(scheduler, clock):
+    release = asyncio.Event()
+
+    async def blocked_display():
+        await release.wait()
+        return MagicMock()
+
+    controller = make_controller("d1", display=AsyncMock(side_effect=blocked_display))
+    scheduler.tick({1: controller})
+    clock.now += 60
+    scheduler.tick({1: controller})
+    await asyncio.sleep(0)
+    clock.now += 60
+    assert scheduler.tick({1: controller}) == 0
+    assert scheduler.stats["skipped_in_flight"] == 1
+    release.set()
+    await scheduler.wait_idle()
+    assert controller.display_dashboard.await_count == 1
+
+@pytest.mark.asyncio
+async def test_failed_refresh_is_counted(scheduler, clock):
+    controller = make_controller("d1", display=AsyncMock(side_effect=RuntimeError("boom")))
+    scheduler.tick({1: controller})
+    clock.now += 60
+    scheduler.tick({1: controller})
+    await scheduler.wait_idle()
+    assert scheduler.stats["failed"] == 1
+
+@pytest.mark.asyncio
+async def test_removed_dashboards_are_forgotten(scheduler, clock):
+    controller = make_controller("d1")
+    scheduler.tick({1: controller})
+    clock.now += 60
+    assert scheduler.tick({}) == 0
+    assert 1 not in scheduler._next_due
+
+@pytest.mark.asyncio
+async def test_registry_shutdown_cancels_running_refreshes(clock):
+    from app.bot.infrastructure.dashboards.dashboard_registry import DashboardRegistry
+
+    bot = MagicMock()
+    bot.wait_until_ready = AsyncMock()
+    registry = DashboardRegistry(bot)
+    registry.refresh_scheduler = DashboardRefreshScheduler(default_interval=60, jitter=0, clock=clock)
+    controller = make_controller("d1", display=AsyncMock(side_effect=asyncio.Event().wait))
+    registry.refresh_scheduler.tick({1: controller})
+    clock.now += 60
+    registry.refresh_scheduler.tick({1: controller})
+    await asyncio.sleep(0)
+    running = list(registry.refresh_scheduler._in_flight.values())
+
+    await registry.shutdown()
+
+    assert running and all(task.cancelled() for task in running)
+    assert not registry.refresh_scheduler._in_flight
+    assert not registry._refresh_active_dashboards_loop.is_running()
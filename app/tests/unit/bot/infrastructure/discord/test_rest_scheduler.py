@@ -0,0 +1,115 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import nextcord
+import pytest
+
+from app.bot.infrastructure.discord.rest_scheduler import DiscordRestScheduler, RequestPriority, rest_route
+
+
+def _rate_limited(retry_after="0.05"):
+    response = MagicMock(status=429, reason="Too Many Requests", headers={"Retry-After": retry_after})
+    return nextcord.HTTPException(response, {"message": "You are being rate limited.", "code": 0})
+
+
+def _call(log, name, result=None, delay=0):
+    async def call():
+        log.append(name)
+        if delay:
+            await asyncio.sleep(delay)
+        return result if result is not None else name
+    return call
+
+
+@pytest.fixture
+async def scheduler():
+    scheduler = DiscordRestScheduler(max_concurrency=1, global_rate=1000, max_retries=2)
+    yield scheduler
+    await scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_runs_first(scheduler):
+    log = []
+    await asyncio.gather(
+        scheduler.submit(_call(log, "cleanup"), rest_route("DELETE", "/channels/{channel_id}/messages/{message_id}", 1), RequestPriority.CLEANUP),
+        scheduler.submit(_call(log, "dashboard"), rest_route("PATCH", "/channels/{channel_id}/messages/{message_id}", 2), RequestPriority.DASHBOARD),
+        scheduler.submit(_call(log, "template"), rest_route("PATCH", "/channels/{channel_id}", 3), RequestPriority.TEMPLATE),
+        scheduler.submit(_call(log, "interaction"), rest_route("POST", "/channels/{channel_id}/messages", 4), RequestPriority.INTERACTION),
+    )
+    assert log == ["interaction", "template", "dashboard", "cleanup"]
+
+
+@pytest.mark.asyncio
+async def test_queued_edit_is_superseded_by_newer_edit(scheduler):
+    log = []
+    route = rest_route("PATCH", "/channels/{channel_id}/messages/{message_id}", 1)
+    key = ("dashboard_edit", 1, 100)
+    blocker = asyncio.ensure_future(scheduler.submit(_call(log, "other", delay=0.02), rest_route("POST", "/x", 9)))
+    await asyncio.sleep(0)
+    results = await asyncio.gather(
+        scheduler.submit(_call(log, "edit-1"), route, coalesce_key=key),
+        scheduler.submit(_call(log, "edit-2"), route, coalesce_key=key),
+    )
+    await blocker
+
+    assert log == ["other", "edit-2"]
+    assert results == ["edit-2", "edit-2"]
+    assert scheduler.stats["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_calls_on_one_route_do_not_overlap():
+    scheduler = DiscordRestScheduler(max_concurrency=4, global_rate=1000)
+    running, peak = 0, 0
+
+    async def call():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    route = rest_route("DELETE", "/channels/{channel_id}/messages/{message_id}", 1)
+    await asyncio.gather(*(scheduler.submit(call, route, RequestPriority.CLEANUP) for _ in range(4)))
+    await scheduler.shutdown()
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_call_is_retried_after_retry_after(scheduler):
+    attempts = []
+
+    async def call():
+        attempts.append(asyncio.get_running_loop().time())
+        if len(attempts) == 1:
+            raise _rate_limited("0.05")
+        return "ok"
+
+    assert await scheduler.submit(call, rest_route("PATCH", "/channels/{channel_id}", 1), RequestPriority.TEMPLATE) == "ok"
+    assert len(attempts) == 2
+    assert attempts[1] - attempts[0] >= 0.04
+    assert scheduler.stats["rate_limited"] == 1
+    assert scheduler.stats["retried"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_error_is_raised_after_max_retries(scheduler):
+    async def call():
+        raise _rate_limited("0")
+
+    with pytest.raises(nextcord.HTTPException):
+        await scheduler.submit(call, rest_route("PATCH", "/channels/{channel_id}", 1))
+    assert scheduler.stats["retried"] == 2
+    assert scheduler.stats["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_report_depth_and_latency(scheduler):
+    await scheduler.submit(_call([], "x"), rest_route("POST", "/channels/{channel_id}/messages", 1), RequestPriority.INTERACTION)
+    metrics = scheduler.metrics()
+
+    assert metrics["queue_depth"] == {"interaction": 0, "template": 0, "dashboard": 0, "cleanup": 0}
+    assert metrics["stats"]["completed"] == 1
+    assert set(metrics["wait_ms"]["interaction"]) == {"p50", "p95", "max"}
+    assert metrics["run_ms"]["cleanup"] is None
@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from app.bot.infrastructure.monitoring.collectors.service.components.security import AuthLogTailer
+
+
+def _failed(ip, user="root"):
+    return f"Oct 16 12:00:00 host sshd[1]: Failed password for {user} from {ip} port 22 ssh2\n"
+
+
+def _append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / "auth.log"
+    path.write_text(_failed("10.0.0.1") + "Oct 16 12:00:01 host sshd[1]: Accepted publickey for admin\n")
+    return str(path)
+
+
+def test_scans_only_new_bytes(log_path):
+    tailer = AuthLogTailer(log_path)
+    assert tailer.scan() == (1, "10.0.0.1")
+    first_read = tailer.stats["bytes_read"]
+
+    assert tailer.scan() == (1, "10.0.0.1")
+    assert tailer.stats["bytes_read"] == first_read
+
+    new_line = _failed("2001:db8::7", user="invalid user admin")
+    _append(log_path, new_line)
+    assert tailer.scan() == (2, "2001:db8::7")
+    assert tailer.stats["bytes_read"] == first_read + len(new_line)
+
+
+def test_partial_line_is_read_once_complete(log_path):
+    tailer = AuthLogTailer(log_path)
+    tailer.scan()
+
+    line = _failed("10.0.0.2")
+    _append(log_path, line[:20])
+    assert tailer.scan() == (1, "10.0.0.1")
+    _append(log_path, line[20:])
+    assert tailer.scan() == (2, "10.0.0.2")
+
+
+def test_rotation_drains_old_file_and_restarts(log_path):
+    tailer = AuthLogTailer(log_path)
+    tailer.scan()
+
+    # Written after our last scan, just before logrotate moves the file
+    _append(log_path, _failed("10.0.0.3"))
+    os.rename(log_path, f"{log_path}.1")
+    with open(log_path, "w") as f:
+        f.write(_failed("10.0.0.4"))
+
+    assert tailer.scan() == (1, "10.0.0.4")
+    assert tailer.total_failed == 3
+    assert tailer.stats["rotations"] == 1
+    assert list(tailer.recent_ips) == ["10.0.0.1", "10.0.0.3", "10.0.0.4"]
+
+
+def test_truncation_is_treated_as_rotation(log_path):
+    tailer = AuthLogTailer(log_path)
+    tailer.scan()
+
+    with open(log_path, "w") as f:
+        f.write("")
+    assert tailer.scan() == (0, "10.0.0.1")
+    _append(log_path, _failed("10.0.0.5"))
+    assert tailer.scan() == (1, "10.0.0.5")
+
+
+def test_top_ips_over_recent_window(tmp_path):
+    path = tmp_path / "auth.log"
+    path.write_text(_failed("10.0.0.9") * 3 + _failed("10.0.0.8") * 5)
+    tailer = AuthLogTailer(str(path), recent_window=6)
+    tailer.scan()
+    assert tailer.top_ips(2) == [("10.0.0.8", 5), ("10.0.0.9", 1)]
@@ -0,0 +1,89 @@
+import pytest
+from unittest.mock import MagicMock
+from docker.errors import NotFound
+
+from app.bot.infrastructure.monitoring.checkers.container_inventory import ContainerInventory
+
+
+def _attrs(container_id, name, status="running", ip="172.18.0.2"):
+    return {
+        "Id": container_id,
+        "Name": f"/{name}",
+        "State": {"Status": status},
+        "NetworkSettings": {"Networks": {"bridge": {"IPAddress": ip}}, "Ports": {}},
+    }
+
+
+@pytest.fixture
+def docker_client():
+    client = MagicMock()
+    client.containers.list.return_value = [
+        MagicMock(attrs=_attrs("a1", "pufferpanel")),
+        MagicMock(attrs=_attrs("b2", "palworld-server", status="exited", ip="")),
+    ]
+    return client
+
+
+@pytest.fixture
+def inventory(docker_client):
+    return ContainerInventory(client_factory=lambda: docker_client, watch_events=False)
+
+
+@pytest.mark.asyncio
+async def test_loads_once_and_serves_from_memory(inventory, docker_client):
+    containers = await inventory.get_containers()
+    assert set(containers) == {"pufferpanel", "palworld-server"}
+    assert containers["pufferpanel"].status == "running"
+    assert containers["pufferpanel"].ip_address == "172.18.0.2"
+    assert containers["palworld-server"].ip_address is None
+
+    await inventory.get_containers()
+    await inventory.get_container("pufferpanel")
+    assert docker_client.containers.list.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_events_update_single_container(inventory, docker_client):
+    await inventory.get_containers()
+
+    docker_client.api.inspect_container.return_value = _attrs("b2", "palworld-server", status="running")
+    inventory.apply_event({"Type": "container", "Action": "start", "Actor": {"ID": "b2"}})
+    assert inventory.snapshot()["palworld-server"].status == "running"
+    docker_client.api.inspect_container.assert_called_once_with("b2")
+
+    inventory.apply_event({"Type": "container", "Action": "destroy", "Actor": {"ID": "a1"}})
+    assert "pufferpanel" not in inventory.snapshot()
+    assert docker_client.containers.list.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_irrelevant_and_vanished_events(inventory, docker_client):
+    await inventory.get_containers()
+
+    # exec events (e.g. from our own process checks) must not trigger inspects
+    inventory.apply_event({"Type": "container", "Action": "exec_start: ps aux", "Actor": {"ID": "a1"}})
+    docker_client.api.inspect_container.assert_not_called()
+
+    docker_client.api.inspect_container.side_effect = NotFound("gone")
+    inventory.apply_event({"Type": "container", "Action": "die", "Actor": {"ID": "a1"}})
+    assert "pufferpanel" not in inventory.snapshot()
+
+
+@pytest.mark.asyncio
+async def test_stale_inventory_is_relisted_without_watcher(inventory, docker_client):
+    inventory.max_age = 0
+    await inventory.get_containers()
+    inventory._last_refresh -= 1
+    await inventory.get_containers()
+    assert docker_client.containers.list.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unavailable_docker_returns_empty_or_raises():
+    def broken_factory():
+        raise RuntimeError("docker socket missing")
+
+    inventory = ContainerInventory(client_factory=broken_factory, watch_events=False)
+    assert await inventory.get_containers() == {}
+    with pytest.raises(RuntimeError):
+        await inventory.get_containers(raise_on_error=True)
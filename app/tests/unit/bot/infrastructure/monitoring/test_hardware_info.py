@@ -0,0 +1,61 @@
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock
+
+from app.bot.infrastructure.monitoring.collectors.system.components import hardware
+
+@pytest.fixture(autouse=True)
+def reset_inventory_cache():
+    hardware._static_hardware_info = None
+    hardware._static_hardware_lock = None
+    yield
+    hardware._static_hardware_info = None
+    hardware._static_hardware_lock = None
+
+@pytest.fixture
+def patched_collectors():
+    """Replaces the real collectors with cheap fakes and counts static CPU lookups."""
+    calls = {"cpu_static": 0}
+
+    def fake_cpu_static():
+        calls["cpu_static"] += 1
+        return {"cpu_model": "Test CPU", "cpu_cores": 4, "cpu_threads": 8}
+
+    with patch.object(hardware, "get_cpu_static_info", side_effect=fake_cpu_static), \
+         patch.object(hardware, "get_gpu_static_info", return_value={"gpu_count": 0}), \
+         patch.object(hardware, "get_sensor_inventory", return_value={"temperature_sensors": ["coretemp"]}), \
+         patch.object(hardware, "get_system_info", AsyncMock(return_value={"system_hostname": "host"})), \
+         patch.object(hardware, "get_cpu_dynamic_info", AsyncMock(return_value={"cpu_freq_current": "3.00 GHz"})), \
+         patch.object(hardware, "get_memory_info", AsyncMock(return_value={"ram_percent": 50})), \
+         patch.object(hardware, "get_network_info", AsyncMock(return_value={"network_adapters": "LAN"})), \
+         patch.object(hardware, "get_power_info", AsyncMock(return_value={"power_status": "ok"})), \
+         patch.object(hardware, "get_sensor_info", AsyncMock(return_value={"temp_coretemp_cpu": 40.0})):
+        yield calls
+
+@pytest.mark.asyncio
+async def test_static_inventory_is_collected_once(patched_collectors):
+    first = await hardware.get_hardware_info()
+    second = await hardware.get_hardware_info()
+
+    assert patched_collectors["cpu_static"] == 1
+    assert first["cpu_model"] == second["cpu_model"] == "Test CPU"
+    assert second["cpu_freq_current"] == "3.00 GHz"
+    assert second["temperature_sensors"] == ["coretemp"]
+
+@pytest.mark.asyncio
+async def test_concurrent_first_callers_share_inventory_collection(patched_collectors):
+    await asyncio.gather(*(hardware.get_static_hardware_info() for _ in range(5)))
+    assert patched_collectors["cpu_static"] == 1
+
+@pytest.mark.asyncio
+async def test_refresh_recollects_inventory(patched_collectors):
+    await hardware.get_static_hardware_info()
+    await hardware.get_static_hardware_info(refresh=True)
+    assert patched_collectors["cpu_static"] == 2
+
+@pytest.mark.asyncio
+async def test_dynamic_info_does_not_touch_static_collectors(patched_collectors):
+    dynamic = await hardware.get_dynamic_hardware_info()
+    assert patched_collectors["cpu_static"] == 0
+    assert "cpu_model" not in dynamic
+    assert dynamic["ram_percent"] == 50
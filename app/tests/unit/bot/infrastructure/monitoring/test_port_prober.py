@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+
+from app.bot.infrastructure.monitoring.checkers.port_prober import PortProber
+
+@pytest.fixture
+async def listening_port():
+    """Starts a local TCP server and yields its port."""
+    server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield port
+    server.close()
+    await server.wait_closed()
+
+@pytest.fixture
+def closed_port():
+    """Returns a port that nothing listens on."""
+    import socket
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+@pytest.mark.asyncio
+async def test_probe_open_and_closed_ports(listening_port, closed_port):
+    prober = PortProber()
+    assert await prober.probe("127.0.0.1", listening_port) is True
+    assert await prober.probe("127.0.0.1", closed_port) is False
+
+@pytest.mark.asyncio
+async def test_probe_results_are_cached(listening_port):
+    prober = PortProber(result_ttl=60)
+    await prober.probe("127.0.0.1", listening_port)
+    await prober.probe("127.0.0.1", listening_port)
+    assert prober.stats["probes"] == 1
+    assert prober.stats["cache_hits"] == 1
+
+@pytest.mark.asyncio
+async def test_probe_many_runs_concurrently(monkeypatch):
+    """A range of slow probes takes about as long as one probe."""
+    prober = PortProber(result_ttl=0)
+    in_progress = 0
+    peak = 0
+
+    async def slow_open_connection(host, port):
+        nonlocal in_progress, peak
+        in_progress += 1
+        peak = max(peak, in_progress)
+        await asyncio.sleep(0.05)
+        in_progress -= 1
+        raise ConnectionRefusedError()
+
+    monkeypatch.setattr(asyncio, "open_connection", slow_open_connection)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await prober.probe_many([("10.0.0.1", port) for port in range(25565, 25576)])
+    elapsed = loop.time() - started
+
+    assert len(results) == 11
+    assert not any(results.values())
+    assert peak == 11
+    assert elapsed < 0.2
+
+@pytest.mark.asyncio
+async def test_per_host_limit(monkeypatch):
+    prober = PortProber(per_host_limit=2, result_ttl=0)
+    in_progress = 0
+    peak = 0
+
+    async def slow_open_connection(host, port):
+        nonlocal in_progress, peak
+        in_progress += 1
+        peak = max(peak, in_progress)
+        await asyncio.sleep(0.01)
+        in_progress -= 1
+        raise ConnectionRefusedError()
+
+    monkeypatch.setattr(asyncio, "open_connection", slow_open_connection)
+    await prober.probe_many([("10.0.0.1", port) for port in range(8)])
+    assert peak == 2
+
+@pytest.mark.asyncio
+async def test_probe_times_out(monkeypatch):
+    prober = PortProber()
+
+    async def hanging_open_connection(host, port):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(asyncio, "open_connection", hanging_open_connection)
+    assert await prober.probe("10.0.0.1", 1, timeout=0.05) is False
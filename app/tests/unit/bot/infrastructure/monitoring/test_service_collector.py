@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+import app.shared.infrastructure.models.guild_templates  # noqa: F401  (registers mappers MetricModel's registry needs)
+from app.bot.infrastructure.monitoring.collectors.service.components import base
+from app.bot.infrastructure.monitoring.collectors.service.impl import ServiceCollector
+
+
+@pytest.fixture
+def probes(mocker):
+    return {
+        "docker": mocker.patch.object(base, "get_docker_status", AsyncMock(
+            return_value=(1, 1, "pufferpanel: ✅ Running\nold: ❌ Exited\n"))),
+        "ssh": mocker.patch.object(base, "get_ssh_attempts", AsyncMock(return_value=(7, "10.0.0.1"))),
+        "services": mocker.patch.object(base, "check_services_status", AsyncMock(
+            return_value={"🎮 Minecraft": "✅ Online auf Port(s): 25565", "🎮 CS2": "❌ Offline"})),
+    }
+
+
+@pytest.mark.asyncio
+async def test_metrics_and_dashboard_data_share_one_snapshot(probes):
+    collector = ServiceCollector()
+
+    metrics, services = await asyncio.gather(collector.collect_all(), collector.collect_game_services())
+
+    for probe in probes.values():
+        assert probe.await_count == 1
+    assert services == {"🎮 Minecraft": "✅ Online auf Port(s): 25565", "🎮 CS2": "❌ Offline"}
+
+    by_name = {}
+    for metric in metrics:
+        by_name.setdefault(metric.name, []).append(metric)
+    assert by_name["docker_running"][0].value == 1
+    assert by_name["ssh_attempts"][0].value == 7
+    assert by_name["ssh_attempts"][0].metric_data["last_ip"] == "10.0.0.1"
+    assert sorted(m.value for m in by_name["container_status"]) == [0, 1]
+    assert sorted(m.value for m in by_name["service_status"]) == [0, 1]
+    assert len(collector.history()) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_is_recollected(probes):
+    collector = ServiceCollector(max_age=0)
+    await collector.collect_all()
+    await collector.collect_all()
+    assert probes["docker"].await_count == 2
+    assert len(collector.history()) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_keeps_defaults(probes):
+    probes["docker"].side_effect = RuntimeError("no docker")
+    data = await base.collect_service_data()
+    assert data["docker_running"] == "N/A"
+    assert data["docker_details"] == "Docker nicht verfügbar"
+    assert data["ssh_attempts"] == 7
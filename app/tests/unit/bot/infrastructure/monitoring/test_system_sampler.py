@@ -0,0 +1,58 @@
+import asyncio
+import time
+import pytest
+
+from app.bot.infrastructure.monitoring.collectors.system.components.sampler import SystemSampler, SystemSample
+
+@pytest.fixture
+async def sampler():
+    sampler = SystemSampler(interval=0.01, history_size=5)
+    yield sampler
+    await sampler.stop()
+
+@pytest.mark.asyncio
+async def test_get_latest_starts_sampler_and_returns_sample(sampler):
+    sample = await sampler.get_latest()
+    assert isinstance(sample, SystemSample)
+    assert 0.0 <= sample.cpu_percent <= 100.0
+    assert sample.memory.total > 0
+    assert sampler.running
+
+@pytest.mark.asyncio
+async def test_history_is_bounded_ring_buffer(sampler):
+    await sampler.get_latest()
+    await asyncio.sleep(0.2)
+    history = sampler.history()
+    assert len(history) == 5
+    assert history[-1] is sampler.latest()
+    assert [s.timestamp for s in history] == sorted(s.timestamp for s in history)
+
+@pytest.mark.asyncio
+async def test_summary_over_history(sampler):
+    await sampler.get_latest()
+    await asyncio.sleep(0.05)
+    summary = sampler.summary('cpu_percent')
+    assert summary['min'] <= summary['avg'] <= summary['max']
+    assert summary['samples'] == len(sampler.history())
+    assert 'avg' in sampler.summary('memory_percent')
+
+@pytest.mark.asyncio
+async def test_sampling_does_not_block_event_loop(sampler, monkeypatch):
+    """psutil runs in a worker thread, so other coroutines keep running meanwhile."""
+    original = sampler._take_sample
+
+    def slow_take_sample(cpu_interval=None):
+        time.sleep(0.2)
+        return original(cpu_interval)
+
+    monkeypatch.setattr(sampler, "_take_sample", slow_take_sample)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    await asyncio.gather(sampler.get_latest(), ticker())
+    assert ticks == 10
@@ -0,0 +1,88 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from app.bot.infrastructure.messaging.async_http_client import AsyncHttpClient
+from app.bot.infrastructure.monitoring.checkers import web_service_checker
+
+
+@pytest.fixture
+async def http_server():
+    async def ok(request):
+        return web.Response(text="ok")
+
+    async def slow(request):
+        await asyncio.sleep(2)
+        return web.Response(text="late")
+
+    async def protected(request):
+        return web.Response(status=401)
+
+    app = web.Application()
+    app.router.add_get("/ok", ok)
+    app.router.add_get("/slow", slow)
+    app.router.add_get("/protected", protected)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.fixture
+async def http_client(mocker):
+    client = AsyncHttpClient()
+    mocker.patch.object(web_service_checker, "get_async_http_client", return_value=client)
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_checks_run_concurrently_with_per_service_timeouts(http_server, http_client):
+    services = [
+        {"name": "slow-1", "url": f"{http_server}/slow", "timeout": 0.3},
+        {"name": "slow-2", "url": f"{http_server}/slow", "timeout": 0.3},
+        {"name": "ok", "url": f"{http_server}/ok"},
+        {"name": "protected", "url": f"{http_server}/protected"},
+    ]
+
+    start = time.perf_counter()
+    results = await web_service_checker.check_web_services(services)
+    elapsed = time.perf_counter() - start
+
+    assert results["slow-1"] == "⏱️ Timeout"
+    assert results["slow-2"] == "⏱️ Timeout"
+    assert results["ok"] == "✅ Online"
+    assert results["protected"] == "🔒 Geschützt"
+    # Two 0.3s timeouts in parallel, not back to back
+    assert elapsed < 0.55
+
+    latencies = web_service_checker.get_web_service_latencies()
+    assert {"slow-1", "slow-2", "ok", "protected"} <= set(latencies)
+    assert latencies["slow-1"] >= 250
+
+
+@pytest.mark.asyncio
+async def test_session_is_shared_between_calls(http_server, http_client):
+    session = http_client.get_session()
+    await http_client.check_url(f"{http_server}/ok")
+    assert await http_client.check_url(f"{http_server}/protected") == {
+        "status": 401, "latency_ms": pytest.approx(0, abs=1000), "error": None
+    }
+    assert http_client.get_session() is session
+
+    await http_client.close()
+    assert session.closed
+    assert http_client.get_session() is not session
+
+
+@pytest.mark.asyncio
+async def test_unreachable_service_is_offline(http_client):
+    results = await web_service_checker.check_web_services(
+        [{"name": "down", "url": "http://127.0.0.1:1/", "timeout": 1}]
+    )
+    assert results == {"down": "❌ Offline"}
@@ -0,0 +1,44 @@
+import json
+import logging
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+
+from app.bot.interfaces.api.internal import routes
+from app.shared.infrastructure.logging.handlers.ring_buffer_handler import RingBufferHandler
+
+
+@pytest.fixture
+def ring(mocker):
+    handler = RingBufferHandler(capacity=50)
+    handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    mocker.patch.object(routes, "get_ring_buffer_handler", return_value=handler)
+    return handler
+
+
+def _log(handler, message):
+    handler.handle(logging.LogRecord("homelab_bot", logging.INFO, __file__, 1, message, None, None))
+
+
+@pytest.mark.asyncio
+async def test_get_logs_since_cursor(ring):
+    for i in range(3):
+        _log(ring, f"line {i}")
+
+    response = await routes.handle_get_logs(make_mocked_request("GET", "/internal/logs?since=1"))
+    body = json.loads(response.text)
+
+    assert response.status == 200
+    assert body['logs'] == ["[INFO] line 1", "[INFO] line 2"]
+    assert [e['seq'] for e in body['entries']] == [2, 3]
+    assert body['next'] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_logs_without_cursor_ignores_invalid_values(ring):
+    _log(ring, "only line")
+
+    response = await routes.handle_get_logs(make_mocked_request("GET", "/internal/logs?since=abc&limit=0"))
+    body = json.loads(response.text)
+
+    assert body['logs'] == ["[INFO] only line"]
@@ -0,0 +1,42 @@
+import pytest
+
+from app.bot.interfaces.dashboards.components.common.embeds.dashboard_embed import DashboardEmbed, format_string
+from app.bot.interfaces.dashboards.components.common.embeds.embed_template import compile_template
+
+DATA = {
+    "hostname": "homelab",
+    "cpu_percent": 12.345,
+    "memory": {"used": 3 * 1024 ** 3, "disks": [{"name": "sda"}]},
+    "empty": "",
+}
+
+
+@pytest.mark.parametrize("template, expected", [
+    ("Host {{hostname}}", "Host homelab"),
+    ("{{memory.disks.0.name}}", "sda"),
+    ("{{cpu_percent|round:1}} / {{cpu_percent|percent}}", "12.3 / 12.3%"),
+    ("{{memory.used|bytes}}", "3.0 GB"),
+    ("{{empty|default:n/a}} {{unknown|default:-}}", "n/a -"),
+    ("{{hostname|percent}}", "homelab"),  # failing formatter falls back to str()
+    ("{{unknown}} stays", "{{unknown}} stays"),
+    ("no placeholders", "no placeholders"),
+])
+def test_compiled_template_rendering(template, expected):
+    assert compile_template(template).render(DATA) == expected
+
+
+def test_format_string_keeps_legacy_behaviour():
+    assert format_string(None, DATA) == ""
+    assert format_string("{{hostname}}", None) == "{{hostname}}"
+    assert compile_template("A {{hostname}}") is compile_template("A {{hostname}}")
+
+
+def test_render_plan_is_compiled_once_and_reset_on_change():
+    embed = DashboardEmbed(None, {"title": "{{hostname}}", "fields": [{"name": "CPU", "value": "{{cpu_percent|round}}"}], "timestamp": False})
+    plan = embed.render_plan
+    assert embed.build(DATA).fields[0].value == "12"
+    assert embed.render_plan is plan
+
+    embed.add_field("Host", "{{hostname}}")
+    assert embed.render_plan is not plan
+    assert [field.value for field in embed.build(DATA).fields] == ["12", "homelab"]
@@ -0,0 +1,89 @@
+from unittest.mock import MagicMock
+
+import nextcord
+import pytest
+
+from app.bot.interfaces.dashboards.controller.dashboard_controller import DashboardController
+
+
+class FakeEmbed:
+    instances = 0
+
+    def __init__(self, bot, config):
+        FakeEmbed.instances += 1
+        self.config = config
+
+    def build(self, data=None):
+        return nextcord.Embed(title=f"CPU {data.get('cpu_percent')}")
+
+
+class FakeButton:
+    instances = 0
+
+    def __init__(self, bot, config):
+        FakeButton.instances += 1
+        self.config = config
+
+    async def add_to_view(self, view, data, config):
+        view.add_item(nextcord.ui.Button(label=config["instance_id"], custom_id=config["instance_id"]))
+
+
+def _config(button_count=3):
+    buttons = [{"component_key": "button", "instance_id": f"btn{i}"} for i in range(button_count)]
+    return {
+        "components": [{"component_key": "embed", "instance_id": "main"}] + buttons,
+        "interactive_components": [b["instance_id"] for b in reversed(buttons)],
+        "data_sources": {"system": {}},
+    }
+
+
+@pytest.fixture
+def registry():
+    registry = MagicMock()
+    registry.get_definition_by_key.side_effect = lambda key: {"type": key}
+    registry.get_type_by_key.side_effect = lambda key: key
+    registry.get_component_class.side_effect = {"embed": FakeEmbed, "button": FakeButton}.get
+    FakeEmbed.instances = FakeButton.instances = 0
+    return registry
+
+
+def _controller(registry, config):
+    return DashboardController(dashboard_id=1, channel_id=2, dashboard_type="system", bot=MagicMock(),
+                               component_registry=registry, data_service=MagicMock(), config=config)
+
+
+@pytest.mark.asyncio
+async def test_refreshes_only_bind_data_to_the_plan(registry):
+    controller = _controller(registry, _config())
+
+    for cpu in (5, 7):
+        embed = await controller.build_embed({"system": {"cpu_percent": cpu}})
+        view = await controller.build_view({})
+        assert embed.title == f"CPU {cpu}"
+        assert [item.custom_id for item in view.children] == ["btn2", "btn1", "btn0"]
+
+    assert (FakeEmbed.instances, FakeButton.instances) == (1, 3)
+    assert registry.get_type_by_key.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_replaced_config_recompiles_plan(registry):
+    controller = _controller(registry, _config())
+    await controller.build_view({})
+
+    controller.config = _config(button_count=1)
+    view = await controller.build_view({})
+
+    assert [item.custom_id for item in view.children] == ["btn0"]
+    assert FakeButton.instances == 4
+
+
+@pytest.mark.asyncio
+async def test_unresolved_components_are_retried(registry):
+    registry.get_component_class.side_effect = {"embed": FakeEmbed}.get
+    controller = _controller(registry, _config(button_count=1))
+    assert await controller.build_view({}) is None
+
+    registry.get_component_class.side_effect = {"embed": FakeEmbed, "button": FakeButton}.get
+    view = await controller.build_view({})
+    assert len(view.children) == 1
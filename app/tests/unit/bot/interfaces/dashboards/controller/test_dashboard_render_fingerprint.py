@@ -0,0 +1,126 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import nextcord
+import pytest
+
+from app.bot.interfaces.dashboards.controller import dashboard_controller as controller_module
+from app.bot.interfaces.dashboards.controller.dashboard_controller import DashboardController, render_fingerprint
+from app.bot.infrastructure.discord.rest_scheduler import get_rest_scheduler
+
+
+def _embed(cpu="5%"):
+    embed = nextcord.Embed(title="System", description=f"CPU {cpu}")
+    embed.timestamp = nextcord.utils.utcnow()
+    return embed
+
+
+def _view(label="Refresh"):
+    view = nextcord.ui.View(timeout=None)
+    view.add_item(nextcord.ui.Button(label=label, custom_id="refresh_button"))
+    return view
+
+
+@pytest.fixture(autouse=True)
+async def rest_scheduler():
+    yield
+    await get_rest_scheduler().shutdown()
+
+
+@pytest.fixture
+def repo(mocker):
+    repo = MagicMock()
+    repo.set_render_state = AsyncMock(return_value=True)
+
+    @asynccontextmanager
+    async def fake_session_context():
+        yield MagicMock()
+
+    mocker.patch.object(controller_module, "session_context", fake_session_context)
+    mocker.patch.object(controller_module, "ActiveDashboardRepositoryImpl", return_value=repo)
+    return repo
+
+
+def _controller(**kwargs):
+    return DashboardController(dashboard_id=7, channel_id=1, dashboard_type="system",
+                               bot=MagicMock(), component_registry=MagicMock(),
+                               data_service=MagicMock(), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_fingerprint_ignores_timestamp_only():
+    assert render_fingerprint(_embed(), _view()) == render_fingerprint(_embed(), _view())
+    assert render_fingerprint(_embed(), _view()) != render_fingerprint(_embed("90%"), _view())
+    assert render_fingerprint(_embed(), _view()) != render_fingerprint(_embed(), _view("Reload"))
+    assert render_fingerprint(_embed(), None) != render_fingerprint(_embed(), _view())
+
+
+@pytest.mark.asyncio
+async def test_unchanged_content_skips_edit_and_persists_changes_only(repo):
+    controller = _controller(message_id="100")
+    controller.message = MagicMock(id=100, edit=AsyncMock())
+    channel = MagicMock()
+
+    for cpu in ("5%", "5%", "5%", "90%"):
+        assert await controller._send_or_edit(channel, _embed(cpu), _view()) is controller.message
+
+    assert controller.message.edit.await_count == 2
+    assert controller.render_stats == {"sent": 2, "skipped": 2}
+    assert repo.set_render_state.await_count == 2
+    repo.set_render_state.assert_awaited_with(7, "100", render_fingerprint(_embed("90%"), _view()))
+
+
+@pytest.mark.asyncio
+async def test_persisted_fingerprint_confirms_message_once_after_restart(repo):
+    embed, view = _embed(), _view()
+    controller = _controller(message_id="100", render_hash=render_fingerprint(embed, view))
+    existing = MagicMock(id=100, edit=AsyncMock())
+    channel = MagicMock()
+    channel.fetch_message = AsyncMock(return_value=existing)
+
+    assert await controller._send_or_edit(channel, embed, view) is existing
+    assert await controller._send_or_edit(channel, _embed(), _view()) is existing
+
+    # One fetch to make sure the stored message still exists, no edit
+    channel.fetch_message.assert_awaited_once_with(100)
+    existing.edit.assert_not_awaited()
+    controller.bot.add_view.assert_any_call(view, message_id=100)
+    assert controller.render_stats == {"sent": 0, "skipped": 2}
+    repo.set_render_state.assert_not_awaited()
+
+
+def _not_found():
+    return nextcord.NotFound(MagicMock(status=404, reason="Not Found"), "Unknown Message")
+
+
+@pytest.mark.asyncio
+async def test_deleted_message_is_recreated_despite_persisted_fingerprint(repo):
+    embed, view = _embed(), _view()
+    controller = _controller(message_id="100", render_hash=render_fingerprint(embed, view))
+    channel = MagicMock()
+    channel.fetch_message = AsyncMock(side_effect=_not_found())
+    channel.send = AsyncMock(return_value=MagicMock(id=200))
+
+    message = await controller._send_or_edit(channel, embed, view)
+
+    assert message.id == 200
+    channel.send.assert_awaited_once()
+    assert controller.message_id == "200"
+    repo.set_render_state.assert_awaited_once_with(7, "200", render_fingerprint(embed, view))
+
+
+@pytest.mark.asyncio
+async def test_forced_refresh_edits_unchanged_content(repo):
+    controller = _controller(message_id="100")
+    shown = MagicMock(id=100, edit=AsyncMock(side_effect=[None, _not_found()]))
+    controller.message = shown
+    channel = MagicMock()
+    channel.send = AsyncMock(return_value=MagicMock(id=300))
+
+    await controller._send_or_edit(channel, _embed(), _view())
+    message = await controller._send_or_edit(channel, _embed(), _view(), force=True)
+
+    # The forced edit notices the deleted message and sends a new one
+    assert shown.edit.await_count == 2
+    assert message.id == 300
+    assert controller.render_stats["skipped"] == 0
@@ -0,0 +1,80 @@
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from app.shared.infrastructure.database.core.engine_registry import (
+    EngineRegistry, EngineSettings, InstrumentedAsyncQueuePool
+)
+from app.shared.infrastructure.database.session.factory import SessionFactory
+from app.shared.infrastructure.database.core.connection import DatabaseConnection
+
+DB_URL = "postgresql+asyncpg://bot:secret@db:5432/foundrycord"
+
+
+@pytest.fixture
+def registry():
+    return EngineRegistry(EngineSettings(pool_size=3, max_overflow=2, pool_recycle=600, statement_cache_size=50))
+
+
+def test_one_engine_per_url_with_configured_pool(registry):
+    engine = registry.get_engine(DB_URL)
+    assert registry.get_engine(DB_URL) is engine
+    assert registry.get_session_factory(DB_URL) is registry.get_session_factory(DB_URL)
+
+    pool = engine.sync_engine.pool
+    assert isinstance(pool, InstrumentedAsyncQueuePool)
+    assert pool.size() == 3
+    assert pool._max_overflow == 2
+    assert pool._recycle == 600
+
+    metrics = registry.get_all_pool_metrics()
+    assert list(metrics) == ["postgresql+asyncpg://bot:***@db:5432/foundrycord"]
+    assert metrics["postgresql+asyncpg://bot:***@db:5432/foundrycord"]["checked_out"] == 0
+
+
+def test_settings_from_env(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "12")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "4")
+    monkeypatch.setenv("DB_STATEMENT_CACHE_SIZE", "0")
+    settings = EngineSettings.from_env()
+    assert (settings.pool_size, settings.max_overflow, settings.statement_cache_size) == (12, 4, 0)
+    assert settings.pool_recycle == EngineSettings.pool_recycle
+
+
+@pytest.mark.asyncio
+async def test_session_helpers_share_the_registry_engine(registry, mocker):
+    mocker.patch("app.shared.infrastructure.database.session.factory.get_database_url", return_value=DB_URL)
+    mocker.patch("app.shared.infrastructure.database.core.connection.get_database_url", return_value=DB_URL)
+    mocker.patch("app.shared.infrastructure.database.session.factory.get_engine_registry", return_value=registry)
+    mocker.patch("app.shared.infrastructure.database.core.connection.get_engine_registry", return_value=registry)
+
+    factory = SessionFactory()
+    # Skip the live "SELECT 1" against Postgres
+    mocker.patch.object(type(registry.get_engine(DB_URL)), "begin", side_effect=RuntimeError("no database"))
+    await factory.initialize()
+    connection = DatabaseConnection()
+    await connection.initialize()
+
+    assert factory._engine is registry.get_engine(DB_URL)
+    assert connection._engine is registry.get_engine(DB_URL)
+    assert connection._session_factory is registry.get_session_factory(DB_URL)
+    assert len(registry.get_all_pool_metrics()) == 1
+    DatabaseConnection._instance = None
+
+
+@pytest.mark.asyncio
+async def test_pool_records_checkouts_and_wait_timeouts():
+    pool = InstrumentedAsyncQueuePool(creator=lambda: MagicMock(), pool_size=1, max_overflow=0, timeout=0.05)
+
+    connection = await greenlet_spawn(pool.connect)
+    with pytest.raises(PoolTimeoutError):
+        await greenlet_spawn(pool.connect)
+    connection.close()
+
+    assert pool.metrics.checkouts == 1
+    assert pool.metrics.timeouts == 1
+    assert pool.metrics.wait_time_max >= 0.05
+
+    # dispose() recreates the pool; metrics carry over
+    assert pool.recreate().metrics is pool.metrics
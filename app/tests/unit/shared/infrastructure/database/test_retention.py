@@ -0,0 +1,138 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import app.shared.infrastructure.models.guild_templates  # noqa: F401  (registers mappers the models reference)
+from app.shared.infrastructure.models import MetricModel
+from app.shared.infrastructure.database.retention import (
+    DEFAULT_POLICIES, RetentionPolicy, RetentionService, delete_in_chunks, load_policies
+)
+
+NOW = datetime(2026, 10, 16, 12, 0, 0)
+
+
+class FakeSession:
+    """Returns the given rowcounts for consecutive DELETEs; reports existing tables."""
+
+    def __init__(self, rowcounts, tables=("metrics", "metric_rollups")):
+        self.rowcounts = list(rowcounts)
+        self.tables = set(tables)
+        self.statements = []
+        self.commit = AsyncMock()
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        result = MagicMock()
+        result.rowcount = self.rowcounts.pop(0)
+        return result
+
+    async def run_sync(self, fn):
+        return fn(MagicMock(name="SyncSession"))
+
+
+def _provider(session):
+    @asynccontextmanager
+    async def provider():
+        yield session
+    return provider
+
+
+@pytest.fixture
+def has_table(mocker):
+    """Makes inspect(...).has_table answer from FakeSession.tables."""
+    def _patch(session):
+        inspector = MagicMock()
+        inspector.has_table.side_effect = lambda name: name in session.tables
+        mocker.patch("app.shared.infrastructure.database.retention.inspect", return_value=inspector)
+    return _patch
+
+
+@pytest.mark.asyncio
+async def test_delete_in_chunks_commits_each_chunk():
+    session = FakeSession([3, 3, 1])
+    table = MetricModel.__table__
+
+    deleted = await delete_in_chunks(session, table, table.c.timestamp < NOW, batch_size=3)
+
+    assert deleted == 7
+    assert session.commit.await_count == 3
+    sql = session.statements[0]
+    assert sql.startswith("DELETE FROM metrics WHERE metrics.id IN (SELECT metrics.id")
+    assert "LIMIT" in sql
+
+
+@pytest.mark.asyncio
+async def test_run_reports_each_policy(has_table):
+    session = FakeSession([2, 0, 0])
+    has_table(session)
+    policies = [
+        RetentionPolicy('metrics', 'metrics', 'timestamp', 30, batch_size=2),
+        RetentionPolicy('metric_rollups_1m', 'metric_rollups', 'bucket_start', 7, {'resolution': '1m'}),
+        RetentionPolicy('alerts', 'alerts', 'created_at', 0),
+        RetentionPolicy('log_entries', 'log_entries', 'timestamp', 30),
+    ]
+    service = RetentionService(policies, session_provider=_provider(session), chunk_pause=0)
+
+    report = await service.run(now=NOW)
+
+    by_policy = {r.policy: r for r in report.results}
+    assert (by_policy['metrics'].status, by_policy['metrics'].deleted, by_policy['metrics'].chunks) == ("done", 2, 2)
+    assert by_policy['metrics'].cutoff == NOW - timedelta(days=30)
+    assert by_policy['metric_rollups_1m'].status == "done"
+    assert "metric_rollups.resolution = " in session.statements[-1]
+    assert by_policy['alerts'].status == "disabled"
+    assert by_policy['log_entries'].status == "missing"
+    assert report.deleted == 2
+    assert service.last_report is report and service.current_report is None
+    assert report.to_dict()['tables'][0]['deleted'] == 2
+
+
+@pytest.mark.asyncio
+async def test_failing_table_does_not_stop_run(has_table):
+    session = FakeSession([])  # every DELETE raises IndexError
+    has_table(session)
+    policies = [
+        RetentionPolicy('metrics', 'metrics', 'timestamp', 30),
+        RetentionPolicy('metric_rollups_1h', 'metric_rollups', 'bucket_start', 180, {'resolution': '1h'}),
+    ]
+    service = RetentionService(policies, session_provider=_provider(session), chunk_pause=0)
+
+    report = await service.run(now=NOW)
+
+    assert [r.status for r in report.results] == ["error", "error"]
+    assert all(r.error for r in report.results)
+
+
+def test_policies_can_be_overridden_per_table(monkeypatch):
+    monkeypatch.setenv("RETENTION_STATE_SNAPSHOTS_DAYS", "3")
+    monkeypatch.setenv("RETENTION_AUDIT_LOGS_DAYS", "0")
+    policies = {p.name: p for p in load_policies()}
+    assert policies['state_snapshots'].max_age_days == 3
+    assert not policies['audit_logs'].enabled
+    assert policies['metrics'].max_age_days == 30
+
+
+@pytest.mark.parametrize("policy", DEFAULT_POLICIES, ids=lambda p: p.name)
+def test_every_default_policy_resolves_its_table(policy):
+    table = RetentionService._get_table(policy.table)
+
+    assert table is not None, f"No table definition for {policy.table}"
+    assert policy.timestamp_column in table.c
+    assert all(column in table.c for column in policy.filters)
+    assert list(table.primary_key.columns)
+
+
+@pytest.mark.asyncio
+async def test_unmapped_state_snapshots_are_pruned(has_table):
+    session = FakeSession([4], tables=("state_snapshots",))
+    has_table(session)
+    policies = [RetentionPolicy('state_snapshots', 'state_snapshots', 'timestamp', 14)]
+    service = RetentionService(policies, session_provider=_provider(session), chunk_pause=0)
+
+    report = await service.run(now=NOW)
+
+    assert (report.results[0].status, report.results[0].deleted) == ("done", 4)
+    assert session.statements[0].startswith("DELETE FROM state_snapshots WHERE state_snapshots.id IN")
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import app.shared.infrastructure.models.guild_templates  # noqa: F401  (registers mappers the models reference)
+from app.shared.infrastructure.logging.handlers.db_handler import DatabaseHandler
+
+
+def _session():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    return session
+
+
+def _provider(session):
+    @asynccontextmanager
+    async def provider():
+        yield session
+    return provider
+
+
+def _record(message, level=logging.WARNING, name="homelab_bot"):
+    return logging.LogRecord(name, level, __file__, 10, message, None, None)
+
+
+def _inserted_batches(session):
+    return [call.args[1] for call in session.execute.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_flush_bulk_inserts_in_batches():
+    session = _session()
+    handler = DatabaseHandler(batch_size=2, flush_interval_ms=60_000, session_provider=_provider(session))
+    for i in range(5):
+        handler._buffer.append(handler._to_row(_record(f"message {i}")))
+
+    assert await handler.aflush() == 5
+
+    batches = _inserted_batches(session)
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert str(session.execute.await_args_list[0].args[0]).startswith("INSERT INTO log_entries")
+    assert batches[0][0]['message'] == "message 0"
+    assert batches[0][0]['level'] == "WARNING"
+    assert handler.stats['written'] == 5 and handler.stats['batches'] == 3
+
+
+@pytest.mark.asyncio
+async def test_full_batch_wakes_writer():
+    session = _session()
+    handler = DatabaseHandler(batch_size=3, flush_interval_ms=60_000, session_provider=_provider(session))
+    try:
+        for i in range(3):
+            handler.emit(_record(f"message {i}"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert handler.stats['written'] == 3
+        assert handler.pending == 0
+    finally:
+        await handler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_records_from_other_threads_are_written_on_close():
+    session = _session()
+    handler = DatabaseHandler(batch_size=100, flush_interval_ms=60_000, session_provider=_provider(session))
+    handler.start()
+
+    threads = [threading.Thread(target=lambda n=n: [handler.emit(_record(f"t{n}-{i}")) for i in range(50)])
+               for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    await handler.aclose()
+
+    assert sum(len(batch) for batch in _inserted_batches(session)) == 200
+    assert handler.stats['emitted'] == handler.stats['written'] == 200
+    handler.emit(_record("after close"))
+    assert handler.pending == 0
+
+
+@pytest.mark.parametrize("overflow, kept", [("drop_oldest", ["m2", "m3"]), ("drop_newest", ["m0", "m1"])])
+def test_overflow_policies_count_drops(overflow, kept):
+    handler = DatabaseHandler(batch_size=1, max_queue_size=2, overflow=overflow,
+                              session_provider=_provider(_session()))
+    for i in range(4):
+        handler.emit(_record(f"m{i}"))  # no running loop: records are only buffered
+
+    assert [row['message'] for row in handler._buffer] == kept
+    assert handler.stats['dropped'] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_dropped_and_logging_inside_writer_is_ignored():
+    session = _session()
+    handler = DatabaseHandler(batch_size=10, flush_interval_ms=60_000, session_provider=_provider(session))
+
+    async def failing_execute(*args, **kwargs):
+        # The database layer logs while the writer runs; that must not loop back into the buffer
+        handler.emit(_record("sqlalchemy noise"))
+        raise RuntimeError("database is down")
+    session.execute.side_effect = failing_execute
+
+    handler.start()
+    handler.emit(_record("first"))
+    await handler.aclose()
+
+    assert handler.stats['errors'] == 1
+    assert handler.stats['dropped'] == 1
+    assert handler.pending == 0
+
+
+def test_unknown_overflow_policy_is_rejected():
+    with pytest.raises(ValueError):
+        DatabaseHandler(overflow="spill")
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import threading
+
+import pytest
+
+from app.shared.infrastructure.logging.handlers.ring_buffer_handler import RingBufferHandler
+
+
+def _log(handler, message, level=logging.INFO):
+    handler.handle(logging.LogRecord("homelab_bot", level, __file__, 1, message, None, None))
+
+
+def test_cursor_returns_only_new_lines():
+    handler = RingBufferHandler(capacity=10)
+    for i in range(3):
+        _log(handler, f"line {i}")
+
+    page = handler.entries_since(None)
+    assert [e['line'] for e in page['entries']] == ["line 0", "line 1", "line 2"]
+    assert page['next'] == 3
+
+    _log(handler, "line 3")
+    page = handler.entries_since(page['next'])
+    assert [(e['seq'], e['line']) for e in page['entries']] == [(4, "line 3")]
+    assert handler.entries_since(page['next'])['entries'] == []
+
+
+def test_evicted_lines_are_reported_as_missed():
+    handler = RingBufferHandler(capacity=3)
+    for i in range(6):
+        _log(handler, f"line {i}")
+
+    page = handler.entries_since(1)
+    assert [e['seq'] for e in page['entries']] == [4, 5, 6]
+    assert page['missed'] == 2
+    assert page['first_seq'] == 4 and page['last_seq'] == 6
+
+    # A cursor from before a restart (ahead of the buffer) starts over
+    assert handler.entries_since(100)['entries'][0]['seq'] == 4
+
+
+def test_limit_pages_through_backlog():
+    handler = RingBufferHandler(capacity=10)
+    for i in range(5):
+        _log(handler, f"line {i}")
+
+    first = handler.entries_since(0, limit=2)
+    second = handler.entries_since(first['next'], limit=2)
+    assert [e['seq'] for e in first['entries']] == [1, 2]
+    assert [e['seq'] for e in second['entries']] == [3, 4]
+    assert [e['seq'] for e in handler.entries_since(None, limit=2)['entries']] == [4, 5]
+
+
+@pytest.mark.asyncio
+async def test_waiters_wake_on_lines_from_other_threads():
+    handler = RingBufferHandler(capacity=10)
+    assert not await handler.wait_for_entries(0, timeout=0.01)
+
+    waiter = asyncio.create_task(handler.wait_for_entries(0, timeout=5))
+    await asyncio.sleep(0)
+    thread = threading.Thread(target=_log, args=(handler, "from thread"))
+    thread.start()
+    thread.join()
+
+    assert await waiter
+    assert handler.entries_since(0)['entries'][0]['line'] == "from thread"
@@ -0,0 +1,143 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import app.shared.infrastructure.models.guild_templates  # noqa: F401  (registers mappers the models reference)
+from app.shared.infrastructure.repositories.monitoring.metric_store import MetricStore
+from app.shared.infrastructure.repositories.monitoring.monitoring_repository_impl import (
+    MonitoringRepositoryImpl, aggregate_rollups, bucket_start, choose_resolution, metric_sample
+)
+
+T0 = datetime(2026, 10, 16, 12, 0, 0)
+
+
+def _session():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    return session
+
+
+def _provider(session):
+    @asynccontextmanager
+    async def provider():
+        yield session
+    return provider
+
+
+def test_rollups_fold_samples_per_bucket():
+    samples = [
+        metric_sample("cpu_usage", 10, "percent", T0 + timedelta(seconds=5)),
+        metric_sample("cpu_usage", 30, "percent", T0 + timedelta(seconds=50)),
+        metric_sample("cpu_usage", 20, "percent", T0 + timedelta(minutes=1, seconds=1)),
+    ]
+    rows = {(r['resolution'], r['bucket_start']): r for r in aggregate_rollups(samples)}
+
+    assert len(rows) == 4  # two 1m buckets, one 1h bucket, one 1d bucket
+    first_minute = rows[('1m', T0)]
+    assert (first_minute['sample_count'], first_minute['value_sum']) == (2, 40)
+    assert (first_minute['min_value'], first_minute['max_value']) == (10, 30)
+    day = rows[('1d', T0.replace(hour=0))]
+    assert (day['sample_count'], day['min_value'], day['max_value']) == (3, 10, 30)
+
+
+def test_resolution_follows_range():
+    assert choose_resolution(timedelta(minutes=30)) is None
+    assert choose_resolution(timedelta(hours=6)) == '1m'
+    assert choose_resolution(timedelta(days=7)) == '1h'
+    assert choose_resolution(timedelta(days=180)) == '1d'
+    assert bucket_start(T0 + timedelta(minutes=17, seconds=3), '1h') == T0
+
+
+def test_sample_category_defaults():
+    assert metric_sample("cpu_usage", 1)['category'] == "cpu"
+    assert metric_sample("docker_running", 1, metric_data={"component": "docker"})['category'] == "docker"
+    with pytest.raises(TypeError):
+        metric_sample("uptime", None)
+
+
+@pytest.mark.asyncio
+async def test_save_metrics_batches_rows_and_rollups():
+    session = _session()
+    repo = MonitoringRepositoryImpl(session)
+    samples = [metric_sample("memory_percent", v, "percent", T0 + timedelta(seconds=v)) for v in range(5)]
+
+    assert await repo.save_metrics(samples) == 5
+
+    assert session.execute.await_count == 2
+    insert_stmt, params = session.execute.await_args_list[0].args
+    assert str(insert_stmt).startswith("INSERT INTO metrics")
+    assert params == samples  # one executemany for the whole batch
+    rollup_sql = str(session.execute.await_args_list[1].args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT ON CONSTRAINT uq_metric_rollup_bucket DO UPDATE" in rollup_sql
+    assert "least(metric_rollups.min_value" in rollup_sql
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_long_ranges_are_served_from_rollups():
+    session = _session()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = []
+    session.execute.return_value = result
+    repo = MonitoringRepositoryImpl(session)
+
+    await repo.get_metric_series("cpu_usage", T0 - timedelta(days=7), T0)
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert "FROM metric_rollups" in sql and "'1h'" in sql
+
+    await repo.get_metric_average("cpu_usage", hours=24 * 30)
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert "FROM metric_rollups" in sql and "'1h'" in sql
+
+
+@pytest.mark.asyncio
+async def test_store_writes_in_batches():
+    session = _session()
+    store = MetricStore(batch_size=2, flush_interval=60, session_provider=_provider(session))
+    for value in range(5):
+        store.record("cpu_usage", value, "percent", timestamp=T0)
+    assert store.pending == 5  # not started: nothing is written implicitly
+
+    assert await store.flush() == 5
+    inserts = [c for c in session.execute.await_args_list if str(c.args[0]).startswith("INSERT INTO metrics")]
+    assert [len(c.args[1]) for c in inserts] == [2, 2, 1]
+    assert store.pending == 0
+    assert store.stats['written'] == 5
+
+
+@pytest.mark.asyncio
+async def test_running_store_flushes_full_batch():
+    session = _session()
+    store = MetricStore(batch_size=3, flush_interval=60, session_provider=_provider(session))
+    store.start()
+    try:
+        store.record_many(SimpleNamespace(name=f"m{i}", value=i, unit="count", timestamp=T0, metric_data={})
+                          for i in range(3))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert store.stats['written'] == 3
+    finally:
+        await store.close()
+    assert not store.running
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_samples():
+    session = _session()
+    session.execute.side_effect = RuntimeError("database is down")
+    store = MetricStore(batch_size=10, session_provider=_provider(session))
+    store.record("cpu_usage", 1, "percent", timestamp=T0)
+    store.record("cpu_usage", 2, "percent", timestamp=T0)
+
+    assert await store.flush() == 0
+    assert store.pending == 2
+    assert store.stats['errors'] == 1
+
+    session.execute.side_effect = None
+    assert await store.flush() == 2
@@ -0,0 +1,178 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import asyncpg
+
+import app.shared.infrastructure.models.guild_templates  # noqa: F401  (registers mappers the models reference)
+from app.shared.infrastructure.repositories.auth.user_repository_impl import UserRepositoryImpl
+
+
+def _rows(params, fields):
+    rows, i = [], 0
+    while f"{fields[0]}_m{i}" in params:
+        rows.append({field: params[f"{field}_m{i}"] for field in fields})
+        i += 1
+    return rows
+
+
+class FakeDatabase:
+    """Emulates the few statements the bulk path issues against app_users/discord_guild_users."""
+
+    def __init__(self, users=None, links=None):
+        self.users = dict(users or {})   # discord_id -> {'id', 'username', 'avatar'}
+        self.links = set(links or ())    # (guild_id, user_id)
+        self.statements = []
+
+    def _result(self, rows):
+        result = MagicMock()
+        result.all.return_value = rows
+        result.scalar_one_or_none.return_value = rows[0] if rows else None
+        return result
+
+    async def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql, params = str(compiled), compiled.params
+        self.statements.append(sql.split(" (")[0])
+
+        if sql.startswith("SELECT app_roles.id"):
+            return self._result([7])
+        if sql.startswith("INSERT INTO app_users"):
+            touched = []
+            for row in _rows(params, ["discord_id", "username", "avatar"]):
+                existing = self.users.get(row["discord_id"])
+                if existing is None:
+                    new_id = len(self.users) + 1
+                    self.users[row["discord_id"]] = {"id": new_id, "username": row["username"], "avatar": row["avatar"]}
+                    touched.append(SimpleNamespace(id=new_id, discord_id=row["discord_id"], inserted=True))
+                elif (existing["username"], existing["avatar"]) != (row["username"], row["avatar"]):
+                    existing.update(username=row["username"], avatar=row["avatar"])
+                    touched.append(SimpleNamespace(id=existing["id"], discord_id=row["discord_id"], inserted=False))
+            return self._result(touched)
+        if sql.startswith("SELECT app_users.id"):
+            wanted = set(params["discord_id_1"])
+            return self._result([SimpleNamespace(id=u["id"], discord_id=d) for d, u in self.users.items() if d in wanted])
+        if sql.startswith("INSERT INTO discord_guild_users"):
+            added = []
+            for row in _rows(params, ["guild_id", "user_id", "role_id"]):
+                key = (row["guild_id"], row["user_id"])
+                if key not in self.links:
+                    self.links.add(key)
+                    added.append(SimpleNamespace(id=len(self.links)))
+            return self._result(added)
+        raise AssertionError(f"Unexpected statement: {sql}")
+
+
+@pytest.fixture
+def database():
+    return FakeDatabase(
+        users={
+            "1": {"id": 1, "username": "alice", "avatar": "a.png"},
+            "2": {"id": 2, "username": "bob", "avatar": None},
+        },
+        links={("42", 1)},
+    )
+
+
+@pytest.fixture
+def repo(database):
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=database.execute)
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return UserRepositoryImpl(session)
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_counts_and_chunks(repo, database):
+    members = [
+        {"discord_id": 1, "username": "alice", "avatar": "a.png"},   # unchanged
+        {"discord_id": 2, "username": "bobby", "avatar": None},      # renamed
+        {"discord_id": 3, "username": "carol", "avatar": None},      # new
+        {"discord_id": 3, "username": "carol", "avatar": None},      # duplicate entry
+    ]
+
+    stats = await repo.bulk_upsert_guild_members("42", members, chunk_size=2)
+
+    assert stats == {"inserted": 1, "updated": 1, "unchanged": 1, "guild_links_added": 2, "errors": 0}
+    assert database.users["2"]["username"] == "bobby"
+    assert database.links == {("42", 1), ("42", 2), ("42", 3)}
+    # Role resolved once, one commit per chunk, no per-member SELECTs
+    assert sum(1 for s in database.statements if s.startswith("SELECT app_roles.id")) == 1
+    assert repo.session.commit.await_count == 2
+    assert sum(1 for s in database.statements if s.startswith("INSERT INTO app_users")) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_is_rolled_back_and_counted(repo, database):
+    original_execute = database.execute
+    calls = {"n": 0}
+
+    async def flaky_execute(stmt):
+        if str(stmt.compile(dialect=postgresql.dialect())).startswith("INSERT INTO app_users"):
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise RuntimeError("deadlock detected")
+        return await original_execute(stmt)
+
+    repo.session.execute.side_effect = flaky_execute
+    members = [{"discord_id": i, "username": f"user{i}"} for i in range(10, 14)]
+
+    stats = await repo.bulk_upsert_guild_members("42", members, chunk_size=2)
+
+    assert stats["errors"] == 2
+    assert stats["inserted"] == 2
+    repo.session.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_empty_member_list_does_nothing(repo, database):
+    stats = await repo.bulk_upsert_guild_members("42", [])
+    assert stats["inserted"] == stats["updated"] == stats["unchanged"] == 0
+    assert database.statements == []
+
+
+@pytest.mark.asyncio
+async def test_remove_guild_members_issues_single_delete(repo):
+    result = MagicMock()
+    result.all.return_value = [SimpleNamespace(id=5), SimpleNamespace(id=6)]
+    repo.session.execute = AsyncMock(return_value=result)
+
+    removed = await repo.remove_guild_members("42", [1, "2", 2])
+
+    assert removed == 2
+    stmt = repo.session.execute.await_args.args[0]
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    assert str(compiled).startswith("DELETE FROM discord_guild_users")
+    assert sorted(compiled.params["discord_id_1"]) == ["1", "2"]
+    repo.session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_remove_departed_guild_members_keeps_present_ones(repo):
+    result = MagicMock()
+    result.all.return_value = [SimpleNamespace(id=8)]
+    repo.session.execute = AsyncMock(return_value=result)
+
+    removed = await repo.remove_departed_guild_members("42", [1, 2, "2"])
+
+    assert removed == 1
+    compiled = repo.session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    assert str(compiled).startswith("DELETE FROM discord_guild_users")
+    assert "!= ALL (%(present_discord_ids)s" in str(compiled)
+    assert sorted(compiled.params["present_discord_ids"]) == ["1", "2"]
+    repo.session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_remove_departed_guild_members_binds_ids_as_one_parameter(repo):
+    result = MagicMock()
+    result.all.return_value = []
+    repo.session.execute = AsyncMock(return_value=result)
+    present = list(range(40000))  # above asyncpg's 32767 bind parameter limit
+
+    await repo.remove_departed_guild_members("42", present)
+
+    compiled = repo.session.execute.await_args.args[0].compile(dialect=asyncpg.dialect())
+    assert compiled.positiontup == ["guild_id_1", "present_discord_ids"]
+    assert len(compiled.params["present_discord_ids"]) == len(present)
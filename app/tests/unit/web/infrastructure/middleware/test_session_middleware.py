@@ -0,0 +1,127 @@
+import time
+
+import httpx
+import jwt
+import pytest
+from fastapi import FastAPI, Request
+
+from app.web.infrastructure.middleware import session as session_module
+from app.web.infrastructure.middleware.session import SessionMiddleware, VerifiedTokenCache
+
+SECRET = "test-secret"
+MAX_AGE = 7 * 24 * 60 * 60
+USER = {"id": "1", "username": "owner"}
+
+
+def _app(**kwargs) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key=SECRET, session_cookie="homelab_session",
+                       max_age=MAX_AGE, **kwargs)
+
+    @app.get("/read")
+    async def read(request: Request):
+        return {"user": request.session.get("user")}
+
+    @app.get("/select")
+    async def select(request: Request):
+        request.session["selected_guild"] = {"guild_id": "42"}
+        return {}
+
+    @app.get("/logout")
+    async def logout(request: Request):
+        request.session.clear()
+        return {}
+
+    return app
+
+
+def _token(issued_at=None, **session):
+    payload = {"user": USER, **session}
+    if issued_at is not None:
+        payload["iat"] = issued_at
+    return jwt.encode(payload, SECRET, algorithm="HS256")
+
+
+def _client(app, token):
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+    client.cookies.set("homelab_session", token)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_unchanged_session_is_not_reissued():
+    async with _client(_app(), _token(issued_at=int(time.time()))) as client:
+        response = await client.get("/read")
+
+    assert response.json() == {"user": USER}
+    assert "set-cookie" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_changed_session_is_reissued_with_issued_at():
+    async with _client(_app(), _token(issued_at=int(time.time()))) as client:
+        response = await client.get("/select")
+
+    cookie = response.cookies["homelab_session"]
+    payload = jwt.decode(cookie, SECRET, algorithms=["HS256"])
+    assert payload["selected_guild"] == {"guild_id": "42"}
+    assert "iat" in payload
+
+
+@pytest.mark.asyncio
+async def test_old_or_legacy_tokens_are_refreshed():
+    stale = int(time.time()) - MAX_AGE // 2 - 60
+    for token in (_token(issued_at=stale), _token()):
+        async with _client(_app(), token) as client:
+            response = await client.get("/read")
+        assert "homelab_session=" in response.headers["set-cookie"]
+        # issued-at is internal: handlers never see it
+        assert response.json() == {"user": USER}
+
+
+@pytest.mark.asyncio
+async def test_cleared_session_deletes_cookie():
+    async with _client(_app(), _token(issued_at=int(time.time()))) as client:
+        response = await client.get("/logout")
+
+    assert "Max-Age=0" in response.headers["set-cookie"]
+
+
+@pytest.mark.asyncio
+async def test_verified_tokens_are_cached(mocker):
+    decode = mocker.spy(session_module.jwt, "decode")
+    app, token = _app(), _token(issued_at=int(time.time()))
+    async with _client(app, token) as client:
+        for _ in range(3):
+            assert (await client.get("/read")).json() == {"user": USER}
+        # Mutations of one request's session must not leak into the cached copy
+        await client.get("/select")
+    async with _client(app, token) as client:
+        assert (await client.get("/read")).json() == {"user": USER}
+
+    assert decode.call_count == 1
+
+
+def test_token_cache_expires_and_evicts(mocker):
+    clock = mocker.patch.object(session_module.time, "monotonic", return_value=100.0)
+    cache = VerifiedTokenCache(ttl=30, max_size=2)
+    cache.put("a", "{}", 1)
+    cache.put("b", "{}", 1)
+    cache.put("c", "{}", 1)
+
+    assert cache.get("a") is None  # evicted (LRU)
+    assert cache.get("b") == ("{}", 1)
+    clock.return_value = 131.0
+    assert cache.get("b") is None
+
+
+@pytest.mark.asyncio
+async def test_session_values_are_not_logged(mocker):
+    logger = mocker.patch.object(session_module, "logger")
+    token = _token(issued_at=int(time.time()), access_token="discord-access-token")
+    async with _client(_app(), token) as client:
+        await client.get("/select")
+
+    logged = repr([call.args for call in logger.debug.call_args_list])
+    assert "access_token" in logged
+    assert "discord-access-token" not in logged
@@ -26,40 +26,50 @@ def setup_middleware(app: FastAPI) -> None:
             logger.critical("CRITICAL: JWT_SECRET_KEY not found in SecurityBootstrapper!")
             raise RuntimeError("Failed to retrieve JWT_SECRET_KEY for session middleware.")
             
-        # 1. Request Tracking Middleware (first to track all requests)
-        app.add_middleware(RequestTrackingMiddleware)
-        
-        # 2. CORS Middleware (before session/auth to handle preflight requests)
-        # Get allowed origins from environment variable, fallback to "*" in development
-        allowed_origins = os.getenv("ALLOWED_ORIGINS", "*").split(",")
-        if os.getenv("ENVIRONMENT", "development").lower() == "development":
-            allowed_origins = ["*"]
-            
-        logger.info(f"Setting up CORS with allowed origins: {allowed_origins}")
-        
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=allowed_origins,
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
-        
-        # 3. Authentication Middleware (before session to check auth)
-        app.add_middleware(AuthenticationMiddleware)
-        
-        # 4. Session Middleware (after auth to set session data)
-        app.add_middleware(
-            SessionMiddleware,
-            secret_key=session_secret,
-            session_cookie="homelab_session",
-            max_age=7 * 24 * 60 * 60,  # 1 week
-            same_site="lax",
-            https_only=os.getenv("ENVIRONMENT", "development").lower() != "development"
-        )
+        install_middleware(app, session_secret)
         
         logger.info("All middleware installed successfully")
             
     except Exception as e:
         logger.critical(f"CRITICAL: Failed to setup middleware: {e}", exc_info=True)
-        raise RuntimeError("Could not configure middleware.") from e 
\ No newline at end of file
+        raise RuntimeError("Could not configure middleware.") from e
+
+
+def install_middleware(app: FastAPI, session_secret: str) -> None:
+    """
+    Add the middleware stack to app. All layers are pure ASGI middleware
+    (no BaseHTTPMiddleware), so requests pass through without extra tasks
+    or response buffering. Starlette runs the last added layer first:
+    Session -> Authentication -> CORS -> RequestTracking -> routes.
+    """
+    # 1. Request Tracking Middleware (first to track all requests)
+    app.add_middleware(RequestTrackingMiddleware)
+    
+    # 2. CORS Middleware (before session/auth to handle preflight requests)
+    # Get allowed origins from environment variable, fallback to "*" in development
+    allowed_origins = os.getenv("ALLOWED_ORIGINS", "*").split(",")
+    if os.getenv("ENVIRONMENT", "development").lower() == "development":
+        allowed_origins = ["*"]
+        
+    logger.info(f"Setting up CORS with allowed origins: {allowed_origins}")
+    
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=allowed_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
+    # 3. Authentication Middleware (before session to check auth)
+    app.add_middleware(AuthenticationMiddleware)
+    
+    # 4. Session Middleware (after auth to set session data)
+    app.add_middleware(
+        SessionMiddleware,
+        secret_key=session_secret,
+        session_cookie="homelab_session",
+        max_age=7 * 24 * 60 * 60,  # 1 week
+        same_site="lax",
+        https_only=os.getenv("ENVIRONMENT", "development").lower() != "development"
+    )
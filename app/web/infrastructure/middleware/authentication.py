@@ -1,9 +1,9 @@
 """
 Authentication middleware for enforcing user authentication.
 """
-from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import status
 from starlette.responses import RedirectResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 from typing import Set
 import logging
 
@@ -20,54 +20,61 @@ PUBLIC_PATHS: Set[str] = {
 
 logger = logging.getLogger(__name__)
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
-    """Middleware to enforce user authentication for protected routes."""
-    
-    async def dispatch(self, request: Request, call_next):
+class AuthenticationMiddleware:
+    """Pure ASGI middleware to enforce user authentication for protected routes."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and check authentication."""
-        path = request.url.path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
         
         # Check if the path is public
         is_public = path in PUBLIC_PATHS or path.startswith("/static/")
         
         try:
             # Get session data from scope
-            session = request.scope.get("session", {})
+            session = scope.get("session") or {}
             user = session.get("user", {})
             
-            logger.debug(f"Auth middleware - Path: {path}, Public: {is_public}, Has session: {bool(user)}, Session data: {session}")
+            # Session keys only: the values hold tokens and are rebuilt on every request
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Auth middleware - Path: %s, Public: %s, Has session: %s, Session keys: %s",
+                             path, is_public, bool(user), list(session.keys()))
             
+            response = None
             # Handle public paths
             if is_public:
                 # If user is logged in and tries to access login page, redirect to home
                 if path == "/auth/login" and user:
                     logger.debug("User is logged in, redirecting from login to home")
-                    return RedirectResponse(
-                        url="/home",
-                        status_code=status.HTTP_303_SEE_OTHER,
-                        headers={"Cache-Control": "no-cache, no-store, must-revalidate"}
-                    )
-                return await call_next(request)
-            
+                    response = _redirect("/home")
             # Handle protected paths
-            if not user:
+            elif not user:
                 logger.debug("No user session found, redirecting to login")
-                return RedirectResponse(
-                    url="/auth/login",
-                    status_code=status.HTTP_303_SEE_OTHER,
-                    headers={"Cache-Control": "no-cache, no-store, must-revalidate"}
-                )
-            
-            # User is authenticated, proceed
-            logger.debug(f"User {user.get('username')} is authenticated, proceeding")
-            return await call_next(request)
+                response = _redirect("/auth/login")
+            else:
+                # User is authenticated, proceed
+                logger.debug("User %s is authenticated, proceeding", user.get('username'))
             
         except Exception as e:
             logger.error(f"Error in authentication middleware: {e}")
-            if is_public:
-                return await call_next(request)
-            return RedirectResponse(
-                url="/auth/login",
-                status_code=status.HTTP_303_SEE_OTHER,
-                headers={"Cache-Control": "no-cache, no-store, must-revalidate"}
-            ) 
\ No newline at end of file
+            response = None if is_public else _redirect("/auth/login")
+
+        if response is not None:
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+def _redirect(url: str) -> RedirectResponse:
+    return RedirectResponse(
+        url=url,
+        status_code=status.HTTP_303_SEE_OTHER,
+        headers={"Cache-Control": "no-cache, no-store, must-revalidate"}
+    )
@@ -1,55 +1,71 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.shared.interfaces.logging.api import get_web_logger
 import uuid
 
 logger = get_web_logger()
 
-class RequestTrackingMiddleware(BaseHTTPMiddleware):
-    """Middleware for request tracking and context logging."""
-    
-    async def dispatch(self, request: Request, call_next):
+class RequestTrackingMiddleware:
+    """Pure ASGI middleware for request tracking and context logging."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         request_id = str(uuid.uuid4())
-        # Store request ID in state for access in other parts of the application
-        request.state.request_id = request_id 
-        
-        client_host = request.client.host if request.client else "unknown"
-        
+        # Store request ID in state (request.state.request_id) for access in other parts of the application
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        method, path = scope["method"], scope["path"]
+        client = scope.get("client")
+        client_host = client[0] if client else "unknown"
+
         logger.info(
-            f"Request started: {request.method} {request.url.path}",
+            "Request started: %s %s", method, path,
             extra={
                 'request_id': request_id,
-                'method': request.method,
-                'path': request.url.path,
+                'method': method,
+                'path': path,
                 'client_host': client_host
             }
         )
-        
+
+        status_code = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         try:
-            response = await call_next(request)
-            logger.info(
-                f"Request completed: {request.method} {request.url.path} -> {response.status_code}",
-                extra={
-                    'request_id': request_id,
-                    'method': request.method,
-                    'path': request.url.path,
-                    'client_host': client_host,
-                    'status_code': response.status_code
-                }
-            )
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             # Log the exception with context
             logger.error(
-                f"Request failed: {request.method} {request.url.path}",
-                exc_info=e, # Log exception info
+                f"Request failed: {method} {path}",
+                exception=e, # Log exception info
                 extra={
                     'request_id': request_id,
-                    'method': request.method,
-                    'path': request.url.path,
+                    'method': method,
+                    'path': path,
                     'client_host': client_host,
                     'error_type': e.__class__.__name__
                 }
             )
             # Re-raise the exception so it can be handled by global exception handlers
-            raise e 
\ No newline at end of file
+            raise
+
+        logger.info(
+            "Request completed: %s %s -> %s", method, path, status_code,
+            extra={
+                'request_id': request_id,
+                'method': method,
+                'path': path,
+                'client_host': client_host,
+                'status_code': status_code
+            }
+        )
@@ -1,90 +1,180 @@
 """
 Session middleware module for handling session management.
 """
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
-import jwt
+from collections import OrderedDict
+from http.cookies import SimpleCookie
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import hashlib
 import json
-from typing import Dict, Any, Optional
+import os
+import time
+import jwt
+from typing import Dict, Any, Optional, Tuple
 from app.shared.interfaces.logging.api import get_web_logger
 
 logger = get_web_logger()
 
-class SessionMiddleware(BaseHTTPMiddleware):
+SESSION_TOKEN_CACHE_TTL = float(os.getenv('SESSION_TOKEN_CACHE_TTL', 30))     # seconds a verified cookie is trusted
+SESSION_TOKEN_CACHE_SIZE = int(os.getenv('SESSION_TOKEN_CACHE_SIZE', 1024))
+SESSION_REFRESH_FRACTION = 0.5  # re-issue an unchanged session once half of max_age has passed
+
+ISSUED_AT_CLAIM = "iat"
+
+
+def _snapshot(session: Dict[str, Any]) -> str:
+    """Canonical JSON of a session, used to detect changes"""
+    return json.dumps(session, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class VerifiedTokenCache:
+    """
+    Small LRU of recently verified session cookies, keyed by the SHA-256 digest
+    of the cookie. Entries hold the session snapshot and expire after ttl
+    seconds, so a signature is checked at most once per window.
+    """
+
+    def __init__(self, ttl: float = SESSION_TOKEN_CACHE_TTL, max_size: int = SESSION_TOKEN_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Tuple[float, str, Optional[int]]]" = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Tuple[str, Optional[int]]]:
+        """(snapshot, issued_at) for a verified token, or None"""
+        if self.ttl <= 0:
+            return None
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1], entry[2]
+
+    def put(self, token: str, snapshot: str, issued_at: Optional[int]) -> None:
+        if self.ttl <= 0:
+            return
+        self._entries[self._key(token)] = (time.monotonic() + self.ttl, snapshot, issued_at)
+        self._entries.move_to_end(self._key(token))
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class SessionMiddleware:
+    """
+    Pure ASGI middleware keeping the session in a signed (HS256 JWT) cookie.
+
+    The cookie is only re-issued when the session changed during the request
+    or when it is older than SESSION_REFRESH_FRACTION of max_age (sliding
+    expiry); a session cleared by the request deletes the cookie.
+    """
+
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         secret_key: str,
         session_cookie: str = "session",
         max_age: int = 14 * 24 * 60 * 60,  # 14 days in seconds
         same_site: str = "lax",
-        https_only: bool = False
+        https_only: bool = False,
+        token_cache: Optional[VerifiedTokenCache] = None
     ):
-        super().__init__(app)
+        self.app = app
         self.secret_key = secret_key
         self.session_cookie = session_cookie
         self.max_age = max_age
         self.same_site = same_site
         self.https_only = https_only
+        self.token_cache = token_cache if token_cache is not None else VerifiedTokenCache()
 
-    async def dispatch(self, request: Request, call_next):
-        # Get session data from cookie
-        session_data = self._get_session(request)
-        logger.debug(f"Retrieved session data from cookie: {session_data}")
-        
-        # Set session data in request scope
-        request.scope["session"] = session_data if session_data else {}
-        logger.debug(f"Set session data in request scope: {request.scope['session']}")
-        
-        # Process the request
-        response = await call_next(request)
-        
-        # Always update session cookie if session data exists
-        if "session" in request.scope and request.scope["session"]:
-            logger.debug(f"Setting session cookie with data: {request.scope['session']}")
-            self._set_session_cookie(response, request.scope["session"])
-            
-        return response
-
-    def _get_session(self, request: Request) -> Dict[str, Any]:
-        session_data = {}
-        session_cookie = request.cookies.get(self.session_cookie)
-        
-        if session_cookie:
-            try:
-                session_data = jwt.decode(
-                    session_cookie,
-                    self.secret_key,
-                    algorithms=["HS256"]
-                )
-                logger.debug(f"Successfully decoded session data: {session_data}")
-            except jwt.InvalidTokenError:
-                logger.warning("Invalid session token")
-                session_data = {}
-                
-        return session_data
-
-    def _set_session_cookie(self, response: Response, session_data: Dict[str, Any]):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Get session data from cookie and set it in the request scope
+        token = HTTPConnection(scope).cookies.get(self.session_cookie)
+        session_data, snapshot, issued_at = self._get_session(token)
+        scope["session"] = session_data
+        logger.debug("Set session data in request scope, keys: %s", list(session_data))
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                session = scope.get("session") or {}
+                if session:
+                    if self._needs_cookie(session, snapshot, issued_at):
+                        self._set_session_cookie(MutableHeaders(scope=message), session)
+                elif token:
+                    # Session cleared (logout) or cookie invalid: remove it from the browser
+                    MutableHeaders(scope=message).append("set-cookie", self._cookie_header("", max_age=0))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _get_session(self, token: Optional[str]) -> Tuple[Dict[str, Any], Optional[str], Optional[int]]:
+        """Returns (session, snapshot of the session as stored, issued_at)"""
+        if not token:
+            return {}, None, None
+
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            snapshot, issued_at = cached
+            # A fresh copy per request: handlers mutate the session in place
+            return json.loads(snapshot), snapshot, issued_at
+
+        try:
+            session_data = jwt.decode(
+                token,
+                self.secret_key,
+                algorithms=["HS256"]
+            )
+        except jwt.InvalidTokenError:
+            logger.warning("Invalid session token")
+            return {}, None, None
+
+        issued_at = session_data.pop(ISSUED_AT_CLAIM, None)
+        snapshot = _snapshot(session_data)
+        self.token_cache.put(token, snapshot, issued_at)
+        logger.debug("Successfully decoded session data, keys: %s", list(session_data))
+        return session_data, snapshot, issued_at
+
+    def _needs_cookie(self, session: Dict[str, Any], snapshot: Optional[str], issued_at: Optional[int]) -> bool:
+        if snapshot is None or _snapshot(session) != snapshot:
+            return True
+        # Tokens from before issued-at tracking count as due
+        return issued_at is None or time.time() - issued_at > self.max_age * SESSION_REFRESH_FRACTION
+
+    def _set_session_cookie(self, headers: MutableHeaders, session_data: Dict[str, Any]):
         if not session_data:
             return
 
         try:
             encoded = jwt.encode(
-                session_data,
+                {**session_data, ISSUED_AT_CLAIM: int(time.time())},
                 self.secret_key,
                 algorithm="HS256"
             )
-            
-            response.set_cookie(
-                self.session_cookie,
-                encoded,
-                max_age=self.max_age,
-                httponly=True,
-                samesite=self.same_site,
-                secure=self.https_only,
-                path="/"  # Session cookie needs to be available for all authenticated routes
-            )
-            logger.debug(f"Successfully set session cookie with data: {session_data}")
+            headers.append("set-cookie", self._cookie_header(encoded))
+            logger.debug("Successfully set session cookie, keys: %s", list(session_data))
         except Exception as e:
-            logger.error(f"Failed to set session cookie: {e}")
\ No newline at end of file
+            logger.error(f"Failed to set session cookie: {e}")
+
+    def _cookie_header(self, value: str, max_age: Optional[int] = None) -> str:
+        """Set-Cookie value with the same attributes Response.set_cookie would produce"""
+        cookie: SimpleCookie = SimpleCookie()
+        cookie[self.session_cookie] = value
+        morsel = cookie[self.session_cookie]
+        morsel["max-age"] = self.max_age if max_age is None else max_age
+        morsel["path"] = "/"  # Session cookie needs to be available for all authenticated routes
+        morsel["httponly"] = True
+        morsel["samesite"] = self.same_site
+        if self.https_only:
+            morsel["secure"] = True
+        return cookie.output(header="").strip()
@@ -1,6 +1,9 @@
 import os
+import json
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from app.shared.infrastructure.models.auth import AppUserEntity
 from app.web.interfaces.api.rest.dependencies.auth_dependencies import get_current_user
 from app.web.interfaces.api.rest.v1.base_controller import BaseController
@@ -8,6 +11,8 @@ from app.shared.interfaces.logging.api import get_web_logger
 
 logger = get_web_logger()
 
+INTERNAL_LOGS_ENDPOINT = "http://foundrycord-bot:9090/internal/logs"
+
 class BotLoggerController(BaseController):
     """Controller for fetching bot logs."""
 
@@ -20,12 +25,13 @@ class BotLoggerController(BaseController):
     def _register_routes(self):
         """Register all routes for this controller"""
         self.router.get("/logs")(self.get_bot_logs)
-        # Add WebSocket route later if needed
-        # self.router.websocket("/ws")(self.websocket_log_stream)
+        self.router.get("/logs/stream")(self.stream_bot_logs)
 
-    async def get_bot_logs(self, current_user: AppUserEntity = Depends(get_current_user)):
-        """Fetch the latest bot logs via the internal bot API."""
-        internal_logs_endpoint = "http://foundrycord-bot:9090/internal/logs"
+    async def get_bot_logs(self, since: Optional[int] = None, limit: Optional[int] = None,
+                           current_user: AppUserEntity = Depends(get_current_user)):
+        """Fetch bot logs via the internal bot API; with ?since=<seq> only lines after that cursor."""
+        internal_logs_endpoint = INTERNAL_LOGS_ENDPOINT
+        params = {key: value for key, value in (('since', since), ('limit', limit)) if value is not None}
         
         try:
             # Ensure only owners can access
@@ -38,11 +44,10 @@ class BotLoggerController(BaseController):
             # --- Fetch logs from internal API --- 
             try:
                 logger.debug(f"Requesting logs from {internal_logs_endpoint}")
-                response = await self.http_client.get(internal_logs_endpoint)
+                response = await self.http_client.get(internal_logs_endpoint, params=params)
                 response.raise_for_status()
                 
                 logs_data = response.json()
-                logger.debug(f"Received log data: {logs_data}")
                 
                 if not isinstance(logs_data, dict) or 'logs' not in logs_data or not isinstance(logs_data['logs'], list):
                      logger.error(f"Invalid log data format received from internal API: {logs_data}")
@@ -68,15 +73,45 @@ class BotLoggerController(BaseController):
             # Handle unexpected errors
             return self.handle_exception(e)
 
+    async def stream_bot_logs(self, request: Request, since: Optional[int] = None,
+                              current_user: AppUserEntity = Depends(get_current_user)):
+        """Relay the bot's log stream as Server-Sent Events (resumable via Last-Event-ID)."""
+        if not current_user.is_owner:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only owner can view bot logs."
+            )
+
+        params = {'since': since} if since is not None else {}
+        headers = {}
+        if request.headers.get('last-event-id'):
+            headers['Last-Event-ID'] = request.headers['last-event-id']
+
+        async def relay():
+            try:
+                # No read timeout: the bot only sends when there are new lines (plus keep-alives)
+                async with self.http_client.stream(
+                    "GET", f"{INTERNAL_LOGS_ENDPOINT}/stream", params=params, headers=headers,
+                    timeout=httpx.Timeout(10.0, read=None)
+                ) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_raw():
+                        yield chunk
+            except httpx.HTTPError as e:
+                logger.error(f"Bot log stream from internal API failed: {e}")
+                yield f"event: error\ndata: {json.dumps({'message': 'Bot service unavailable'})}\n\n".encode()
+
+        return StreamingResponse(
+            relay(),
+            media_type="text/event-stream",
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+
     async def close_http_client(self):
         """Gracefully close the httpx client."""
         if hasattr(self, 'http_client') and self.http_client:
             await self.http_client.aclose()
             logger.info("HTTP client closed.")
 
-    # TODO: Implement WebSocket endpoint if real-time streaming is desired
-    # async def websocket_log_stream(self, websocket: WebSocket, current_user: AppUserEntity = Depends(get_current_user_ws)):
-    # ... (rest of websocket code remains the same)
-
 # Controller instance
 bot_logger_controller = BotLoggerController()
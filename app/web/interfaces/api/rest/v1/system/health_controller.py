@@ -4,6 +4,7 @@ from app.shared.infrastructure.models.auth import AppUserEntity, AppRoleEntity
 from app.web.interfaces.api.rest.dependencies.auth_dependencies import get_current_user
 from pydantic import BaseModel
 import psutil
+from app.shared.infrastructure.database.core.engine_registry import get_engine_registry
 from fastapi import HTTPException
 
 class HealthStatus(BaseModel):
@@ -24,6 +25,7 @@ class HealthController(BaseController):
         """Register all health routes"""
         self.router.get("/status", response_model=HealthStatus)(self.get_system_status)
         self.router.get("/ping")(self.ping)
+        self.router.get("/database")(self.get_database_pool_status)
     
     async def get_system_status(self, current_user: AppUserEntity = Depends(get_current_user)) -> HealthStatus:
         """Get system health status including CPU, memory and disk usage"""
@@ -45,6 +47,13 @@ class HealthController(BaseController):
             self.logger.error(f"Error fetching system status: {e}", exc_info=e)
             raise HTTPException(status_code=500, detail="Failed to retrieve system status")
     
+    async def get_database_pool_status(self, current_user: AppUserEntity = Depends(get_current_user)):
+        """Live connection pool figures of this process (checked out, overflow, wait time)"""
+        try:
+            return {"engines": get_engine_registry().get_all_pool_metrics()}
+        except Exception as e:
+            return self.handle_exception(e)
+    
     async def ping(self, current_user: AppUserEntity = Depends(get_current_user)):
         """Simple ping endpoint for checking if the API is responsive"""
         try:
@@ -6,9 +6,12 @@ class BotLogger {
         this.refreshButton = document.getElementById('refresh-logs-btn');
         this.autoRefreshSwitch = document.getElementById('auto-refresh-switch');
         this.autoRefreshInterval = null;
-        this.refreshIntervalMs = 5000; // Refresh every 5 seconds
+        this.refreshIntervalMs = 5000; // Poll interval when streaming is unavailable
         this.isAutoRefreshing = true;
         this.isFetching = false; // Prevent concurrent fetches
+        this.lastSeq = null; // Cursor: sequence number of the newest displayed line
+        this.maxLines = 2000; // Oldest lines are removed from the DOM beyond this
+        this.eventSource = null;
 
         this.init();
     }
@@ -21,11 +24,8 @@ class BotLogger {
 
         console.log('Initializing bot logger...');
 
-        // Initial fetch
-        this.fetchAndDisplayLogs();
-
-        // Setup auto-refresh
-        this.setupAutoRefresh();
+        // Initial fetch, then follow from its cursor
+        this.fetchAndDisplayLogs().then(() => this.setupAutoRefresh());
 
         // Add event listeners
         this.refreshButton.addEventListener('click', () => this.fetchAndDisplayLogs(true)); // Pass true for manual refresh
@@ -42,14 +42,26 @@ class BotLogger {
             showToast('info', 'Refreshing logs...');
         }
 
+        // Manual refresh reloads the whole tail, polling only asks for lines after the cursor
+        const incremental = !isManual && this.lastSeq !== null;
+        const url = incremental
+            ? `/api/v1/owner/bot/logger/logs?since=${this.lastSeq}`
+            : '/api/v1/owner/bot/logger/logs';
+
         try {
             // apiRequest likely returns the full {status, message, data} object
-            const response = await apiRequest('/api/v1/owner/bot/logger/logs');
-            console.log('Fetched logs response:', response); // Log the full response
+            const response = await apiRequest(url);
 
             // Check if the response structure is valid and extract logs from the 'data' field
             if (response && response.status === 'success' && response.data && Array.isArray(response.data.logs)) {
-                this.updateLogDisplay(response.data.logs); // Use response.data.logs
+                if (incremental) {
+                    this.appendLogLines(response.data.logs, response.data.missed);
+                } else {
+                    this.updateLogDisplay(response.data.logs);
+                }
+                if (response.data.next !== undefined) {
+                    this.lastSeq = response.data.next;
+                }
             } else {
                 // Log the actual received structure for debugging
                 console.warn('Received unexpected log data format:', response);
@@ -79,25 +91,7 @@ class BotLogger {
         }
 
         // Add new log lines
-        logs.forEach(line => {
-            const logLineElement = document.createElement('div');
-            logLineElement.classList.add('log-line');
-            logLineElement.textContent = line;
-
-            // Basic log level coloring (can be expanded)
-            const lowerLine = line.toLowerCase();
-            if (lowerLine.includes('[error]') || lowerLine.includes('[critical]')) {
-                logLineElement.classList.add('error');
-            } else if (lowerLine.includes('[warn]') || lowerLine.includes('[warning]')) {
-                logLineElement.classList.add('warn');
-            } else if (lowerLine.includes('[info]')) {
-                logLineElement.classList.add('info');
-            } else if (lowerLine.includes('[debug]')) {
-                logLineElement.classList.add('debug');
-            }
-
-            this.logContainer.appendChild(logLineElement);
-        });
+        logs.forEach(line => this.logContainer.appendChild(this.createLogLine(line)));
 
         // Scroll to bottom if it was near the bottom before update
         if (shouldScroll) {
@@ -105,19 +99,105 @@ class BotLogger {
         }
     }
 
+    appendLogLines(logs, missed = 0) {
+        if (!this.logContainer || (logs.length === 0 && !missed)) return;
+
+        const shouldScroll = this.logContainer.scrollHeight - this.logContainer.scrollTop <= this.logContainer.clientHeight + 50;
+
+        // Drop the "No logs available." placeholder
+        if (!this.logContainer.querySelector('.log-line')) {
+            this.logContainer.innerHTML = '';
+        }
+        if (missed) {
+            const gap = this.createLogLine(`... ${missed} log line(s) skipped ...`);
+            gap.classList.add('warn');
+            this.logContainer.appendChild(gap);
+        }
+        logs.forEach(line => this.logContainer.appendChild(this.createLogLine(line)));
+
+        while (this.logContainer.childElementCount > this.maxLines) {
+            this.logContainer.removeChild(this.logContainer.firstElementChild);
+        }
+        if (shouldScroll) {
+            this.logContainer.scrollTop = this.logContainer.scrollHeight;
+        }
+    }
+
+    createLogLine(line) {
+        const logLineElement = document.createElement('div');
+        logLineElement.classList.add('log-line');
+        logLineElement.textContent = line;
+
+        // Basic log level coloring (can be expanded)
+        const lowerLine = line.toLowerCase();
+        if (lowerLine.includes('[error]') || lowerLine.includes('[critical]')) {
+            logLineElement.classList.add('error');
+        } else if (lowerLine.includes('[warn]') || lowerLine.includes('[warning]')) {
+            logLineElement.classList.add('warn');
+        } else if (lowerLine.includes('[info]')) {
+            logLineElement.classList.add('info');
+        } else if (lowerLine.includes('[debug]')) {
+            logLineElement.classList.add('debug');
+        }
+        return logLineElement;
+    }
+
+    openStream() {
+        if (this.eventSource || typeof EventSource === 'undefined') {
+            return false;
+        }
+        const since = this.lastSeq !== null ? `?since=${this.lastSeq}` : '';
+        this.eventSource = new EventSource(`/api/v1/owner/bot/logger/logs/stream${since}`);
+
+        this.eventSource.addEventListener('log', (event) => {
+            const entry = JSON.parse(event.data);
+            if (this.lastSeq !== null && entry.seq <= this.lastSeq) {
+                return; // Already shown by a manual refresh
+            }
+            this.lastSeq = entry.seq;
+            this.appendLogLines([entry.line]);
+        });
+        this.eventSource.addEventListener('missed', (event) => {
+            this.appendLogLines([], JSON.parse(event.data).count);
+        });
+        this.eventSource.addEventListener('error', () => {
+            // Bot unreachable or stream ended: fall back to polling with the cursor
+            console.warn('Bot log stream unavailable, falling back to polling.');
+            this.closeStream();
+            this.startPolling();
+        });
+        console.log('Bot log stream opened.');
+        return true;
+    }
+
+    closeStream() {
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
+        }
+    }
+
+    startPolling() {
+        if (!this.autoRefreshInterval) {
+            this.autoRefreshInterval = setInterval(() => {
+                if (this.isAutoRefreshing) {
+                    this.fetchAndDisplayLogs();
+                }
+            }, this.refreshIntervalMs);
+            console.log(`Auto-refresh started (every ${this.refreshIntervalMs}ms).`);
+        }
+    }
+
     setupAutoRefresh() {
         if (this.autoRefreshSwitch.checked) {
             this.isAutoRefreshing = true;
-            if (!this.autoRefreshInterval) {
-                this.autoRefreshInterval = setInterval(() => {
-                    if (this.isAutoRefreshing) {
-                        this.fetchAndDisplayLogs();
-                    }
-                }, this.refreshIntervalMs);
-                console.log(`Auto-refresh started (every ${this.refreshIntervalMs}ms).`);
+            // Prefer the live stream; poll with the cursor where EventSource is unavailable
+            if (!this.eventSource && !this.openStream()) {
+                this.startPolling();
             }
         } else {
             this.isAutoRefreshing = false;
+            this.closeStream();
             this.clearAutoRefreshInterval();
         }
     }
@@ -125,10 +205,10 @@ class BotLogger {
     toggleAutoRefresh() {
         this.isAutoRefreshing = this.autoRefreshSwitch.checked;
         if (this.isAutoRefreshing) {
-            this.setupAutoRefresh(); // Start or ensure interval is running
-            // Optionally fetch immediately when toggled on
-            this.fetchAndDisplayLogs();
+            // Catch up from the cursor first, then resume streaming/polling
+            this.fetchAndDisplayLogs().then(() => this.setupAutoRefresh());
         } else {
+            this.closeStream();
             this.clearAutoRefreshInterval();
             console.log('Auto-refresh stopped.');
         }